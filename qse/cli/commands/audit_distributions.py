@@ -7,23 +7,78 @@ from pathlib import Path
 import pandas as pd
 import typer
 
-from qse.cli.formatters.audit_formatter import format_audit_result
-from qse.data.cache import load_or_fetch
-from qse.distributions.distribution_audit import audit_distributions_for_symbol
+from qse.cli.formatters.audit_formatter import format_audit_result, format_batch_summary
+from qse.data.bulk_fetch import RateLimiter, limits_for
+from qse.data.cache import fetch_symbol, load_or_fetch, parse_symbol_list
+from qse.data.universe import load_symbol_file
+from qse.distributions.backtesting.rolling_var import RollingVarConfig
+from qse.distributions.batch_audit import audit_universe
+from qse.distributions.cache.cache_manager import DEFAULT_CACHE_DIR, AuditCache
+from qse.distributions.distribution_audit import (
+    audit_distributions_for_symbol,
+    default_audit_workers,
+)
+from qse.distributions.plotting.plot_data import plot_data_path
+from qse.exceptions import ConfigValidationError
 from qse.utils.logging import get_logger
 
 log = get_logger(__name__, component="cli_audit_distributions")
 
 
 def audit_distributions(
-    symbol: str = typer.Option(..., "--symbol", help="Ticker symbol to audit"),
+    symbol: str | None = typer.Option(None, "--symbol", help="Ticker symbol to audit"),
+    symbols: str | None = typer.Option(
+        None, "--symbols", help="Symbol list for a batch audit: AAPL,MSFT or ['AAPL','MSFT']"
+    ),
+    symbols_file: Path | None = typer.Option(
+        None, "--symbols-file", help="Universe/watchlist file (CSV with a symbol column, or one per line)"
+    ),
     lookback_days: int = typer.Option(756, "--lookback-days", help="Historical days to audit"),
     end_date: str | None = typer.Option(None, "--end-date", help="End date YYYY-MM-DD"),
     interval: str = typer.Option("1d", "--interval", help="Data interval for historical fetch"),
     target: Path = typer.Option(Path("data"), "--target", help="Data cache directory"),
     force_refit: bool = typer.Option(False, "--force-refit/--use-cache", help="Bypass cached audit results"),
-    plot_fit: bool = typer.Option(False, "--plot-fit/--no-plot-fit", help="Emit diagnostic fit plot"),
+    evict_expired: bool = typer.Option(
+        False, "--evict-expired", help="Delete cached audits older than the 30-day TTL before auditing"
+    ),
+    plot_fit: bool = typer.Option(
+        False,
+        "--plot-fit/--no-plot-fit",
+        help="Emit diagnostic fit plot (batches save plot data only; render with `qse audit-plots`)",
+    ),
+    workers: int | None = typer.Option(
+        None,
+        "--workers",
+        help="Processes for (symbol x model) audit tasks (default: one per model, or all CPUs for batches)",
+    ),
+    rolling_var: bool = typer.Option(
+        False, "--rolling-var/--static-var", help="Walk-forward VaR backtest with rolling refits"
+    ),
+    var_window: int = typer.Option(500, "--var-window", help="Rolling VaR: returns per refit"),
+    refit_every: int = typer.Option(5, "--refit-every", help="Rolling VaR: days between refits"),
+    var_obs: int = typer.Option(1000, "--var-obs", help="Rolling VaR: most recent days backtested"),
 ) -> None:
+    """Audit return distributions for one symbol, or a universe in batch mode.
+
+    With --symbols/--symbols-file every (symbol x model) task runs on one
+    shared process pool; symbols with a fresh cached audit are skipped
+    (unless --force-refit) and a best-model-per-symbol table is printed.
+    """
+
+    symbol_list: list[str] = [symbol] if symbol else []
+    if symbols:
+        symbol_list.extend(s.upper() for s in parse_symbol_list(symbols))
+    if symbols_file:
+        try:
+            symbol_list.extend(load_symbol_file(symbols_file))
+        except ConfigValidationError as exc:
+            log.error("invalid symbols file", extra={"error": str(exc)})
+            raise typer.Exit(code=1)
+    symbol_list = list(dict.fromkeys(symbol_list))
+    if not symbol_list:
+        log.error("no symbols supplied; use --symbol, --symbols or --symbols-file")
+        raise typer.Exit(code=1)
+
     try:
         end_ts = pd.Timestamp(end_date) if end_date else pd.Timestamp.utcnow().normalize()
     except Exception:
@@ -31,6 +86,29 @@ def audit_distributions(
         raise typer.Exit(code=1)
 
     start_ts = end_ts - pd.Timedelta(days=lookback_days)
+    var_backtest = (
+        RollingVarConfig(window=var_window, refit_every=refit_every, max_obs=var_obs)
+        if rolling_var
+        else None
+    )
+    if symbols or symbols_file:
+        _audit_batch(
+            symbol_list,
+            start=start_ts.date().isoformat(),
+            end=end_ts.date().isoformat(),
+            lookback_days=lookback_days,
+            interval=interval,
+            target=target,
+            force_refit=force_refit,
+            evict_expired=evict_expired,
+            workers=workers,
+            var_backtest=var_backtest,
+            plot_fit=plot_fit,
+        )
+        return
+    if evict_expired:
+        AuditCache(DEFAULT_CACHE_DIR).evict_expired()
+    symbol = symbol_list[0]
     log.info(
         "Fetching historical data for audit",
         extra={"symbol": symbol, "start": start_ts.date().isoformat(), "end": end_ts.date().isoformat(), "interval": interval},
@@ -57,10 +135,75 @@ def audit_distributions(
         data_source=f"yfinance:{interval}",
         force_refit=force_refit,
         plot_fit=plot_fit,
+        max_workers=(
+            workers
+            if workers is not None
+            else default_audit_workers(rolling_var=var_backtest is not None)
+        ),
+        var_backtest=var_backtest,
     )
 
     typer.echo(format_audit_result(result))
+    if plot_fit:
+        _render_plot(symbol)
     log.info("distribution audit complete", extra={"symbol": symbol, "best_model": result.best_model.name if result.best_model else None})
 
 
+def _audit_batch(
+    symbol_list: list[str],
+    *,
+    start: str,
+    end: str,
+    lookback_days: int,
+    interval: str,
+    target: Path,
+    force_refit: bool,
+    workers: int | None,
+    evict_expired: bool = False,
+    var_backtest: RollingVarConfig | None = None,
+    plot_fit: bool = False,
+) -> None:
+    # Loader threads share yfinance's rate budget; cache hits never touch it
+    limited_fetch = RateLimiter(limits_for("yfinance")).wrap(fetch_symbol)
+
+    def _load_prices(sym: str) -> pd.Series | None:
+        df = load_or_fetch(
+            sym, start=start, end=end, interval=interval, target=target, fetcher=limited_fetch
+        )
+        return None if df.empty else df.sort_values("date")["close"]
+
+    def _report(summary) -> None:
+        typer.echo(f"{summary.symbol}: {summary.status} ({summary.best_model or '-'})")
+
+    summaries = audit_universe(
+        symbol_list,
+        _load_prices,
+        lookback_days=lookback_days,
+        end_date=end,
+        data_source=f"yfinance:{interval}",
+        force_refit=force_refit,
+        evict_expired=evict_expired,
+        max_workers=workers,
+        on_result=_report,
+        var_backtest=var_backtest,
+        plot_fit=plot_fit,
+    )
+    typer.echo(format_batch_summary(summaries))
+    if plot_fit:
+        typer.echo("Fit plot data saved; render PNGs with `qse audit-plots`")
+    if all(s.status in {"failed", "no_data"} for s in summaries):
+        raise typer.Exit(code=2)
+
+
+def _render_plot(symbol: str) -> None:
+    data_path = plot_data_path(symbol)
+    if not data_path.exists():  # cached audits do not refit, so there is no new plot data
+        log.info("no fit plot data to render", extra={"symbol": symbol, "path": str(data_path)})
+        return
+    from qse.distributions.plotting.fit_diagnostics import render_plot_file
+
+    image = render_plot_file(data_path)
+    typer.echo(f"Fit diagnostic plot: {image}")
+
+
 __all__ = ["audit_distributions"]
@@ -0,0 +1,46 @@
+"""CLI command rendering saved distribution-fit plot data to PNGs (US6a)."""
+
+from __future__ import annotations
+
+from pathlib import Path
+
+import typer
+
+from qse.distributions.plotting.plot_data import DEFAULT_PLOT_DIR, PLOT_DATA_SUFFIX, plot_data_path
+from qse.utils.logging import get_logger
+
+log = get_logger(__name__, component="cli_audit_plots")
+
+
+def audit_plots(
+    symbols: list[str] | None = typer.Argument(None, help="Symbols to render (default: all saved)"),
+    data_dir: Path = typer.Option(
+        DEFAULT_PLOT_DIR, "--data-dir", help="Directory of *_fit_data.json files from audits"
+    ),
+    force: bool = typer.Option(False, "--force", help="Re-render PNGs that are already up to date"),
+    workers: int = typer.Option(1, "--workers", help="Processes rendering in parallel"),
+) -> None:
+    """Render fit diagnostic PNGs from plot data saved by `audit-distributions --plot-fit`."""
+
+    if symbols:
+        paths = [plot_data_path(s.upper(), data_dir) for s in symbols]
+        missing = [p for p in paths if not p.exists()]
+        for path in missing:
+            log.warning("no plot data for symbol", extra={"path": str(path)})
+        paths = [p for p in paths if p.exists()]
+    else:
+        paths = sorted(data_dir.glob(f"*{PLOT_DATA_SUFFIX}"))
+    if not paths:
+        log.error("no fit plot data found", extra={"data_dir": str(data_dir)})
+        raise typer.Exit(code=2)
+
+    # matplotlib loads only for this command
+    from qse.distributions.plotting.fit_diagnostics import render_plot_files
+
+    written = render_plot_files(paths, force=force, max_workers=workers)
+    for image in written:
+        typer.echo(f"Rendered {image}")
+    typer.echo(f"{len(written)} rendered, {len(paths) - len(written)} up to date or failed")
+
+
+__all__ = ["audit_plots"]
@@ -10,8 +10,12 @@ import typer
 from rich.console import Console
 from rich.progress import Progress, SpinnerColumn, TextColumn
 
+from qse.data.bulk_fetch import RateLimitedSource, fetch_symbols
+from qse.data.cache import parse_symbol_list
 from qse.data.data_loader import DataLoader
 from qse.data.factory import FallbackDataSource, get_data_source
+from qse.data.universe import load_symbol_file
+from qse.exceptions import ConfigValidationError
 from qse.utils.logging import get_logger
 
 console = Console()
@@ -19,7 +23,14 @@ log = get_logger(__name__, component="cli.fetch")
 
 
 def fetch(
-    symbol: str = typer.Option(..., "--symbol", help="Stock ticker symbol (e.g., AAPL)"),
+    symbol: Optional[str] = typer.Option(None, "--symbol", help="Stock ticker symbol (e.g., AAPL)"),
+    symbols: Optional[str] = typer.Option(
+        None, "--symbols", help="Symbol list for a bulk fetch: AAPL,MSFT or ['AAPL','MSFT']"
+    ),
+    symbols_file: Optional[Path] = typer.Option(
+        None, "--symbols-file", help="Universe/watchlist file (CSV with a symbol column, or one per line)"
+    ),
+    max_workers: int = typer.Option(8, "--max-workers", help="Concurrent symbols for bulk fetches"),
     start: str = typer.Option(
         ..., "--start", help="Start date in YYYY-MM-DD format (e.g., 2018-01-01)"
     ),
@@ -39,6 +50,16 @@ def fetch(
     access_token: Optional[str] = typer.Option(None, "--access-token", envvar="SCHWAB_ACCESS_TOKEN"),
     timeout: float = typer.Option(10.0, "--timeout", help="HTTP timeout seconds for Schwab calls"),
     max_retries: int = typer.Option(3, "--max-retries", help="Retries for yfinance downloads"),
+    partitioned: bool = typer.Option(
+        False,
+        "--partitioned/--single-file",
+        help="Store year (daily) / month (intraday) partitions so refreshes only rewrite the latest",
+    ),
+    derive: bool = typer.Option(
+        True,
+        "--derive/--no-derive",
+        help="Resample 5m/1d bars from stored 1m/5m bars covering the range instead of fetching them",
+    ),
 ) -> None:
     """
     Fetch historical market data and save as Parquet.
@@ -46,8 +67,15 @@ def fetch(
     Downloads OHLCV data via yfinance and stores in partitioned Parquet format:
     target/historical/interval={interval}/symbol={symbol}/_v1/data.parquet
 
+    Bulk fetches (--symbols/--symbols-file) run symbols concurrently behind the
+    provider's rate limit and concurrency cap, writing each partition as it arrives.
+
+    With --derive (the default) 5m/1d requests covered by stored 1m/5m bars are
+    resampled locally into target/historical/derived/ without a provider call.
+
     Example:
         python -m qse.cli.fetch --symbol AAPL --start 2018-01-01 --end 2024-12-31 --interval 1d --target data/
+        qse fetch --symbols-file data/universes/sp500.csv --start 2024-01-01 --end 2024-12-31
     """
     # Validate dates
     try:
@@ -68,9 +96,42 @@ def fetch(
         )
         raise typer.Exit(code=1)
 
+    symbol_list: list[str] = [symbol.upper()] if symbol else []
+    if symbols:
+        symbol_list.extend(s.upper() for s in parse_symbol_list(symbols))
+    if symbols_file:
+        try:
+            symbol_list.extend(load_symbol_file(symbols_file))
+        except ConfigValidationError as exc:
+            console.print(f"[red]Error: {exc}[/red]")
+            raise typer.Exit(code=1)
+    symbol_list = list(dict.fromkeys(symbol_list))
+    if not symbol_list:
+        console.print("[red]Error: Provide --symbol, --symbols or --symbols-file[/red]")
+        raise typer.Exit(code=1)
+
     # Setup output directory
     output_dir = target / "historical"
 
+    if len(symbol_list) > 1:
+        _fetch_bulk(
+            symbol_list,
+            start=start,
+            end=end,
+            interval=interval,
+            output_dir=output_dir,
+            data_source=data_source,
+            allow_fallback=allow_fallback,
+            access_token=access_token,
+            timeout=timeout,
+            max_retries=max_retries,
+            partitioned=partitioned,
+            max_workers=max_workers,
+            derive=derive,
+        )
+        return
+    symbol = symbol_list[0]
+
     console.print(f"[bold cyan]Fetching {symbol} data[/bold cyan]")
     console.print(f"  Period: {start} to {end}")
     console.print(f"  Interval: {interval}")
@@ -95,11 +156,20 @@ def fetch(
             )
 
             loader = DataLoader(
-                base_dir=output_dir, data_source=provider, storage_format="parquet", category="historical"
+                base_dir=output_dir,
+                data_source=provider,
+                storage_format="parquet",
+                category="historical",
+                layout="partitioned" if partitioned else "single",
+                derive=derive,
             )
+            derived_from = loader.derived_source(symbol, start, end, interval) if derive else None
             df = loader.load_ohlcv(symbol, start, end, interval=interval)
 
-            saved_path = loader._resolve_partition(symbol, f"interval={interval}", version=None) / "data.parquet"
+            partition_dir = loader._resolve_partition(symbol, f"interval={interval}", version=None)
+            saved_path = partition_dir if partitioned else partition_dir / "data.parquet"
+            if derived_from is not None:
+                saved_path = loader.resampler.path(symbol, interval, derived_from)
             progress.stop()
             console.print(f"[green]✓[/green] Saved {len(df)} rows to {saved_path}")
             log.info(
@@ -111,3 +181,70 @@ def fetch(
             console.print(f"[red]Error during fetch: {exc}[/red]")
             log.exception(f"Failed to fetch data for {symbol}")
             raise typer.Exit(code=3)
+
+
+def _fetch_bulk(
+    symbol_list: list[str],
+    *,
+    start: str,
+    end: str,
+    interval: str,
+    output_dir: Path,
+    data_source: str,
+    allow_fallback: bool,
+    access_token: Optional[str],
+    timeout: float,
+    max_retries: int,
+    partitioned: bool,
+    max_workers: int,
+    derive: bool,
+) -> None:
+    console.print(f"[bold cyan]Fetching {len(symbol_list)} symbols[/bold cyan]")
+    console.print(f"  Period: {start} to {end}")
+    console.print(f"  Interval: {interval}")
+    console.print(f"  Provider: {data_source} (max {max_workers} concurrent)")
+    try:
+        primary = get_data_source(
+            data_source, access_token=access_token, timeout=timeout, max_retries=max_retries
+        )
+        provider = (
+            FallbackDataSource(primary, get_data_source("yfinance", max_retries=max_retries), logger=log)
+            if allow_fallback and data_source != "yfinance"
+            else primary
+        )
+    except Exception as exc:
+        console.print(f"[red]Error initializing data provider: {exc}[/red]")
+        raise typer.Exit(code=3)
+
+    limited = RateLimitedSource(provider)
+    loader = DataLoader(
+        base_dir=output_dir,
+        data_source=limited,
+        storage_format="parquet",
+        category="historical",
+        layout="partitioned" if partitioned else "single",
+        single_flight=True,
+        derive=derive,
+    )
+
+    def _report(result, _df) -> None:
+        if result.status == "success":
+            console.print(f"[green]✓[/green] {result.symbol}: {result.rows} rows ({result.runtime_seconds:.1f}s)")
+        elif result.status == "empty":
+            console.print(f"[yellow]-[/yellow] {result.symbol}: no data")
+        else:
+            console.print(f"[red]✗[/red] {result.symbol}: {result.error}")
+
+    results = fetch_symbols(
+        symbol_list,
+        lambda sym: loader.load_ohlcv(sym, start, end, interval=interval),
+        max_workers=max_workers,
+        on_result=_report,
+    )
+    failed = [r for r in results if r.status != "success"]
+    console.print(
+        f"\nFetched {len(results) - len(failed)}/{len(results)} symbols "
+        f"({limited.limiter.calls} provider calls, {limited.limiter.waited_seconds:.1f}s rate-limit wait)"
+    )
+    if len(failed) == len(results):
+        raise typer.Exit(code=3)
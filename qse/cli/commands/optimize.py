@@ -39,6 +39,14 @@ def optimize_strategy(
     retest: Optional[Path] = typer.Option(
         None, "--retest", help="Retest existing Top-10 list with fresh market data (<30s mode)"
     ),
+    chain_cache: bool = typer.Option(
+        False,
+        "--chain-cache/--synthetic-chain",
+        help="Serve option chains from the provider via the session chain cache (default: synthetic)",
+    ),
+    chain_cache_dir: Path = typer.Option(
+        Path("data") / "option_chains", "--chain-cache-dir", help="Option chain cache directory"
+    ),
 ) -> None:
     """
     Optimize option strategies from ticker + regime + horizon.
@@ -136,12 +144,18 @@ def optimize_strategy(
 
         try:
             # Import here to avoid circular dependencies
+            from qse.data.option_chain_cache import session_chain_cache
             from qse.optimizers.strategy_optimizer import StrategyOptimizer
 
             optimizer = StrategyOptimizer(
                 config=merged_config,
                 data_provider=provider,
                 logger=log,
+                chain_cache=(
+                    session_chain_cache(provider, chain_cache_dir, merged_config)
+                    if chain_cache
+                    else None
+                ),
             )
 
             # FR-061: Two runtime modes (full sweep vs retest)
@@ -185,6 +199,135 @@ def optimize_strategy(
             raise typer.Exit(code=3)
 
 
+def optimize_batch(
+    tickers: Optional[str] = typer.Option(None, "--tickers", help="Comma-separated tickers (e.g., NVDA,AAPL)"),
+    watchlist: Optional[Path] = typer.Option(
+        None, "--watchlist", help="Watchlist file (CSV with a symbol column, or one ticker per line)"
+    ),
+    regime: str = typer.Option(..., "--regime", help="Regime label (e.g., strong-bullish, neutral)"),
+    trade_horizon: int = typer.Option(1, "--trade-horizon", help="Trade horizon in days (default: 1)"),
+    config: Optional[Path] = typer.Option(None, "--config", help="Path to config.yml file"),
+    override: list[str] = typer.Option(
+        [], "--override", help="Override config values: --override 'mc.num_paths=10000'"
+    ),
+    data_source: str = typer.Option(
+        "schwab", "--data-source", help="Primary data provider (schwab|yfinance|schwab_stub)"
+    ),
+    allow_fallback: bool = typer.Option(
+        True, "--allow-fallback/--no-fallback", help="Fallback to yfinance on Schwab errors"
+    ),
+    access_token: Optional[str] = typer.Option(None, "--access-token", envvar="SCHWAB_ACCESS_TOKEN"),
+    timeout: float = typer.Option(10.0, "--timeout", help="HTTP timeout seconds for data provider"),
+    max_workers: Optional[int] = typer.Option(None, "--max-workers", help="Worker processes (default: min(6, CPUs))"),
+    top_n: int = typer.Option(50, "--top-n", help="Entries kept in the combined ranking"),
+    output: Optional[Path] = typer.Option(None, "--output", help="Output JSON file for the combined report"),
+    chain_cache: bool = typer.Option(
+        False,
+        "--chain-cache/--synthetic-chain",
+        help="Serve option chains from the provider via the session chain cache (default: synthetic)",
+    ),
+    chain_cache_dir: Path = typer.Option(
+        Path("data") / "option_chains", "--chain-cache-dir", help="Option chain cache directory"
+    ),
+) -> None:
+    """
+    Optimize option strategies for many tickers on one persistent worker pool.
+
+    Each worker builds the optimizer once and reuses fitted distributions;
+    per-ticker Top-10 lists are merged into one combined ranking.
+
+    Example:
+        qse optimize-batch --watchlist data/universes/watchlist.txt --regime neutral --max-workers 4
+    """
+    from qse.data.universe import load_symbol_file
+    from qse.optimizers.batch import run_optimizer_batch
+
+    symbols: list[str] = []
+    if tickers:
+        symbols.extend(t.strip().upper() for t in tickers.split(",") if t.strip())
+    if watchlist:
+        try:
+            symbols.extend(load_symbol_file(watchlist))
+        except ConfigValidationError as exc:
+            console.print(f"[red]Error: {exc}[/red]")
+            raise typer.Exit(code=1)
+    symbols = list(dict.fromkeys(symbols))
+    if not symbols:
+        console.print("[red]Error: Provide --tickers and/or --watchlist[/red]")
+        raise typer.Exit(code=1)
+
+    if trade_horizon < 1 or trade_horizon > 30:
+        console.print("[red]Error: Trade horizon must be between 1 and 30 days[/red]")
+        raise typer.Exit(code=1)
+
+    cli_overrides: dict[str, any] = {}
+    for override_str in override:
+        try:
+            if "=" not in override_str:
+                raise ValueError(f"Override must be in format 'key=value', got: {override_str}")
+            key, value = override_str.split("=", 1)
+            _set_nested_value(cli_overrides, key, _parse_value(value))
+        except Exception as exc:
+            console.print(f"[red]Error parsing override '{override_str}': {exc}[/red]")
+            raise typer.Exit(code=1)
+
+    try:
+        merged_config = load_config_with_precedence(
+            config_path=config,
+            env_prefix="QSE_",
+            cli_values=cli_overrides,
+            defaults=_get_default_config(),
+            casters=_get_config_casters(),
+        )
+    except ConfigValidationError as exc:
+        console.print(f"[red]Config validation failed: {exc}[/red]")
+        raise typer.Exit(code=1)
+
+    if regime not in merged_config.get("regimes", {}):
+        console.print(f"[red]Error: Unknown regime '{regime}'[/red]")
+        raise typer.Exit(code=1)
+
+    console.print(f"[bold cyan]Optimize Batch[/bold cyan] ({len(symbols)} tickers, regime={regime})")
+    provider_spec = {"name": data_source, "timeout": timeout, "max_retries": 3}
+    if access_token:
+        provider_spec["access_token"] = access_token
+    if allow_fallback and data_source != "yfinance":
+        provider_spec["fallback"] = "yfinance"
+
+    try:
+        report = run_optimizer_batch(
+            symbols,
+            regime=regime,
+            trade_horizon=trade_horizon,
+            config=merged_config,
+            provider_spec=provider_spec,
+            chain_cache_dir=chain_cache_dir if chain_cache else None,
+            max_workers=max_workers,
+            top_n=top_n,
+            output_path=output,
+        )
+    except Exception as exc:
+        console.print(f"[red]Batch optimization failed: {exc}[/red]")
+        log.exception("Batch optimization failed")
+        raise typer.Exit(code=3)
+
+    console.print(f"\n[bold]Top-{min(10, len(report.ranked))} across tickers:[/bold]")
+    for i, entry in enumerate(report.ranked[:10], 1):
+        metrics = entry.get("metrics") or {}
+        console.print(
+            f"  #{i}: {entry['ticker']:6s} {entry.get('structure_type', 'Unknown'):20s} | "
+            f"E[PnL]=${metrics.get('expected_pnl', 0):8.2f} | Score={metrics.get('score', 0):.3f}"
+        )
+    failed = [o for o in report.outcomes if o.status != "success"]
+    for outcome in failed:
+        console.print(f"[yellow]  {outcome.ticker}: {outcome.error}[/yellow]")
+    console.print(f"\n[cyan]Total Runtime: {report.runtime_seconds:.1f} seconds[/cyan]")
+    if output:
+        console.print(f"[green]✓[/green] Report saved to {output}")
+    if failed and len(failed) == len(report.outcomes):
+        raise typer.Exit(code=3)
+
+
 def _set_nested_value(d: dict, path: str, value: any) -> None:
     """Set nested dictionary value from dot-separated path."""
     keys = path.split(".")
@@ -232,6 +375,10 @@ def _get_default_config() -> dict:
             "min_epnl": 500,
             "min_pop_breakeven": 0.60,
         },
+        "execution": {
+            "mode": "serial",  # serial | per_expiry
+            "max_workers": None,
+        },
         "scoring": {
             "w_pop": 0.35,
             "w_roc": 0.30,
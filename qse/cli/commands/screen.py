@@ -8,10 +8,13 @@ import pandas as pd
 import typer
 
 from qse.cli.validation import validate_screen_inputs
-from qse.features.pipeline import enrich_ohlcv
+from qse.features.pipeline import enrich_panel
 from qse.selectors.gap_volume import GapVolumeSelector
-from qse.simulation.screen import screen_universe, run_strategy_screen
-from qse.data.cache import safe_load_or_fetch, parse_symbol_list
+from qse.simulation.screen import screen_panel, run_strategy_screen
+from qse.data.bulk_fetch import RateLimiter, fetch_symbols, limits_for
+from qse.data.cache import ensure_cached, fetch_symbol, parse_symbol_list
+from qse.data.compact import to_representation
+from qse.data.universe_dataset import UniverseDataset, as_panel, split_panel
 from qse.selectors.loader import load_selector
 from qse.utils.logging import get_logger
 
@@ -35,13 +38,17 @@ def screen(
     max_workers: int = typer.Option(4, help="Max workers for screening"),
     output: Path = typer.Option(Path("runs"), help="Output directory for artifacts"),
     lookback_years: float = typer.Option(None, help="Optional lookback horizon in years for universe data"),
+    compact: bool = typer.Option(
+        False, "--compact/--standard", help="Hold bars and features as float32 to halve memory"
+    ),
 ) -> None:
     validate_screen_inputs(horizon=horizon, max_workers=max_workers)
+    representation = "compact" if compact else "standard"
     valid_intervals = {"1m", "5m", "15m", "30m", "1h", "1d", "1wk", "1mo"}
     if interval not in valid_intervals:
         raise typer.Exit(code=1)
 
-    grouped: dict[str, pd.DataFrame] = {}
+    panel: pd.DataFrame | None = None
 
     if universe:
         # Universe must be a CSV file path
@@ -56,9 +63,9 @@ def screen(
             log.error("universe CSV missing required columns", extra={"missing": list(missing)})
             raise typer.Exit(code=1)
         df["date"] = pd.to_datetime(df["date"])
-        grouped = {sym: g.set_index("date").sort_index() for sym, g in df.groupby("symbol")}
+        panel = to_representation(as_panel(df), representation)
 
-    if not grouped and symbols:
+    if (panel is None or panel.empty) and symbols:
         symbol_list = parse_symbol_list(symbols)
         if not symbol_list:
             log.error("no valid symbols provided")
@@ -66,24 +73,32 @@ def screen(
         if not start or not end:
             log.error("--start and --end are required when using --symbols")
             raise typer.Exit(code=1)
-        for sym in symbol_list:
-            df = safe_load_or_fetch(sym, start=start, end=end, interval=interval, target=target)
-            if df is None or df.empty:
-                log.warning("no data for symbol", extra={"symbol": sym})
-                continue
-            df = df.sort_values("date")
-            grouped[sym] = df.set_index("date")
-
-    if not grouped:
+        # Cache misses go to yfinance concurrently, within its rate budget
+        limited_fetch = RateLimiter(limits_for("yfinance")).wrap(fetch_symbol)
+        results = fetch_symbols(
+            symbol_list,
+            lambda sym: ensure_cached(
+                sym, start=start, end=end, interval=interval, target=target, fetcher=limited_fetch
+            ),
+            max_workers=max_workers,
+        )
+        available = [r.symbol for r in results if r.status == "success"]
+        # One dataset scan over the cache tree instead of a read per symbol
+        dataset = UniverseDataset(target / "historical", interval=interval)
+        if available:
+            panel = dataset.load(available, start=start, end=end, representation=representation)
+
+    if panel is None or panel.empty:
         if not universe and not symbols:
             log.error("must provide either --universe (CSV file) or --symbols (ticker list)")
             raise typer.Exit(code=1)
         log.error("no symbols with data available")
         raise typer.Exit(code=2)
 
-    # Enrich each symbol's data with features
-    enriched = {sym: enrich_ohlcv(g, log_output=False) for sym, g in grouped.items()}
-    log.info("Feature pipeline complete", extra={"symbols_processed": len(enriched)})
+    # Features for every symbol in grouped passes over the panel
+    enriched = enrich_panel(panel)
+    symbols_processed = len(enriched["symbol"].cat.categories)
+    log.info("Feature pipeline complete", extra={"symbols_processed": symbols_processed})
 
     output.mkdir(parents=True, exist_ok=True)
     # lookback_years currently informational; hook for future slicing logic
@@ -91,7 +106,7 @@ def screen(
     # Mode A: selector-only
     if not strategy:
         selector = GapVolumeSelector(gap_min=gap_min, volume_z_min=volume_z_min, horizon=horizon)
-        candidates = screen_universe(universe=enriched, selector=selector, max_workers=max_workers, top_n=top)
+        candidates = screen_panel(panel=enriched, selector=selector, top_n=top)
         payload = [
             {
                 "symbol": c.symbol,
@@ -115,7 +130,7 @@ def screen(
     if conditional_file:
         selector = load_selector(Path(conditional_file))
     results = run_strategy_screen(
-        universe=enriched,
+        universe=split_panel(enriched),
         strategy=strategy,
         rank_by=rank_by,
         selector=selector,
@@ -2,8 +2,9 @@
 
 from __future__ import annotations
 
-from typing import List
+from typing import List, Sequence
 
+from qse.distributions.batch_audit import SymbolAuditSummary
 from qse.distributions.distribution_audit import DistributionAuditResult, ModelScore
 
 
@@ -48,4 +49,28 @@ def format_audit_result(result: DistributionAuditResult) -> str:
     return "\n".join(sections)
 
 
-__all__ = ["format_audit_result"]
+def format_batch_summary(summaries: Sequence[SymbolAuditSummary]) -> str:
+    """Return a best-model-per-symbol table for a batch audit."""
+
+    header = f"Distribution Audit Summary ({len(summaries)} symbols)"
+    width = max([6] + [len(s.symbol) for s in summaries])
+    lines = [
+        header,
+        "=" * len(header),
+        f"{'Symbol':<{width}}  {'Status':<8}  {'Best Model':<10}  {'Score':>7}  {'Time':>6}",
+    ]
+    for s in summaries:
+        score = f"{s.score:.3f}" if s.score is not None else "n/a"
+        runtime = f"{s.runtime_seconds:.1f}s" if s.status == "audited" else "-"
+        lines.append(
+            f"{s.symbol:<{width}}  {s.status:<8}  {s.best_model or '-':<10}  {score:>7}  {runtime:>6}"
+        )
+    counts = {status: sum(s.status == status for s in summaries) for status in ("audited", "cached")}
+    failed = [s for s in summaries if s.status in {"failed", "no_data"}]
+    lines.append(f"Audited: {counts['audited']}  Cached: {counts['cached']}  Failed: {len(failed)}")
+    for s in failed:
+        lines.append(f"  {s.symbol}: {s.error or 'no data'}")
+    return "\n".join(lines)
+
+
+__all__ = ["format_audit_result", "format_batch_summary"]
@@ -7,14 +7,16 @@ import sys
 import typer
 
 from qse.cli.commands.audit_distributions import audit_distributions
+from qse.cli.commands.audit_plots import audit_plots
 from qse.cli.commands.compare import compare
 from qse.cli.commands.fetch import fetch
 from qse.cli.commands.grid import grid
 from qse.cli.commands.monitor import monitor
-from qse.cli.commands.optimize import optimize_strategy
+from qse.cli.commands.optimize import optimize_batch, optimize_strategy
 from qse.cli.commands.replay import replay
 from qse.cli.commands.screen import screen
 from qse.cli.commands.conditional import conditional
+from qse.distributions.cache.fit_cache import default_fit_cache
 from qse.exceptions import (
     ConfigValidationError,
     DistributionFitError,
@@ -31,10 +33,12 @@ app.command()(compare)
 app.command()(grid)
 app.command()(monitor)
 app.command()(optimize_strategy)
+app.command()(optimize_batch)
 app.command()(replay)
 app.command()(screen)
 app.command()(conditional)
 app.command()(audit_distributions)
+app.command()(audit_plots)
 
 
 log = get_logger(__name__, component="cli")
@@ -62,6 +66,8 @@ def main() -> None:
     except Exception:
         log.exception("Unhandled exception")
         raise typer.Exit(code=255)
+    finally:
+        default_fit_cache().log_stats()
 
 
 if __name__ == "__main__":
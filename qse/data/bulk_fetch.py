@@ -0,0 +1,221 @@
+"""Concurrent multi-symbol fetching behind per-provider rate limits.
+
+Provider calls run on a thread pool (the work is I/O-bound). Every ``fetch*``
+call on a wrapped provider first takes a slot from a per-provider
+concurrency cap and a token from a token bucket, so cache hits cost nothing
+and cold fetches never exceed the provider's request budget. Each symbol is
+written by its own loader call as soon as it arrives.
+"""
+
+from __future__ import annotations
+
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from contextlib import contextmanager
+from dataclasses import dataclass
+from functools import wraps
+from typing import Any, Callable, Iterator, Sequence
+
+import pandas as pd
+
+from qse.utils.logging import get_logger
+from qse.utils.progress import ProgressReporter
+
+log = get_logger(__name__, component="bulk_fetch")
+
+
+@dataclass(frozen=True)
+class ProviderLimits:
+    """Request budget for one provider."""
+
+    rate_per_second: float
+    burst: int
+    max_concurrency: int
+
+
+# Schwab market data allows ~120 requests/minute per app; yfinance is unofficial
+# and throttles aggressively, so stay conservative.
+PROVIDER_LIMITS: dict[str, ProviderLimits] = {
+    "schwab": ProviderLimits(rate_per_second=2.0, burst=4, max_concurrency=4),
+    "yfinance": ProviderLimits(rate_per_second=1.0, burst=2, max_concurrency=2),
+    "schwab_stub": ProviderLimits(rate_per_second=50.0, burst=50, max_concurrency=8),
+}
+DEFAULT_LIMITS = ProviderLimits(rate_per_second=1.0, burst=2, max_concurrency=2)
+
+
+def limits_for(provider_name: str | None) -> ProviderLimits:
+    """Limits for a provider name (``schwab+yfinance`` resolves to the primary)."""
+
+    primary = (provider_name or "").split("+", 1)[0].lower()
+    return PROVIDER_LIMITS.get(primary, DEFAULT_LIMITS)
+
+
+class TokenBucket:
+    """Thread-safe token bucket; ``acquire`` blocks until a token is available."""
+
+    def __init__(
+        self,
+        rate: float,
+        capacity: float | None = None,
+        *,
+        clock: Callable[[], float] = time.monotonic,
+        sleep: Callable[[float], None] = time.sleep,
+    ) -> None:
+        if rate <= 0:
+            raise ValueError("rate must be positive")
+        self.rate = float(rate)
+        self.capacity = float(capacity if capacity is not None else max(1.0, rate))
+        self._tokens = self.capacity
+        self._clock = clock
+        self._sleep = sleep
+        self._updated = clock()
+        self._lock = threading.Lock()
+
+    def acquire(self, tokens: float = 1.0) -> float:
+        """Take ``tokens``; return seconds spent waiting."""
+
+        waited = 0.0
+        while True:
+            with self._lock:
+                now = self._clock()
+                self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+                self._updated = now
+                if self._tokens >= tokens:
+                    self._tokens -= tokens
+                    return waited
+                wait = (tokens - self._tokens) / self.rate
+            self._sleep(wait)
+            waited += wait
+
+
+class RateLimiter:
+    """Concurrency cap plus token bucket for one provider."""
+
+    def __init__(self, limits: ProviderLimits, *, bucket: TokenBucket | None = None) -> None:
+        self.limits = limits
+        self.bucket = bucket or TokenBucket(limits.rate_per_second, limits.burst)
+        self._slots = threading.BoundedSemaphore(max(1, limits.max_concurrency))
+        self.calls = 0
+        self.waited_seconds = 0.0
+        self._lock = threading.Lock()
+
+    @contextmanager
+    def slot(self) -> Iterator[None]:
+        with self._slots:
+            waited = self.bucket.acquire()
+            with self._lock:
+                self.calls += 1
+                self.waited_seconds += waited
+            yield
+
+    def wrap(self, fn: Callable) -> Callable:
+        @wraps(fn)
+        def limited(*args, **kwargs):
+            with self.slot():
+                return fn(*args, **kwargs)
+
+        return limited
+
+
+class RateLimitedSource:
+    """Provider proxy that throttles every ``fetch*`` method through a limiter."""
+
+    def __init__(self, source, limiter: RateLimiter | None = None) -> None:
+        self._source = source
+        self.limiter = limiter or RateLimiter(limits_for(getattr(source, "name", None)))
+
+    @property
+    def name(self) -> str | None:
+        return getattr(self._source, "name", None)
+
+    def __getattr__(self, attr: str):
+        value = getattr(self._source, attr)
+        if attr.startswith("fetch") and callable(value):
+            return self.limiter.wrap(value)
+        return value
+
+
+@dataclass
+class SymbolFetchResult:
+    """Outcome for one symbol in a bulk fetch."""
+
+    symbol: str
+    status: str  # success | empty | failed
+    rows: int = 0
+    error: str | None = None
+    runtime_seconds: float = 0.0
+
+
+def fetch_symbols(
+    symbols: Sequence[str],
+    load: Callable[[str], Any],
+    *,
+    max_workers: int = 4,
+    on_result: Callable[[SymbolFetchResult, Any], None] | None = None,
+) -> list[SymbolFetchResult]:
+    """Run ``load(symbol)`` concurrently and report per-symbol outcomes.
+
+    ``load`` is expected to persist its own partition (e.g. ``DataLoader.load_ohlcv``)
+    so data lands on disk as each symbol completes. It returns the bars, or
+    any other non-None value (such as the cache path) when only persistence
+    matters. ``on_result`` is called from the calling thread as results
+    arrive. Results are returned in input order.
+    """
+
+    symbols = list(dict.fromkeys(symbols))
+    progress = ProgressReporter(total=len(symbols), log=log, component="bulk_fetch")
+    results: dict[str, SymbolFetchResult] = {}
+
+    def _run(symbol: str) -> tuple[SymbolFetchResult, Any]:
+        start = time.time()
+        try:
+            df = load(symbol)
+        except Exception as exc:  # noqa: BLE001 - reported per symbol
+            elapsed = time.time() - start
+            failed = SymbolFetchResult(symbol, "failed", error=str(exc), runtime_seconds=elapsed)
+            return failed, None
+        elapsed = time.time() - start
+        if df is None or (isinstance(df, pd.DataFrame) and df.empty):
+            return SymbolFetchResult(symbol, "empty", runtime_seconds=elapsed), None
+        rows = len(df) if isinstance(df, pd.DataFrame) else 0
+        return SymbolFetchResult(symbol, "success", rows=rows, runtime_seconds=elapsed), df
+
+    with ThreadPoolExecutor(max_workers=max(1, int(max_workers))) as executor:
+        futures = {executor.submit(_run, symbol): symbol for symbol in symbols}
+        for future in as_completed(futures):
+            result, df = future.result()
+            results[result.symbol] = result
+            if result.status == "failed":
+                log.error(
+                    "symbol fetch failed", extra={"symbol": result.symbol, "error": result.error}
+                )
+            elif result.status == "empty":
+                log.warning("no data for symbol", extra={"symbol": result.symbol})
+            if on_result is not None:
+                on_result(result, df)
+            progress.tick("bulk fetch")
+
+    ordered = [results[s] for s in symbols]
+    log.info(
+        "bulk fetch complete",
+        extra={
+            "symbols": len(ordered),
+            "failed": sum(r.status == "failed" for r in ordered),
+            "empty": sum(r.status == "empty" for r in ordered),
+        },
+    )
+    return ordered
+
+
+__all__ = [
+    "DEFAULT_LIMITS",
+    "PROVIDER_LIMITS",
+    "ProviderLimits",
+    "RateLimitedSource",
+    "RateLimiter",
+    "SymbolFetchResult",
+    "TokenBucket",
+    "fetch_symbols",
+    "limits_for",
+]
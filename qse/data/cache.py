@@ -4,10 +4,14 @@ from __future__ import annotations
 
 import ast
 from pathlib import Path
+from typing import Callable
 
 import pandas as pd
 import yfinance as yf
 
+from qse.data.compact import Representation, to_representation
+from qse.data.parquet_io import column_bounds, read_parquet_range, write_sorted_parquet
+
 
 def fetch_symbol(symbol: str, start: str, end: str, interval: str, target: Path) -> pd.DataFrame:
     ticker = yf.Ticker(symbol)
@@ -21,38 +25,103 @@ def fetch_symbol(symbol: str, start: str, end: str, interval: str, target: Path)
     df["symbol"] = symbol
     df["interval"] = interval
 
-    output_dir = target / "historical" / f"interval={interval}" / f"symbol={symbol}" / "_v1"
-    output_dir.mkdir(parents=True, exist_ok=True)
-    output_file = output_dir / "data.parquet"
-    df.to_parquet(output_file, index=False, engine="pyarrow", compression="snappy")
+    output_file = cache_path(target, interval, symbol)
+    output_file.parent.mkdir(parents=True, exist_ok=True)
+    write_sorted_parquet(df, output_file, sort_column="date", index=False)
     return df
 
 
-def load_or_fetch(symbol: str, start: str, end: str, interval: str, target: Path) -> pd.DataFrame:
-    path = target / "historical" / f"interval={interval}" / f"symbol={symbol}" / "_v1" / "data.parquet"
+def load_or_fetch(
+    symbol: str,
+    start: str,
+    end: str,
+    interval: str,
+    target: Path,
+    *,
+    fetcher: Callable[..., pd.DataFrame] | None = None,
+    representation: Representation = "standard",
+) -> pd.DataFrame:
+    """Return cached bars for the window, fetching via `fetcher` on a miss.
+
+    `fetcher` defaults to ``fetch_symbol``. ``representation="compact"``
+    returns float32 prices, uint32 volume and categorical symbol/interval.
+    """
+
+    fetcher = fetcher or fetch_symbol
+    path = cache_path(target, interval, symbol)
     start_ts = pd.to_datetime(start)
     end_ts = pd.to_datetime(end)
 
-    if path.exists():
-        df = pd.read_parquet(path, engine="pyarrow")
+    if _covers(path, start_ts, end_ts):
+        # Only the requested range is decoded
+        df = read_parquet_range(path, start=start_ts, end=end_ts, column="date")
         df["date"] = pd.to_datetime(df["date"]).dt.tz_localize(None)
-        min_date, max_date = df["date"].min(), df["date"].max()
-        if start_ts < min_date or end_ts > max_date:
-            df = fetch_symbol(symbol, start, end, interval, target)
-        else:
-            mask = (df["date"] >= start_ts) & (df["date"] <= end_ts)
-            df = df.loc[mask].copy()
+        mask = (df["date"] >= start_ts) & (df["date"] <= end_ts)
+        df = df.loc[mask].reset_index(drop=True)
     else:
-        df = fetch_symbol(symbol, start, end, interval, target)
-
-    return df
-
-
-def safe_load_or_fetch(symbol: str, start: str, end: str, interval: str, target: Path) -> pd.DataFrame | None:
+        df = fetcher(symbol, start, end, interval, target)
+
+    return to_representation(df, representation)
+
+
+def ensure_cached(
+    symbol: str,
+    start: str,
+    end: str,
+    interval: str,
+    target: Path,
+    *,
+    fetcher: Callable[..., pd.DataFrame] | None = None,
+) -> Path:
+    """Fetch `symbol` only if its cache file does not cover the window; return the file path.
+
+    Unlike ``load_or_fetch`` no bars are decoded on a hit, so callers that scan
+    the cache tree afterwards (``UniverseDataset``) read each file once.
+    """
+
+    path = cache_path(target, interval, symbol)
+    if not _covers(path, pd.to_datetime(start), pd.to_datetime(end)):
+        (fetcher or fetch_symbol)(symbol, start, end, interval, target)
+    return path
+
+
+def cache_path(target: Path, interval: str, symbol: str) -> Path:
+    symbol_dir = target / "historical" / f"interval={interval}" / f"symbol={symbol}"
+    return symbol_dir / "_v1" / "data.parquet"
+
+
+def _covers(path: Path, start_ts: pd.Timestamp, end_ts: pd.Timestamp) -> bool:
+    if not path.exists():
+        return False
+    # Coverage comes from row-group statistics
+    min_date, max_date = (
+        None if ts is None else ts.tz_localize(None) for ts in column_bounds(path, "date")
+    )
+    return min_date is not None and min_date <= start_ts and end_ts <= max_date
+
+
+def safe_load_or_fetch(
+    symbol: str,
+    start: str,
+    end: str,
+    interval: str,
+    target: Path,
+    *,
+    fetcher: Callable[..., pd.DataFrame] | None = None,
+    representation: Representation = "standard",
+) -> pd.DataFrame | None:
     """Wrapper that returns None instead of raising when data is missing."""
 
     try:
-        df = load_or_fetch(symbol, start=start, end=end, interval=interval, target=target)
+        df = load_or_fetch(
+            symbol,
+            start=start,
+            end=end,
+            interval=interval,
+            target=target,
+            fetcher=fetcher,
+            representation=representation,
+        )
     except Exception:
         return None
     if df is None or df.empty:
@@ -74,4 +143,4 @@ def parse_symbol_list(raw: str) -> list[str]:
     return [s.strip().strip("'\"") for s in cleaned.split(",") if s.strip().strip("'\"")]
 
 
-__all__ = ["fetch_symbol", "load_or_fetch", "parse_symbol_list"]
+__all__ = ["cache_path", "ensure_cached", "fetch_symbol", "load_or_fetch", "parse_symbol_list"]
@@ -0,0 +1,122 @@
+"""Cross-process partition locks and atomic writes for the on-disk data cache.
+
+Grid, screen and audit workers share one ``data/historical`` tree. Each
+partition (``.../symbol=S/_vN/``) has a ``.lock`` file taken with
+``fcntl.flock`` around writes, and, in single-flight mode, around the whole
+check-fetch-write sequence so concurrent requests for a missing partition
+wait for one fetch instead of duplicating it. Locks are re-entrant within a
+process (threads serialise on an in-process lock first). Data, metadata and
+manifests are written to a temp file and renamed into place, so readers
+never see a partially written file and need no lock.
+
+On platforms without ``fcntl`` the locks only serialise threads.
+"""
+
+from __future__ import annotations
+
+import os
+import threading
+import time
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Callable, Iterator
+
+from qse.exceptions import DataSourceError
+
+try:  # pragma: no cover - exercised implicitly on POSIX
+    import fcntl
+except ImportError:  # pragma: no cover - Windows
+    fcntl = None  # type: ignore[assignment]
+
+LOCK_NAME = ".lock"
+DEFAULT_LOCK_TIMEOUT = float(os.getenv("QSE_CACHE_LOCK_TIMEOUT", "300"))
+_POLL_SECONDS = 0.05
+
+
+@dataclass
+class _HeldLock:
+    mutex: threading.RLock = field(default_factory=threading.RLock)
+    depth: int = 0
+    fd: int | None = None
+
+
+_registry: dict[str, _HeldLock] = {}
+_registry_guard = threading.Lock()
+
+
+def _held(path: Path) -> _HeldLock:
+    key = str(path.resolve())
+    with _registry_guard:
+        return _registry.setdefault(key, _HeldLock())
+
+
+@contextmanager
+def partition_lock(directory: Path, *, timeout: float = DEFAULT_LOCK_TIMEOUT) -> Iterator[None]:
+    """Hold the exclusive lock of a cache partition directory.
+
+    Raises ``DataSourceError`` if the lock is not acquired within ``timeout``
+    seconds.
+    """
+
+    directory.mkdir(parents=True, exist_ok=True)
+    path = directory / LOCK_NAME
+    held = _held(path)
+    deadline = time.monotonic() + max(0.0, timeout)
+    if not held.mutex.acquire(timeout=max(0.0, timeout)):
+        raise DataSourceError(f"Timed out waiting for cache lock {path}")
+    try:
+        if held.depth == 0:
+            held.fd = _acquire_file_lock(path, deadline)
+        held.depth += 1
+        try:
+            yield
+        finally:
+            held.depth -= 1
+            if held.depth == 0 and held.fd is not None:
+                if fcntl is not None:
+                    fcntl.flock(held.fd, fcntl.LOCK_UN)
+                os.close(held.fd)
+                held.fd = None
+    finally:
+        held.mutex.release()
+
+
+def _acquire_file_lock(path: Path, deadline: float) -> int | None:
+    if fcntl is None:
+        return None
+    fd = os.open(path, os.O_RDWR | os.O_CREAT, 0o644)
+    while True:
+        try:
+            fcntl.flock(fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+            return fd
+        except BlockingIOError:
+            if time.monotonic() >= deadline:
+                os.close(fd)
+                raise DataSourceError(f"Timed out waiting for cache lock {path}") from None
+            time.sleep(_POLL_SECONDS)
+
+
+def atomic_write(path: Path, write: Callable[[Path], None]) -> None:
+    """Call ``write(tmp)`` on a sibling temp file, then rename it over ``path``."""
+
+    tmp = path.with_name(f".{path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+    try:
+        write(tmp)
+        os.replace(tmp, path)
+    except BaseException:
+        tmp.unlink(missing_ok=True)
+        raise
+
+
+def atomic_write_text(path: Path, text: str) -> None:
+    atomic_write(path, lambda tmp: tmp.write_text(text))
+
+
+__all__ = [
+    "DEFAULT_LOCK_TIMEOUT",
+    "LOCK_NAME",
+    "atomic_write",
+    "atomic_write_text",
+    "partition_lock",
+]
@@ -0,0 +1,139 @@
+"""Compact in-memory OHLCV representation.
+
+Standard frames use float64 prices/features and, from ``fetch_symbol``,
+object ``symbol``/``interval`` columns. The compact representation stores
+prices and derived features as float32 (~7 significant digits, ample for
+quotes and indicators), volume as uint32 when it fits (else int64),
+``symbol``/``interval`` as categoricals and timestamps as ``datetime64[ns]``
+(int64 nanoseconds). It roughly halves memory for intraday universes.
+Conversion happens at the loader boundary; which representation a frame
+uses is recorded in cache metadata and in ``df.attrs``.
+"""
+
+from __future__ import annotations
+
+from typing import Literal
+
+import numpy as np
+import pandas as pd
+
+Representation = Literal["standard", "compact"]
+
+PRICE_COLUMNS = ("open", "high", "low", "close")
+CATEGORY_COLUMNS = ("symbol", "interval")
+_UINT32_MAX = np.iinfo(np.uint32).max
+
+
+def compact_ohlcv(df: pd.DataFrame) -> pd.DataFrame:
+    """Return ``df`` in the compact representation (other columns untouched).
+
+    Frames that are already compact are returned as-is, without a copy.
+    """
+
+    converted: dict[str, pd.Series] = {}
+    for column in df.columns:
+        series = df[column]
+        if column == "volume":
+            target = _compact_volume(series)
+        elif column in CATEGORY_COLUMNS:
+            is_category = isinstance(series.dtype, pd.CategoricalDtype)
+            target = series if is_category else series.astype("category")
+        elif pd.api.types.is_datetime64_any_dtype(series.dtype):
+            target = _as_ns(series)
+        elif series.dtype == np.float64:
+            target = series.astype(np.float32)
+        else:
+            continue
+        if target is not series:
+            converted[column] = target
+    index = _as_ns(df.index) if isinstance(df.index, pd.DatetimeIndex) else df.index
+    if not converted and index is df.index:
+        return df
+
+    out = df.assign(**converted) if converted else df.copy()
+    out.index = index
+    out.attrs["representation"] = "compact"
+    return out
+
+
+def expand_ohlcv(df: pd.DataFrame) -> pd.DataFrame:
+    """Return ``df`` with float32 columns widened to float64 (standard representation)."""
+
+    float32 = [c for c in df.columns if df[c].dtype == np.float32]
+    out = df.astype({c: np.float64 for c in float32}) if float32 else df.copy()
+    out.attrs["representation"] = "standard"
+    return out
+
+
+def to_representation(df: pd.DataFrame, representation: Representation) -> pd.DataFrame:
+    if representation == "compact":
+        return compact_ohlcv(df)
+    if any(df[c].dtype == np.float32 for c in df.columns):
+        return expand_ohlcv(df)
+    return df
+
+
+def is_compact(df: pd.DataFrame) -> bool:
+    """True when the price columns are float32."""
+
+    prices = [c for c in PRICE_COLUMNS if c in df.columns]
+    return bool(prices) and all(df[c].dtype == np.float32 for c in prices)
+
+
+def match_precision(out: pd.DataFrame, source: pd.DataFrame) -> pd.DataFrame:
+    """Downcast float64 columns of ``out`` to float32 when ``source`` is compact.
+
+    Rolling/ewm kernels compute in float64 internally; this keeps derived
+    features in the caller's representation.
+    """
+
+    if not is_compact(source):
+        return out
+    wide = [c for c in out.columns if out[c].dtype == np.float64]
+    if wide:
+        out[wide] = out[wide].astype(np.float32)
+    out.attrs["representation"] = "compact"
+    return out
+
+
+def dtype_summary(df: pd.DataFrame) -> dict[str, str]:
+    """Column -> dtype name, for metadata."""
+
+    summary = {str(c): str(t) for c, t in df.dtypes.items()}
+    summary["__index__"] = str(df.index.dtype)
+    return summary
+
+
+def _compact_volume(series: pd.Series) -> pd.Series:
+    values = series.to_numpy()
+    if series.dtype.kind in "iu":
+        integral = True
+    elif series.dtype.kind == "f":
+        finite = np.isfinite(values)
+        integral = bool(finite.all()) and bool(np.all(values == np.round(values)))
+    else:
+        return series
+    if not integral:
+        return series.astype(np.float32) if series.dtype == np.float64 else series
+    if len(values) == 0 or (values.min() >= 0 and values.max() <= _UINT32_MAX):
+        return series if series.dtype == np.uint32 else series.astype(np.uint32)
+    return series if series.dtype == np.int64 else series.astype(np.int64)
+
+
+def _as_ns(values):
+    tz = getattr(values.dtype, "tz", None)
+    target = f"datetime64[ns, {tz}]" if tz is not None else "datetime64[ns]"
+    return values if str(values.dtype) == target else values.astype(target)
+
+
+__all__ = [
+    "CATEGORY_COLUMNS",
+    "PRICE_COLUMNS",
+    "Representation",
+    "compact_ohlcv",
+    "dtype_summary",
+    "expand_ohlcv",
+    "is_compact",
+    "match_precision",
+    "to_representation",
+]
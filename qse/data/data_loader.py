@@ -9,13 +9,38 @@ from typing import Literal
 
 import pandas as pd
 
+from qse.data.cache_lock import (
+    DEFAULT_LOCK_TIMEOUT,
+    atomic_write,
+    atomic_write_text,
+    partition_lock,
+)
+from qse.data.compact import (
+    Representation,
+    compact_ohlcv,
+    dtype_summary,
+    is_compact,
+    to_representation,
+)
+from qse.data.frame_cache import FrameCache, default_frame_cache
+from qse.data.parquet_io import read_parquet_range, write_sorted_parquet
+from qse.data.partitioned_store import PartitionedStore, granularity_for_interval
+from qse.data.resolution import derivable_from
 from qse.data.validation import (
+    FINGERPRINT_VERSION,
+    REQUIRED_COLUMNS,
+    Fingerprint,
     compute_fingerprint,
+    fingerprint_version,
     validate_option_chain,
     validate_ohlcv,
 )
 from qse.exceptions import DataSourceError
 
+# Parquet files at least this large are range-read (pushdown) instead of
+# being parsed whole into the frame cache.
+PUSHDOWN_MIN_BYTES = 8 * 1024 * 1024
+
 
 class DataLoader:
     def __init__(
@@ -24,12 +49,40 @@ class DataLoader:
         category: Literal["historical", "features", "option_chains"] = "historical",
         storage_format: Literal["parquet", "pickle"] = "parquet",
         data_source=None,
+        frame_cache: FrameCache | None = None,
+        layout: Literal["single", "partitioned"] = "single",
+        representation: Representation = "standard",
+        single_flight: bool = False,
+        lock_timeout: float = DEFAULT_LOCK_TIMEOUT,
+        derive: bool = False,
     ) -> None:
         """Create a loader for OHLCV/feature data.
 
         `base_dir` should point to the partition root (e.g., data/historical).
         Storage format defaults to parquet; tests may use pickle to avoid optional
-        parquet dependencies.
+        parquet dependencies. Parsed files are served from `frame_cache`
+        (the process-wide cache by default); returned frames are shared slices
+        and must not be modified in place.
+
+        `layout="partitioned"` writes OHLCV as year (daily) or month (intraday)
+        partitions with a manifest so incremental updates only rewrite the
+        latest partition. Reads detect the layout from ``data.meta.json``.
+
+        `representation="compact"` converts fetched bars to float32 prices,
+        uint32 volume and ns timestamps (see ``qse.data.compact``) as they
+        enter the loader; they are cached that way (recorded as
+        ``representation`` in the metadata) and returned compact.
+
+        Cache writes always hold the partition's file lock and replace files
+        atomically. `single_flight=True` also holds it across the
+        check-fetch-write of a cache miss, so parallel workers (threads or
+        processes) asking for the same missing or stale partition wait for
+        one fetch and then read its result; fresh cache hits never lock.
+
+        `derive=True` serves 5m/1d requests from bars resampled out of a
+        stored finer tier (see ``qse.data.resampling``) whenever that tier
+        covers ``[start, end]``, without contacting the provider. The derived
+        bars are as current as the stored tier; refresh it to pull new bars.
         """
 
         if category == "historical" and "historical" not in base_dir.parts:
@@ -42,7 +95,14 @@ class DataLoader:
         self.base_dir = base_dir
         self.category = category
         self.storage_format = storage_format
+        self.layout = layout
+        self.representation = representation
+        self.single_flight = single_flight
+        self.lock_timeout = lock_timeout
+        self.derive = derive
+        self._resampler = None
         self.data_source = data_source
+        self.frame_cache = frame_cache if frame_cache is not None else default_frame_cache()
         self.base_dir.mkdir(parents=True, exist_ok=True)
 
     def load_ohlcv(
@@ -54,8 +114,64 @@ class DataLoader:
         version: str | None = None,
         force_refresh: bool = False,
         allow_stale_cache: bool = False,
+        columns: list[str] | None = None,
     ) -> pd.DataFrame:
+        """Load OHLCV bars for ``[start, end]``, refreshing the cache as needed.
+
+        `columns` limits the returned (and, for large parquet files, decoded)
+        columns; the index is always kept.
+        """
+
         partition_dir = self._resolve_partition(symbol, f"interval={interval}", version)
+        if not force_refresh:
+            hit = self._fresh_cache_hit(partition_dir, start, end, interval, columns)
+            if hit is not None:
+                return hit
+            derive = self.derive and version is None
+            source = self.derived_source(symbol, start, end, interval) if derive else None
+            if source is not None:
+                df = self.resampler.load(symbol, start, end, target=interval, source=source)
+                return self._finish(df, columns)
+        args = (partition_dir, symbol, start, end, interval, force_refresh, allow_stale_cache, columns)
+        if not self.single_flight:
+            return self._load_ohlcv(*args)
+        with partition_lock(partition_dir, timeout=self.lock_timeout):
+            # Another worker may have filled the partition while we waited
+            return self._load_ohlcv(*args)
+
+    def _fresh_cache_hit(
+        self, partition_dir: Path, start: str, end: str, interval: str, columns: list[str] | None
+    ) -> pd.DataFrame | None:
+        """Serve a fresh, covering cache without locking (files are replaced atomically)."""
+
+        meta_path = partition_dir / "data.meta.json"
+        if not meta_path.exists():
+            return None
+        try:
+            meta = self._read_meta(meta_path)
+            if not _is_fresh(meta, start, end, interval):
+                return None
+            data_path = partition_dir / "data.parquet"
+            if not data_path.exists() and (partition_dir / "data.pkl").exists():
+                data_path = partition_dir / "data.pkl"
+            if meta.get("layout") != "partitioned" and not data_path.exists():
+                return None
+            df = self._read_cache(data_path, meta, start=start, end=end, columns=columns)
+        except Exception:
+            return None
+        return self._finish(df.loc[start:end], columns)
+
+    def _load_ohlcv(
+        self,
+        partition_dir: Path,
+        symbol: str,
+        start: str,
+        end: str,
+        interval: str,
+        force_refresh: bool,
+        allow_stale_cache: bool,
+        columns: list[str] | None,
+    ) -> pd.DataFrame:
         parquet_path = partition_dir / "data.parquet"
         pickle_path = partition_dir / "data.pkl"
         cache_meta_path = partition_dir / "data.meta.json"
@@ -71,61 +187,152 @@ class DataLoader:
         if force_refresh:
             df = self._fetch_from_source(symbol, start, end, interval)
             self._write_cache(data_path, cache_meta_path, df, symbol, start, end)
-            return df
+            return self._finish(df, columns)
 
-        if data_path.exists() and cache_meta_path.exists():
+        has_data = data_path.exists() or self._store(partition_dir).exists()
+        if has_data and cache_meta_path.exists():
             try:
-                cache_meta = json.loads(cache_meta_path.read_text())
-                fetched_at = pd.Timestamp(cache_meta.get("fetched_at"))
+                cache_meta = self._read_meta(cache_meta_path)
                 cached_start = pd.Timestamp(cache_meta.get("start"))
                 cached_end = pd.Timestamp(cache_meta.get("end"))
                 last_close = cache_meta.get("last_close")
-                stale_threshold = timedelta(days=1 if interval == "1d" else 0)
-                is_stale = (datetime.utcnow() - fetched_at.to_pydatetime()) > stale_threshold
-                has_coverage = cached_start <= pd.Timestamp(start) and cached_end >= pd.Timestamp(end)
-                if has_coverage and not is_stale:
-                    df = self._read_cache(cache_path, cache_meta)
-                    return df.loc[start:end]
-
-                if not is_stale and cached_end < pd.Timestamp(end):
+                is_stale = _is_stale(cache_meta, interval)
+                if _is_fresh(cache_meta, start, end, interval):
+                    df = self._read_cache(cache_path, cache_meta, start=start, end=end, columns=columns)
+                    return self._finish(df.loc[start:end], columns)
+
+                # Partitioned caches covering the older range refresh from their
+                # end even when stale, so only the latest partitions are rewritten
+                partitioned = (
+                    cache_meta.get("layout") == "partitioned" and cached_start <= pd.Timestamp(start)
+                )
+                if (not is_stale and cached_end < pd.Timestamp(end)) or (is_stale and partitioned):
                     # Corporate action detection via overlap bar
                     overlap_start = cached_end.date().isoformat()
                     overlap_end = (cached_end + timedelta(days=1)).date().isoformat()
                     overlap = self._fetch_from_source(symbol, overlap_start, overlap_end, interval)
                     if len(overlap) > 0 and last_close is not None:
-                        fresh_close = float(overlap.iloc[0]["close"])
+                        layout = cache_meta.get("layout")
+                        last_bar = self._last_cached_bar(partition_dir) if layout == "partitioned" else None
+                        fresh_close = _overlap_close(overlap, last_bar)
                         divergence = abs(fresh_close - last_close) / last_close
                         if divergence > 0.01:
                             # Trigger full refresh
                             df = self._fetch_from_source(symbol, start, end, interval)
                             self._write_cache(data_path, cache_meta_path, df, symbol, start, end)
-                            return df
+                            return self._finish(df, columns)
 
                     # No corporate action detected, fetch incremental
-                    incremental = self._fetch_from_source(
-                        symbol, cached_end.date().isoformat(), end, interval
-                    )
+                    if pd.Timestamp(end) > cached_end:
+                        incremental = self._fetch_from_source(symbol, overlap_start, end, interval)
+                    else:
+                        # Stale but covering: the overlap window holds the bars to refresh
+                        incremental = overlap
+                    if cache_meta.get("layout") == "partitioned":
+                        # Append-only: only partitions the new bars fall in are rewritten
+                        new_end = end if pd.Timestamp(end) > cached_end else cache_meta.get("end")
+                        self._append_partitions(
+                            partition_dir, cache_meta_path, cache_meta, incremental, new_end
+                        )
+                        df = self._read_cache(cache_path, self._read_meta(cache_meta_path), start=start, end=end)
+                        return self._finish(df.loc[start:end], columns)
                     df_cached = self._read_cache(cache_path, cache_meta)
                     df = pd.concat([df_cached, incremental]).sort_index()
                     df = df[~df.index.duplicated(keep="last")]
                     self._write_cache(
-                        data_path, cache_meta_path, df, symbol, cached_start.isoformat(), end
+                        data_path,
+                        cache_meta_path,
+                        df,
+                        symbol,
+                        cached_start.isoformat(),
+                        end,
+                        fingerprint=_appended_fingerprint(cache_meta, df_cached, incremental, df),
                     )
-                    return df.loc[start:end]
+                    return self._finish(df.loc[start:end], columns)
             except Exception:
                 if not allow_stale_cache:
                     raise
 
             if allow_stale_cache:
                 try:
-                    meta = json.loads(cache_meta_path.read_text())
-                    return self._read_cache(cache_path, meta)
+                    meta = self._read_meta(cache_meta_path)
+                    return self._finish(self._read_cache(cache_path, meta).iloc[:], columns)
                 except Exception:
                     pass
 
         df = self._fetch_from_source(symbol, start, end, interval)
         self._write_cache(data_path, cache_meta_path, df, symbol, start, end)
-        return df
+        return self._finish(df, columns)
+
+    @property
+    def resampler(self):
+        """``ResampleCache`` serving derived tiers for this loader (created on first use)."""
+
+        if self._resampler is None:
+            # qse.data.resampling builds on DataLoader, so import it lazily
+            from qse.data.resampling import ResampleCache
+
+            self._resampler = ResampleCache(self)
+        return self._resampler
+
+    def derived_source(self, symbol: str, start: str, end: str, interval: str) -> str | None:
+        """Stored finer tier covering ``[start, end]`` that ``interval`` bars can be built from."""
+
+        for source in derivable_from(interval):
+            meta = self.cache_meta(symbol, source)
+            if meta is not None and _covers(meta, start, end):
+                return source
+        return None
+
+    def partitioned_store(
+        self, symbol: str, interval: str = "1d", version: str | None = None
+    ) -> PartitionedStore | None:
+        """Store behind a partitioned cache (None when not cached or single-file)."""
+
+        meta = self.cache_meta(symbol, interval, version)
+        if meta is None or meta.get("layout") != "partitioned":
+            return None
+        return self._store(self._resolve_partition(symbol, f"interval={interval}", version))
+
+    def cache_meta(self, symbol: str, interval: str = "1d", version: str | None = None) -> dict | None:
+        """Return the cached metadata for ``symbol``/``interval`` (None if not cached)."""
+
+        partition_dir = self._resolve_partition(symbol, f"interval={interval}", version)
+        meta_path = partition_dir / "data.meta.json"
+        if not meta_path.exists():
+            return None
+        return self._read_meta(meta_path)
+
+    def read_cached(
+        self,
+        symbol: str,
+        interval: str = "1d",
+        *,
+        version: str | None = None,
+        start: str | None = None,
+        end: str | None = None,
+        columns: list[str] | None = None,
+    ) -> pd.DataFrame | None:
+        """Return cached bars without contacting the provider (None if not cached).
+
+        Unlike ``load_ohlcv`` this ignores staleness; ``start``/``end`` slice
+        the result when given.
+        """
+
+        partition_dir = self._resolve_partition(symbol, f"interval={interval}", version)
+        meta_path = partition_dir / "data.meta.json"
+        if not meta_path.exists():
+            return None
+        meta = self._read_meta(meta_path)
+        data_path = partition_dir / "data.parquet"
+        if not data_path.exists() and (partition_dir / "data.pkl").exists():
+            data_path = partition_dir / "data.pkl"
+        if meta.get("layout") != "partitioned" and not data_path.exists():
+            return None
+        df = self._read_cache(data_path, meta, start=start, end=end, columns=columns)
+        if start is not None or end is not None:
+            df = df.loc[start:end]
+        return self._finish(df, columns)
 
     def load_option_chain(
         self,
@@ -143,11 +350,11 @@ class DataLoader:
 
         if not force_refresh and data_path.exists() and cache_meta_path.exists():
             try:
-                meta = json.loads(cache_meta_path.read_text())
+                meta = self._read_meta(cache_meta_path)
                 cached_expiry = meta.get("expiry")
                 cached_as_of = meta.get("as_of")
                 if cached_expiry == (expiry or "all") and cached_as_of == as_of:
-                    return self._read_cache(data_path, meta)
+                    return self._read_cache(data_path, meta).iloc[:]
             except Exception:
                 if not force_refresh:
                     pass
@@ -156,10 +363,6 @@ class DataLoader:
             raise DataSourceError("Configured data source does not support option chains")
         df = self.data_source.fetch_option_chain(symbol=symbol, expiry=expiry)
         validate_option_chain(df)
-        if data_path.suffix == ".parquet":
-            df.to_parquet(data_path)
-        else:
-            df.to_pickle(data_path)
         meta = {
             "symbol": symbol,
             "expiry": expiry or "all",
@@ -168,16 +371,32 @@ class DataLoader:
             "storage_format": self.storage_format,
             "data_source": getattr(self.data_source, "name", None),
         }
-        cache_meta_path.write_text(json.dumps(meta, indent=2))
+        with partition_lock(partition_dir, timeout=self.lock_timeout):
+            self.frame_cache.invalidate(data_path)
+            self.frame_cache.invalidate(cache_meta_path)
+            if data_path.suffix == ".parquet":
+                atomic_write(data_path, df.to_parquet)
+            else:
+                atomic_write(data_path, df.to_pickle)
+            atomic_write_text(cache_meta_path, json.dumps(meta, indent=2))
         return df
 
     def _fetch_from_source(self, symbol: str, start: str, end: str, interval: str) -> pd.DataFrame:
+        df = self._fetch_raw(symbol, start, end, interval)
+        if self.representation == "compact" and isinstance(df, pd.DataFrame):
+            df = compact_ohlcv(df)
+        return df
+
+    def _fetch_raw(self, symbol: str, start: str, end: str, interval: str) -> pd.DataFrame:
         if self.data_source is None:
             raise DataSourceError("No data source configured; provide data_source or override")
         if hasattr(self.data_source, "fetch_ohlcv"):
             return self.data_source.fetch_ohlcv(symbol=symbol, start=start, end=end, interval=interval)
         return self.data_source.fetch(symbol=symbol, start=start, end=end, interval=interval)
 
+    def _finish(self, df: pd.DataFrame, columns: list[str] | None) -> pd.DataFrame:
+        return to_representation(_project(df, columns), self.representation)
+
     def _write_cache(
         self,
         data_path: Path,
@@ -186,33 +405,118 @@ class DataLoader:
         symbol: str,
         start: str,
         end: str,
+        *,
+        fingerprint: str | None = None,
     ) -> None:
+        if self.representation == "compact":
+            df = compact_ohlcv(df)
         validate_ohlcv(df)
-        if data_path.suffix == ".parquet":
-            df.to_parquet(data_path)
-        else:
-            df.to_pickle(data_path)
-        meta = {
-            "symbol": symbol,
-            "start": start,
-            "end": end,
-            "fetched_at": datetime.utcnow().isoformat(),
-            "fingerprint": compute_fingerprint(df),
-            "last_close": float(df["close"].iloc[-1]),
-            "storage_format": self.storage_format,
-            "data_source": getattr(self.data_source, "name", None),
-        }
-        cache_meta_path.write_text(json.dumps(meta, indent=2))
+        with partition_lock(data_path.parent, timeout=self.lock_timeout):
+            self.frame_cache.invalidate(data_path)
+            self.frame_cache.invalidate(cache_meta_path)
+            extra: dict = {}
+            if self.layout == "partitioned":
+                manifest = self._store(data_path.parent).write(df)
+                # A single-file copy from an earlier layout must not shadow the partitions
+                data_path.unlink(missing_ok=True)
+                fingerprint = manifest.fingerprint
+                extra = {"layout": "partitioned", "granularity": manifest.granularity, "rows": manifest.rows}
+            else:
+                if data_path.suffix == ".parquet":
+                    # Sorted with bounded row groups so range reads can skip groups
+                    atomic_write(data_path, lambda tmp: write_sorted_parquet(df, tmp))
+                else:
+                    atomic_write(data_path, df.to_pickle)
+                fingerprint = fingerprint or compute_fingerprint(df)
+            meta = {
+                "symbol": symbol,
+                "start": start,
+                "end": end,
+                "fetched_at": datetime.utcnow().isoformat(),
+                "fingerprint": fingerprint,
+                "last_close": float(df["close"].iloc[-1]),
+                "storage_format": self.storage_format,
+                "data_source": getattr(self.data_source, "name", None),
+                "representation": "compact" if is_compact(df) else "standard",
+                "dtypes": dtype_summary(df),
+                **extra,
+            }
+            atomic_write_text(cache_meta_path, json.dumps(meta, indent=2))
+
+    def _append_partitions(
+        self, partition_dir: Path, cache_meta_path: Path, meta: dict, incremental: pd.DataFrame, end: str
+    ) -> None:
+        with partition_lock(partition_dir, timeout=self.lock_timeout):
+            store = self._store(partition_dir)
+            if len(incremental):
+                validate_ohlcv(incremental)
+                store.append(incremental)
+            manifest = store.load_manifest()
+            last_close = meta.get("last_close")
+            if len(incremental):
+                last_close = float(incremental["close"].iloc[-1])
+            meta = {
+                **meta,
+                "end": end,
+                "fetched_at": datetime.utcnow().isoformat(),
+                "fingerprint": manifest.fingerprint,
+                "rows": manifest.rows,
+                "last_close": last_close,
+                "data_source": getattr(self.data_source, "name", None),
+            }
+            self.frame_cache.invalidate(cache_meta_path)
+            atomic_write_text(cache_meta_path, json.dumps(meta, indent=2))
+
+    def _last_cached_bar(self, partition_dir: Path) -> pd.Timestamp | None:
+        ends = [entry.end for entry in self._store(partition_dir).load_manifest().partitions.values()]
+        return max(pd.Timestamp(e) for e in ends) if ends else None
+
+    def _store(self, partition_dir: Path) -> PartitionedStore:
+        interval = next(
+            (p.split("=", 1)[1] for p in reversed(partition_dir.parts) if p.startswith("interval=")), "1d"
+        )
+        return PartitionedStore(
+            partition_dir,
+            granularity=granularity_for_interval(interval),
+            storage_format=self.storage_format,
+            frame_cache=self.frame_cache,
+        )
+
+    def _read_meta(self, meta_path: Path) -> dict:
+        return dict(self.frame_cache.get(meta_path, lambda p: json.loads(p.read_text())))
+
+    def _read_cache(
+        self,
+        cache_path: Path,
+        meta: dict,
+        *,
+        start: str | None = None,
+        end: str | None = None,
+        columns: list[str] | None = None,
+    ) -> pd.DataFrame:
+        """Return the parsed partition (shared with the frame cache; read-only).
 
-    def _read_cache(self, cache_path: Path, meta: dict) -> pd.DataFrame:
+        Large parquet files not already cached are read with the date range
+        and column list pushed down to pyarrow; the result is a superset of
+        ``[start, end]`` that callers slice.
+        """
+
+        if meta.get("layout") == "partitioned":
+            return self._store(cache_path.parent).read(start, end, columns=columns)
         storage_format = meta.get("storage_format")
         if storage_format is None:
             storage_format = "pickle" if cache_path.suffix == ".pkl" else "parquet"
         if storage_format == "pickle":
             target = cache_path if cache_path.suffix == ".pkl" else cache_path.with_suffix(".pkl")
-            return pd.read_pickle(target)
+            return self.frame_cache.get(target, pd.read_pickle)
         target = cache_path if cache_path.suffix == ".parquet" else cache_path.with_suffix(".parquet")
-        return pd.read_parquet(target)
+        if start is not None or end is not None:
+            cached = self.frame_cache.peek(target)
+            if cached is not None:
+                return cached
+            if target.stat().st_size >= PUSHDOWN_MIN_BYTES:
+                return read_parquet_range(target, start=start, end=end, columns=columns)
+        return self.frame_cache.get(target, pd.read_parquet)
 
     def _resolve_partition(
         self, symbol: str, partition_key: str, version: str | None, *, as_of: str | None = None
@@ -233,3 +537,63 @@ class DataLoader:
         if not str(version).startswith("_v"):
             version = f"_v{version}"
         return partition_root / str(version)
+
+
+def _appended_fingerprint(
+    meta: dict, cached: pd.DataFrame, incremental: pd.DataFrame, merged: pd.DataFrame
+) -> str | None:
+    """Update the stored v2 fingerprint by the rows an append replaced and added.
+
+    Returns None (full recompute) for v1 fingerprints or when the merge changed
+    dtypes, since that alters the hashes of the existing rows too.
+    """
+
+    previous = meta.get("fingerprint")
+    if not previous or fingerprint_version(previous) != FINGERPRINT_VERSION:
+        return None
+    if merged.index.dtype != cached.index.dtype or not merged[REQUIRED_COLUMNS].dtypes.equals(
+        cached[REQUIRED_COLUMNS].dtypes
+    ):
+        return None
+    added = incremental[~incremental.index.duplicated(keep="last")]
+    replaced = cached[cached.index.isin(added.index)]
+    return str(Fingerprint.parse(previous) - Fingerprint.of(replaced) + Fingerprint.of(added))
+
+
+def _overlap_close(overlap: pd.DataFrame, last_bar: pd.Timestamp | None) -> float:
+    """Close of the re-fetched copy of the last cached bar (first bar if unknown).
+
+    Intraday overlap windows start at midnight, so the first bar is not the
+    cached last bar there.
+    """
+
+    if last_bar is not None and last_bar in overlap.index:
+        return float(overlap.loc[last_bar, "close"])
+    return float(overlap.iloc[0]["close"])
+
+
+def _is_stale(meta: dict, interval: str) -> bool:
+    fetched_at = pd.Timestamp(meta.get("fetched_at"))
+    stale_threshold = timedelta(days=1 if interval == "1d" else 0)
+    return (datetime.utcnow() - fetched_at.to_pydatetime()) > stale_threshold
+
+
+def _is_fresh(meta: dict, start: str, end: str, interval: str) -> bool:
+    """True when the cached range covers ``[start, end]`` and is not stale."""
+
+    return _covers(meta, start, end) and not _is_stale(meta, interval)
+
+
+def _covers(meta: dict, start: str, end: str) -> bool:
+    cached_start = pd.Timestamp(meta.get("start"))
+    cached_end = pd.Timestamp(meta.get("end"))
+    return cached_start <= pd.Timestamp(start) and cached_end >= pd.Timestamp(end)
+
+
+def _project(df: pd.DataFrame, columns: list[str] | None) -> pd.DataFrame:
+    if not columns:
+        return df
+    missing = [c for c in columns if c not in df.columns]
+    if missing:
+        raise DataSourceError(f"Requested columns not in OHLCV data: {missing}")
+    return df[list(columns)]
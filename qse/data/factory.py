@@ -59,12 +59,15 @@ class FallbackDataSource:
             return self.fallback.fetch_analyst_ratings(*args, **kwargs)
 
 
+_SCHWAB_OPTIONS = {"access_token", "timeout", "http_get", "session", "pool_maxsize", "quote_batch_size"}
+
+
 def _build_provider(name: str, **kwargs):
     name = name.lower()
     if name == "yfinance":
         return YFinanceDataSource(**{k: v for k, v in kwargs.items() if k in {"max_retries"}})
     if name == "schwab":
-        return SchwabDataSource(**{k: v for k, v in kwargs.items() if k in {"access_token", "timeout", "http_get"}})
+        return SchwabDataSource(**{k: v for k, v in kwargs.items() if k in _SCHWAB_OPTIONS})
     if name == "schwab_stub":
         return SchwabDataSourceStub()
     raise DependencyError(f"Unknown data source: {name}")
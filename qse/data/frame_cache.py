@@ -0,0 +1,141 @@
+"""Process-wide, byte-bounded LRU of parsed cache files.
+
+``DataLoader`` reads the same partitions repeatedly during screening,
+conditional runs and audits. Entries are keyed by path plus the file's
+``mtime_ns``/size, so a rewrite by any process misses naturally; the loader
+also invalidates explicitly after ``_write_cache``. Cached frames are shared:
+callers get slices and must treat them as read-only.
+"""
+
+from __future__ import annotations
+
+import os
+import threading
+from collections import OrderedDict
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Any, Callable, TypeVar
+
+import pandas as pd
+
+T = TypeVar("T")
+
+DEFAULT_MAX_BYTES = int(float(os.getenv("QSE_FRAME_CACHE_MB", "256")) * 1024 * 1024)
+
+
+@dataclass
+class FrameCacheStats:
+    """Counters exposed for tuning the cache budget."""
+
+    hits: int = 0
+    misses: int = 0
+    evictions: int = 0
+    invalidations: int = 0
+    entries: int = 0
+    bytes: int = 0
+
+    def to_dict(self) -> dict[str, int]:
+        return asdict(self)
+
+
+def estimate_nbytes(obj: Any) -> int:
+    """Approximate in-memory size of a cached object."""
+
+    if isinstance(obj, pd.DataFrame):
+        return int(obj.memory_usage(index=True, deep=True).sum())
+    if isinstance(obj, pd.Series):
+        return int(obj.memory_usage(index=True, deep=True))
+    nbytes = getattr(obj, "nbytes", None)
+    if nbytes is not None:
+        return int(nbytes)
+    return len(repr(obj))
+
+
+class FrameCache:
+    """LRU keyed by ``(path, mtime_ns, size)`` with a total byte budget."""
+
+    def __init__(self, max_bytes: int = DEFAULT_MAX_BYTES) -> None:
+        self.max_bytes = max(0, int(max_bytes))
+        self.stats = FrameCacheStats()
+        self._entries: OrderedDict[tuple[str, int, int], tuple[Any, int]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, path: Path, loader: Callable[[Path], T]) -> T:
+        """Return the parsed contents of ``path``, loading on miss."""
+
+        try:
+            st = path.stat()
+        except FileNotFoundError:
+            return loader(path)
+        key = (str(path.resolve()), st.st_mtime_ns, st.st_size)
+        with self._lock:
+            cached = self._entries.get(key)
+            if cached is not None:
+                self._entries.move_to_end(key)
+                self.stats.hits += 1
+                return cached[0]
+            self.stats.misses += 1
+
+        value = loader(path)
+        nbytes = estimate_nbytes(value)
+        if nbytes > self.max_bytes:
+            return value
+        with self._lock:
+            self._drop_path(key[0])
+            self._entries[key] = (value, nbytes)
+            self.stats.bytes += nbytes
+            while self.stats.bytes > self.max_bytes and self._entries:
+                _, (_, evicted) = self._entries.popitem(last=False)
+                self.stats.bytes -= evicted
+                self.stats.evictions += 1
+            self.stats.entries = len(self._entries)
+        return value
+
+    def peek(self, path: Path) -> Any | None:
+        """Return the cached value for the current version of ``path`` without loading."""
+
+        try:
+            st = path.stat()
+        except FileNotFoundError:
+            return None
+        key = (str(path.resolve()), st.st_mtime_ns, st.st_size)
+        with self._lock:
+            cached = self._entries.get(key)
+            if cached is None:
+                return None
+            self._entries.move_to_end(key)
+            self.stats.hits += 1
+            return cached[0]
+
+    def invalidate(self, path: Path) -> None:
+        """Drop every entry for ``path`` (any mtime)."""
+
+        with self._lock:
+            if self._drop_path(str(path.resolve())):
+                self.stats.invalidations += 1
+            self.stats.entries = len(self._entries)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self.stats.bytes = 0
+            self.stats.entries = 0
+
+    def _drop_path(self, resolved: str) -> bool:
+        stale = [k for k in self._entries if k[0] == resolved]
+        for k in stale:
+            _, nbytes = self._entries.pop(k)
+            self.stats.bytes -= nbytes
+        return bool(stale)
+
+
+_DEFAULT_CACHE = FrameCache()
+
+
+def default_frame_cache() -> FrameCache:
+    """Return the process-wide cache shared by ``DataLoader`` instances."""
+
+    return _DEFAULT_CACHE
+
+
+__all__ = ["FrameCache", "FrameCacheStats", "default_frame_cache", "estimate_nbytes"]
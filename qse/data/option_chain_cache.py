@@ -0,0 +1,438 @@
+"""Session-level option chain cache with TTL-based incremental quote refresh.
+
+Chains are stored columnar (one parquet per symbol) and keyed by an OCC-style
+contract ID. Static contract metadata (expiry, strike, type, open interest)
+is fetched once per ``metadata_ttl_seconds``; quote columns (bid/ask/IV/volume)
+carry a ``quote_ts`` and are refreshed per expiry only for contracts inside the
+Stage 0/1 window once they are older than ``ttl_seconds``. Stage 0 expiry
+selection is served from an in-memory expiry index. ``spot`` keeps the
+underlying price within the quote TTL, so the Stage 1 moneyness window is
+built around a current price even when the metadata snapshot is hours old.
+"""
+
+from __future__ import annotations
+
+import json
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Any, Callable, Iterable, Mapping
+
+import pandas as pd
+
+from qse.data.cache_lock import atomic_write, atomic_write_text, partition_lock
+from qse.data.validation import validate_option_chain
+from qse.exceptions import DataSourceError
+from qse.optimizers.candidate_filter import (
+    Stage0Config,
+    Stage1Config,
+    select_expiries_from_index,
+)
+from qse.utils.logging import get_logger
+
+log = get_logger(__name__, component="option_chain_cache")
+
+QUOTE_COLUMNS = ["bid", "ask", "implied_volatility", "volume"]
+# Price fields across provider quote payloads (Schwab nests them under "quote")
+_SPOT_FIELDS = (
+    "lastPrice",
+    "mark",
+    "regularMarketPrice",
+    "currentPrice",
+    "last",
+    "price",
+    "close",
+)
+
+
+@dataclass(frozen=True)
+class ChainCacheConfig:
+    """TTL settings for quote and static contract metadata refreshes."""
+
+    ttl_seconds: float = 60.0
+    metadata_ttl_seconds: float = 24 * 3600.0
+
+
+@dataclass
+class ChainCacheStats:
+    """Counters exposed for tuning refresh cadence."""
+
+    full_fetches: int = 0
+    quote_refreshes: int = 0
+    contracts_refreshed: int = 0
+    memory_hits: int = 0
+    disk_hits: int = 0
+
+
+def contract_id(symbol: str, expiry: pd.Timestamp | str, option_type: str, strike: float) -> str:
+    """Return an OCC-style contract identifier (e.g. ``AAPL  240119C00100000``)."""
+
+    ts = pd.Timestamp(expiry)
+    flag = "C" if str(option_type).lower().startswith("c") else "P"
+    return f"{symbol.upper():<6}{ts:%y%m%d}{flag}{int(round(float(strike) * 1000)):08d}"
+
+
+@dataclass
+class _ChainEntry:
+    frame: pd.DataFrame
+    expiries: list[pd.Timestamp]
+    fetched_at: datetime
+    underlying_price: float | None = None
+    data_source: str | None = None
+    underlying_at: datetime | None = None  # when underlying_price was quoted
+
+
+class OptionChainCache:
+    """Cache option chains per symbol and refresh quotes incrementally.
+
+    `base_dir` must live under ``data/option_chains`` (mirrors ``DataLoader``).
+    `clock` is injectable so tests can advance time without sleeping.
+    """
+
+    def __init__(
+        self,
+        base_dir: Path,
+        data_source,
+        config: ChainCacheConfig | None = None,
+        *,
+        clock: Callable[[], datetime] | None = None,
+    ) -> None:
+        if "option_chains" not in base_dir.parts:
+            raise DataSourceError("Option chains must live under data/option_chains")
+        if not hasattr(data_source, "fetch_option_chain"):
+            raise DataSourceError("Configured data source does not support option chains")
+        self.base_dir = base_dir
+        self.data_source = data_source
+        self.config = config or ChainCacheConfig()
+        self.stats = ChainCacheStats()
+        self._clock = clock or datetime.utcnow
+        self._entries: dict[str, _ChainEntry] = {}
+        self.base_dir.mkdir(parents=True, exist_ok=True)
+
+    # ------------------------------------------------------------------
+    # Public API
+    # ------------------------------------------------------------------
+
+    def expiries(self, symbol: str) -> list[pd.Timestamp]:
+        """Return the sorted expiry index for ``symbol`` without touching quotes."""
+
+        return list(self._entry(symbol).expiries)
+
+    def select_expiries(
+        self, symbol: str, as_of: datetime, config: Stage0Config | None = None
+    ) -> list[pd.Timestamp]:
+        """Stage 0 expiry selection served from the in-memory index."""
+
+        return select_expiries_from_index(self.expiries(symbol), as_of, config)
+
+    def underlying_price(self, symbol: str) -> float | None:
+        """Underlying price from the last chain fetch (may be up to the metadata TTL old)."""
+
+        return self._entry(symbol).underlying_price
+
+    def spot(self, symbol: str, *, expiries: Iterable[pd.Timestamp] | None = None) -> float | None:
+        """Underlying price no older than ``ttl_seconds``.
+
+        A stale price is refreshed with the quotes of the nearest of
+        ``expiries`` when the provider's chains carry the underlying price,
+        otherwise through ``fetch_quotes``. Falls back to the cached price
+        (with a warning) when neither yields one.
+        """
+
+        entry = self._entry(symbol)
+        if entry.underlying_price is not None and not self._quote_expired(entry.underlying_at):
+            return entry.underlying_price
+
+        selected = sorted(pd.Timestamp(e) for e in expiries) if expiries is not None else entry.expiries
+        frame = entry.frame
+        chain_has_spot = "underlying_price" in frame.columns and frame["underlying_price"].notna().any()
+        if chain_has_spot and selected:
+            self.refresh_quotes(symbol, expiries=selected[:1], force=True)
+            entry = self._entry(symbol)
+            if not self._quote_expired(entry.underlying_at):
+                return entry.underlying_price
+
+        price = self._quote_spot(symbol)
+        if price is not None:
+            entry.underlying_price, entry.underlying_at = price, self._clock()
+            self._persist(symbol, entry)
+            return price
+
+        if entry.underlying_price is not None:
+            log.warning(
+                "using cached underlying price; no fresh quote available",
+                extra={"symbol": symbol, "quoted_at": str(entry.underlying_at)},
+            )
+        return entry.underlying_price
+
+    def get_chain(
+        self,
+        symbol: str,
+        *,
+        expiries: Iterable[pd.Timestamp] | None = None,
+        spot: float | None = None,
+        stage1: Stage1Config | None = None,
+    ) -> pd.DataFrame:
+        """Return the cached chain restricted to the Stage 0/1 window.
+
+        Quotes for contracts inside the window are refreshed first when older
+        than ``ttl_seconds``. The returned frame carries ``contract_id`` and
+        ``quote_ts`` columns alongside the standard option chain fields.
+        """
+
+        selected = None if expiries is None else [pd.Timestamp(e) for e in expiries]
+        self.refresh_quotes(symbol, expiries=selected, spot=spot, stage1=stage1)
+        frame = self._entry(symbol).frame
+        window = self._window_mask(frame, selected, spot, stage1)
+        return frame.loc[window].reset_index()
+
+    def refresh_quotes(
+        self,
+        symbol: str,
+        *,
+        expiries: Iterable[pd.Timestamp] | None = None,
+        spot: float | None = None,
+        stage1: Stage1Config | None = None,
+        force: bool = False,
+    ) -> int:
+        """Refresh quote columns for stale contracts in the window.
+
+        Returns the number of contracts whose quotes were updated.
+        """
+
+        entry = self._entry(symbol)
+        frame = entry.frame
+        selected = None if expiries is None else [pd.Timestamp(e) for e in expiries]
+        window = self._window_mask(frame, selected, spot, stage1)
+        if not force:
+            cutoff = self._clock() - timedelta(seconds=self.config.ttl_seconds)
+            window &= frame["quote_ts"] < pd.Timestamp(cutoff)
+        stale_expiries = sorted(frame.loc[window, "expiry"].unique())
+        if not stale_expiries:
+            return 0
+
+        updated = 0
+        for expiry in stale_expiries:
+            expiry_ts = pd.Timestamp(expiry)
+            fresh = self._normalize(
+                symbol, self.data_source.fetch_option_chain(symbol=symbol, expiry=expiry_ts.date().isoformat())
+            )
+            targets = frame.index[window & (frame["expiry"] == expiry_ts)]
+            matched = fresh.index.intersection(targets)
+            frame.loc[matched, QUOTE_COLUMNS] = fresh.loc[matched, QUOTE_COLUMNS].to_numpy()
+            frame.loc[matched, "quote_ts"] = fresh.loc[matched, "quote_ts"]
+            # Contracts listed since the metadata snapshot join the cache as new rows
+            listed = fresh.index.difference(frame.index)
+            if len(listed):
+                frame = pd.concat([frame, fresh.loc[listed].reindex(columns=frame.columns)])
+                window = window.reindex(frame.index, fill_value=False)
+            if "underlying_price" in fresh.columns and fresh["underlying_price"].notna().any():
+                entry.underlying_price = float(fresh["underlying_price"].dropna().iloc[0])
+                entry.underlying_at = self._clock()
+            updated += len(matched) + len(listed)
+            self.stats.quote_refreshes += 1
+
+        entry.frame = frame.sort_values(["expiry", "strike", "option_type"])
+        entry.expiries = self._expiry_index(entry.frame)
+        self.stats.contracts_refreshed += updated
+        self._persist(symbol, entry)
+        log.info(
+            "refreshed option quotes",
+            extra={"symbol": symbol, "expiries": len(stale_expiries), "contracts": updated},
+        )
+        return updated
+
+    def invalidate(self, symbol: str) -> None:
+        """Drop the in-memory entry so the next access re-reads disk."""
+
+        self._entries.pop(symbol, None)
+
+    # ------------------------------------------------------------------
+    # Internals
+    # ------------------------------------------------------------------
+
+    def _entry(self, symbol: str) -> _ChainEntry:
+        entry = self._entries.get(symbol)
+        if entry is not None and not self._metadata_expired(entry):
+            self.stats.memory_hits += 1
+            return entry
+
+        entry = self._read(symbol)
+        if entry is not None and not self._metadata_expired(entry):
+            self.stats.disk_hits += 1
+        else:
+            entry = self._fetch_full(symbol)
+        self._entries[symbol] = entry
+        return entry
+
+    def _metadata_expired(self, entry: _ChainEntry) -> bool:
+        age = self._clock() - entry.fetched_at
+        return age > timedelta(seconds=self.config.metadata_ttl_seconds)
+
+    def _quote_expired(self, quoted_at: datetime | None) -> bool:
+        if quoted_at is None:
+            return True
+        return self._clock() - quoted_at > timedelta(seconds=self.config.ttl_seconds)
+
+    def _quote_spot(self, symbol: str) -> float | None:
+        if not hasattr(self.data_source, "fetch_quotes"):
+            return None
+        try:
+            payload = self.data_source.fetch_quotes([symbol])
+        except Exception as exc:  # noqa: BLE001 - caller falls back to the cached price
+            log.warning("underlying quote failed", extra={"symbol": symbol, "error": str(exc)})
+            return None
+        return _quote_price(payload.get(symbol) if isinstance(payload, Mapping) else None)
+
+    def _fetch_full(self, symbol: str) -> _ChainEntry:
+        raw = self.data_source.fetch_option_chain(symbol=symbol, expiry=None)
+        frame = self._normalize(symbol, raw).sort_values(["expiry", "strike", "option_type"])
+        if frame.empty:
+            raise DataSourceError(
+                f"Option chain for {symbol} from {getattr(self.data_source, 'name', 'provider')} "
+                "has no contracts with a valid expiry"
+            )
+        underlying = None
+        if "underlying_price" in frame.columns and frame["underlying_price"].notna().any():
+            underlying = float(frame["underlying_price"].dropna().iloc[0])
+        now = self._clock()
+        entry = _ChainEntry(
+            frame=frame,
+            expiries=self._expiry_index(frame),
+            fetched_at=now,
+            underlying_price=underlying,
+            data_source=getattr(self.data_source, "name", None),
+            underlying_at=now if underlying is not None else None,
+        )
+        self.stats.full_fetches += 1
+        self._persist(symbol, entry)
+        return entry
+
+    def _normalize(self, symbol: str, raw: pd.DataFrame) -> pd.DataFrame:
+        validate_option_chain(raw)
+        frame = raw.copy()
+        frame["expiry"] = pd.to_datetime(frame["expiry"], errors="coerce")
+        frame = frame.dropna(subset=["expiry", "strike"])
+        frame["strike"] = frame["strike"].astype(float)
+        frame["option_type"] = frame["option_type"].astype(str).str.lower()
+        for col in QUOTE_COLUMNS + ["open_interest"]:
+            frame[col] = pd.to_numeric(frame[col], errors="coerce")
+        frame["quote_ts"] = pd.Timestamp(self._clock())
+        frame["contract_id"] = [
+            contract_id(symbol, exp, opt, strike)
+            for exp, opt, strike in zip(frame["expiry"], frame["option_type"], frame["strike"])
+        ]
+        frame = frame.drop_duplicates("contract_id", keep="last").set_index("contract_id")
+        return frame
+
+    @staticmethod
+    def _expiry_index(frame: pd.DataFrame) -> list[pd.Timestamp]:
+        return [pd.Timestamp(e) for e in sorted(frame["expiry"].unique())]
+
+    @staticmethod
+    def _window_mask(
+        frame: pd.DataFrame,
+        expiries: list[pd.Timestamp] | None,
+        spot: float | None,
+        stage1: Stage1Config | None,
+    ) -> pd.Series:
+        mask = pd.Series(True, index=frame.index)
+        if expiries is not None:
+            mask &= frame["expiry"].isin(expiries)
+        if spot is not None and spot > 0:
+            stage1 = stage1 or Stage1Config()
+            moneyness = frame["strike"] / spot
+            mask &= (moneyness >= stage1.moneyness_low) & (moneyness <= stage1.moneyness_high)
+        return mask
+
+    def _paths(self, symbol: str) -> tuple[Path, Path]:
+        partition_dir = self.base_dir / f"symbol={symbol}"
+        return partition_dir / "chain.parquet", partition_dir / "chain.meta.json"
+
+    def _persist(self, symbol: str, entry: _ChainEntry) -> None:
+        data_path, meta_path = self._paths(symbol)
+        meta = {
+            "symbol": symbol,
+            "fetched_at": entry.fetched_at.isoformat(),
+            "underlying_price": entry.underlying_price,
+            "underlying_at": entry.underlying_at.isoformat() if entry.underlying_at else None,
+            "data_source": entry.data_source,
+            "contracts": int(len(entry.frame)),
+            "expiries": [e.date().isoformat() for e in entry.expiries],
+        }
+        with partition_lock(data_path.parent):
+            atomic_write(data_path, entry.frame.to_parquet)
+            atomic_write_text(meta_path, json.dumps(meta, indent=2))
+
+    def _read(self, symbol: str) -> _ChainEntry | None:
+        data_path, meta_path = self._paths(symbol)
+        if not data_path.exists() or not meta_path.exists():
+            return None
+        try:
+            meta = json.loads(meta_path.read_text())
+            frame = pd.read_parquet(data_path)
+        except Exception as exc:  # noqa: BLE001
+            log.warning("unreadable option chain cache", extra={"symbol": symbol, "error": str(exc)})
+            return None
+        return _ChainEntry(
+            frame=frame,
+            expiries=self._expiry_index(frame),
+            fetched_at=datetime.fromisoformat(meta["fetched_at"]),
+            underlying_price=meta.get("underlying_price"),
+            data_source=meta.get("data_source"),
+            underlying_at=datetime.fromisoformat(meta["underlying_at"])
+            if meta.get("underlying_at")
+            else None,
+        )
+
+
+def _quote_price(quote: Any) -> float | None:
+    if not isinstance(quote, Mapping):
+        return None
+    for block in (quote.get("quote"), quote):
+        if not isinstance(block, Mapping):
+            continue
+        for key in _SPOT_FIELDS:
+            value = block.get(key)
+            if value is not None and pd.notna(value) and float(value) > 0:
+                return float(value)
+    return None
+
+
+def session_chain_cache(
+    data_source, base_dir: Path, config: Mapping[str, Any] | None = None
+) -> OptionChainCache | None:
+    """Chain cache for one CLI session built from the configured provider.
+
+    TTLs come from the ``chain_cache`` config section. Returns None (callers
+    then use the synthetic chain) when the provider cannot serve option chains.
+    """
+
+    if data_source is None or not hasattr(data_source, "fetch_option_chain"):
+        log.warning(
+            "data source has no option chains; using the synthetic chain",
+            extra={"data_source": getattr(data_source, "name", None)},
+        )
+        return None
+    section = dict((config or {}).get("chain_cache") or {})
+    defaults = ChainCacheConfig()
+    return OptionChainCache(
+        base_dir,
+        data_source,
+        ChainCacheConfig(
+            ttl_seconds=float(section.get("ttl_seconds", defaults.ttl_seconds)),
+            metadata_ttl_seconds=float(
+                section.get("metadata_ttl_seconds", defaults.metadata_ttl_seconds)
+            ),
+        ),
+    )
+
+
+__all__ = [
+    "ChainCacheConfig",
+    "ChainCacheStats",
+    "OptionChainCache",
+    "QUOTE_COLUMNS",
+    "contract_id",
+    "session_chain_cache",
+]
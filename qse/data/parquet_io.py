@@ -0,0 +1,134 @@
+"""Parquet read/write helpers with date-range pushdown.
+
+Files are written sorted by time with bounded row groups so the per-group
+min/max statistics are tight; reads pass the date range as pyarrow
+``filters`` (row groups outside the range are skipped) and only the
+requested columns are decoded.
+"""
+
+from __future__ import annotations
+
+import json
+from pathlib import Path
+from typing import Sequence
+
+import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
+
+# ~6 months of 1-minute RTH bars per row group; daily histories stay one group
+ROW_GROUP_ROWS = 50_000
+
+
+def write_sorted_parquet(
+    df: pd.DataFrame,
+    path: Path,
+    *,
+    sort_column: str | None = None,
+    row_group_size: int = ROW_GROUP_ROWS,
+    index: bool | None = None,
+) -> None:
+    """Write ``df`` sorted by its index (or ``sort_column``) with bounded row groups."""
+
+    if sort_column is not None:
+        ordered = df if df[sort_column].is_monotonic_increasing else df.sort_values(sort_column, kind="stable")
+    else:
+        ordered = df if df.index.is_monotonic_increasing else df.sort_index(kind="stable")
+    ordered.to_parquet(
+        path, engine="pyarrow", compression="snappy", row_group_size=row_group_size, index=index
+    )
+
+
+def time_column(path: Path) -> str | None:
+    """Return the stored name of a datetime index column, if the file has one."""
+
+    schema = pq.read_schema(path)
+    raw = (schema.metadata or {}).get(b"pandas")
+    if not raw:
+        return None
+    for column in json.loads(raw).get("index_columns", []):
+        if isinstance(column, str) and pa.types.is_timestamp(schema.field(column).type):
+            return column
+    return None
+
+
+def column_bounds(path: Path, column: str) -> tuple[pd.Timestamp | None, pd.Timestamp | None]:
+    """Min/max of ``column`` from row-group statistics (no data pages read)."""
+
+    metadata = pq.ParquetFile(path).metadata
+    names = [metadata.schema.column(i).name for i in range(metadata.num_columns)]
+    if column not in names:
+        return None, None
+    idx = names.index(column)
+    lows, highs = [], []
+    for rg in range(metadata.num_row_groups):
+        stats = metadata.row_group(rg).column(idx).statistics
+        if stats is None or not stats.has_min_max:
+            return None, None
+        lows.append(pd.Timestamp(stats.min))
+        highs.append(pd.Timestamp(stats.max))
+    if not lows:
+        return None, None
+    return min(lows), max(highs)
+
+
+def _bound(value: str | pd.Timestamp, tz) -> pd.Timestamp:
+    ts = pd.Timestamp(value)
+    if tz is not None:
+        return ts.tz_localize(tz) if ts.tzinfo is None else ts.tz_convert(tz)
+    return ts.tz_localize(None) if ts.tzinfo is not None else ts
+
+
+def range_bounds(
+    start: str | pd.Timestamp | None, end: str | pd.Timestamp | None, tz=None
+) -> list[tuple[str, pd.Timestamp]]:
+    """``(op, value)`` comparisons selecting ``[start, end]`` on a column in ``tz``.
+
+    A date-only ``end`` covers that whole day.
+    """
+
+    bounds: list[tuple[str, pd.Timestamp]] = []
+    if start is not None:
+        bounds.append((">=", _bound(start, tz)))
+    if end is not None:
+        end_ts = _bound(end, tz)
+        if end_ts == end_ts.normalize():
+            bounds.append(("<", end_ts + pd.Timedelta(days=1)))
+        else:
+            bounds.append(("<=", end_ts))
+    return bounds
+
+
+def read_parquet_range(
+    path: Path,
+    *,
+    start: str | pd.Timestamp | None = None,
+    end: str | pd.Timestamp | None = None,
+    column: str | None = None,
+    columns: Sequence[str] | None = None,
+) -> pd.DataFrame:
+    """Read rows of ``path`` whose time ``column`` falls in ``[start, end]``.
+
+    ``column`` defaults to the stored datetime index. A date-only ``end``
+    covers that whole day (matching ``df.loc[start:end]`` on intraday data);
+    callers still slice the result for exact bounds.
+    """
+
+    column = column or time_column(path)
+    filters = None
+    if column is not None and (start is not None or end is not None):
+        tz = getattr(pq.read_schema(path).field(column).type, "tz", None)
+        filters = [(column, op, value) for op, value in range_bounds(start, end, tz)]
+    return pd.read_parquet(
+        path, engine="pyarrow", columns=list(columns) if columns else None, filters=filters or None
+    )
+
+
+__all__ = [
+    "ROW_GROUP_ROWS",
+    "column_bounds",
+    "range_bounds",
+    "read_parquet_range",
+    "time_column",
+    "write_sorted_parquet",
+]
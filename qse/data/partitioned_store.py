@@ -0,0 +1,294 @@
+"""Year/month partitioned, append-only OHLCV storage.
+
+Layout inside a DataLoader version directory (``.../symbol=S/_vN/``)::
+
+    manifest.json
+    year=2023/data.parquet                 # daily and slower intervals
+    year=2024/month=03/data.parquet        # intraday intervals
+
+Incremental updates rewrite only the partitions the new bars fall into
+(normally just the latest); ``manifest.json`` records rows, time bounds and
+a fingerprint per partition so reads and staleness checks never touch the
+older files.
+
+Full rewrites put the new partitions under fresh file names and replace the
+manifest atomically before unlinking the files of the previous one, so a
+lock-free reader always finds the files its manifest names and a crash
+leaves only unreferenced files (swept by the next rewrite).
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import uuid
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from typing import Literal, Sequence
+
+import pandas as pd
+
+from qse.data.cache_lock import atomic_write, atomic_write_text
+from qse.data.parquet_io import read_parquet_range, write_sorted_parquet
+from qse.data.validation import (
+    FINGERPRINT_VERSION,
+    combine_fingerprints,
+    compute_fingerprint,
+    fingerprint_version,
+)
+
+Granularity = Literal["year", "month"]
+
+MANIFEST_NAME = "manifest.json"
+DAILY_INTERVALS = {"1d", "1wk", "1mo"}
+
+
+def granularity_for_interval(interval: str) -> Granularity:
+    """Yearly partitions for daily bars, monthly for intraday."""
+
+    return "year" if interval in DAILY_INTERVALS else "month"
+
+
+@dataclass
+class PartitionEntry:
+    """Manifest record for one partition file."""
+
+    path: str
+    rows: int
+    start: str
+    end: str
+    fingerprint: str
+
+
+@dataclass
+class PartitionManifest:
+    granularity: Granularity
+    storage_format: str = "parquet"
+    partitions: dict[str, PartitionEntry] = field(default_factory=dict)
+
+    @property
+    def rows(self) -> int:
+        return sum(p.rows for p in self.partitions.values())
+
+    @property
+    def fingerprint(self) -> str:
+        """Fingerprint of the whole series, composed from the per-partition ones.
+
+        v2 partition fingerprints add up to exactly what ``compute_fingerprint``
+        returns for the concatenated frame; manifests holding v1 entries fall
+        back to hashing the per-partition digests in key order.
+        """
+
+        values = [p.fingerprint for p in self.partitions.values()]
+        if all(fingerprint_version(v) == FINGERPRINT_VERSION for v in values):
+            return combine_fingerprints(values)
+        digest = hashlib.sha256()
+        for key in sorted(self.partitions):
+            digest.update(f"{key}:{self.partitions[key].fingerprint};".encode())
+        return digest.hexdigest()
+
+    def to_dict(self) -> dict:
+        return {
+            "granularity": self.granularity,
+            "storage_format": self.storage_format,
+            "rows": self.rows,
+            "fingerprint": self.fingerprint,
+            "partitions": {k: asdict(v) for k, v in sorted(self.partitions.items())},
+        }
+
+    @classmethod
+    def from_dict(cls, payload: dict) -> "PartitionManifest":
+        return cls(
+            granularity=payload["granularity"],
+            storage_format=payload.get("storage_format", "parquet"),
+            partitions={k: PartitionEntry(**v) for k, v in payload.get("partitions", {}).items()},
+        )
+
+
+class PartitionedStore:
+    """Read/append OHLCV frames split into time partitions under ``root``."""
+
+    def __init__(
+        self,
+        root: Path,
+        *,
+        granularity: Granularity = "year",
+        storage_format: Literal["parquet", "pickle"] = "parquet",
+        frame_cache=None,
+    ) -> None:
+        self.root = root
+        self.granularity = granularity
+        self.storage_format = storage_format
+        self.frame_cache = frame_cache
+        self.manifest_path = root / MANIFEST_NAME
+
+    def exists(self) -> bool:
+        return self.manifest_path.exists()
+
+    def load_manifest(self) -> PartitionManifest:
+        if not self.exists():
+            return PartitionManifest(granularity=self.granularity, storage_format=self.storage_format)
+        manifest = PartitionManifest.from_dict(json.loads(self.manifest_path.read_text()))
+        self.granularity = manifest.granularity
+        self.storage_format = manifest.storage_format  # type: ignore[assignment]
+        return manifest
+
+    def write(self, df: pd.DataFrame) -> PartitionManifest:
+        """Replace all partitions with ``df``."""
+
+        previous = self.load_manifest()
+        manifest = PartitionManifest(granularity=self.granularity, storage_format=self.storage_format)
+        generation = uuid.uuid4().hex[:12]
+        for key, part in df.groupby(self._keys(df.index), sort=True):
+            self._write_part(manifest, key, part, path=self._partition_path(key, generation))
+        self._save(manifest)
+        # Readers holding the previous manifest may still open its files until here
+        live = {self.root / entry.path for entry in manifest.partitions.values()}
+        stale = {self.root / entry.path for entry in previous.partitions.values()}
+        stale.update(self._data_files())  # leftovers of an interrupted rewrite
+        for path in stale - live:
+            if self.frame_cache is not None:
+                self.frame_cache.invalidate(path)
+            path.unlink(missing_ok=True)
+        return manifest
+
+    def append(self, df: pd.DataFrame) -> list[str]:
+        """Merge new bars into the partitions they fall in; return touched keys.
+
+        Bars overlapping existing rows replace them (last write wins), so the
+        corporate-action overlap bar can be re-appended safely.
+        """
+
+        manifest = self.load_manifest()
+        if df.empty:
+            return []
+        touched: list[str] = []
+        for key, part in df.groupby(self._keys(df.index), sort=True):
+            path = None
+            if key in manifest.partitions:
+                existing = self._read_part(key, manifest=manifest)
+                part = pd.concat([existing, part])
+                part = part[~part.index.duplicated(keep="last")].sort_index()
+                path = self.root / manifest.partitions[key].path
+            self._write_part(manifest, key, part, path=path)
+            touched.append(key)
+        self._save(manifest)
+        return touched
+
+    def read(
+        self,
+        start: str | pd.Timestamp | None = None,
+        end: str | pd.Timestamp | None = None,
+        *,
+        columns: Sequence[str] | None = None,
+    ) -> pd.DataFrame:
+        """Combine the partitions overlapping ``[start, end]`` (superset; callers slice)."""
+
+        try:
+            return self._read(self.load_manifest(), start, end, columns)
+        except FileNotFoundError:
+            # A rewrite replaced the manifest (and its files) after we loaded it
+            return self._read(self.load_manifest(), start, end, columns)
+
+    def _read(
+        self,
+        manifest: PartitionManifest,
+        start: str | pd.Timestamp | None,
+        end: str | pd.Timestamp | None,
+        columns: Sequence[str] | None,
+    ) -> pd.DataFrame:
+        lo = None if start is None else pd.Timestamp(start)
+        hi = None if end is None else pd.Timestamp(end).normalize() + pd.Timedelta(days=1)
+        frames = []
+        for key in sorted(manifest.partitions):
+            entry = manifest.partitions[key]
+            p_start, p_end = _naive(entry.start), _naive(entry.end)
+            if lo is not None and p_end < _naive(lo):
+                continue
+            if hi is not None and p_start >= _naive(hi):
+                continue
+            frames.append(self._read_part(key, columns=columns, manifest=manifest))
+        if not frames:
+            if not manifest.partitions:
+                return pd.DataFrame()
+            # Keep the schema (and datetime index) so callers can still slice
+            last = max(manifest.partitions)
+            return self._read_part(last, columns=columns, manifest=manifest).iloc[0:0]
+        return pd.concat(frames) if len(frames) > 1 else frames[0]
+
+    def files(self) -> list[Path]:
+        return [self.root / entry.path for entry in self.load_manifest().partitions.values()]
+
+    # ------------------------------------------------------------------
+
+    def _keys(self, index: pd.DatetimeIndex) -> pd.Index:
+        # An Index, not a list: pandas reads a length-1 list as a list of group keys
+        if self.granularity == "year":
+            return pd.Index([f"year={y}" for y in index.year])
+        return pd.Index([f"year={y}/month={m:02d}" for y, m in zip(index.year, index.month)])
+
+    def _partition_path(self, key: str, generation: str | None = None) -> Path:
+        suffix = "parquet" if self.storage_format == "parquet" else "pkl"
+        name = f"data-{generation}.{suffix}" if generation else f"data.{suffix}"
+        return self.root / key / name
+
+    def _data_files(self) -> list[Path]:
+        suffix = "parquet" if self.storage_format == "parquet" else "pkl"
+        return [p for p in self.root.glob(f"year=*/**/data*.{suffix}") if p.is_file()]
+
+    def _write_part(
+        self, manifest: PartitionManifest, key: str, part: pd.DataFrame, *, path: Path | None = None
+    ) -> None:
+        path = path or self._partition_path(key)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        if self.frame_cache is not None:
+            self.frame_cache.invalidate(path)
+        if self.storage_format == "parquet":
+            atomic_write(path, lambda tmp: write_sorted_parquet(part, tmp))
+        else:
+            atomic_write(path, part.sort_index().to_pickle)
+        manifest.partitions[key] = PartitionEntry(
+            path=str(path.relative_to(self.root)),
+            rows=int(len(part)),
+            start=part.index.min().isoformat(),
+            end=part.index.max().isoformat(),
+            fingerprint=compute_fingerprint(part),
+        )
+
+    def _read_part(
+        self,
+        key: str,
+        *,
+        columns: Sequence[str] | None = None,
+        manifest: PartitionManifest | None = None,
+    ) -> pd.DataFrame:
+        entry = (manifest or self.load_manifest()).partitions.get(key)
+        path = self.root / entry.path if entry is not None else self._partition_path(key)
+        reader = pd.read_parquet if self.storage_format == "parquet" else pd.read_pickle
+        if columns and self.storage_format == "parquet" and (
+            self.frame_cache is None or self.frame_cache.peek(path) is None
+        ):
+            return read_parquet_range(path, columns=columns)
+        df = self.frame_cache.get(path, reader) if self.frame_cache is not None else reader(path)
+        return df[list(columns)] if columns else df
+
+    def _save(self, manifest: PartitionManifest) -> None:
+        self.root.mkdir(parents=True, exist_ok=True)
+        atomic_write_text(self.manifest_path, json.dumps(manifest.to_dict(), indent=2))
+        if self.frame_cache is not None:
+            self.frame_cache.invalidate(self.manifest_path)
+
+
+def _naive(value: str | pd.Timestamp) -> pd.Timestamp:
+    # Compare wall-clock times, as ``df.loc[start:end]`` does on a tz-aware index
+    ts = pd.Timestamp(value)
+    return ts.tz_localize(None) if ts.tzinfo is not None else ts
+
+
+__all__ = [
+    "MANIFEST_NAME",
+    "PartitionEntry",
+    "PartitionManifest",
+    "PartitionedStore",
+    "granularity_for_interval",
+]
@@ -0,0 +1,329 @@
+"""Derived resolution tiers resampled from stored intraday bars.
+
+5m bars are built from cached 1m bars, and 1d bars from 5m (or 1m) bars,
+instead of fetching every tier from the provider. Aggregation is
+open=first, high=max, low=min, close=last, volume=sum, and bins never cross
+a session: only bars inside the trading session count, and daily bars are
+keyed by the session date in the exchange timezone.
+
+Derived bars are cached next to the source tree::
+
+    historical/derived/interval=5m/source=1m/symbol=S/
+        derived.meta.json                  # source fingerprint and end
+        manifest.json
+        year=2024/month=03/data.parquet
+
+The metadata keys the derived partitions by the source cache fingerprint and
+records the source's per-partition fingerprints (a single entry for
+single-file caches). When new source bars are appended, every earlier
+partition still matches and only the last recorded one is re-read to check
+its prefix, so only the bins from the last (possibly partial) derived bin
+onward are recomputed from the bars read from there on; any other change to
+the source rebuilds the tier.
+"""
+
+from __future__ import annotations
+
+import json
+from dataclasses import asdict, dataclass
+from datetime import datetime
+from pathlib import Path
+
+import pandas as pd
+
+from qse.data.cache_lock import atomic_write_text, partition_lock
+from qse.data.compact import PRICE_COLUMNS, compact_ohlcv, is_compact
+from qse.data.data_loader import DataLoader
+from qse.data.partitioned_store import PartitionedStore, granularity_for_interval
+from qse.data.resolution import derivable_from
+from qse.data.validation import compute_fingerprint
+from qse.exceptions import DataSourceError
+from qse.utils.logging import get_logger
+
+log = get_logger(__name__, component="resampling")
+
+OHLCV_AGGREGATION = {"open": "first", "high": "max", "low": "min", "close": "last", "volume": "sum"}
+DERIVED_META_NAME = "derived.meta.json"
+_BIN_RULES = {"5m": "5min", "1d": None}
+
+
+@dataclass(frozen=True)
+class Session:
+    """Trading session in exchange-local wall time (``close`` is exclusive)."""
+
+    open: str = "09:30"
+    close: str = "16:00"
+    tz: str = "America/New_York"
+
+
+REGULAR_SESSION = Session()
+
+
+def resample_ohlcv(
+    df: pd.DataFrame, target: str, *, session: Session | None = REGULAR_SESSION
+) -> pd.DataFrame:
+    """Aggregate OHLCV bars into ``target`` (``"5m"`` or ``"1d"``) bars.
+
+    Bars outside ``session`` are dropped (``session=None`` keeps all bars).
+    Intraday bins are labelled by their left edge in the source timezone;
+    daily bars are indexed by naive session date. Empty bins are omitted.
+    """
+
+    if target not in _BIN_RULES:
+        raise DataSourceError(f"Cannot resample to {target!r}; supported: {sorted(_BIN_RULES)}")
+    if not isinstance(df.index, pd.DatetimeIndex):
+        raise DataSourceError("Resampling requires a DatetimeIndex")
+    agg = {c: f for c, f in OHLCV_AGGREGATION.items() if c in df.columns}
+    if df.empty:
+        return df[list(agg)].iloc[0:0]
+
+    local = _local_index(df.index, session)
+    bars = df
+    if session is not None:
+        positions = local.indexer_between_time(
+            session.open, session.close, include_start=True, include_end=False
+        )
+        bars, local = df.iloc[positions], local[positions]
+
+    rule = _BIN_RULES[target]
+    if rule is None:
+        keys = local.normalize()
+        if keys.tz is not None:
+            keys = keys.tz_localize(None)
+    else:
+        keys = bars.index.floor(rule)
+    out = bars.groupby(keys, sort=True).agg(agg)
+    out.index.name = df.index.name
+    out = out.astype({c: df[c].dtype for c in PRICE_COLUMNS if c in out.columns})
+    return compact_ohlcv(out) if is_compact(df) else out
+
+
+def bin_start(
+    ts: pd.Timestamp, target: str, *, session: Session | None = REGULAR_SESSION
+) -> pd.Timestamp:
+    """Start of the ``target`` bin containing ``ts``, in ``ts``'s timezone."""
+
+    rule = _BIN_RULES.get(target)
+    if rule is not None:
+        return ts.floor(rule)
+    if ts.tzinfo is None or session is None:
+        return ts.normalize()
+    return ts.tz_convert(session.tz).normalize().tz_convert(ts.tzinfo)
+
+
+@dataclass
+class ResampleStats:
+    """How derived-tier requests were served."""
+
+    hits: int = 0
+    incremental: int = 0
+    rebuilds: int = 0
+
+    def to_dict(self) -> dict[str, int]:
+        return asdict(self)
+
+
+class ResampleCache:
+    """Serve 5m/1d bars derived from a ``DataLoader``'s stored finer bars."""
+
+    def __init__(self, loader: DataLoader, *, session: Session | None = REGULAR_SESSION) -> None:
+        self.loader = loader
+        self.session = session
+        self.root = loader.base_dir / "derived"
+        self.stats = ResampleStats()
+
+    def path(self, symbol: str, target: str, source: str) -> Path:
+        return self.root / f"interval={target}" / f"source={source}" / f"symbol={symbol}"
+
+    def source_for(self, symbol: str, target: str) -> str | None:
+        """Finest stored tier ``target`` can be derived from (None if none is cached)."""
+
+        for source in derivable_from(target):
+            if self.loader.cache_meta(symbol, source) is not None:
+                return source
+        return None
+
+    def load(
+        self,
+        symbol: str,
+        start: str | None = None,
+        end: str | None = None,
+        target: str = "1d",
+        *,
+        source: str | None = None,
+    ) -> pd.DataFrame:
+        """Return derived ``target`` bars for ``[start, end]``, refreshing the tier if needed."""
+
+        source = source or self.source_for(symbol, target)
+        if source is None:
+            raise DataSourceError(f"No stored bars to derive {target} bars for {symbol}")
+        store = self.refresh(symbol, target, source)
+        df = store.read(start, end)
+        return df.loc[start:end] if start is not None or end is not None else df
+
+    def refresh(self, symbol: str, target: str, source: str) -> PartitionedStore:
+        """Bring the derived tier in line with the source cache; return its store."""
+
+        if source not in derivable_from(target):
+            raise DataSourceError(f"{target} bars cannot be derived from {source} bars")
+        source_meta = self.loader.cache_meta(symbol, source)
+        if source_meta is None:
+            raise DataSourceError(f"No cached {source} bars for {symbol}")
+
+        directory = self.path(symbol, target, source)
+        store = PartitionedStore(
+            directory,
+            granularity=granularity_for_interval(target),
+            storage_format=self.loader.storage_format,
+            frame_cache=self.loader.frame_cache,
+        )
+        key = source_meta.get("fingerprint")
+        if key and self._current_meta(store, key) is not None:
+            self.stats.hits += 1
+            return store
+        with partition_lock(directory, timeout=self.loader.lock_timeout):
+            # A concurrent worker may have rebuilt the tier while we waited
+            meta = self._current_meta(store, None)
+            if meta is not None and key and meta.get("source_fingerprint") == key:
+                self.stats.hits += 1
+                return store
+            return self._rebuild(store, meta, symbol, target, source, key)
+
+    def _current_meta(self, store: PartitionedStore, key: str | None) -> dict | None:
+        """Derived metadata matching this session (and ``key``, when given)."""
+
+        meta_path = store.root / DERIVED_META_NAME
+        if not (meta_path.exists() and store.exists()):
+            return None
+        meta = json.loads(meta_path.read_text())
+        session = asdict(self.session) if self.session is not None else None
+        if meta.get("session") != session:
+            return None
+        if key is not None and meta.get("source_fingerprint") != key:
+            return None
+        return meta
+
+    def _rebuild(
+        self,
+        store: PartitionedStore,
+        meta: dict | None,
+        symbol: str,
+        target: str,
+        source: str,
+        key: str | None,
+    ) -> PartitionedStore:
+        partitions, source_store = self._source_partitions(symbol, source)
+        if meta is not None and self._appended_since(meta, partitions, source_store, symbol, source):
+            cutoff = bin_start(pd.Timestamp(meta["source_end"]), target, session=self.session)
+            bars = self.loader.read_cached(symbol, source, start=cutoff.isoformat())
+            bars = bars[bars.index >= cutoff].sort_index() if bars is not None else None
+            if bars is None or bars.empty:
+                raise DataSourceError(f"No cached {source} bars for {symbol}")
+            store.append(resample_ohlcv(bars, target, session=self.session))
+            self.stats.incremental += 1
+            mode = "incremental"
+        else:
+            bars = self.loader.read_cached(symbol, source)
+            if bars is None or bars.empty:
+                raise DataSourceError(f"No cached {source} bars for {symbol}")
+            bars = bars.sort_index()
+            store.write(resample_ohlcv(bars, target, session=self.session))
+            self.stats.rebuilds += 1
+            mode = "rebuild"
+
+        manifest = store.load_manifest()
+        session = asdict(self.session) if self.session is not None else None
+        self._save_meta(
+            store.root / DERIVED_META_NAME,
+            {
+                "symbol": symbol,
+                "interval": target,
+                "source_interval": source,
+                "source_fingerprint": key,
+                "source_partitions": partitions,
+                "source_end": bars.index.max().isoformat(),
+                "session": session,
+                "fingerprint": manifest.fingerprint,
+                "rows": manifest.rows,
+                "built_at": datetime.utcnow().isoformat(),
+            },
+        )
+        log.info(
+            "derived tier refreshed",
+            extra={"symbol": symbol, "interval": target, "source": source, "mode": mode},
+        )
+        return store
+
+    def _source_partitions(
+        self, symbol: str, source: str
+    ) -> tuple[dict[str, str], PartitionedStore | None]:
+        """Per-partition source fingerprints from the manifest (one entry if single-file)."""
+
+        source_store = self.loader.partitioned_store(symbol, source)
+        if source_store is None:
+            meta = self.loader.cache_meta(symbol, source) or {}
+            return {"all": meta.get("fingerprint")}, None
+        manifest = source_store.load_manifest()
+        return {k: entry.fingerprint for k, entry in manifest.partitions.items()}, source_store
+
+    def _appended_since(
+        self,
+        meta: dict,
+        partitions: dict[str, str],
+        source_store: PartitionedStore | None,
+        symbol: str,
+        source: str,
+    ) -> bool:
+        """True when the source bars up to the last build are unchanged.
+
+        Partitions before the last recorded one must keep their manifest
+        fingerprints; only the last recorded partition (which new bars may
+        have extended) is read to fingerprint its rows up to ``source_end``.
+        """
+
+        recorded = meta.get("source_partitions")
+        end = meta.get("source_end")
+        if not recorded or not end:
+            return False
+        last = max(recorded)
+        if any(partitions.get(k) != fp for k, fp in recorded.items() if k != last):
+            return False
+        if any(k < last and k not in recorded for k in partitions) or last not in partitions:
+            return False
+        if source_store is not None:
+            first = source_store.load_manifest().partitions[last].start
+            bars = source_store.read(first, end)
+        else:
+            first, bars = None, self.loader.read_cached(symbol, source)
+        if bars is None:
+            return False
+        try:
+            prefix = bars[bars.index <= pd.Timestamp(end)]
+            if first is not None:
+                prefix = prefix[prefix.index >= pd.Timestamp(first)]
+        except TypeError:  # tz-naive vs tz-aware after a source rewrite
+            return False
+        return compute_fingerprint(prefix.sort_index()) == recorded[last]
+
+    @staticmethod
+    def _save_meta(meta_path: Path, meta: dict) -> None:
+        atomic_write_text(meta_path, json.dumps(meta, indent=2))
+
+
+def _local_index(index: pd.DatetimeIndex, session: Session | None) -> pd.DatetimeIndex:
+    # Naive timestamps are taken to be exchange-local already
+    if session is None or index.tz is None:
+        return index
+    return index.tz_convert(session.tz)
+
+
+__all__ = [
+    "DERIVED_META_NAME",
+    "OHLCV_AGGREGATION",
+    "REGULAR_SESSION",
+    "ResampleCache",
+    "ResampleStats",
+    "Session",
+    "bin_start",
+    "resample_ohlcv",
+]
@@ -22,3 +22,16 @@ def select_resolution(for_use: str) -> Resolution:
     }
     return mapping.get(for_use, "1d")  # default to safest tier
 
+
+
+# Finer tiers each resolution can be resampled from, preferred (coarsest) first
+_DERIVABLE_FROM: dict[str, tuple[Resolution, ...]] = {
+    "5m": ("1m",),
+    "1d": ("5m", "1m"),
+}
+
+
+def derivable_from(target: str) -> tuple[Resolution, ...]:
+    """Stored tiers ``target`` bars can be built from (see ``qse.data.resampling``)."""
+
+    return _DERIVABLE_FROM.get(target, ())
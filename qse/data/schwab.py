@@ -4,7 +4,9 @@ from __future__ import annotations
 
 import logging
 import os
-from dataclasses import dataclass
+import threading
+import time
+from dataclasses import dataclass, field
 from typing import Any, Callable, Iterable, Mapping
 
 import pandas as pd
@@ -16,6 +18,10 @@ log = logging.getLogger(__name__)
 
 _HttpGetter = Callable[[str, Any], Any]
 
+# Symbols per /quotes call; the endpoint accepts comma-separated lists of
+# equities and OCC option symbols alike.
+QUOTE_BATCH_SIZE = 100
+
 
 @dataclass(slots=True)
 class _SchwabResponse:
@@ -26,6 +32,48 @@ class _SchwabResponse:
         return self.payload
 
 
+@dataclass
+class EndpointStats:
+    requests: int = 0
+    errors: int = 0
+    total_seconds: float = 0.0
+    max_seconds: float = 0.0
+
+    def to_dict(self) -> dict[str, float]:
+        mean = self.total_seconds / self.requests if self.requests else 0.0
+        return {
+            "requests": self.requests,
+            "errors": self.errors,
+            "total_seconds": round(self.total_seconds, 6),
+            "mean_seconds": round(mean, 6),
+            "max_seconds": round(self.max_seconds, 6),
+        }
+
+
+@dataclass
+class RequestMetrics:
+    """Per-endpoint request counts and latency for one client."""
+
+    endpoints: dict[str, EndpointStats] = field(default_factory=dict)
+    _lock: threading.Lock = field(default_factory=threading.Lock, repr=False, compare=False)
+
+    def record(self, endpoint: str, seconds: float, *, ok: bool) -> None:
+        with self._lock:
+            stats = self.endpoints.setdefault(endpoint, EndpointStats())
+            stats.requests += 1
+            stats.errors += 0 if ok else 1
+            stats.total_seconds += seconds
+            stats.max_seconds = max(stats.max_seconds, seconds)
+
+    @property
+    def requests(self) -> int:
+        return sum(s.requests for s in self.endpoints.values())
+
+    def to_dict(self) -> dict[str, dict[str, float]]:
+        with self._lock:
+            return {name: stats.to_dict() for name, stats in sorted(self.endpoints.items())}
+
+
 class SchwabDataSource:
     """REST adapter for Schwab market data endpoints.
 
@@ -33,6 +81,11 @@ class SchwabDataSource:
     simplify testing. Responses are normalized into pandas DataFrames for
     OHLCV and option chain workflows, with DataSourceError used for all
     recoverable failures (FR-004/FR-005).
+
+    Without an injected getter, calls share one keep-alive ``requests.Session``
+    whose connection pool is sized by ``pool_maxsize``. Quote lookups for many
+    symbols are coalesced into ``quote_batch_size`` chunks, and every call is
+    counted and timed in ``metrics``.
     """
 
     name = "schwab"
@@ -44,11 +97,19 @@ class SchwabDataSource:
         base_url: str = "https://api.schwabapi.com/marketdata/v1",
         timeout: float = 10.0,
         http_get: _HttpGetter | None = None,
+        session: Any | None = None,
+        pool_maxsize: int = 8,
+        quote_batch_size: int = QUOTE_BATCH_SIZE,
     ) -> None:
         self.access_token = access_token or os.getenv("SCHWAB_ACCESS_TOKEN")
         self.base_url = base_url.rstrip("/")
         self.timeout = timeout
+        self.pool_maxsize = max(1, int(pool_maxsize))
+        self.quote_batch_size = max(1, int(quote_batch_size))
+        self.metrics = RequestMetrics()
         self._http_get = http_get
+        self._session = session
+        self._session_lock = threading.Lock()
 
     def fetch_ohlcv(
         self, symbol: str, start: str, end: str, interval: str = "1d"
@@ -78,13 +139,21 @@ class SchwabDataSource:
         return frame[required]
 
     def fetch_quotes(self, symbols: Iterable[str], fields: Iterable[str] | None = None) -> dict[str, Any]:
-        params: dict[str, Any] = {"symbols": ",".join(symbols)}
-        if fields:
-            params["fields"] = ",".join(fields)
-        payload = self._request("quotes", params=params)
-        if not isinstance(payload, Mapping):
-            raise DataSourceError("Unexpected Schwab quote payload")
-        return dict(payload)
+        """Quote any mix of equity and option symbols in as few calls as possible."""
+
+        unique = list(dict.fromkeys(symbols))
+        field_param = ",".join(fields) if fields else None
+        quotes: dict[str, Any] = {}
+        for offset in range(0, len(unique), self.quote_batch_size):
+            batch = unique[offset : offset + self.quote_batch_size]
+            params: dict[str, Any] = {"symbols": ",".join(batch)}
+            if field_param:
+                params["fields"] = field_param
+            payload = self._request("quotes", params=params)
+            if not isinstance(payload, Mapping):
+                raise DataSourceError("Unexpected Schwab quote payload")
+            quotes.update(payload)
+        return quotes
 
     def fetch_fundamentals(self, symbol: str) -> dict[str, Any]:
         quote_payload = self.fetch_quotes([symbol], fields=["fundamental", "reference"])
@@ -111,6 +180,7 @@ class SchwabDataSource:
 
     def _normalize_option_chain(self, payload: Mapping[str, Any]) -> pd.DataFrame:
         rows: list[dict[str, Any]] = []
+        underlying_price = payload.get("underlyingPrice") if isinstance(payload, Mapping) else None
         for key, option_type in (("callExpDateMap", "call"), ("putExpDateMap", "put")):
             exp_map = payload.get(key, {}) if isinstance(payload, Mapping) else {}
             for expiry, strikes in exp_map.items():
@@ -132,6 +202,7 @@ class SchwabDataSource:
                                 "gamma": contract.get("gamma"),
                                 "theta": contract.get("theta"),
                                 "vega": contract.get("vega"),
+                                "underlying_price": underlying_price,
                             }
                         )
 
@@ -143,13 +214,22 @@ class SchwabDataSource:
     def _request(self, path: str, params: Mapping[str, Any] | None = None) -> Mapping[str, Any]:
         if not self.access_token:
             raise DataSourceError("Schwab access token required for API calls")
-        response = self._perform_request(path, params or {})
+        started = time.perf_counter()
+        try:
+            response = self._perform_request(path, params or {})
+        except Exception:
+            self.metrics.record(path, time.perf_counter() - started, ok=False)
+            raise
         try:
             payload = response.json()
         except Exception as exc:  # pragma: no cover - defensive
+            self.metrics.record(path, time.perf_counter() - started, ok=False)
             raise DataSourceError("Unable to parse Schwab response as JSON") from exc
 
         status_code = getattr(response, "status_code", 500)
+        elapsed = time.perf_counter() - started
+        self.metrics.record(path, elapsed, ok=status_code < 400)
+        log.debug("Schwab %s -> %s in %.3fs", path, status_code, elapsed)
         if status_code >= 400:
             message = self._extract_error(payload, status_code)
             raise DataSourceError(message)
@@ -157,14 +237,33 @@ class SchwabDataSource:
             raise DataSourceError("Schwab response payload must be a mapping")
         return payload
 
+    def close(self) -> None:
+        """Release pooled connections (a new session is opened on next use)."""
+
+        with self._session_lock:
+            session, self._session = self._session, None
+        if session is not None and hasattr(session, "close"):
+            session.close()
+
+    def _get_session(self) -> Any:
+        with self._session_lock:
+            if self._session is None:
+                try:
+                    import requests
+                    from requests.adapters import HTTPAdapter
+                except Exception as exc:  # pragma: no cover - optional dependency guard
+                    raise DataSourceError("requests is required for Schwab HTTP calls") from exc
+                session = requests.Session()
+                adapter = HTTPAdapter(pool_connections=1, pool_maxsize=self.pool_maxsize)
+                session.mount("https://", adapter)
+                session.mount("http://", adapter)
+                self._session = session
+            return self._session
+
     def _perform_request(self, path: str, params: Mapping[str, Any]) -> _SchwabResponse:
         client = self._http_get
         if client is None:
-            try:
-                import requests
-            except Exception as exc:  # pragma: no cover - optional dependency guard
-                raise DataSourceError("requests is required for Schwab HTTP calls") from exc
-            client = requests.get  # type: ignore[assignment]
+            client = self._get_session().get
 
         url = f"{self.base_url}/{path.lstrip('/')}"
         headers = {
@@ -186,4 +285,4 @@ class SchwabDataSource:
         return f"Schwab API {status_code}: unexpected error"
 
 
-__all__ = ["SchwabDataSource"]
+__all__ = ["EndpointStats", "QUOTE_BATCH_SIZE", "RequestMetrics", "SchwabDataSource"]
@@ -2,7 +2,9 @@
 
 from __future__ import annotations
 
+import csv
 from dataclasses import dataclass, field
+from pathlib import Path
 
 from qse.exceptions import ConfigValidationError
 
@@ -23,3 +25,30 @@ class UniverseConfig:
         if len(symbols) != len(set(symbols)):
             raise ConfigValidationError(f"Duplicate symbols in {name} tier")
 
+
+
+def load_symbol_file(path: Path) -> list[str]:
+    """Read tickers from a watchlist/universe file.
+
+    Accepts a CSV with a ``symbol``/``Symbol``/``ticker`` column (e.g. the
+    exports under ``data/universes``) or plain text with one ticker per line
+    or comma-separated. Duplicates are dropped, preserving order.
+    """
+
+    if not path.exists():
+        raise ConfigValidationError(f"Symbol file not found: {path}")
+    text = path.read_text(encoding="utf-8-sig")
+    symbols: list[str] = []
+    if path.suffix.lower() == ".csv":
+        reader = csv.DictReader(text.splitlines())
+        column = next(
+            (c for c in (reader.fieldnames or []) if c.strip().lower() in {"symbol", "ticker"}), None
+        )
+        if column is None:
+            raise ConfigValidationError(f"{path} has no symbol/ticker column")
+        symbols = [row[column].strip() for row in reader if row.get(column, "").strip()]
+    else:
+        for line in text.splitlines():
+            line = line.split("#", 1)[0].replace(",", " ")
+            symbols.extend(tok.strip("[]'\" ") for tok in line.split() if tok.strip("[]'\" "))
+    return list(dict.fromkeys(s.upper() for s in symbols))
@@ -0,0 +1,250 @@
+"""Multi-symbol OHLCV panels scanned from the partitioned parquet tree.
+
+``UniverseDataset`` opens every requested symbol's cache files
+(``historical/interval=I/symbol=S/_vN/...``) as one ``pyarrow.dataset`` and
+reads them in a single multi-threaded scan, with the date range pushed
+down as a filter. The result is a long panel (one row per symbol/bar,
+sorted by symbol then date, ``symbol`` categorical) that feature and
+selector code can process in vectorised passes instead of looping over a
+``dict`` of per-symbol frames.
+"""
+
+from __future__ import annotations
+
+import json
+import operator
+from pathlib import Path
+from typing import Iterable, Sequence
+
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+import pyarrow.compute as pc
+import pyarrow.dataset as ds
+import pyarrow.parquet as pq
+
+from qse.data.compact import Representation, to_representation
+from qse.data.parquet_io import range_bounds, time_column
+from qse.data.partitioned_store import MANIFEST_NAME, PartitionManifest
+from qse.exceptions import DataSourceError
+from qse.utils.logging import get_logger
+
+log = get_logger(__name__, component="universe_dataset")
+
+PANEL_COLUMNS = ["symbol", "date", "open", "high", "low", "close", "volume"]
+_VALUE_COLUMNS = ["open", "high", "low", "close", "volume"]
+
+
+class UniverseDataset:
+    """Read many symbols of one interval from ``root`` (a ``historical`` directory)."""
+
+    def __init__(self, root: Path, *, interval: str = "1d") -> None:
+        self.root = Path(root)
+        self.interval = interval
+        self.interval_dir = self.root / f"interval={interval}"
+
+    def symbols(self) -> list[str]:
+        """Symbols with at least one cached version for this interval."""
+
+        if not self.interval_dir.exists():
+            return []
+        return sorted(
+            p.name.split("=", 1)[1]
+            for p in self.interval_dir.iterdir()
+            if p.is_dir() and p.name.startswith("symbol=")
+        )
+
+    def files(self, symbols: Iterable[str] | None = None) -> dict[str, list[Path]]:
+        """Parquet files of the latest version of each symbol (missing symbols omitted)."""
+
+        found: dict[str, list[Path]] = {}
+        for symbol in self.symbols() if symbols is None else symbols:
+            version_dir = _latest_version(self.interval_dir / f"symbol={symbol}")
+            if version_dir is None:
+                continue
+            manifest_path = version_dir / MANIFEST_NAME
+            if manifest_path.exists():
+                manifest = PartitionManifest.from_dict(json.loads(manifest_path.read_text()))
+                if manifest.storage_format != "parquet":
+                    continue
+                parts = manifest.partitions
+                paths = [version_dir / parts[key].path for key in sorted(parts)]
+            else:
+                paths = [version_dir / "data.parquet"]
+            paths = [p for p in paths if p.exists()]
+            if paths:
+                found[symbol] = paths
+        return found
+
+    def load(
+        self,
+        symbols: Sequence[str] | None = None,
+        start: str | pd.Timestamp | None = None,
+        end: str | pd.Timestamp | None = None,
+        *,
+        representation: Representation = "standard",
+    ) -> pd.DataFrame:
+        """Return a long panel with ``PANEL_COLUMNS`` for ``[start, end]``.
+
+        A date-only ``end`` covers that whole day. Symbols without cached data
+        are skipped (and logged); the panel is empty if none have data.
+        ``representation="compact"`` returns float32 prices and uint32 volume.
+        """
+
+        files = self.files(symbols)
+        if symbols is not None:
+            missing = [s for s in symbols if s not in files]
+            if missing:
+                log.warning(
+                    "symbols missing from dataset",
+                    extra={"missing": missing[:20], "count": len(missing)},
+                )
+        if not files:
+            return empty_panel()
+
+        # Cache-tree files carry a ``date`` column; DataLoader files store the
+        # time as the parquet index column. Scan each layout as its own dataset.
+        groups: dict[tuple[str, pa.DataType], list[str]] = {}
+        for paths in files.values():
+            for path in paths:
+                groups.setdefault(_time_field(path), []).append(str(path))
+
+        tables = []
+        for (field, field_type), paths in groups.items():
+            schema = pa.schema(
+                [(field, field_type)]
+                + [(c, pa.float64()) for c in _VALUE_COLUMNS]
+                + [("symbol", pa.string())]
+            )
+            dataset = ds.dataset(
+                paths,
+                format="parquet",
+                schema=schema,
+                partitioning=ds.partitioning(pa.schema([("symbol", pa.string())]), flavor="hive"),
+                partition_base_dir=str(self.interval_dir),
+            )
+            table = dataset.to_table(
+                columns=["symbol", field, *_VALUE_COLUMNS],
+                filter=_range_filter(field, field_type, start, end),
+            )
+            tables.append(table.rename_columns(PANEL_COLUMNS))
+
+        if len(tables) > 1:
+            table = pa.concat_tables(tables, promote_options="permissive")
+        else:
+            table = tables[0]
+        order = [s for s in (symbols if symbols is not None else sorted(files)) if s in files]
+        panel = to_representation(as_panel(table.to_pandas(), symbols=order), representation)
+        log.info("loaded universe panel", extra={"symbols": len(files), "rows": len(panel)})
+        return panel
+
+
+def empty_panel() -> pd.DataFrame:
+    panel = pd.DataFrame({c: pd.Series(dtype="float64") for c in PANEL_COLUMNS})
+    panel["symbol"] = pd.Categorical([])
+    panel["date"] = pd.Series(dtype="datetime64[ns]")
+    return panel
+
+
+def as_panel(df: pd.DataFrame, *, symbols: Sequence[str] | None = None) -> pd.DataFrame:
+    """Normalise a long frame to ``PANEL_COLUMNS``, symbol-categorical and sorted.
+
+    ``symbols`` fixes the category (and row) order; it defaults to sorted symbols.
+    """
+
+    panel = df[PANEL_COLUMNS].copy()
+    if symbols is None:
+        order = sorted(panel["symbol"].unique())
+    else:
+        order = list(dict.fromkeys(symbols))
+    panel["symbol"] = pd.Categorical(panel["symbol"], categories=order)
+    return panel.sort_values(["symbol", "date"], kind="stable", ignore_index=True)
+
+
+def panel_from_frames(frames: dict[str, pd.DataFrame]) -> pd.DataFrame:
+    """Build a long panel from date-indexed per-symbol frames (e.g. a CSV groupby)."""
+
+    if not frames:
+        return empty_panel()
+    parts = []
+    for symbol, df in frames.items():
+        part = df[_VALUE_COLUMNS].rename_axis("date").reset_index()
+        part.insert(0, "symbol", symbol)
+        parts.append(part)
+    return as_panel(pd.concat(parts, ignore_index=True), symbols=list(frames))
+
+
+def symbol_bounds(panel: pd.DataFrame) -> dict[str, tuple[int, int]]:
+    """Row slice ``[start, stop)`` of each symbol in a panel sorted by symbol."""
+
+    codes = panel["symbol"].cat.codes.to_numpy()
+    if not len(codes):
+        return {}
+    change = np.flatnonzero(np.diff(codes)) + 1
+    starts = np.concatenate([[0], change])
+    stops = np.concatenate([change, [len(codes)]])
+    categories = panel["symbol"].cat.categories
+    return {str(categories[codes[a]]): (int(a), int(b)) for a, b in zip(starts, stops)}
+
+
+def split_panel(panel: pd.DataFrame) -> dict[str, pd.DataFrame]:
+    """Per-symbol, date-indexed frames (without ``symbol``) in category order."""
+
+    bounds = symbol_bounds(panel)
+    body = panel.drop(columns="symbol").set_index("date")
+    return {
+        str(symbol): body.iloc[bounds[symbol][0] : bounds[symbol][1]]
+        for symbol in panel["symbol"].cat.categories
+        if symbol in bounds
+    }
+
+
+def to_wide(panel: pd.DataFrame, column: str = "close") -> pd.DataFrame:
+    """Aligned ``date x symbol`` panel of one column (NaN where a symbol has no bar)."""
+
+    if column not in panel.columns:
+        raise DataSourceError(f"Column {column!r} not in panel")
+    return panel.pivot(index="date", columns="symbol", values=column).sort_index()
+
+
+def _latest_version(symbol_dir: Path) -> Path | None:
+    if not symbol_dir.exists():
+        return None
+    versions = [p for p in symbol_dir.iterdir() if p.is_dir() and p.name.startswith("_v")]
+    if not versions:
+        return None
+    return max(versions, key=lambda p: int(p.name[2:]))
+
+
+def _time_field(path: Path) -> tuple[str, pa.DataType]:
+    schema = pq.read_schema(path)
+    name = "date" if "date" in schema.names else time_column(path)
+    if name is None:
+        raise DataSourceError(f"No time column in {path}")
+    return name, schema.field(name).type
+
+
+def _range_filter(
+    field: str,
+    field_type: pa.DataType,
+    start: str | pd.Timestamp | None,
+    end: str | pd.Timestamp | None,
+) -> pc.Expression | None:
+    ops = {">=": operator.ge, "<": operator.lt, "<=": operator.le}
+    expr = None
+    for op, value in range_bounds(start, end, getattr(field_type, "tz", None)):
+        term = ops[op](pc.field(field), value)
+        expr = term if expr is None else expr & term
+    return expr
+
+
+__all__ = [
+    "PANEL_COLUMNS",
+    "UniverseDataset",
+    "as_panel",
+    "empty_panel",
+    "panel_from_frames",
+    "split_panel",
+    "symbol_bounds",
+    "to_wide",
+]
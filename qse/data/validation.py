@@ -4,6 +4,7 @@ from __future__ import annotations
 
 import hashlib
 from dataclasses import dataclass
+from typing import Iterable
 
 import pandas as pd
 
@@ -41,14 +42,92 @@ def validate_ohlcv(df: pd.DataFrame, allow_future: bool = False) -> None:
         raise TimestampAnomalyError("Data contains future timestamps")
 
 
-def compute_fingerprint(df: pd.DataFrame) -> str:
-    """Return SHA256 hash of canonicalized OHLCV data."""
-    payload = df[REQUIRED_COLUMNS].to_csv(index=True).encode()
-    return hashlib.sha256(payload).hexdigest()
+# v1: SHA256 over the CSV rendering (untagged hex, still found in old metadata).
+# v2: per-row 64-bit hashes of the column buffers, summed, so fingerprints of
+#     disjoint row sets add up to the fingerprint of their union.
+LEGACY_FINGERPRINT_VERSION = "v1"
+FINGERPRINT_VERSION = "v2"
+_MASK = (1 << 64) - 1
+
+
+@dataclass(frozen=True)
+class Fingerprint:
+    """Composable (v2) fingerprint: row count plus two modular sums of row hashes."""
+
+    rows: int = 0
+    sum: int = 0
+    sum_sq: int = 0
+
+    @classmethod
+    def of(cls, df: pd.DataFrame) -> "Fingerprint":
+        if df.empty:
+            return cls()
+        hashes = pd.util.hash_pandas_object(df[REQUIRED_COLUMNS], index=True).to_numpy()
+        # uint64 arithmetic wraps, giving sums mod 2**64
+        return cls(len(hashes), int(hashes.sum()), int((hashes * hashes).sum()))
+
+    @classmethod
+    def parse(cls, value: str) -> "Fingerprint":
+        version, _, body = value.partition(":")
+        if version != FINGERPRINT_VERSION:
+            raise SchemaError(f"Not a {FINGERPRINT_VERSION} fingerprint: {value!r}")
+        rows, _, digest = body.partition(":")
+        return cls(int(rows, 16), int(digest[16:], 16), int(digest[:16], 16))
+
+    def __add__(self, other: "Fingerprint") -> "Fingerprint":
+        return Fingerprint(
+            self.rows + other.rows,
+            (self.sum + other.sum) & _MASK,
+            (self.sum_sq + other.sum_sq) & _MASK,
+        )
+
+    def __sub__(self, other: "Fingerprint") -> "Fingerprint":
+        return Fingerprint(
+            self.rows - other.rows,
+            (self.sum - other.sum) & _MASK,
+            (self.sum_sq - other.sum_sq) & _MASK,
+        )
+
+    def __str__(self) -> str:
+        return f"{FINGERPRINT_VERSION}:{self.rows:x}:{self.sum_sq:016x}{self.sum:016x}"
+
+
+def fingerprint_version(fingerprint: str) -> str:
+    """Return the version tag of a stored fingerprint (untagged means v1)."""
+
+    if fingerprint.startswith(f"{FINGERPRINT_VERSION}:"):
+        return FINGERPRINT_VERSION
+    return LEGACY_FINGERPRINT_VERSION
+
+
+def compute_fingerprint(df: pd.DataFrame, *, version: str = FINGERPRINT_VERSION) -> str:
+    """Return a versioned fingerprint of the OHLCV columns and index."""
+
+    if version == LEGACY_FINGERPRINT_VERSION:
+        payload = df[REQUIRED_COLUMNS].to_csv(index=True).encode()
+        return hashlib.sha256(payload).hexdigest()
+    if version != FINGERPRINT_VERSION:
+        raise SchemaError(f"Unknown fingerprint version: {version}")
+    return str(Fingerprint.of(df))
+
+
+def combine_fingerprints(fingerprints: Iterable[str]) -> str:
+    """Fingerprint of the union of disjoint row sets, from their v2 fingerprints."""
+
+    total = Fingerprint()
+    for fingerprint in fingerprints:
+        total = total + Fingerprint.parse(fingerprint)
+    return str(total)
+
 
+def fingerprints_match(fp_old: str, fp_new: str, *, df: pd.DataFrame | None = None) -> bool:
+    """Compare fingerprints, re-fingerprinting ``df`` (the new data) across versions."""
 
-def fingerprints_match(fp_old: str, fp_new: str) -> bool:
-    return fp_old == fp_new
+    if fingerprint_version(fp_old) == fingerprint_version(fp_new):
+        return fp_old == fp_new
+    if df is None:
+        return False
+    return fp_old == compute_fingerprint(df, version=fingerprint_version(fp_old))
 
 
 def enforce_missing_tolerance(df: pd.DataFrame, max_gap: int = 3, max_ratio: float = 0.01) -> tuple[int, float]:
@@ -8,6 +8,8 @@ from typing import Literal
 
 import pandas as pd
 
+from qse.data.validation import REQUIRED_COLUMNS, compute_fingerprint, fingerprint_version
+
 DriftKind = Literal["none", "schema", "distribution", "count"]
 
 
@@ -17,6 +19,8 @@ class DataVersion:
     row_count: int
     mean_return: float
     std_return: float
+    # Version-tagged content fingerprint; None in run metadata written before it existed
+    fingerprint: str | None = None
 
 
 def compute_version(df: pd.DataFrame, *, return_column: str = "close") -> DataVersion:
@@ -26,12 +30,27 @@ def compute_version(df: pd.DataFrame, *, return_column: str = "close") -> DataVe
     returns = df[return_column].pct_change().dropna()
     mean_return = float(returns.mean()) if not returns.empty else 0.0
     std_return = float(returns.std()) if not returns.empty else 0.0
-    return DataVersion(schema_hash=schema_hash, row_count=row_count, mean_return=mean_return, std_return=std_return)
+    fingerprint = compute_fingerprint(df) if set(REQUIRED_COLUMNS).issubset(df.columns) else None
+    return DataVersion(
+        schema_hash=schema_hash,
+        row_count=row_count,
+        mean_return=mean_return,
+        std_return=std_return,
+        fingerprint=fingerprint,
+    )
 
 
 def detect_drift(old: DataVersion, new: DataVersion, *, row_threshold: float = 0.05, stat_threshold: float = 0.2) -> DriftKind:
     if old.schema_hash != new.schema_hash:
         return "schema"
+    if (
+        old.fingerprint
+        and new.fingerprint
+        and fingerprint_version(old.fingerprint) == fingerprint_version(new.fingerprint)
+        and old.fingerprint == new.fingerprint
+    ):
+        # Identical content; fingerprints from another scheme fall through to the stats
+        return "none"
     if old.row_count == 0:
         return "none"
     row_change = abs(new.row_count - old.row_count) / max(1, old.row_count)
@@ -47,7 +47,7 @@ class YFinanceDataSource:
             raise DataSourceError("yfinance not installed") from exc
 
         output: dict[str, Any] = {}
-        for symbol in symbols:
+        for symbol in dict.fromkeys(symbols):
             info = yf.Ticker(symbol).info  # type: ignore[attr-defined]
             if not info:
                 raise DataSourceError(f"Quote lookup failed for {symbol}")
@@ -63,22 +63,30 @@ class YFinanceDataSource:
         return {k: v for k, v in fundamentals.items() if "rating" in k or "target" in k}
 
     def fetch_option_chain(self, symbol: str, expiry: str | None = None) -> pd.DataFrame:
-        chain = self._option_chain(symbol, expiry)
-        if chain is None:
-            raise DataSourceError("Empty option chain returned from yfinance")
+        # yfinance serves one expiry per call; a full chain walks ``Ticker.options``
+        expiries = [expiry] if expiry else self._option_expiries(symbol)
+        if not expiries:
+            raise DataSourceError(f"No listed option expiries for {symbol}")
 
         frames: list[pd.DataFrame] = []
-        for option_type, df in (("call", chain.calls), ("put", chain.puts)):
-            if df is None or df.empty:
+        for exp in expiries:
+            chain = self._option_chain(symbol, exp)
+            if chain is None:
                 continue
-            frame = df.copy()
-            frame.columns = [col.lower() for col in frame.columns]
-            frame["option_type"] = option_type
-            frame["expiry"] = expiry or getattr(chain, "expiry", "")
-            frames.append(frame)
+            underlying = getattr(chain, "underlying", None) or {}
+            for option_type, df in (("call", chain.calls), ("put", chain.puts)):
+                if df is None or df.empty:
+                    continue
+                frame = df.copy()
+                frame.columns = [col.lower() for col in frame.columns]
+                frame["option_type"] = option_type
+                frame["expiry"] = exp
+                if underlying.get("regularMarketPrice") is not None:
+                    frame["underlying_price"] = float(underlying["regularMarketPrice"])
+                frames.append(frame)
 
         if not frames:
-            raise DataSourceError("Option chain returned no contracts")
+            raise DataSourceError(f"Option chain for {symbol} returned no contracts")
         merged = pd.concat(frames, ignore_index=True)
         rename_map = {"impliedvolatility": "implied_volatility", "openinterest": "open_interest"}
         merged = merged.rename(columns=rename_map)
@@ -103,6 +111,14 @@ class YFinanceDataSource:
             return ticker.option_chain(date=expiry)
         return ticker.option_chain()
 
+    def _option_expiries(self, symbol: str) -> list[str]:
+        try:
+            import yfinance as yf  # type: ignore
+        except Exception as exc:  # pragma: no cover - optional dependency
+            raise DataSourceError("yfinance not installed") from exc
+
+        return list(yf.Ticker(symbol).options or [])
+
     @staticmethod
     def _normalize_columns(df: pd.DataFrame) -> pd.DataFrame:
         rename_map = {col: col.lower() for col in df.columns}
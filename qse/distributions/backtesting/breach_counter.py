@@ -5,9 +5,10 @@ from __future__ import annotations
 import numpy as np
 
 
-def count_breaches(returns: np.ndarray, var_level: float) -> tuple[int, list[bool]]:
-    breaches_bool = (returns < var_level).tolist()
-    return int(sum(breaches_bool)), breaches_bool
+def count_breaches(returns: np.ndarray, var_level: float) -> tuple[int, np.ndarray]:
+    """Number of ``returns`` below ``var_level`` and the boolean breach sequence."""
+    breaches = np.asarray(returns, dtype=float) < var_level
+    return int(np.count_nonzero(breaches)), breaches
 
 
 __all__ = ["count_breaches"]
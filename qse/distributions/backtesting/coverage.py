@@ -0,0 +1,161 @@
+"""Vectorized VaR coverage tests in log space (US6a AS4, T151-T152).
+
+``coverage_tests`` evaluates Kupiec unconditional coverage (LR_uc),
+Christoffersen independence (LR_ind) and their sum, conditional coverage
+(LR_cc), for a whole array of breach sequences in one call. The last axis is
+time and every leading axis (models x levels x windows x symbols ...) is
+batched. Likelihoods are accumulated as ``x * log(p)`` terms (with
+``0 * log 0 = 0``), never as products of probabilities, so the statistics
+stay finite for arbitrarily long windows. Transition counts come from array
+operations on shifted sequences.
+
+P-values use the asymptotic chi-square distribution (1 dof for LR_uc and
+LR_ind, 2 dof for LR_cc).
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+
+import numpy as np
+from scipy.special import xlogy
+from scipy.stats import chi2
+
+
+@dataclass
+class CoverageTests:
+    """Coverage statistics; every field has the leading shape of the breach array."""
+
+    n_obs: np.ndarray
+    n_breaches: np.ndarray
+    expected_breaches: np.ndarray
+    lr_uc: np.ndarray
+    kupiec_pvalue: np.ndarray
+    lr_ind: np.ndarray
+    christoffersen_pvalue: np.ndarray
+    lr_cc: np.ndarray
+    cc_pvalue: np.ndarray
+
+    def passed(self, threshold: float = 0.05) -> np.ndarray:
+        return (self.kupiec_pvalue >= threshold) & (self.christoffersen_pvalue >= threshold)
+
+
+def breach_rate(level: float | np.ndarray) -> np.ndarray:
+    """Expected breach probability: ``1 - level`` for a confidence level (e.g. 0.99).
+
+    Values below 0.5 are taken to be the tail probability itself.
+    """
+
+    level = np.asarray(level, dtype=float)
+    return np.where(level > 0.5, 1.0 - level, level)
+
+
+def breach_matrix(returns: np.ndarray, var: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+    """Breach indicators ``returns < var`` and a validity mask (False where VaR is NaN).
+
+    ``returns`` and ``var`` broadcast against each other; time is the last axis.
+    """
+
+    returns = np.asarray(returns, dtype=float)
+    var = np.asarray(var, dtype=float)
+    valid = ~np.isnan(var) & ~np.isnan(returns)
+    out = np.zeros(np.broadcast(returns, var).shape, dtype=bool)
+    breaches = np.less(returns, var, where=valid, out=out)
+    return breaches, np.broadcast_to(valid, breaches.shape)
+
+
+def kupiec_lr(n_obs: np.ndarray, n_breaches: np.ndarray, p: np.ndarray) -> np.ndarray:
+    """Kupiec LR_uc statistic in log space (0 where there are no observations)."""
+
+    n_obs = np.asarray(n_obs, dtype=float)
+    x = np.asarray(n_breaches, dtype=float)
+    p = np.asarray(p, dtype=float)
+    pi_hat = np.divide(x, n_obs, out=np.zeros(np.broadcast(x, n_obs).shape), where=n_obs > 0)
+    ll_null = xlogy(n_obs - x, 1.0 - p) + xlogy(x, p)
+    ll_alt = xlogy(n_obs - x, 1.0 - pi_hat) + xlogy(x, pi_hat)
+    return np.maximum(-2.0 * (ll_null - ll_alt), 0.0)
+
+
+def transition_counts(
+    breaches: np.ndarray, valid: np.ndarray | None = None
+) -> tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    """``(n00, n01, n10, n11)`` over consecutive valid observations along the last axis."""
+
+    b = np.asarray(breaches, dtype=bool)
+    prev, curr = b[..., :-1], b[..., 1:]
+    pair = np.ones(prev.shape, bool)
+    if valid is not None:
+        v = np.asarray(valid, dtype=bool)
+        pair = v[..., :-1] & v[..., 1:]
+    n01 = np.count_nonzero(~prev & curr & pair, axis=-1)
+    n10 = np.count_nonzero(prev & ~curr & pair, axis=-1)
+    n11 = np.count_nonzero(prev & curr & pair, axis=-1)
+    n00 = np.count_nonzero(pair, axis=-1) - n01 - n10 - n11
+    return n00, n01, n10, n11
+
+
+def christoffersen_lr(n00, n01, n10, n11) -> np.ndarray:
+    """Christoffersen LR_ind statistic from transition counts."""
+
+    n00, n01, n10, n11 = (np.asarray(n, dtype=float) for n in (n00, n01, n10, n11))
+    pi0 = _rate(n01, n00 + n01)
+    pi1 = _rate(n11, n10 + n11)
+    pi = _rate(n01 + n11, n00 + n01 + n10 + n11)
+    ll_ind = xlogy(n00 + n10, 1.0 - pi) + xlogy(n01 + n11, pi)
+    ll_dep = xlogy(n00, 1.0 - pi0) + xlogy(n01, pi0) + xlogy(n10, 1.0 - pi1) + xlogy(n11, pi1)
+    return np.maximum(-2.0 * (ll_ind - ll_dep), 0.0)
+
+
+def _rate(k: np.ndarray, n: np.ndarray) -> np.ndarray:
+    return np.divide(k, n, out=np.zeros(np.broadcast(k, n).shape), where=n > 0)
+
+
+def coverage_tests(
+    breaches: np.ndarray,
+    levels: float | np.ndarray,
+    valid: np.ndarray | None = None,
+) -> CoverageTests:
+    """Kupiec, Christoffersen and conditional-coverage tests for every breach sequence.
+
+    ``breaches`` is boolean with time on the last axis; ``levels`` (VaR
+    confidence levels) broadcast against its leading shape, e.g. shape
+    ``(n_levels, 1)`` for a ``(n_levels, n_models, T)`` array. ``valid``
+    masks out days without a forecast.
+    """
+
+    b = np.asarray(breaches, dtype=bool)
+    if valid is not None:
+        valid = np.broadcast_to(np.asarray(valid, dtype=bool), b.shape)
+        b = b & valid
+        n_obs = np.count_nonzero(valid, axis=-1)
+    else:
+        n_obs = np.full(b.shape[:-1], b.shape[-1])
+    n_breaches = np.count_nonzero(b, axis=-1)
+    p = np.broadcast_to(breach_rate(levels), n_obs.shape)
+
+    lr_uc = kupiec_lr(n_obs, n_breaches, p)
+    lr_ind = christoffersen_lr(*transition_counts(b, valid))
+    lr_cc = lr_uc + lr_ind
+    empty = n_obs == 0
+    return CoverageTests(
+        n_obs=n_obs,
+        n_breaches=n_breaches,
+        expected_breaches=p * n_obs,
+        lr_uc=lr_uc,
+        kupiec_pvalue=np.where(empty, 1.0, chi2.sf(lr_uc, 1)),
+        lr_ind=lr_ind,
+        christoffersen_pvalue=np.where(empty, 1.0, chi2.sf(lr_ind, 1)),
+        lr_cc=lr_cc,
+        cc_pvalue=np.where(empty, 1.0, chi2.sf(lr_cc, 2)),
+    )
+
+
+__all__ = [
+    "CoverageTests",
+    "breach_matrix",
+    "breach_rate",
+    "christoffersen_lr",
+    "coverage_tests",
+    "kupiec_lr",
+    "transition_counts",
+]
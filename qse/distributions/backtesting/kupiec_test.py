@@ -2,22 +2,22 @@
 
 from __future__ import annotations
 
-import math
+from scipy.stats import chi2
+
+from qse.distributions.backtesting.coverage import breach_rate, kupiec_lr
 
 
 def kupiec_pvalue(n_obs: int, n_breaches: int, alpha: float) -> float:
-    """Return p-value for Kupiec unconditional coverage test."""
+    """Return p-value for Kupiec unconditional coverage test.
+
+    ``alpha`` is the VaR confidence level (0.99 expects 1% breaches). The
+    likelihood ratio is computed in log space (see ``backtesting.coverage``)
+    and compared against chi-square with 1 dof.
+    """
     if n_obs <= 0:
         return 1.0
-    pi = n_breaches / n_obs
-    if pi == 0 or pi == 1:
-        return 0.0
-    lr_stat = -2 * (
-        math.log((1 - alpha) ** (n_obs - n_breaches) * alpha ** n_breaches)
-        - math.log((1 - pi) ** (n_obs - n_breaches) * pi ** n_breaches)
-    )
-    # asymptotic chi-square with 1 dof: pvalue = exp(-lr/2)
-    return math.exp(-lr_stat / 2)
+    lr_stat = float(kupiec_lr(n_obs, n_breaches, breach_rate(alpha)))
+    return float(chi2.sf(lr_stat, 1))
 
 
 __all__ = ["kupiec_pvalue"]
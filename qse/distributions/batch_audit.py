@@ -0,0 +1,176 @@
+"""Universe-wide distribution audits on one shared worker pool.
+
+Symbols whose audit cache entry is still fresh are reported from the cache
+index without loading prices or reading payloads. The rest are audited concurrently: a lightweight
+thread per in-flight symbol loads prices and merges results, while every
+(symbol x model) fit/backtest/simulation task is submitted to a single
+bounded process pool. A universe refresh therefore keeps every core busy
+and pays interpreter/import start-up once per worker, not per symbol.
+"""
+
+from __future__ import annotations
+
+import os
+import time
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor, as_completed
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Callable, Sequence
+
+import pandas as pd
+
+from qse.distributions.cache.cache_manager import (
+    DEFAULT_CACHE_DIR,
+    TTL_DAYS,
+    AuditCache,
+    summarize_payload,
+)
+from qse.distributions.backtesting.rolling_var import RollingVarConfig
+from qse.distributions.distribution_audit import (
+    DistributionAuditResult,
+    audit_cache_source,
+    audit_distributions_for_symbol,
+)
+from qse.utils.logging import get_logger
+from qse.utils.progress import ProgressReporter
+
+log = get_logger(__name__, component="batch_audit")
+
+
+@dataclass
+class SymbolAuditSummary:
+    """Outcome for one symbol in a batch audit."""
+
+    symbol: str
+    status: str  # audited | cached | no_data | failed
+    best_model: str | None = None
+    score: float | None = None
+    cache_path: str | None = None
+    error: str | None = None
+    runtime_seconds: float = 0.0
+
+
+def summarize_result(result: DistributionAuditResult) -> tuple[str | None, float | None]:
+    """Best model name and its total score."""
+
+    best = result.best_model.name if result.best_model else None
+    score = next((s.total_score for s in result.scores if s.model_name == best), None)
+    return best, score
+
+
+def audit_universe(
+    symbols: Sequence[str],
+    load_prices: Callable[[str], pd.Series | None],
+    *,
+    cache_dir: str | Path | None = None,
+    lookback_days: int | None = None,
+    end_date: str | None = None,
+    data_source: str | None = None,
+    force_refit: bool = False,
+    seed: int | None = None,
+    max_workers: int | None = None,
+    executor: Executor | None = None,
+    on_result: Callable[[SymbolAuditSummary], None] | None = None,
+    var_backtest: RollingVarConfig | None = None,
+    plot_fit: bool = False,
+    evict_expired: bool = False,
+) -> list[SymbolAuditSummary]:
+    """Audit every symbol, writing each result to the audit cache.
+
+    ``load_prices(symbol)`` returns the close series (None/empty when there is
+    no data). ``max_workers`` bounds the shared process pool (default: CPU
+    count); pass ``executor`` to reuse an existing pool. Results are returned
+    in input order; ``on_result`` is called as each symbol finishes.
+    ``var_backtest`` selects walk-forward VaR backtests for every symbol.
+    ``plot_fit`` saves each audited symbol's fit plot data (``qse audit-plots``
+    renders it). ``evict_expired`` first deletes cache entries past the TTL.
+    """
+
+    symbols = list(dict.fromkeys(symbols))
+    cache_base = Path(cache_dir) if cache_dir else DEFAULT_CACHE_DIR
+    progress = ProgressReporter(total=len(symbols), log=log, component="batch_audit")
+    results: dict[str, SymbolAuditSummary] = {}
+
+    def _finish(summary: SymbolAuditSummary) -> None:
+        results[summary.symbol] = summary
+        if summary.status == "failed":
+            log.error("symbol audit failed", extra={"symbol": summary.symbol, "error": summary.error})
+        if on_result is not None:
+            on_result(summary)
+        progress.tick("batch audit")
+
+    cache = AuditCache(cache_base, ttl_days=TTL_DAYS)
+    if evict_expired:
+        cache.evict_expired()
+    cache_source = audit_cache_source(data_source, var_backtest)
+    pending: list[str] = []
+    for symbol in symbols:
+        # Index-only check: the summary comes from the index row, no payload is read
+        entry = None if force_refit else cache.get(symbol, lookback_days, end_date, cache_source)
+        if entry is not None and entry.is_fresh(ttl_days=TTL_DAYS):
+            _finish(
+                SymbolAuditSummary(
+                    symbol, "cached", entry.best_model, entry.best_score, str(entry.path)
+                )
+            )
+        else:
+            pending.append(symbol)
+
+    workers = max(1, max_workers or os.cpu_count() or 1)
+    pool = executor
+    if pending and pool is None:
+        pool = ProcessPoolExecutor(max_workers=workers)
+
+    def _audit(symbol: str) -> SymbolAuditSummary:
+        start = time.time()
+        path = cache.path_for(symbol, lookback_days, end_date, cache_source)
+        try:
+            prices = load_prices(symbol)
+            if prices is None or len(prices) == 0:
+                return SymbolAuditSummary(symbol, "no_data", runtime_seconds=time.time() - start)
+            result = audit_distributions_for_symbol(
+                symbol=symbol,
+                price_series=prices,
+                cache_dir=str(cache_base),
+                lookback_days=lookback_days,
+                end_date=end_date,
+                data_source=data_source,
+                force_refit=True,  # freshness was checked above
+                seed=seed,
+                executor=pool,
+                var_backtest=var_backtest,
+                plot_fit=plot_fit,
+            )
+        except Exception as exc:  # noqa: BLE001 - reported per symbol
+            return SymbolAuditSummary(
+                symbol, "failed", error=str(exc), runtime_seconds=time.time() - start
+            )
+        best, score = summarize_result(result)
+        return SymbolAuditSummary(
+            symbol, "audited", best, score, str(path), runtime_seconds=time.time() - start
+        )
+
+    try:
+        # Enough symbols in flight to keep the process pool's queue full
+        with ThreadPoolExecutor(max_workers=max(1, min(len(pending), 2 * workers))) as threads:
+            futures = [threads.submit(_audit, symbol) for symbol in pending]
+            for future in as_completed(futures):
+                _finish(future.result())
+    finally:
+        if executor is None and pool is not None:
+            pool.shutdown(wait=True)
+
+    ordered = [results[s] for s in symbols]
+    log.info(
+        "batch audit complete",
+        extra={
+            "symbols": len(ordered),
+            "audited": sum(r.status == "audited" for r in ordered),
+            "cached": sum(r.status == "cached" for r in ordered),
+            "failed": sum(r.status == "failed" for r in ordered),
+        },
+    )
+    return ordered
+
+
+__all__ = ["SymbolAuditSummary", "audit_universe", "summarize_payload", "summarize_result"]
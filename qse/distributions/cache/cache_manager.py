@@ -1,13 +1,64 @@
-"""Cache manager for distribution audits (US6a AS7, T169)."""
+"""Cache manager for distribution audits (US6a AS7, T169).
+
+Audits are stored as one compressed payload per key plus a small SQLite
+index (``index.sqlite``) in the cache directory::
+
+    output/distribution_audits/
+        index.sqlite                                  # key -> path, age, best model
+        AAPL_756_2024-12-31_yfinance:1d.json.zlib     # zlib-compressed compact JSON
+
+The index holds the symbol/lookback/end_date/source key, the write time and
+the best-model summary, so freshness checks, "latest entry for a symbol"
+lookups and batch summaries never list or parse payload files; loading a
+model is one index query plus one read. Pretty-printed ``{key}.json`` files
+written by older versions are still read, and are indexed the first time a
+lookup needs them. Entries past the TTL stay readable (stale fallbacks) until
+``AuditCache.evict_expired`` removes them (``audit-distributions --evict-expired``).
+"""
 
 from __future__ import annotations
 
 import json
-from datetime import datetime, timedelta
+import sqlite3
+import time
+import zlib
+from contextlib import closing
+from dataclasses import dataclass
 from pathlib import Path
-from typing import Optional
+from typing import Any, Optional
+
+from qse.data.cache_lock import atomic_write
+from qse.utils.logging import get_logger
+
+log = get_logger(__name__, component="distribution_cache")
 
 TTL_DAYS = 30
+DEFAULT_CACHE_DIR = Path("output") / "distribution_audits"
+INDEX_NAME = "index.sqlite"
+PAYLOAD_SUFFIX = ".json.zlib"
+_LEGACY_SUFFIX = ".json"
+_SECONDS_PER_DAY = 86400.0
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS entries (
+    key TEXT PRIMARY KEY,
+    symbol TEXT NOT NULL,
+    lookback_days INTEGER,
+    end_date TEXT,
+    data_source TEXT,
+    path TEXT NOT NULL,
+    format TEXT NOT NULL,
+    written_at REAL NOT NULL,
+    best_model TEXT,
+    best_score REAL
+);
+CREATE INDEX IF NOT EXISTS entries_symbol ON entries (symbol, written_at);
+CREATE TABLE IF NOT EXISTS state (name TEXT PRIMARY KEY, value TEXT);
+"""
+_COLUMNS = (
+    "key, symbol, lookback_days, end_date, data_source, path, format, written_at, "
+    "best_model, best_score"
+)
 
 
 def _key(symbol: str, lookback_days: int | None, end_date: str | None, data_source: str | None) -> str:
@@ -21,30 +72,284 @@ def _key(symbol: str, lookback_days: int | None, end_date: str | None, data_sour
     )
 
 
-def get_cache_path(cache_dir: Path, symbol: str, lookback_days: int | None, end_date: str | None, data_source: str | None) -> Path:
-    cache_dir.mkdir(parents=True, exist_ok=True)
-    return cache_dir / f"{_key(symbol, lookback_days, end_date, data_source)}.json"
-
-
-def is_fresh(path: Path, ttl_days: int = TTL_DAYS) -> bool:
-    if not path.exists():
-        return False
-    mtime = datetime.fromtimestamp(path.stat().st_mtime)
-    return datetime.now() - mtime <= timedelta(days=ttl_days)
-
-
 def load_cache(path: Path) -> Optional[dict]:
     if not path.exists():
         return None
     try:
+        if path.name.endswith(PAYLOAD_SUFFIX):
+            return json.loads(zlib.decompress(path.read_bytes()))
         return json.loads(path.read_text())
     except Exception:
         return None
 
 
-def save_cache(path: Path, payload: dict) -> None:
-    path.parent.mkdir(parents=True, exist_ok=True)
-    path.write_text(json.dumps(payload, indent=2))
+def summarize_payload(payload: dict) -> tuple[str | None, float | None]:
+    """Best model name and score from a cached audit payload."""
+
+    raw = payload.get("best_model")
+    best = raw.get("name") if isinstance(raw, dict) else None
+    score = next(
+        (
+            s.get("total_score")
+            for s in payload.get("scores") or []
+            if isinstance(s, dict) and s.get("model_name") == best
+        ),
+        None,
+    )
+    return best, score
+
+
+@dataclass(frozen=True)
+class AuditCacheEntry:
+    """Index row for one cached audit."""
+
+    key: str
+    symbol: str
+    lookback_days: int | None
+    end_date: str | None
+    data_source: str | None
+    path: Path
+    written_at: float
+    best_model: str | None = None
+    best_score: float | None = None
+
+    def age_days(self, now: float | None = None) -> float:
+        return ((now if now is not None else time.time()) - self.written_at) / _SECONDS_PER_DAY
+
+    def is_fresh(self, ttl_days: int = TTL_DAYS) -> bool:
+        return self.age_days() <= ttl_days
+
+    def load(self) -> Optional[dict]:
+        """Read the payload (None when the file is missing or unreadable)."""
+
+        return load_cache(self.path)
+
+
+class AuditCache:
+    """Indexed store of distribution audit payloads in one directory.
+
+    Connections are opened per call, so one instance can be shared between
+    threads, and several processes can use the same directory.
+    """
+
+    def __init__(self, cache_dir: str | Path, *, ttl_days: int = TTL_DAYS) -> None:
+        self.cache_dir = Path(cache_dir)
+        self.ttl_days = ttl_days
+        self.index_path = self.cache_dir / INDEX_NAME
+        self._ready = False
+
+    def path_for(
+        self,
+        symbol: str,
+        lookback_days: int | None,
+        end_date: str | None,
+        data_source: str | None,
+    ) -> Path:
+        key = _key(symbol, lookback_days, end_date, data_source)
+        return self.cache_dir / f"{key}{PAYLOAD_SUFFIX}"
+
+    def put(
+        self,
+        symbol: str,
+        lookback_days: int | None,
+        end_date: str | None,
+        data_source: str | None,
+        payload: dict,
+    ) -> AuditCacheEntry:
+        """Write ``payload`` for the key and record it in the index."""
+
+        path = self.path_for(symbol, lookback_days, end_date, data_source)
+        blob = zlib.compress(json.dumps(payload, separators=(",", ":"), default=str).encode())
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        atomic_write(path, lambda tmp: tmp.write_bytes(blob))
+        best, score = summarize_payload(payload)
+        entry = AuditCacheEntry(
+            key=_key(symbol, lookback_days, end_date, data_source),
+            symbol=symbol,
+            lookback_days=lookback_days,
+            end_date=end_date,
+            data_source=data_source,
+            path=path,
+            written_at=time.time(),
+            best_model=best,
+            best_score=score,
+        )
+        with closing(self._connect()) as conn, conn:
+            self._upsert(conn, entry, "zlib")
+        # The indexed payload supersedes any pre-index JSON file for this key
+        self._legacy_path(entry.key).unlink(missing_ok=True)
+        return entry
+
+    def get(
+        self,
+        symbol: str,
+        lookback_days: int | None,
+        end_date: str | None,
+        data_source: str | None,
+    ) -> AuditCacheEntry | None:
+        """Index entry for the exact key (None when nothing is cached)."""
+
+        key = _key(symbol, lookback_days, end_date, data_source)
+        with closing(self._connect()) as conn, conn:
+            row = conn.execute(
+                f"SELECT {_COLUMNS} FROM entries WHERE key = ?", (key,)
+            ).fetchone()
+            if row is not None and row[6] == "json" and _mtime(Path(row[5])) != row[7]:
+                row = None  # legacy file rewritten in place (or removed) by an older writer
+            if row is None:
+                legacy = self._legacy_path(key)
+                if not legacy.exists():
+                    conn.execute("DELETE FROM entries WHERE key = ?", (key,))
+                    return None
+                return self._import_legacy(conn, legacy)
+            entry = _entry(row)
+            if not entry.path.exists():
+                conn.execute("DELETE FROM entries WHERE key = ?", (key,))
+                return None
+            return entry
+
+    def latest(self, symbol: str, *, fresh_only: bool = False) -> AuditCacheEntry | None:
+        """Most recently written entry for ``symbol`` across all keys."""
+
+        query = f"SELECT {_COLUMNS} FROM entries WHERE symbol = ?"
+        params: list[Any] = [symbol]
+        if fresh_only:
+            query += " AND written_at >= ?"
+            params.append(time.time() - self.ttl_days * _SECONDS_PER_DAY)
+        query += " ORDER BY written_at DESC"
+        with closing(self._connect()) as conn, conn:
+            self._sync_legacy(conn)
+            for row in conn.execute(query, params).fetchall():
+                entry = _entry(row)
+                if entry.path.exists():
+                    return entry
+                conn.execute("DELETE FROM entries WHERE key = ?", (entry.key,))
+        return None
+
+    def entries(self, symbol: str | None = None) -> list[AuditCacheEntry]:
+        """All indexed entries (optionally for one symbol), newest first."""
+
+        query = f"SELECT {_COLUMNS} FROM entries"
+        params: tuple = ()
+        if symbol is not None:
+            query += " WHERE symbol = ?"
+            params = (symbol,)
+        with closing(self._connect()) as conn, conn:
+            self._sync_legacy(conn)
+            rows = conn.execute(query + " ORDER BY written_at DESC", params).fetchall()
+        return [_entry(row) for row in rows]
+
+    def evict_expired(self, ttl_days: int | None = None) -> int:
+        """Delete entries older than ``ttl_days`` (default: the cache TTL); return the count."""
+
+        cutoff = time.time() - (self.ttl_days if ttl_days is None else ttl_days) * _SECONDS_PER_DAY
+        with closing(self._connect()) as conn, conn:
+            self._sync_legacy(conn)
+            rows = conn.execute(
+                "SELECT key, path FROM entries WHERE written_at < ?", (cutoff,)
+            ).fetchall()
+            for _, path in rows:
+                Path(path).unlink(missing_ok=True)
+            conn.executemany("DELETE FROM entries WHERE key = ?", [(key,) for key, _ in rows])
+        if rows:
+            log.info(
+                "Evicted expired audit cache entries",
+                extra={"cache_dir": str(self.cache_dir), "evicted": len(rows)},
+            )
+        return len(rows)
+
+    def _connect(self) -> sqlite3.Connection:
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        conn = sqlite3.connect(str(self.index_path), timeout=30)
+        if not self._ready:
+            conn.executescript(_SCHEMA)
+            self._ready = True
+        return conn
+
+    def _legacy_path(self, key: str) -> Path:
+        return self.cache_dir / f"{key}{_LEGACY_SUFFIX}"
+
+    @staticmethod
+    def _upsert(conn: sqlite3.Connection, entry: AuditCacheEntry, fmt: str) -> None:
+        conn.execute(
+            f"INSERT OR REPLACE INTO entries ({_COLUMNS}) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+            (
+                entry.key,
+                entry.symbol,
+                entry.lookback_days,
+                entry.end_date,
+                entry.data_source,
+                str(entry.path),
+                fmt,
+                entry.written_at,
+                entry.best_model,
+                entry.best_score,
+            ),
+        )
+
+    def _import_legacy(self, conn: sqlite3.Connection, path: Path) -> AuditCacheEntry | None:
+        payload = load_cache(path)
+        if not payload:
+            return None
+        # Keys are "{symbol}_{lookback}_{end}_{source}"; only the symbol may contain "_"
+        parts = path.name[: -len(_LEGACY_SUFFIX)].rsplit("_", 3)
+        if len(parts) != 4:
+            return None
+        symbol, lookback, end_date, source = (None if p == "na" else p for p in parts)
+        best, score = summarize_payload(payload)
+        entry = AuditCacheEntry(
+            key=path.name[: -len(_LEGACY_SUFFIX)],
+            symbol=symbol or "",
+            lookback_days=int(lookback) if lookback and lookback.isdigit() else None,
+            end_date=end_date,
+            data_source=source,
+            path=path,
+            written_at=path.stat().st_mtime,
+            best_model=best,
+            best_score=score,
+        )
+        self._upsert(conn, entry, "json")
+        return entry
+
+    def _sync_legacy(self, conn: sqlite3.Connection) -> None:
+        """Index pre-index ``*.json`` payloads; only rescans after the directory changes."""
+
+        stamp = str(self.cache_dir.stat().st_mtime_ns)
+        row = conn.execute("SELECT value FROM state WHERE name = 'legacy_scan'").fetchone()
+        if row is not None and row[0] == stamp:
+            return
+        indexed = dict(
+            conn.execute("SELECT path, written_at FROM entries WHERE format = 'json'").fetchall()
+        )
+        for path in self.cache_dir.glob(f"*{_LEGACY_SUFFIX}"):
+            if indexed.get(str(path)) != path.stat().st_mtime:
+                self._import_legacy(conn, path)
+        conn.execute(
+            "INSERT OR REPLACE INTO state (name, value) VALUES ('legacy_scan', ?)", (stamp,)
+        )
+
+
+def _mtime(path: Path) -> float | None:
+    try:
+        return path.stat().st_mtime
+    except FileNotFoundError:
+        return None
+
+
+def _entry(row: tuple) -> AuditCacheEntry:
+    key, symbol, lookback, end_date, source, path, _fmt, written_at, best, score = row
+    return AuditCacheEntry(
+        key, symbol, lookback, end_date, source, Path(path), written_at, best, score
+    )
 
 
-__all__ = ["get_cache_path", "is_fresh", "load_cache", "save_cache", "TTL_DAYS"]
+__all__ = [
+    "AuditCache",
+    "AuditCacheEntry",
+    "DEFAULT_CACHE_DIR",
+    "INDEX_NAME",
+    "PAYLOAD_SUFFIX",
+    "TTL_DAYS",
+    "load_cache",
+    "summarize_payload",
+]
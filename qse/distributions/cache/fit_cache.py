@@ -0,0 +1,243 @@
+"""Memoised ``ReturnDistribution.fit`` results keyed by a returns fingerprint.
+
+``compare``, ``grid``, ``conditional`` and ``screen`` refit the same return
+histories repeatedly, and every fit reruns the stationarity tests, AR
+detection and the MLE. ``cached_fit`` wraps a distribution's ``fit``: the key
+is a digest of the model class, the returns' bytes and shape, and the fit's
+settings (``min_samples`` etc.), and a hit restores the fitted parameters
+(``fit_state``) and ``DistributionMetadata`` without refitting. Failed fits
+raise as before and are not cached.
+
+Entries live in a process-wide LRU and, when ``QSE_FIT_CACHE_DIR`` is set (or
+``configure_fit_cache`` gives a directory), in one JSON file per key on disk
+so separate runs share fits. Bump ``FIT_CACHE_VERSION`` when a model's fitting
+logic changes to orphan stale entries.
+"""
+
+from __future__ import annotations
+
+import functools
+import hashlib
+import inspect
+import json
+import os
+import threading
+from collections import OrderedDict
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Any, Callable, Mapping
+
+import numpy as np
+
+from qse.data.cache_lock import atomic_write_text
+from qse.interfaces.distribution import DistributionMetadata
+from qse.utils.logging import get_logger
+
+log = get_logger(__name__, component="fit_cache")
+
+FIT_CACHE_VERSION = 1
+DEFAULT_MAX_ENTRIES = int(os.getenv("QSE_FIT_CACHE_ENTRIES", "512"))
+DEFAULT_CACHE_DIR = os.getenv("QSE_FIT_CACHE_DIR") or None
+
+
+@dataclass
+class FitCacheStats:
+    """Lookup counters; ``disk_hits`` are the subset of ``hits`` served from disk."""
+
+    hits: int = 0
+    disk_hits: int = 0
+    misses: int = 0
+    stores: int = 0
+    evictions: int = 0
+    entries: int = 0
+
+    def to_dict(self) -> dict[str, int]:
+        return asdict(self)
+
+
+def returns_fingerprint(returns: Any) -> str:
+    """Digest of a return series' float64 values and shape."""
+
+    arr = np.ascontiguousarray(np.asarray(returns, dtype=np.float64))
+    digest = hashlib.blake2b(arr.tobytes(), digest_size=16)
+    digest.update(repr(arr.shape).encode())
+    return digest.hexdigest()
+
+
+def fit_cache_key(model: str, returns: Any, settings: Mapping[str, Any] | None = None) -> str:
+    """Key for fitting ``model`` on ``returns`` with ``settings``."""
+
+    payload = {
+        "version": FIT_CACHE_VERSION,
+        "model": model,
+        "returns": returns_fingerprint(returns),
+        "settings": dict(settings or {}),
+    }
+    text = json.dumps(payload, sort_keys=True, default=str)
+    return hashlib.blake2b(text.encode(), digest_size=20).hexdigest()
+
+
+class FitCache:
+    """Two-tier (memory LRU + optional JSON directory) store of fitted states."""
+
+    def __init__(
+        self, max_entries: int = DEFAULT_MAX_ENTRIES, cache_dir: str | Path | None = None
+    ) -> None:
+        self.max_entries = max(0, int(max_entries))
+        self.cache_dir = Path(cache_dir) if cache_dir else None
+        self.stats = FitCacheStats()
+        self._entries: OrderedDict[str, dict] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def path_for(self, key: str) -> Path | None:
+        if self.cache_dir is None:
+            return None
+        return self.cache_dir / key[:2] / f"{key}.json"
+
+    def get(self, key: str) -> dict | None:
+        """Cached entry for ``key`` (memory first, then disk), or None."""
+
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+                self.stats.hits += 1
+                return entry
+
+        entry = self._read(key)
+        with self._lock:
+            if entry is None:
+                self.stats.misses += 1
+                return None
+            self.stats.hits += 1
+            self.stats.disk_hits += 1
+            self._remember(key, entry)
+        return entry
+
+    def put(self, key: str, entry: dict) -> None:
+        with self._lock:
+            self.stats.stores += 1
+            self._remember(key, entry)
+        path = self.path_for(key)
+        if path is None:
+            return
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            atomic_write_text(path, json.dumps(entry, default=_json_default))
+        except OSError as exc:
+            log.warning("fit cache write failed", extra={"path": str(path), "error": str(exc)})
+
+    def clear(self) -> None:
+        """Drop the memory tier (disk entries are kept)."""
+
+        with self._lock:
+            self._entries.clear()
+            self.stats.entries = 0
+
+    def log_stats(self) -> None:
+        if self.stats.hits or self.stats.misses:
+            log.info("fit cache stats", extra=self.stats.to_dict())
+
+    def _remember(self, key: str, entry: dict) -> None:
+        if self.max_entries == 0:
+            return
+        self._entries[key] = entry
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+            self.stats.evictions += 1
+        self.stats.entries = len(self._entries)
+
+    def _read(self, key: str) -> dict | None:
+        path = self.path_for(key)
+        if path is None or not path.exists():
+            return None
+        try:
+            return json.loads(path.read_text())
+        except (OSError, ValueError) as exc:
+            log.warning("fit cache entry unreadable", extra={"path": str(path), "error": str(exc)})
+            return None
+
+
+def _json_default(obj: Any) -> Any:
+    if isinstance(obj, np.generic):
+        return obj.item()
+    if isinstance(obj, np.ndarray):
+        return obj.tolist()
+    raise TypeError(f"{type(obj).__name__} is not JSON serialisable")
+
+
+_DEFAULT_CACHE = FitCache(cache_dir=DEFAULT_CACHE_DIR)
+_enabled = True
+
+
+def default_fit_cache() -> FitCache:
+    """Return the process-wide cache used by ``cached_fit``."""
+
+    return _DEFAULT_CACHE
+
+
+def configure_fit_cache(
+    *,
+    enabled: bool | None = None,
+    cache_dir: str | Path | None = None,
+    max_entries: int | None = None,
+) -> FitCache:
+    """Toggle memoisation or replace the process-wide cache (new tiers start empty)."""
+
+    global _DEFAULT_CACHE, _enabled
+    if enabled is not None:
+        _enabled = bool(enabled)
+    if cache_dir is not None or max_entries is not None:
+        _DEFAULT_CACHE = FitCache(
+            max_entries=DEFAULT_MAX_ENTRIES if max_entries is None else max_entries,
+            cache_dir=cache_dir if cache_dir is not None else _DEFAULT_CACHE.cache_dir,
+        )
+    return _DEFAULT_CACHE
+
+
+def cached_fit(fit: Callable[..., None]) -> Callable[..., None]:
+    """Memoise a ``ReturnDistribution.fit(self, returns, ...)`` method."""
+
+    signature = inspect.signature(fit)
+
+    @functools.wraps(fit)
+    def wrapper(self, returns, *args, **kwargs) -> None:
+        if not _enabled:
+            return fit(self, returns, *args, **kwargs)
+        bound = signature.bind(self, returns, *args, **kwargs)
+        bound.apply_defaults()
+        settings = {k: v for k, v in bound.arguments.items() if k not in ("self", "returns")}
+        model = f"{type(self).__module__}.{type(self).__qualname__}"
+        try:
+            key = fit_cache_key(model, returns, settings)
+        except (TypeError, ValueError):  # non-numeric input: let fit() report it
+            return fit(self, returns, *args, **kwargs)
+
+        cache = default_fit_cache()
+        entry = cache.get(key)
+        if entry is not None:
+            self.restore_fit_state(entry["state"])
+            self.metadata = DistributionMetadata(**entry["metadata"])
+            log.debug("fit cache hit", extra={"model": model, **cache.stats.to_dict()})
+            return None
+
+        fit(self, returns, *args, **kwargs)
+        cache.put(key, {"state": self.fit_state(), "metadata": asdict(self.metadata)})
+        log.debug("fit cache miss", extra={"model": model, **cache.stats.to_dict()})
+        return None
+
+    return wrapper
+
+
+__all__ = [
+    "DEFAULT_MAX_ENTRIES",
+    "FIT_CACHE_VERSION",
+    "FitCache",
+    "FitCacheStats",
+    "cached_fit",
+    "configure_fit_cache",
+    "default_fit_cache",
+    "fit_cache_key",
+    "returns_fingerprint",
+]
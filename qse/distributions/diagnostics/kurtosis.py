@@ -7,10 +7,15 @@ from scipy.stats import kurtosis
 
 
 def compare_kurtosis(empirical: np.ndarray, model_samples: np.ndarray) -> dict:
+    return compare_kurtosis_value(empirical, float(kurtosis(model_samples, fisher=True)))
+
+
+def compare_kurtosis_value(empirical: np.ndarray, model_k: float) -> dict:
+    """``compare_kurtosis`` given the model's excess kurtosis."""
     emp_k = float(kurtosis(empirical, fisher=True))
-    model_k = float(kurtosis(model_samples, fisher=True))
+    model_k = float(model_k)
     meets_threshold = model_k >= 1.0
     return {"empirical": emp_k, "model": model_k, "meets_threshold": meets_threshold}
 
 
-__all__ = ["compare_kurtosis"]
+__all__ = ["compare_kurtosis", "compare_kurtosis_value"]
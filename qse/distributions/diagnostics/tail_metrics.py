@@ -2,15 +2,23 @@
 
 from __future__ import annotations
 
+from typing import Mapping
+
 import numpy as np
 
 
 def tail_error(empirical: np.ndarray, model_samples: np.ndarray, levels=(0.95, 0.99, 0.995)) -> dict:
     """Compute relative tail errors at specified upper-tail VaR levels."""
+    model_quantiles = {lvl: float(np.quantile(model_samples, 1.0 - lvl)) for lvl in levels}
+    return tail_error_from_quantiles(empirical, model_quantiles)
+
+
+def tail_error_from_quantiles(empirical: np.ndarray, model_quantiles: Mapping[float, float]) -> dict:
+    """``tail_error`` given the model's ``1 - level`` quantiles keyed by level."""
     errors = {}
-    for lvl in levels:
+    for lvl, mod_q in model_quantiles.items():
         emp_q = float(np.quantile(empirical, 1.0 - lvl))
-        mod_q = float(np.quantile(model_samples, 1.0 - lvl))
+        mod_q = float(mod_q)
         if emp_q == 0:
             rel = 0.0
         else:
@@ -19,4 +27,4 @@ def tail_error(empirical: np.ndarray, model_samples: np.ndarray, levels=(0.95, 0
     return errors
 
 
-__all__ = ["tail_error"]
+__all__ = ["tail_error", "tail_error_from_quantiles"]
@@ -2,8 +2,8 @@
 
 from __future__ import annotations
 
-from qse.distributions.diagnostics.kurtosis import compare_kurtosis
-from qse.distributions.diagnostics.tail_metrics import tail_error
+from qse.distributions.diagnostics.kurtosis import compare_kurtosis, compare_kurtosis_value
+from qse.distributions.diagnostics.tail_metrics import tail_error, tail_error_from_quantiles
 
 
 def build_tail_report(empirical, model_samples) -> dict:
@@ -13,4 +13,11 @@ def build_tail_report(empirical, model_samples) -> dict:
     return {"tail_errors": errors, "kurtosis": kurt}
 
 
-__all__ = ["build_tail_report"]
+def build_tail_report_from_summary(empirical, summary, levels=(0.95, 0.99, 0.995)) -> dict:
+    """``build_tail_report`` from a streamed ``ModelSampleSummary`` instead of raw samples."""
+    errors = tail_error_from_quantiles(empirical, {lvl: summary.var(lvl) for lvl in levels})
+    kurt = compare_kurtosis_value(empirical, summary.kurtosis())
+    return {"tail_errors": errors, "kurtosis": kurt}
+
+
+__all__ = ["build_tail_report", "build_tail_report_from_summary"]
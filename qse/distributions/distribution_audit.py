@@ -29,6 +29,10 @@ See tasks.md Phase 7a for detailed implementation tasks.
 from __future__ import annotations
 
 import json
+import os
+import pickle
+from concurrent.futures import Executor, ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
 from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Dict, List, Optional, Sequence, Tuple
@@ -36,15 +40,17 @@ from typing import Dict, List, Optional, Sequence, Tuple
 import numpy as np
 import pandas as pd
 
-from qse.distributions.backtesting.breach_counter import count_breaches
-from qse.distributions.backtesting.christoffersen_test import christoffersen_pvalue
+from qse.distributions.backtesting.coverage import CoverageTests, breach_matrix, coverage_tests
 from qse.distributions.backtesting.data_split import train_test_split
-from qse.distributions.backtesting.kupiec_test import kupiec_pvalue
+from qse.distributions.backtesting.rolling_var import RollingVarConfig, rolling_var_forecasts
 from qse.distributions.backtesting.var_predictor import predict_var_from_samples
-from qse.distributions.cache.cache_manager import get_cache_path, is_fresh, load_cache, save_cache, TTL_DAYS
-from qse.distributions.cache.serializer import deserialize_payload, serialize_payload
-from qse.distributions.diagnostics.tail_report import build_tail_report
-from qse.distributions.diagnostics.tail_metrics import tail_error
+from qse.distributions.cache.cache_manager import DEFAULT_CACHE_DIR, AuditCache, TTL_DAYS
+from qse.distributions.cache.serializer import serialize_payload
+from qse.distributions.diagnostics.tail_report import (
+    build_tail_report,
+    build_tail_report_from_summary,
+)
+from qse.distributions.diagnostics.tail_metrics import tail_error, tail_error_from_quantiles
 from qse.distributions.errors import (
     handle_insufficient_data,
     has_minimum_samples,
@@ -56,14 +62,18 @@ from qse.distributions.fitters.student_t_fitter import StudentTFitter
 from qse.distributions.integration.cache_checker import warn_if_stale
 from qse.distributions.metrics.information_criteria import aic as calc_aic, bic as calc_bic
 from qse.distributions.models import FitResult
+from qse.distributions.plotting.plot_data import (
+    PLOT_IMAGE_SUFFIX,
+    compute_fit_plot_data,
+    plot_data_path,
+    save_plot_data,
+)
 from qse.distributions.selection.selection_report import build_selection_report
 from qse.distributions.selection.scorer import composite_score
-from qse.distributions.validation.clustering_calc import autocorr_squared_returns
-from qse.distributions.validation.drawdown_calc import max_drawdown
-from qse.distributions.validation.extreme_moves import extreme_move_frequencies
 from qse.distributions.validation.historical_metrics import compute_historical_metrics
+from qse.distributions.validation.path_metrics import realism_metrics
 from qse.distributions.validation.realism_report import build_realism_report
-from qse.distributions.validation.volatility_calc import annualized_volatility
+from qse.distributions.validation.sample_stream import summarize_model_samples
 from qse.distributions.validation.stationarity import MIN_SAMPLES
 from qse.exceptions import DistributionFitError
 from qse.interfaces.distribution import ReturnDistribution
@@ -71,6 +81,9 @@ from qse.utils.logging import get_logger
 
 log = get_logger(__name__, component="distribution_audit")
 
+TAIL_LEVELS = (0.95, 0.99, 0.995)  # tail metrics / tail report
+VAR_LEVELS = (0.95, 0.99)  # static VaR backtests
+
 
 # ---------------------------------------------------------------------------
 # Data classes for audit results
@@ -307,37 +320,37 @@ def compute_tail_metrics(
             simulated = fitter.sample(n_paths=mc_paths, n_steps=mc_steps, seed=draw_seed).reshape(-1)  # type: ignore[attr-defined]
             samples_by_model[spec.name] = simulated
             errors = tail_error(returns, simulated, levels=levels)
-
-            def _metric(level: float, key: str) -> Tuple[float, float, float]:
-                entry = errors.get(key)
-                if not entry:
-                    return emp_q[level], float(np.nan), float("inf")
-                return entry["empirical"], entry["model"], entry["relative_error"]
-
-            emp_95, model_95, err_95 = _metric(0.95, "var_95.0")
-            emp_99, model_99, err_99 = _metric(0.99, "var_99.0")
-            emp_995, model_995, err_995 = _metric(0.995, "var_99.5")
-
-            tail_results.append(
-                TailMetrics(
-                    model_name=spec.name,
-                    var_emp_95=emp_95,
-                    var_emp_99=emp_99,
-                    var_emp_995=emp_995,
-                    var_model_95=model_95,
-                    var_model_99=model_99,
-                    var_model_995=model_995,
-                    tail_error_95=err_95,
-                    tail_error_99=err_99,
-                    tail_error_995=err_995,
-                )
-            )
+            tail_results.append(_tail_metrics(spec.name, errors, emp_q))
         except Exception as exc:  # noqa: BLE001
             log.warning("tail metric calculation failed", extra={"model": spec.name, "error": str(exc)})
 
     return tail_results, samples_by_model
 
 
+def _tail_metrics(model_name: str, errors: dict, emp_q: Dict[float, float]) -> TailMetrics:
+    def _metric(level: float, key: str) -> Tuple[float, float, float]:
+        entry = errors.get(key)
+        if not entry:
+            return emp_q.get(level, float(np.nan)), float(np.nan), float("inf")
+        return entry["empirical"], entry["model"], entry["relative_error"]
+
+    emp_95, model_95, err_95 = _metric(0.95, "var_95.0")
+    emp_99, model_99, err_99 = _metric(0.99, "var_99.0")
+    emp_995, model_995, err_995 = _metric(0.995, "var_99.5")
+    return TailMetrics(
+        model_name=model_name,
+        var_emp_95=emp_95,
+        var_emp_99=emp_99,
+        var_emp_995=emp_995,
+        var_model_95=model_95,
+        var_model_99=model_99,
+        var_model_995=model_995,
+        tail_error_95=err_95,
+        tail_error_99=err_99,
+        tail_error_995=err_995,
+    )
+
+
 def run_var_backtests(
     returns_test: np.ndarray,
     fitted_models: Sequence[ModelSpec],
@@ -348,11 +361,11 @@ def run_var_backtests(
     """
     Perform VaR backtests on an out-of-sample segment using each model.
 
-    TODO [T150-T155, AS4 - scheduled]:
-    - Call ``qse.var_predictor`` to generate rolling one-step VaR forecasts instead of
-      sampling static returns from ``fitter.sample``.
-    - Replace placeholder p-values with the actual Kupiec (LR_uc) and Christoffersen (LR_ind) tests
-      defined under ``distributions.backtesting`` modules and persist their statistics in ``VarBacktestResult``.
+    Kupiec (LR_uc) and Christoffersen (LR_ind) p-values come from the
+    log-space, vectorized engine in ``distributions.backtesting.coverage``;
+    see ``run_rolling_var_backtests`` for walk-forward VaR forecasts.
+
+    TODO [T154-T155, AS4 - scheduled]:
     - Compute breach counts via ``breach_counter.py`` and aggregate everything within
       ``backtest_report.py`` so CLI output can summarize pass/fail decisions per AS4.
     - Enforce FR requirement: audit must mark catastrophic failure when **both** tests return ``p < 0.01``.
@@ -369,33 +382,124 @@ def run_var_backtests(
             continue
 
         try:
-            for level in levels:
-                var_level = predict_var_from_samples(sample, level)
-                n_breaches, breach_sequence = count_breaches(returns_test, var_level)
-                n_obs = len(returns_test)
-                expected_breaches = (1.0 - level) * n_obs
-                kupiec = kupiec_pvalue(n_obs, n_breaches, level)
-                christ = christoffersen_pvalue(breach_sequence)
-                passed = kupiec >= 0.05 and christ >= 0.05
-
-                results.append(
-                    VarBacktestResult(
-                        model_name=spec.name,
-                        level=level,
-                        n_obs=n_obs,
-                        n_breaches=n_breaches,
-                        expected_breaches=expected_breaches,
-                        kupiec_pvalue=kupiec,
-                        christoffersen_pvalue=christ,
-                        passed=passed,
-                    )
-                )
+            var_levels = [predict_var_from_samples(sample, level) for level in levels]
+            results.extend(_static_var_backtests(spec.name, returns_test, var_levels, levels))
         except Exception as exc:  # noqa: BLE001
             log.warning("VaR backtest failed", extra={"model": spec.name, "error": str(exc)})
 
     return results
 
 
+def _static_var_backtests(
+    model_name: str,
+    returns_test: np.ndarray,
+    var_levels: Sequence[float],
+    levels: Sequence[float],
+) -> List[VarBacktestResult]:
+    # One static VaR per level; all levels are tested in one vectorized call
+    var_arr = np.asarray(var_levels, dtype=float)
+    breaches, valid = breach_matrix(np.asarray(returns_test)[None, :], var_arr[:, None])
+    tests = coverage_tests(breaches, np.asarray(levels), valid)
+    return _var_results(model_name, levels, tests)
+
+
+def run_rolling_var_backtests(
+    returns: np.ndarray,
+    fitted_models: Sequence[ModelSpec],
+    fit_results: Sequence[FitResult],
+    *,
+    start: int,
+    config: RollingVarConfig | None = None,
+    levels: Sequence[float] = (0.95, 0.99),
+    seed: int | None = None,
+    max_workers: int | None = 1,
+    executor: Executor | None = None,
+) -> List[VarBacktestResult]:
+    """Walk-forward VaR backtests over ``returns[start:]`` (AS4 rolling mode).
+
+    Each model is refit on a sliding window and forecasts next-day VaR (see
+    ``qse.distributions.backtesting.rolling_var``); the breach sequences feed
+    the same Kupiec/Christoffersen tests as the static backtest.
+    """
+    config = config or RollingVarConfig()
+    fit_success = {fr.model_name: fr.fit_success for fr in fit_results}
+    fitters = {spec.name: spec.cls for spec in fitted_models if fit_success.get(spec.name, False)}
+    if not fitters:
+        return []
+    forecasts = rolling_var_forecasts(
+        returns,
+        fitters,
+        start=start,
+        config=config,
+        levels=levels,
+        seed=seed,
+        max_workers=max_workers,
+        executor=executor,
+    )
+
+    # (models x levels x days) breach matrix, tested in one vectorized call
+    names = list(forecasts)
+    var = np.stack([forecasts[name].var.T for name in names])
+    realized = forecasts[names[0]].realized
+    breaches, valid = breach_matrix(realized[None, None, :], var)
+    tests = coverage_tests(breaches, np.asarray(levels)[None, :], valid)
+
+    results: List[VarBacktestResult] = []
+    for i, name in enumerate(names):
+        forecast = forecasts[name]
+        if not tests.n_obs[i].any():
+            log.warning("rolling VaR backtest produced no forecasts", extra={"model": name})
+            continue
+        results.extend(_var_results(name, levels, tests, index=i))
+        if forecast.n_failed_refits:
+            log.info(
+                "rolling VaR refits without a clean fit",
+                extra={
+                    "model": name,
+                    "failed": forecast.n_failed_refits,
+                    "refits": forecast.n_refits,
+                },
+            )
+    return results
+
+
+def _var_results(
+    model_name: str,
+    levels: Sequence[float],
+    tests: CoverageTests,
+    index: int | None = None,
+) -> List[VarBacktestResult]:
+    """VarBacktestResult rows for one model from a (levels,) or (models, levels) test grid."""
+
+    def pick(values: np.ndarray, j: int):
+        return values[index, j] if index is not None else values[j]
+
+    passed = tests.passed()
+    return [
+        VarBacktestResult(
+            model_name=model_name,
+            level=level,
+            n_obs=int(pick(tests.n_obs, j)),
+            n_breaches=int(pick(tests.n_breaches, j)),
+            expected_breaches=float(pick(tests.expected_breaches, j)),
+            kupiec_pvalue=float(pick(tests.kupiec_pvalue, j)),
+            christoffersen_pvalue=float(pick(tests.christoffersen_pvalue, j)),
+            passed=bool(pick(passed, j)),
+        )
+        for j, level in enumerate(levels)
+    ]
+
+
+def audit_cache_source(
+    data_source: str | None, var_backtest: RollingVarConfig | None
+) -> str | None:
+    """Cache-key data source; rolling-backtest audits are cached apart from static ones."""
+
+    if var_backtest is None:
+        return data_source
+    return f"{data_source or 'na'}:{var_backtest.tag}"
+
+
 def simulate_paths_and_metrics(
     symbol: str,
     s0: float,
@@ -442,40 +546,28 @@ def simulate_paths_and_metrics(
             fitter = spec.cls if hasattr(spec.cls, "sample") else spec.cls()
             draw_seed = _derive_seed(seed, spec.name, "sim")
             returns = fitter.sample(n_paths=paths, n_steps=steps, seed=draw_seed)  # type: ignore[attr-defined]
-            price_paths = np.exp(np.log(max(s0, 1e-9)) + np.cumsum(returns, axis=1))
-            price_paths = np.clip(price_paths, 1e-8, None)
-
-            returns_flat = returns.reshape(-1)
-            sim_vol = annualized_volatility(returns_flat)
-            sim_acf = autocorr_squared_returns(returns_flat, lag=1)
-            drawdowns = [max_drawdown(path) for path in price_paths]
-            mean_max_dd = float(np.mean(drawdowns))
-            extremes = extreme_move_frequencies(returns_flat)
-
-            sim_detail = {
-                "annualized_vol": sim_vol,
-                "acf_sq_lag1": sim_acf,
-                "max_drawdown": mean_max_dd,
-                "extremes": extremes,
-            }
+            # One chunked pass: price paths only ever exist for one block of paths
+            sim_detail = realism_metrics(returns, s0)
+            sim_results.append(_simulation_metrics(spec.name, sim_detail))
             realism_reports[spec.name] = build_realism_report(sim_detail, hist_metrics)
-
-            sim_results.append(
-                SimulationMetrics(
-                    model_name=spec.name,
-                    mean_annualized_vol=sim_vol,
-                    acf_sq_returns_lag1=sim_acf,
-                    mean_max_drawdown=mean_max_dd,
-                    freq_gt_3pct_move=extremes.get("gt_3pct", 0.0),
-                    freq_gt_5pct_move=extremes.get("gt_5pct", 0.0),
-                )
-            )
         except Exception as exc:  # noqa: BLE001
             log.warning("simulation metrics failed", extra={"model": spec.name, "error": str(exc)})
 
     return sim_results, realism_reports
 
 
+def _simulation_metrics(model_name: str, sim_detail: dict) -> SimulationMetrics:
+    extremes = sim_detail["extremes"]
+    return SimulationMetrics(
+        model_name=model_name,
+        mean_annualized_vol=sim_detail["annualized_vol"],
+        acf_sq_returns_lag1=sim_detail["acf_sq_lag1"],
+        mean_max_drawdown=sim_detail["max_drawdown"],
+        freq_gt_3pct_move=extremes.get("gt_3pct", 0.0),
+        freq_gt_5pct_move=extremes.get("gt_5pct", 0.0),
+    )
+
+
 def score_models(
     fit_results: Sequence[FitResult],
     tail_metrics: Sequence[TailMetrics],
@@ -643,6 +735,233 @@ def select_best_fit(
     return None
 
 
+@dataclass
+class ModelAuditOutcome:
+    """Fit, tail, VaR and realism results for one candidate model."""
+
+    spec: ModelSpec  # ``cls`` holds the fitted instance
+    fit_result: FitResult
+    tail_metrics: List[TailMetrics] = field(default_factory=list)
+    var_backtests: List[VarBacktestResult] = field(default_factory=list)
+    simulation_metrics: List[SimulationMetrics] = field(default_factory=list)
+    tail_report: Optional[dict] = None
+    realism_report: Optional[dict] = None
+
+
+def audit_single_model(
+    spec: ModelSpec,
+    r_train: np.ndarray,
+    r_test: np.ndarray,
+    *,
+    hist_metrics: dict,
+    s0: float,
+    symbol: str | None = None,
+    seed: int | None = None,
+    paths: int = 10_000,
+    steps: int = 252,
+    var_backtest: RollingVarConfig | None = None,
+    rolling_var: bool = True,
+) -> ModelAuditOutcome:
+    """Run every per-model audit stage for ``spec``.
+
+    The model is sampled once: ``paths x steps`` returns drawn from the
+    ``_derive_seed(seed, model, "sim")`` stream are streamed block by block
+    into a quantile sketch, moment sums and the realism accumulators, so the
+    tail metrics, tail report, static VaR and simulation metrics all come
+    from the same draws and peak memory stays at one block. With
+    ``var_backtest`` the VaR stage is a walk-forward backtest over the test
+    segment (seeded from its own stream) instead of the static one;
+    ``rolling_var=False`` leaves that stage to the caller (``run_model_audits``
+    spreads its refit segments over the pool).
+    """
+
+    fit_result = fit_candidate_models(r_train, [spec], symbol=symbol)[0]
+    outcome = ModelAuditOutcome(spec=spec, fit_result=fit_result)
+    if not fit_result.fit_success:
+        return outcome
+
+    try:
+        fitter = spec.cls if hasattr(spec.cls, "sample") else spec.cls()
+        summary = summarize_model_samples(
+            fitter,
+            s0=s0,
+            paths=paths,
+            steps=steps,
+            seed=_derive_seed(seed, spec.name, "sim"),
+        )
+    except Exception as exc:  # noqa: BLE001
+        log.warning("model sampling failed", extra={"model": spec.name, "error": str(exc)})
+        summary = None
+
+    if summary is not None:
+        try:
+            emp_q = {lvl: float(np.quantile(r_train, 1.0 - lvl)) for lvl in TAIL_LEVELS}
+            model_q = {lvl: summary.var(lvl) for lvl in TAIL_LEVELS}
+            errors = tail_error_from_quantiles(r_train, model_q)
+            outcome.tail_metrics = [_tail_metrics(spec.name, errors, emp_q)]
+            outcome.tail_report = build_tail_report_from_summary(r_train, summary, TAIL_LEVELS)
+        except Exception as exc:  # noqa: BLE001
+            log.warning("tail diagnostics failed", extra={"model": spec.name, "error": str(exc)})
+
+    if var_backtest is not None:
+        if rolling_var:
+            outcome.var_backtests = _rolling_var_stage(
+                outcome, r_train, r_test, var_backtest, seed=seed
+            )
+    elif summary is not None:
+        try:
+            var_levels = [summary.var(lvl) for lvl in VAR_LEVELS]
+            outcome.var_backtests = _static_var_backtests(spec.name, r_test, var_levels, VAR_LEVELS)
+        except Exception as exc:  # noqa: BLE001
+            log.warning("VaR backtest failed", extra={"model": spec.name, "error": str(exc)})
+
+    if summary is not None:
+        try:
+            sim_detail = summary.realism.result()
+            outcome.simulation_metrics = [_simulation_metrics(spec.name, sim_detail)]
+            outcome.realism_report = build_realism_report(sim_detail, hist_metrics)
+        except Exception as exc:  # noqa: BLE001
+            log.warning("simulation metrics failed", extra={"model": spec.name, "error": str(exc)})
+    return outcome
+
+
+def _rolling_var_stage(
+    outcome: ModelAuditOutcome,
+    r_train: np.ndarray,
+    r_test: np.ndarray,
+    config: RollingVarConfig,
+    *,
+    seed: int | None,
+    executor: Executor | None = None,
+) -> List[VarBacktestResult]:
+    """Walk-forward VaR backtest of one audited model over the test segment."""
+
+    return run_rolling_var_backtests(
+        np.concatenate([r_train, r_test]),
+        [outcome.spec],
+        [outcome.fit_result],
+        start=len(r_train),
+        config=config,
+        seed=_derive_seed(seed, outcome.spec.name, "rolling_var"),
+        executor=executor,
+    )
+
+
+def default_audit_workers(n_models: int = 3, *, rolling_var: bool = False) -> int:
+    """One worker per candidate model, bounded by the CPU count.
+
+    Rolling VaR backtests add (model x refit segment) tasks, so they use every CPU.
+    """
+
+    if rolling_var:
+        return max(1, os.cpu_count() or 1)
+
+    return max(1, min(n_models, os.cpu_count() or 1))
+
+
+def _is_pool_failure(exc: BaseException) -> bool:
+    """True when a task failed because it could not run on the pool (not a bug in the task)."""
+
+    if isinstance(exc, (pickle.PicklingError, BrokenProcessPool)):
+        return True
+    # Unpicklable objects surface as TypeError ("cannot pickle ...") or, for local
+    # functions, AttributeError ("Can't pickle local object ...")
+    return isinstance(exc, (TypeError, AttributeError)) and "pickle" in str(exc).lower()
+
+
+def run_model_audits(
+    candidate_models: Sequence[ModelSpec],
+    r_train: np.ndarray,
+    r_test: np.ndarray,
+    *,
+    hist_metrics: dict,
+    s0: float,
+    symbol: str | None = None,
+    seed: int | None = None,
+    paths: int = 10_000,
+    steps: int = 252,
+    max_workers: int | None = 1,
+    executor: Executor | None = None,
+    var_backtest: RollingVarConfig | None = None,
+) -> List[ModelAuditOutcome]:
+    """Audit each candidate model as an independent task; results keep candidate order.
+
+    With ``max_workers > 1`` (or a shared ``executor``) the models run on a
+    process pool, so wall time approaches that of the slowest model. With
+    ``var_backtest`` each model's walk-forward refit segments are submitted to
+    the same pool once its fit returns, rather than running serially inside
+    the model task. A model whose task cannot run in a worker (e.g. an
+    unpicklable custom fitter) is audited in-process instead.
+    """
+
+    kwargs = dict(
+        hist_metrics=hist_metrics,
+        s0=s0,
+        symbol=symbol,
+        seed=seed,
+        paths=paths,
+        steps=steps,
+        var_backtest=var_backtest,
+    )
+    parallel_tasks = len(candidate_models) > 1 or var_backtest is not None
+    if executor is None and (max_workers is None or max_workers <= 1 or not parallel_tasks):
+        return [audit_single_model(spec, r_train, r_test, **kwargs) for spec in candidate_models]
+
+    own_pool = executor is None
+    if own_pool and var_backtest is None:
+        max_workers = min(max_workers, len(candidate_models))
+    pool = executor or ProcessPoolExecutor(max_workers=max_workers)
+    try:
+        futures = [
+            pool.submit(audit_single_model, spec, r_train, r_test, **kwargs, rolling_var=False)
+            for spec in candidate_models
+        ]
+        outcomes = []
+        for spec, future in zip(candidate_models, futures):
+            try:
+                outcome = future.result()
+            except Exception as exc:
+                if not _is_pool_failure(exc):
+                    raise
+                log.warning(
+                    "model audit task failed in worker; running in-process",
+                    extra={"model": spec.name, "error": str(exc)},
+                )
+                outcomes.append(audit_single_model(spec, r_train, r_test, **kwargs))
+                continue
+            if var_backtest is not None and outcome.fit_result.fit_success:
+                # Later models keep fitting on the pool while this one's segments run
+                outcome.var_backtests = _rolling_var_on_pool(
+                    outcome, r_train, r_test, var_backtest, seed=seed, pool=pool
+                )
+            outcomes.append(outcome)
+        return outcomes
+    finally:
+        if own_pool:
+            pool.shutdown(wait=True)
+
+
+def _rolling_var_on_pool(
+    outcome: ModelAuditOutcome,
+    r_train: np.ndarray,
+    r_test: np.ndarray,
+    config: RollingVarConfig,
+    *,
+    seed: int | None,
+    pool: Executor,
+) -> List[VarBacktestResult]:
+    try:
+        return _rolling_var_stage(outcome, r_train, r_test, config, seed=seed, executor=pool)
+    except Exception as exc:
+        if not _is_pool_failure(exc):
+            raise
+        log.warning(
+            "rolling VaR segments failed in worker; running in-process",
+            extra={"model": outcome.spec.name, "error": str(exc)},
+        )
+        return _rolling_var_stage(outcome, r_train, r_test, config, seed=seed)
+
+
 # ---------------------------------------------------------------------------
 # High-level orchestration
 # ---------------------------------------------------------------------------
@@ -663,6 +982,11 @@ def audit_distributions_for_symbol(
     data_source: str | None = None,
     force_refit: bool = False,
     seed: int | None = None,
+    max_workers: int | None = 1,
+    executor: Executor | None = None,
+    simulation_paths: int = 10_000,
+    simulation_steps: int = 252,
+    var_backtest: RollingVarConfig | None = None,
 ) -> DistributionAuditResult:
     """
     Run the full audit pipeline for a single symbol:
@@ -674,7 +998,7 @@ def audit_distributions_for_symbol(
     5. Run VaR backtests on test window.
     6. Simulate paths and realism metrics.
     7. Score models and select the best.
-    8. Optionally generate fit diagnostic plots.
+    8. Optionally save fit diagnostic plot data (rendered later by ``qse audit-plots``).
 
     Parameters
     ----------
@@ -691,9 +1015,20 @@ def audit_distributions_for_symbol(
     require_heavy_tails : bool, default=True
         Require selected model to have heavy tails (excess kurtosis >= 1.0)
     plot_fit : bool, default=False
-        Generate diagnostic plots showing fit quality
+        Save the numeric arrays of the fit diagnostic plots (no rendering)
     plot_output_path : Optional[str]
-        Custom path for plot output; defaults to output/distribution_fits/{symbol}_fit_diagnostics.png
+        Custom PNG path for the plot; the data is saved alongside it as ``.json``.
+        Defaults to output/distribution_fits/{symbol}_fit_data.json (+ ``_fit_diagnostics.png``)
+    max_workers : int, default=1
+        Process-pool size for the per-model fit/backtest/simulation tasks;
+        1 runs the models in-process one after another
+    executor : Optional[Executor]
+        Shared pool to submit the per-model tasks to (overrides ``max_workers``)
+    simulation_paths, simulation_steps : int
+        Size of the realism simulation per model (default 10,000 x 252)
+    var_backtest : Optional[RollingVarConfig]
+        Walk-forward VaR backtest settings; None keeps the static backtest.
+        Rolling audits are cached under their own key.
 
     Caching/reproducibility (T169-T172, AS7-8) implemented: cache entries live at
     ``output/distribution_audits`` with a 30-day TTL, ``--force-refit`` bypasses
@@ -722,13 +1057,15 @@ def audit_distributions_for_symbol(
         np.random.seed(seed)
         random.seed(seed)
 
-    cache_base = Path(cache_dir) if cache_dir else Path("output") / "distribution_audits"
-    cache_path = get_cache_path(cache_base, symbol, lookback_days, end_date, data_source)
-    cached = load_cache(cache_path)
-    if cached and not force_refit:
-        if is_fresh(cache_path, ttl_days=TTL_DAYS):
-            log.info("Loaded audit from cache", extra={"path": str(cache_path)})
-            data = deserialize_payload(json.dumps(cached))
+    cache_base = Path(cache_dir) if cache_dir else DEFAULT_CACHE_DIR
+    cache = AuditCache(cache_base, ttl_days=TTL_DAYS)
+    cache_source = audit_cache_source(data_source, var_backtest)
+    entry = None if force_refit else cache.get(symbol, lookback_days, end_date, cache_source)
+    cached = entry.load() if entry is not None else None
+    if cached:
+        if entry.is_fresh(ttl_days=TTL_DAYS):
+            log.info("Loaded audit from cache", extra={"path": str(entry.path)})
+            data = cached
             data["models"] = [m for m in (_rehydrate_model_spec(m) for m in data.get("models", [])) if m]
             data["fit_results"] = _rehydrate_fit_results(data.get("fit_results", []))
             if data.get("scores"):
@@ -738,7 +1075,7 @@ def audit_distributions_for_symbol(
             if data.get("best_fit") and not isinstance(data["best_fit"], FitResult):
                 data["best_fit"] = FitResult(**data["best_fit"])
             return DistributionAuditResult(**data)  # type: ignore[arg-type]
-        warn_if_stale(cache_path, ttl_days=TTL_DAYS)
+        warn_if_stale(entry.path, ttl_days=TTL_DAYS)
 
     r_train, r_test = train_test_split(log_returns, train_fraction=train_fraction, min_train=50)
 
@@ -749,7 +1086,26 @@ def audit_distributions_for_symbol(
             ModelSpec(name="garch_t", cls=GarchTFitter(), config={}),
         ]
 
-    fit_results = fit_candidate_models(r_train, candidate_models, symbol=symbol)
+    hist_metrics = compute_historical_metrics(r_train)
+    s0 = float(s0_override if s0_override is not None else prices.iloc[-1])
+
+    outcomes = run_model_audits(
+        candidate_models,
+        r_train,
+        r_test,
+        hist_metrics=hist_metrics,
+        s0=s0,
+        symbol=symbol,
+        seed=seed,
+        paths=simulation_paths,
+        steps=simulation_steps,
+        max_workers=max_workers,
+        executor=executor,
+        var_backtest=var_backtest,
+    )
+    # Workers fit copies of the specs; keep the fitted instances for plotting/callers
+    candidate_models = [outcome.spec for outcome in outcomes]
+    fit_results = [outcome.fit_result for outcome in outcomes]
 
     if not any(fr.fit_success for fr in fit_results):
         status_summary = ", ".join(
@@ -759,28 +1115,19 @@ def audit_distributions_for_symbol(
             "Distribution audit failed: no models converged | " + status_summary
         )
 
-    tail_metrics, samples_by_model = compute_tail_metrics(
-        r_train,
-        candidate_models,
-        fit_results,
-        seed=seed,
-    )
-
-    var_backtests = run_var_backtests(r_test, candidate_models, fit_results, samples_by_model)
-
-    hist_metrics = compute_historical_metrics(r_train)
-
-    s0 = float(s0_override if s0_override is not None else prices.iloc[-1])
-    sim_metrics, realism_reports = simulate_paths_and_metrics(
-        symbol=symbol,
-        s0=s0,
-        fitted_models=candidate_models,
-        fit_results=fit_results,
-        hist_metrics=hist_metrics,
-        paths=10_000,
-        steps=252,
-        seed=seed,
-    )
+    tail_metrics = [tm for outcome in outcomes for tm in outcome.tail_metrics]
+    var_backtests = [vb for outcome in outcomes for vb in outcome.var_backtests]
+    sim_metrics = [sm for outcome in outcomes for sm in outcome.simulation_metrics]
+    realism_reports = {
+        outcome.spec.name: outcome.realism_report
+        for outcome in outcomes
+        if outcome.realism_report is not None
+    }
+    tail_reports: Dict[str, dict] = {
+        outcome.spec.name: outcome.tail_report
+        for outcome in outcomes
+        if outcome.tail_report is not None
+    }
 
     scores = score_models(
         fit_results=fit_results,
@@ -814,40 +1161,35 @@ def audit_distributions_for_symbol(
     )
     best_fit = select_best_fit(fit_results, best_model)
 
-    # Tail diagnostics (QQ/tail errors/kurtosis) per model
-    tail_reports: Dict[str, dict] = {}
-    for name, samples in samples_by_model.items():
-        try:
-            tail_reports[name] = build_tail_report(r_train, samples)
-        except Exception as exc:
-            log.warning("tail diagnostics failed", extra={"model": name, "error": str(exc)})
-
     # Selection report using simple constraints (heavy-tail & VaR pass)
     selection_report = build_selection_report(scores, best_model.name if best_model else None)
 
-    # Generate fit diagnostic plots if requested
+    # Save fit diagnostic plot data if requested; `qse audit-plots` renders the PNGs
     if plot_fit:
-        from qse.distributions.plotting import plot_distribution_fits
-
-        output_path = None
         if plot_output_path:
-            output_path = Path(plot_output_path)
+            image_path = Path(plot_output_path)
+            data_path = image_path.with_suffix(".json")
         else:
-            # Default to output/distribution_fits/{symbol}_fit_diagnostics.png
-            output_path = Path("output") / "distribution_fits" / f"{symbol}_fit_diagnostics.png"
+            # Default to output/distribution_fits/{symbol}_fit_data.json (+ _fit_diagnostics.png)
+            data_path = plot_data_path(symbol)
+            image_path = data_path.with_name(f"{symbol}{PLOT_IMAGE_SUFFIX}")
 
         try:
-            plot_distribution_fits(
-                returns=log_returns,
-                fit_results=fit_results,
-                candidate_models=candidate_models,
+            plot_data = compute_fit_plot_data(
+                log_returns,
+                fit_results,
+                candidate_models,
                 symbol=symbol,
-                output_path=output_path,
-                show_plot=False,  # Don't block in automated workflows
+                seed=_derive_seed(seed, symbol, "plot"),
+                image_path=image_path,
+            )
+            save_plot_data(plot_data, data_path)
+            log.info(
+                "saved fit plot data; render with `qse audit-plots`",
+                extra={"symbol": symbol, "path": str(data_path)},
             )
-            log.info(f"Generated fit diagnostic plots for {symbol}")
         except Exception as exc:
-            log.warning(f"Failed to generate fit plots for {symbol}: {exc}")
+            log.warning(f"Failed to save fit plot data for {symbol}: {exc}")
 
     result = DistributionAuditResult(
         symbol=symbol,
@@ -867,7 +1209,7 @@ def audit_distributions_for_symbol(
     # Save to cache if enabled
     try:
         payload = serialize_payload(result)
-        save_cache(cache_path, json.loads(payload))
+        cache.put(symbol, lookback_days, end_date, cache_source, json.loads(payload))
     except Exception as exc:
         log.warning("Failed to cache audit result", extra={"error": str(exc)})
 
@@ -1,65 +1,65 @@
-"""GARCH-T fitter placeholder with explicit failure messaging."""
+"""GARCH(1,1)-t fitter (native compiled likelihood with an ``arch`` fallback)."""
 
 from __future__ import annotations
 
+import warnings as _warnings
+from typing import Mapping, Sequence
+
 import numpy as np
 
+from qse.distributions.fitters.garch_native import NATIVE_AVAILABLE, PARAM_NAMES, fit_garch_t
 from qse.distributions.models import FitResult
 from qse.distributions.validation.stationarity import ensure_min_samples
 from qse.exceptions import DistributionFitError
+from qse.utils.logging import get_logger
+
+log = get_logger(__name__, component="garch_t_fitter")
 
 
 class GarchTFitter:
+    """GARCH(1,1)-t with a compiled likelihood, falling back to ``arch``.
+
+    ``engine="auto"`` fits with :mod:`qse.distributions.fitters.garch_native`
+    when numba is available and uses ``arch`` only when the native optimiser
+    does not converge; ``engine="arch"`` always uses ``arch``. Both report
+    parameters in rescaled units under arch's names.
+    """
+
     name = "garch_t"
     k = 4  # omega, alpha, beta, nu (rough estimate for criteria)
-    def __init__(self) -> None:
+    supports_warm_start = True
+    engines = ("auto", "arch")
+
+    def __init__(self, engine: str = "auto") -> None:
+        if engine not in self.engines:
+            raise ValueError(f"engine must be one of {self.engines}, got {engine!r}")
+        self.engine = engine
+        self.fit_engine: str | None = None  # engine that produced the current fit
         self._fit_params = None
         self._scale_factor = None  # Store scale factor for rescaling samples
-        self._fit_result = None  # Store arch model result for simulation
+        self._fit_result = None  # arch result or NativeGarchFit of the last fit
+        self._last_resid = None  # final residual and variance seed forecast_var
+        self._last_sigma2 = None
 
-    def fit(self, returns: np.ndarray) -> FitResult:
-        ensure_min_samples(returns, self.name)
-        try:
-            from arch import arch_model  # type: ignore
-        except Exception as exc:  # pragma: no cover - dependency guard
-            raise DistributionFitError(f"GARCH-T requires 'arch' package: {exc}") from exc
+    def fit(
+        self, returns: np.ndarray, *, starting_values: Mapping[str, float] | None = None
+    ) -> FitResult:
+        """Fit GARCH(1,1)-t.
 
+        ``starting_values`` (params of a previous fit, in rescaled units)
+        warm-start the optimiser; the previous fit's scale factor is reused so
+        the parameters stay comparable. Rolling backtests refit on windows that
+        differ by a few days, where this roughly halves the fit time.
+        """
+        ensure_min_samples(returns, self.name)
+        warm = starting_values is not None and self._scale_factor is not None
         try:
-            # Build model WITH rescaling for numerical stability
-            # rescale=True prevents false convergence due to tiny parameter values
-            am = arch_model(
-                returns,
-                mean="Constant",  # Estimate mean parameter
-                vol="GARCH",
-                p=1,
-                o=0,
-                q=1,
-                dist="t",
-                rescale=True,  # CRITICAL: Enables proper optimization
-            )
-
-            # Fit with robust optimization settings
-            # Let arch auto-initialize starting values (works better with rescaling)
-            res = am.fit(
-                update_freq=0,
-                disp="off",
-                show_warning=False,
-                options={
-                    "maxiter": 1000,  # More iterations for convergence
-                    "ftol": 1e-10,    # Tight tolerance
-                },
-            )
-
-            # Extract parameters (in rescaled units) and scale factor
-            params = {k: float(v) for k, v in res.params.items()}
-            loglik = float(res.loglikelihood)
-
-            # Store scale factor for converting samples back to original scale
-            self._scale_factor = float(res.scale)
-
-            # Check convergence
-            converged_attr = getattr(res, "converged", None)
-            converged = bool(converged_attr) if converged_attr is not None else bool(getattr(res, "convergence", 0) == 0)
+            fitted = None
+            if self.engine == "auto" and NATIVE_AVAILABLE:
+                fitted = self._fit_native(returns, starting_values if warm else None)
+            if fitted is None:
+                fitted = self._fit_arch(returns, starting_values if warm else None)
+            params, loglik, n_params, converged = fitted
 
             # Validate fitted parameters (detect degenerate solutions)
             # Note: Parameters are in rescaled units
@@ -97,17 +97,17 @@ class GarchTFitter:
                     "Variance may be undefined."
                 )
 
-            # Store fitted params and model result for sampling
+            # Store fitted params for sampling
             self._fit_params = params
-            self._fit_result = res  # Store full result for simulate() method
+            n = len(returns)
 
             return FitResult(
                 model_name=self.name,
                 log_likelihood=loglik,
-                aic=float(res.aic),
-                bic=float(res.bic),
+                aic=-2.0 * loglik + 2.0 * n_params,
+                bic=-2.0 * loglik + np.log(n) * n_params,
                 params=params,
-                n=len(returns),
+                n=n,
                 converged=converged,
                 heavy_tailed=True,  # Student-t always heavy-tailed if nu < 30
                 fit_success=converged and not warnings,
@@ -116,6 +116,79 @@ class GarchTFitter:
         except Exception as exc:
             raise DistributionFitError(f"GARCH-T fit failed: {exc}") from exc
 
+    def _fit_native(
+        self, returns: np.ndarray, starting_values: Mapping[str, float] | None
+    ) -> tuple[dict, float, int, bool] | None:
+        """Compiled fit, or None when it does not converge (caller falls back to arch)."""
+        res = fit_garch_t(
+            returns,
+            scale=self._scale_factor if starting_values is not None else None,
+            starting_values=starting_values,
+        )
+        if not res.converged:
+            log.debug("native GARCH-t fit did not converge", extra={"reason": res.message})
+            return None
+        self._scale_factor = res.scale
+        self._fit_result = res
+        self._last_resid = float(res.resid[-1])
+        self._last_sigma2 = float(res.sigma2[-1])
+        self.fit_engine = "native"
+        return dict(res.params), res.loglikelihood, len(PARAM_NAMES), True
+
+    def _fit_arch(
+        self, returns: np.ndarray, starting_values: Mapping[str, float] | None
+    ) -> tuple[dict, float, int, bool]:
+        try:
+            from arch import arch_model  # type: ignore
+        except Exception as exc:  # pragma: no cover - dependency guard
+            raise DistributionFitError(f"GARCH-T requires 'arch' package: {exc}") from exc
+
+        warm = starting_values is not None
+        # Build model WITH rescaling for numerical stability
+        # rescale=True prevents false convergence due to tiny parameter values
+        am = arch_model(
+            np.asarray(returns) * self._scale_factor if warm else returns,
+            mean="Constant",  # Estimate mean parameter
+            vol="GARCH",
+            p=1,
+            o=0,
+            q=1,
+            dist="t",
+            rescale=not warm,  # CRITICAL: Enables proper optimization
+        )
+
+        # Fit with robust optimization settings
+        # Let arch auto-initialize starting values (works better with rescaling)
+        with _warnings.catch_warnings():
+            # arch falls back to its own start when a warm start violates the bounds
+            _warnings.filterwarnings("ignore", message="Starting values do not satisfy")
+            res = am.fit(
+                update_freq=0,
+                disp="off",
+                show_warning=False,
+                starting_values=np.array(list(starting_values.values())) if warm else None,
+                options={
+                    "maxiter": 1000,  # More iterations for convergence
+                    "ftol": 1e-10,    # Tight tolerance
+                },
+            )
+
+        # Extract parameters (in rescaled units) and scale factor
+        params = {k: float(v) for k, v in res.params.items()}
+
+        # Store scale factor for converting samples back to original scale
+        if not warm:
+            self._scale_factor = float(res.scale)
+        self._fit_result = res
+        self._last_resid = float(np.asarray(res.resid)[-1])
+        self._last_sigma2 = float(np.asarray(res.conditional_volatility)[-1]) ** 2
+        self.fit_engine = "arch"
+
+        # Check convergence
+        converged_attr = getattr(res, "converged", None)
+        converged = bool(converged_attr) if converged_attr is not None else bool(getattr(res, "convergence", 0) == 0)
+        return params, float(res.loglikelihood), int(res.num_params), converged
+
     def sample(self, n_paths: int, n_steps: int, seed: int | None = None):
         """
         Sample from fitted GARCH-t distribution.
@@ -137,8 +210,12 @@ class GarchTFitter:
         np.ndarray
             Simulated returns in original scale, shape (n_paths, n_steps)
         """
-        if self._fit_result is None or self._scale_factor is None:
+        if self._fit_params is None or self._scale_factor is None:
             raise DistributionFitError("GarchTFitter.sample called before fit")
+        from arch import arch_model  # type: ignore
+
+        model = arch_model(None, mean="Constant", vol="GARCH", p=1, q=1, dist="t")
+        params = np.array([self._fit_params[name] for name in PARAM_NAMES])
 
         # Set random seed if provided
         if seed is not None:
@@ -148,13 +225,39 @@ class GarchTFitter:
         # This properly handles GARCH conditional volatility dynamics
         all_paths = []
         for _ in range(n_paths):
-            sim = self._fit_result.model.simulate(self._fit_result.params, nobs=n_steps)
+            sim = model.simulate(params, nobs=n_steps)
             # Rescale back to original data scale
             path = sim.data.values / self._scale_factor
             all_paths.append(path)
 
         return np.array(all_paths)
 
+    def forecast_var(self, returns_ahead: np.ndarray, levels: Sequence[float]) -> np.ndarray:
+        """One-step-ahead VaR for each of ``returns_ahead`` (shape ``(n, len(levels))``).
+
+        Row ``i`` is the VaR for ``returns_ahead[i]`` given the fit window and
+        ``returns_ahead[:i]``: the GARCH variance recursion is run forward
+        through the realised returns with the fitted parameters held fixed.
+        """
+        if self._fit_params is None or self._scale_factor is None:
+            raise DistributionFitError("GarchTFitter.forecast_var called before fit")
+        from scipy import stats
+
+        params = self._fit_params
+        mu, omega = float(params["mu"]), float(params["omega"])
+        alpha, beta, nu = float(params["alpha[1]"]), float(params["beta[1]"]), float(params["nu"])
+        # arch's standardised t has unit variance
+        z = stats.t.ppf(1.0 - np.asarray(levels, dtype=float), nu) * np.sqrt((nu - 2.0) / nu)
+
+        resid, sigma2 = self._last_resid, self._last_sigma2
+        scaled = np.asarray(returns_ahead, dtype=float) * self._scale_factor
+        sigmas = np.empty(len(scaled))
+        for i, r in enumerate(scaled):
+            sigma2 = omega + alpha * resid * resid + beta * sigma2
+            sigmas[i] = np.sqrt(sigma2)
+            resid = r - mu
+        return (mu + sigmas[:, None] * z[None, :]) / self._scale_factor
+
     def log_likelihood(self) -> float:
         raise DistributionFitError("GARCH-T log-likelihood not available (not implemented)")
 
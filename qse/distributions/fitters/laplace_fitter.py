@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+from typing import Sequence
+
 import numpy as np
 from scipy.stats import kurtosis, laplace
 
@@ -57,6 +59,13 @@ class LaplaceFitter:
         rng = np.random.default_rng(seed)
         return rng.laplace(self.params["loc"], self.params["scale"], size=(n_paths, n_steps))
 
+    def forecast_var(self, returns_ahead: np.ndarray, levels: Sequence[float]) -> np.ndarray:
+        """One-step-ahead VaR for each of ``returns_ahead``; constant for an i.i.d. model."""
+        if not self.params:
+            raise DistributionFitError("LaplaceFitter.forecast_var called before fit")
+        q = np.tile(1.0 - np.asarray(levels, dtype=float), (len(returns_ahead), 1))
+        return laplace.ppf(q, loc=self.params["loc"], scale=self.params["scale"])
+
     def log_likelihood(self) -> float:
         if self._loglik is None:
             raise DistributionFitError("LaplaceFitter.log_likelihood called before fit")
@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+from typing import Mapping, Sequence
+
 import numpy as np
 from scipy import stats
 
@@ -13,15 +15,27 @@ from qse.exceptions import DistributionFitError
 class StudentTFitter:
     name = "student_t"
     k = 3
+    supports_warm_start = True
 
     def __init__(self) -> None:
         self.params: dict[str, float] | None = None
         self._loglik: float | None = None
 
-    def fit(self, returns: np.ndarray) -> FitResult:
+    def fit(
+        self, returns: np.ndarray, *, starting_values: Mapping[str, float] | None = None
+    ) -> FitResult:
         warnings: list[str] = []
         try:
-            df, loc, scale = stats.t.fit(returns)
+            if starting_values:
+                # Warm start from a previous fit (rolling refits on overlapping windows)
+                df, loc, scale = stats.t.fit(
+                    returns,
+                    starting_values["df"],
+                    loc=starting_values["loc"],
+                    scale=starting_values["scale"],
+                )
+            else:
+                df, loc, scale = stats.t.fit(returns)
             loglik = float(stats.t.logpdf(returns, df=df, loc=loc, scale=scale).sum())
             self._loglik = loglik
             params = {"df": float(df), "loc": float(loc), "scale": float(scale)}
@@ -47,6 +61,13 @@ class StudentTFitter:
         rng = np.random.default_rng(seed)
         return rng.standard_t(self.params["df"], size=(n_paths, n_steps)) * self.params["scale"] + self.params["loc"]
 
+    def forecast_var(self, returns_ahead: np.ndarray, levels: Sequence[float]) -> np.ndarray:
+        """One-step-ahead VaR for each of ``returns_ahead``; constant for an i.i.d. model."""
+        if not self.params:
+            raise DistributionFitError("StudentTFitter.forecast_var called before fit")
+        q = np.tile(1.0 - np.asarray(levels, dtype=float), (len(returns_ahead), 1))
+        return stats.t.ppf(q, self.params["df"], loc=self.params["loc"], scale=self.params["scale"])
+
     def log_likelihood(self) -> float:
         if self._loglik is None:
             raise DistributionFitError("StudentTFitter.log_likelihood called before fit")
@@ -6,6 +6,7 @@ import numpy as np
 from scipy.stats import kurtosis
 from numpy.random import PCG64, Generator
 
+from qse.distributions.cache.fit_cache import cached_fit
 from qse.distributions.stationarity import check_stationarity
 from qse.distributions.validation import enforce_convergence, validate_returns
 from qse.exceptions import DependencyError, DistributionFitError
@@ -19,6 +20,7 @@ class GarchTDistribution(ReturnDistribution):
         self._params = None
         self._last_return: float | None = None
 
+    @cached_fit
     def fit(self, returns: np.ndarray, min_samples: int = 252) -> None:
         validate_returns(returns, min_samples)
         stationarity = check_stationarity(returns)
@@ -49,6 +51,19 @@ class GarchTDistribution(ReturnDistribution):
             heavy_tail_warning=False,
         )
 
+    def fit_state(self) -> dict:
+        params = None if self._params is None else {k: float(v) for k, v in self._params.items()}
+        return {"params": params, "last_return": self._last_return}
+
+    def restore_fit_state(self, state: dict) -> None:
+        from arch.univariate import arch_model  # type: ignore
+        import pandas as pd
+
+        # Simulation only needs the specification, not the fitted data
+        self._model = arch_model(None, mean="Constant", vol="GARCH", p=1, q=1, dist="t")
+        self._params = pd.Series(state["params"], dtype=float)
+        self._last_return = state["last_return"]
+
     def sample(self, n_paths: int, n_steps: int, seed: int | None = None) -> np.ndarray:
         if self._model is None or self._params is None or self._last_return is None:
             raise DistributionFitError("Model not fit")
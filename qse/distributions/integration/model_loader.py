@@ -2,18 +2,11 @@
 
 from __future__ import annotations
 
-import json
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Any, Dict, Optional, Tuple
-
-from qse.distributions.cache.cache_manager import (
-    TTL_DAYS,
-    get_cache_path,
-    is_fresh,
-    load_cache,
-)
-from qse.distributions.cache.serializer import deserialize_payload
+from typing import Any, Dict, Optional
+
+from qse.distributions.cache.cache_manager import DEFAULT_CACHE_DIR, TTL_DAYS, AuditCache
 from qse.distributions.distribution_audit import instantiate_distribution
 from qse.distributions.integration.cache_checker import warn_if_stale
 from qse.distributions.integration.fallback import laplace_fallback_distribution
@@ -57,27 +50,6 @@ def _extract_best(payload: Dict[str, Any]) -> tuple[Optional[str], Dict[str, Any
     return best_model, best_fit
 
 
-def _find_latest_cache_entry(
-    cache_dir: Path,
-    symbol: str,
-    *,
-    allow_stale: bool,
-) -> Tuple[Optional[Path], Optional[dict], bool]:
-    pattern = f"{symbol}_*.json"
-    candidates = sorted(cache_dir.glob(pattern), key=lambda p: p.stat().st_mtime, reverse=True)
-    for path in candidates:
-        payload = load_cache(path)
-        if not payload:
-            continue
-        stale_flag = not is_fresh(path, ttl_days=TTL_DAYS)
-        if stale_flag:
-            warn_if_stale(path, ttl_days=TTL_DAYS)
-            if not allow_stale:
-                continue
-        return path, payload, stale_flag
-    return None, None, False
-
-
 def load_validated_model(
     *,
     symbol: str,
@@ -94,12 +66,12 @@ def load_validated_model(
     prefer the empirically selected model from the distribution audit.
     """
 
-    cache_base = Path(cache_dir) if cache_dir else Path("output") / "distribution_audits"
-    cache_path = get_cache_path(cache_base, symbol, lookback_days, end_date, data_source)
-    payload = load_cache(cache_path)
+    cache_base = Path(cache_dir) if cache_dir else DEFAULT_CACHE_DIR
+    cache = AuditCache(cache_base, ttl_days=TTL_DAYS)
+    entry = cache.get(symbol, lookback_days, end_date, data_source)
+    payload = entry.load() if entry is not None else None
 
-    def _build_from_payload(raw_payload: dict, path: Path, stale_flag: bool) -> LoadedModel:
-        data = deserialize_payload(json.dumps(raw_payload))
+    def _build_from_payload(data: dict, path: Path, stale_flag: bool) -> LoadedModel:
         best_model, best_fit = _extract_best(data)
         params = best_fit.get("params") if isinstance(best_fit.get("params"), dict) else {}
 
@@ -137,28 +109,30 @@ def load_validated_model(
 
     stale_flag = False
     if payload:
-        stale_flag = not is_fresh(cache_path, ttl_days=TTL_DAYS)
+        stale_flag = not entry.is_fresh(ttl_days=TTL_DAYS)
         if stale_flag:
-            warn_if_stale(cache_path, ttl_days=TTL_DAYS)
+            warn_if_stale(entry.path, ttl_days=TTL_DAYS)
             if not allow_stale:
                 payload = None
 
     if payload:
-        return _build_from_payload(payload, cache_path, stale_flag)
+        return _build_from_payload(payload, entry.path, stale_flag)
 
     should_try_symbol_cache = allow_symbol_fallback and (
         lookback_days is None or end_date is None or data_source is None
     )
     if should_try_symbol_cache and cache_base.exists():
-        alt_path, alt_payload, alt_stale = _find_latest_cache_entry(
-            cache_base, symbol, allow_stale=allow_stale
-        )
+        latest = cache.latest(symbol, fresh_only=not allow_stale)
+        alt_payload = latest.load() if latest is not None else None
         if alt_payload:
+            alt_stale = not latest.is_fresh(ttl_days=TTL_DAYS)
+            if alt_stale:
+                warn_if_stale(latest.path, ttl_days=TTL_DAYS)
             log.info(
                 "Using latest cached audit entry for symbol",
-                extra={"symbol": symbol, "path": str(alt_path)},
+                extra={"symbol": symbol, "path": str(latest.path)},
             )
-            return _build_from_payload(alt_payload, alt_path, alt_stale)
+            return _build_from_payload(alt_payload, latest.path, alt_stale)
 
     dist, meta = laplace_fallback_distribution("no cached audit available")
     return LoadedModel(distribution=dist, metadata=meta, source="fallback", cache_path=None)
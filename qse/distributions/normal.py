@@ -6,6 +6,7 @@ import numpy as np
 from numpy.random import PCG64, Generator
 from scipy.stats import kurtosis, norm
 
+from qse.distributions.cache.fit_cache import cached_fit
 from qse.distributions.stationarity import check_stationarity
 from qse.distributions.validation import (
     enforce_convergence,
@@ -18,11 +19,14 @@ from qse.interfaces.distribution import DistributionMetadata, ReturnDistribution
 
 
 class NormalDistribution(ReturnDistribution):
+    fit_state_attrs = ("loc", "scale")
+
     def __init__(self) -> None:
         super().__init__()
         self.loc: float | None = None
         self.scale: float | None = None
 
+    @cached_fit
     def fit(self, returns: np.ndarray, min_samples: int = 60) -> None:
         validate_returns(returns, min_samples)
         stationarity = check_stationarity(returns)
@@ -36,11 +40,12 @@ class NormalDistribution(ReturnDistribution):
         excess_kurt = float(kurtosis(returns, fisher=True))
         # normal has kurtosis 0; allow heavy_tail_status to warn
         _, warn = heavy_tail_status(excess_kurt)
+        logpdf = norm.logpdf(returns, loc=loc, scale=scale).sum()
         self.metadata = DistributionMetadata(
             estimator="mle",
-            loglik=float(norm.logpdf(returns, loc=loc, scale=scale).sum()),
-            aic=float(2 * 2 - 2 * norm.logpdf(returns, loc=loc, scale=scale).sum()),
-            bic=float(len(returns) * np.log(len(returns)) - 2 * norm.logpdf(returns, loc=loc, scale=scale).sum()),
+            loglik=float(logpdf),
+            aic=float(2 * 2 - 2 * logpdf),
+            bic=float(len(returns) * np.log(len(returns)) - 2 * logpdf),
             fit_status="success",
             min_samples=min_samples,
             excess_kurtosis=excess_kurt,
@@ -1,5 +1,36 @@
-"""Distribution fit diagnostic plotting."""
+"""Distribution fit diagnostic plotting.
 
-from qse.distributions.plotting.fit_diagnostics import plot_distribution_fits
+``plot_data`` holds the numeric panel arrays and has no plotting dependency;
+the matplotlib renderers in ``fit_diagnostics`` load on first attribute access.
+"""
 
-__all__ = ["plot_distribution_fits"]
+from qse.distributions.plotting.plot_data import (
+    FitPlotData,
+    compute_fit_plot_data,
+    load_plot_data,
+    plot_data_path,
+    save_plot_data,
+)
+
+_RENDERERS = {"plot_distribution_fits", "render_fit_plot", "render_plot_file", "render_plot_files"}
+
+
+def __getattr__(name: str):
+    if name in _RENDERERS:
+        from qse.distributions.plotting import fit_diagnostics
+
+        return getattr(fit_diagnostics, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+__all__ = [
+    "FitPlotData",
+    "compute_fit_plot_data",
+    "load_plot_data",
+    "plot_data_path",
+    "plot_distribution_fits",
+    "render_fit_plot",
+    "render_plot_file",
+    "render_plot_files",
+    "save_plot_data",
+]
@@ -2,29 +2,73 @@
 Diagnostic plotting for distribution fit quality assessment.
 
 Generates visualizations of fitted distributions against empirical data with
-quality metrics and parameter legends.
+quality metrics and parameter legends. Figures are drawn from the arrays in
+:class:`~qse.distributions.plotting.plot_data.FitPlotData`, which audits save
+without importing this module; ``render_plot_files`` renders saved files
+(optionally on a process pool) for ``qse audit-plots``.
 """
 
 from __future__ import annotations
 
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
-from typing import List, Optional, Sequence
+from typing import TYPE_CHECKING, Iterable, List, Optional, Sequence
 
 import matplotlib.pyplot as plt
 import numpy as np
 from matplotlib.figure import Figure
 
-from qse.distributions.distribution_audit import ModelSpec
 from qse.distributions.models import FitResult
+from qse.distributions.plotting.plot_data import (
+    PLOT_DATA_SUFFIX,
+    PLOT_IMAGE_SUFFIX,
+    FitPlotData,
+    compute_fit_plot_data,
+    load_plot_data,
+)
 from qse.utils.logging import get_logger
 
+if TYPE_CHECKING:  # pragma: no cover
+    from qse.distributions.distribution_audit import ModelSpec
+
 log = get_logger(__name__, component="fit_diagnostics")
 
+# Colorblind-friendly color palette (Wong palette + line styles + markers)
+# Each model gets a unique combination of color, line style, and marker
+MODEL_STYLES = {
+    "laplace": {
+        "color": "#0072B2",      # Blue
+        "linestyle": "-",         # Solid
+        "marker": "o",           # Circle
+        "markersize": 6,
+    },
+    "student_t": {
+        "color": "#E69F00",      # Orange
+        "linestyle": "--",        # Dashed
+        "marker": "s",           # Square
+        "markersize": 6,
+    },
+    "garch_t": {
+        "color": "#009E73",      # Green
+        "linestyle": "-.",        # Dash-dot
+        "marker": "^",           # Triangle up
+        "markersize": 6,
+    },
+}
+
+# Default style for unknown models
+DEFAULT_STYLE = {
+    "color": "#CC79A7",      # Purple
+    "linestyle": ":",         # Dotted
+    "marker": "D",           # Diamond
+    "markersize": 6,
+}
+
 
 def plot_distribution_fits(
     returns: np.ndarray,
     fit_results: Sequence[FitResult],
-    candidate_models: Sequence[ModelSpec],
+    candidate_models: Sequence["ModelSpec"],
     symbol: str = "UNKNOWN",
     output_path: Optional[Path] = None,
     show_plot: bool = True,
@@ -58,80 +102,39 @@ def plot_distribution_fits(
     Figure
         Matplotlib figure object
     """
+    data = compute_fit_plot_data(returns, fit_results, candidate_models, symbol=symbol)
+    return render_fit_plot(data, output_path=output_path, show_plot=show_plot)
+
+
+def render_fit_plot(
+    data: FitPlotData, output_path: Optional[Path] = None, show_plot: bool = False
+) -> Figure:
+    """Draw the four diagnostic panels from precomputed ``data``."""
     # Create figure with 2x2 subplots
     fig, axes = plt.subplots(2, 2, figsize=(16, 12))
-    fig.suptitle(f"Distribution Fit Diagnostics: {symbol}", fontsize=16, fontweight="bold")
+    fig.suptitle(f"Distribution Fit Diagnostics: {data.symbol}", fontsize=16, fontweight="bold")
 
     ax_pdf = axes[0, 0]
     ax_cdf = axes[0, 1]
     ax_qq = axes[1, 0]
     ax_tail = axes[1, 1]
-
-    # Colorblind-friendly color palette (Wong palette + line styles + markers)
-    # Each model gets a unique combination of color, line style, and marker
-    model_styles = {
-        "laplace": {
-            "color": "#0072B2",      # Blue
-            "linestyle": "-",         # Solid
-            "marker": "o",           # Circle
-            "markersize": 6,
-        },
-        "student_t": {
-            "color": "#E69F00",      # Orange
-            "linestyle": "--",        # Dashed
-            "marker": "s",           # Square
-            "markersize": 6,
-        },
-        "garch_t": {
-            "color": "#009E73",      # Green
-            "linestyle": "-.",        # Dash-dot
-            "marker": "^",           # Triangle up
-            "markersize": 6,
-        },
-    }
-
-    # Default style for unknown models
-    default_style = {
-        "color": "#CC79A7",      # Purple
-        "linestyle": ":",         # Dotted
-        "marker": "D",           # Diamond
-        "markersize": 6,
-    }
-
-    # Empirical data
-    hist_data = returns
-    x_range = np.linspace(returns.min(), returns.max(), 500)
+    hist_kwargs = {"bins": data.hist_edges, "weights": data.hist_density}
+    centers = 0.5 * (data.hist_edges[:-1] + data.hist_edges[1:])
 
     # --- Panel 1: PDF Overlay ---
-    ax_pdf.hist(hist_data, bins=50, density=True, alpha=0.3, color="gray", label="Empirical")
-
-    for spec, fr in zip(candidate_models, fit_results):
-        if not fr.fit_success:
+    ax_pdf.hist(centers, alpha=0.3, color="gray", label="Empirical", **hist_kwargs)
+    for model in data.models:
+        if model.pdf is None:
             continue
-
-        try:
-            # Sample from fitted distribution to estimate PDF
-            fitter = spec.cls
-            samples = fitter.sample(n_paths=10000, n_steps=1).flatten()
-
-            # Kernel density estimate
-            from scipy.stats import gaussian_kde
-            kde = gaussian_kde(samples)
-            pdf_vals = kde(x_range)
-
-            # Get style for this model
-            style = model_styles.get(spec.name, default_style)
-            label = _format_legend_label(spec.name, fr)
-            ax_pdf.plot(
-                x_range, pdf_vals,
-                label=label,
-                color=style["color"],
-                linestyle=style["linestyle"],
-                linewidth=2.5,
-                alpha=0.9
-            )
-        except Exception as e:
-            log.warning(f"Failed to plot PDF for {spec.name}: {e}")
+        style = MODEL_STYLES.get(model.name, DEFAULT_STYLE)
+        ax_pdf.plot(
+            data.x_grid, model.pdf,
+            label=model.label,
+            color=style["color"],
+            linestyle=style["linestyle"],
+            linewidth=2.5,
+            alpha=0.9
+        )
 
     ax_pdf.set_xlabel("Log Return")
     ax_pdf.set_ylabel("Density")
@@ -140,38 +143,20 @@ def plot_distribution_fits(
     ax_pdf.grid(True, alpha=0.3)
 
     # --- Panel 2: CDF Comparison ---
-    # Empirical CDF
-    sorted_returns = np.sort(hist_data)
-    empirical_cdf = np.arange(1, len(sorted_returns) + 1) / len(sorted_returns)
-    ax_cdf.plot(sorted_returns, empirical_cdf, label="Empirical", color="black",
+    ax_cdf.plot(data.ecdf_x, data.ecdf_y, label="Empirical", color="black",
                 linewidth=2, alpha=0.7)
-
-    for spec, fr in zip(candidate_models, fit_results):
-        if not fr.fit_success:
+    for model in data.models:
+        if model.cdf is None:
             continue
-
-        try:
-            # Generate CDF from samples
-            fitter = spec.cls
-            samples = fitter.sample(n_paths=50000, n_steps=1).flatten()
-            sorted_samples = np.sort(samples)
-            model_cdf = np.arange(1, len(sorted_samples) + 1) / len(sorted_samples)
-
-            # Interpolate to common x-range for plotting
-            cdf_interp = np.interp(sorted_returns, sorted_samples, model_cdf)
-
-            # Get style for this model
-            style = model_styles.get(spec.name, default_style)
-            ax_cdf.plot(
-                sorted_returns, cdf_interp,
-                label=spec.name.capitalize(),
-                color=style["color"],
-                linestyle=style["linestyle"],
-                linewidth=2.5,
-                alpha=0.9
-            )
-        except Exception as e:
-            log.warning(f"Failed to plot CDF for {spec.name}: {e}")
+        style = MODEL_STYLES.get(model.name, DEFAULT_STYLE)
+        ax_cdf.plot(
+            data.ecdf_x, model.cdf,
+            label=model.name.capitalize(),
+            color=style["color"],
+            linestyle=style["linestyle"],
+            linewidth=2.5,
+            alpha=0.9
+        )
 
     ax_cdf.set_xlabel("Log Return")
     ax_cdf.set_ylabel("Cumulative Probability")
@@ -180,37 +165,25 @@ def plot_distribution_fits(
     ax_cdf.grid(True, alpha=0.3)
 
     # --- Panel 3: Q-Q Plots ---
-    quantiles = np.linspace(0.01, 0.99, 100)
-    empirical_quantiles = np.quantile(hist_data, quantiles)
-
-    for spec, fr in zip(candidate_models, fit_results):
-        if not fr.fit_success:
+    qq_lo, qq_hi = data.empirical_quantiles.min(), data.empirical_quantiles.max()
+    for model in data.models:
+        if model.qq is None:
             continue
-
-        try:
-            fitter = spec.cls
-            samples = fitter.sample(n_paths=50000, n_steps=1).flatten()
-            model_quantiles = np.quantile(samples, quantiles)
-
-            # Get style for this model
-            style = model_styles.get(spec.name, default_style)
-            ax_qq.scatter(
-                empirical_quantiles, model_quantiles,
-                label=spec.name.capitalize(),
-                color=style["color"],
-                marker=style["marker"],
-                s=50,
-                alpha=0.7,
-                edgecolors='black',
-                linewidths=0.5
-            )
-        except Exception as e:
-            log.warning(f"Failed to plot Q-Q for {spec.name}: {e}")
+        style = MODEL_STYLES.get(model.name, DEFAULT_STYLE)
+        ax_qq.scatter(
+            data.empirical_quantiles, model.qq,
+            label=model.name.capitalize(),
+            color=style["color"],
+            marker=style["marker"],
+            s=50,
+            alpha=0.7,
+            edgecolors='black',
+            linewidths=0.5
+        )
+        qq_lo, qq_hi = min(qq_lo, model.qq.min()), max(qq_hi, model.qq.max())
 
     # Perfect fit reference line
-    qq_min = min(empirical_quantiles.min(), model_quantiles.min())
-    qq_max = max(empirical_quantiles.max(), model_quantiles.max())
-    ax_qq.plot([qq_min, qq_max], [qq_min, qq_max], "k--", linewidth=1.5,
+    ax_qq.plot([qq_lo, qq_hi], [qq_lo, qq_hi], "k--", linewidth=1.5,
                alpha=0.5, label="Perfect Fit")
 
     ax_qq.set_xlabel("Empirical Quantiles")
@@ -223,65 +196,24 @@ def plot_distribution_fits(
     # --- Panel 4: Left Tail Focus ---
     # Shows how well the model (fitted to all data) captures the left tail behavior
     # Use full data histogram but zoom x-axis to tail region
-    tail_threshold = np.quantile(hist_data, 0.10)
-
-    # Plot histogram of ALL data (not just tail) so scale matches model PDFs
-    ax_tail.hist(hist_data, bins=50, density=True, alpha=0.3, color="darkred",
-                 label="Empirical (All Data)")
-
-    # Define tail x-range for zooming and model evaluation
-    tail_min = hist_data.min()
-    tail_x_range = np.linspace(tail_min, tail_threshold, 200)
-
-    for spec, fr in zip(candidate_models, fit_results):
-        if not fr.fit_success:
+    ax_tail.hist(centers, alpha=0.3, color="darkred", label="Empirical (All Data)", **hist_kwargs)
+    for model in data.models:
+        if model.tail_pdf is None:
             continue
-
-        try:
-            # Use actual PDF function instead of sample+KDE for better accuracy
-            if spec.name == "laplace":
-                from scipy.stats import laplace
-                loc = fr.params.get("loc", 0.0)
-                scale = fr.params.get("scale", 1.0)
-                tail_pdf = laplace.pdf(tail_x_range, loc=loc, scale=scale)
-
-            elif spec.name == "student_t":
-                from scipy.stats import t
-                df = fr.params.get("df", 5.0)
-                loc = fr.params.get("loc", 0.0)
-                scale = fr.params.get("scale", 1.0)
-                tail_pdf = t.pdf(tail_x_range, df=df, loc=loc, scale=scale)
-
-            elif spec.name == "garch_t":
-                # GARCH-t is conditional, so we sample and use larger sample for better tail estimate
-                fitter = spec.cls
-                samples = fitter.sample(n_paths=100000, n_steps=1).flatten()
-
-                # Use KDE with scott's bandwidth on full sample, then evaluate in tail
-                from scipy.stats import gaussian_kde
-                kde = gaussian_kde(samples, bw_method='scott')
-                tail_pdf = kde(tail_x_range)
-            else:
-                # Unknown model - skip
-                continue
-
-            # Get style for this model
-            style = model_styles.get(spec.name, default_style)
-            ax_tail.plot(
-                tail_x_range, tail_pdf,
-                label=spec.name.capitalize(),
-                color=style["color"],
-                linestyle=style["linestyle"],
-                linewidth=2.5,
-                alpha=0.9
-            )
-        except Exception as e:
-            log.warning(f"Failed to plot tail for {spec.name}: {e}")
+        style = MODEL_STYLES.get(model.name, DEFAULT_STYLE)
+        ax_tail.plot(
+            data.tail_x, model.tail_pdf,
+            label=model.name.capitalize(),
+            color=style["color"],
+            linestyle=style["linestyle"],
+            linewidth=2.5,
+            alpha=0.9
+        )
 
     ax_tail.set_xlabel("Log Return")
     ax_tail.set_ylabel("Density")
     ax_tail.set_title("Left Tail Focus (Bottom 10% - Extreme Losses)")
-    ax_tail.set_xlim(tail_min, tail_threshold)  # Zoom x-axis to tail region only
+    ax_tail.set_xlim(data.tail_x[0], data.tail_x[-1])  # Zoom x-axis to tail region only
     ax_tail.legend(loc="upper left", fontsize=9)
     ax_tail.grid(True, alpha=0.3)
 
@@ -289,6 +221,7 @@ def plot_distribution_fits(
 
     # Save if output path provided
     if output_path:
+        output_path = Path(output_path)
         output_path.parent.mkdir(parents=True, exist_ok=True)
         fig.savefig(output_path, dpi=150, bbox_inches="tight")
         log.info(f"Saved fit diagnostic plot to {output_path}")
@@ -300,26 +233,66 @@ def plot_distribution_fits(
     return fig
 
 
-def _format_legend_label(model_name: str, fit_result: FitResult) -> str:
-    """
-    Format a legend label with model name, parameters, and quality metrics.
-
-    Example output:
-    "Laplace (μ=0.001, σ=0.015) | AIC=1234.5 | HT=✓"
-    """
-    params_str = ", ".join(f"{k}={v:.4f}" for k, v in fit_result.params.items())
+def image_path_for(data_path: Path, data: FitPlotData | None = None) -> Path:
+    """PNG target for a saved plot-data file (its recorded path, else alongside it)."""
+    if data is not None and data.image_path:
+        return Path(data.image_path)
+    name = data_path.name
+    stem = name[: -len(PLOT_DATA_SUFFIX)] if name.endswith(PLOT_DATA_SUFFIX) else data_path.stem
+    return data_path.with_name(f"{stem}{PLOT_IMAGE_SUFFIX}")
 
-    # Format quality metrics
-    aic_str = f"AIC={fit_result.aic:.1f}" if np.isfinite(fit_result.aic) else "AIC=inf"
-    bic_str = f"BIC={fit_result.bic:.1f}" if np.isfinite(fit_result.bic) else "BIC=inf"
-    ht_indicator = "✓" if fit_result.heavy_tailed else "✗"
 
-    label = (
-        f"{model_name.capitalize()} ({params_str})\n"
-        f"{aic_str} | {bic_str} | HeavyTail={ht_indicator}"
-    )
+def render_plot_file(data_path: Path, output_path: Optional[Path] = None) -> Path:
+    """Render one saved plot-data file to PNG and return the image path."""
+    data_path = Path(data_path)
+    data = load_plot_data(data_path)
+    target = Path(output_path) if output_path else image_path_for(data_path, data)
+    fig = render_fit_plot(data, output_path=target, show_plot=False)
+    plt.close(fig)
+    return target
 
-    return label
 
+def render_plot_files(
+    data_paths: Iterable[Path], *, force: bool = False, max_workers: int | None = 1
+) -> List[Path]:
+    """Render every plot-data file whose PNG is missing or older than the data.
 
-__all__ = ["plot_distribution_fits"]
+    ``max_workers > 1`` renders on a process pool. Failures are logged and
+    skipped; returns the images written.
+    """
+    todo = []
+    for path in map(Path, data_paths):
+        target = image_path_for(path)
+        try:
+            target = image_path_for(path, load_plot_data(path))
+        except Exception as exc:  # noqa: BLE001 - reported below when rendering
+            log.debug("plot data unreadable", extra={"path": str(path), "error": str(exc)})
+        if force or not target.exists() or target.stat().st_mtime < path.stat().st_mtime:
+            todo.append(path)
+
+    written: List[Path] = []
+    if max_workers is not None and max_workers > 1 and len(todo) > 1:
+        with ProcessPoolExecutor(max_workers=max_workers) as pool:
+            futures = {path: pool.submit(render_plot_file, path) for path in todo}
+            for path, future in futures.items():
+                try:
+                    written.append(future.result())
+                except Exception as exc:  # noqa: BLE001 - keep rendering the rest
+                    log.warning("plot render failed", extra={"path": str(path), "error": str(exc)})
+        return written
+
+    for path in todo:
+        try:
+            written.append(render_plot_file(path))
+        except Exception as exc:  # noqa: BLE001 - keep rendering the rest
+            log.warning("plot render failed", extra={"path": str(path), "error": str(exc)})
+    return written
+
+
+__all__ = [
+    "image_path_for",
+    "plot_distribution_fits",
+    "render_fit_plot",
+    "render_plot_file",
+    "render_plot_files",
+]
@@ -0,0 +1,221 @@
+"""Numeric inputs of the fit diagnostic figure (no plotting dependency).
+
+Audits call ``compute_fit_plot_data`` and ``save_plot_data``: the arrays the
+four diagnostic panels draw (histogram, density and CDF curves, Q-Q quantiles,
+left-tail densities) are tens of kilobytes of JSON per symbol, so audits never
+import matplotlib or render figures. ``qse audit-plots`` (see
+``fit_diagnostics.render_plot_files``) turns the saved files into PNGs on
+demand.
+
+Each successful model is sampled once: ``fitter.sample(1, n)`` is one long
+path, i.e. draws from the stationary marginal (for GARCH-t as well, where
+one-step samples from separate paths cost one ``arch`` simulation each).
+"""
+
+from __future__ import annotations
+
+import json
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Optional, Sequence
+
+import numpy as np
+
+from qse.data.cache_lock import atomic_write_text
+from qse.distributions.models import FitResult
+from qse.utils.logging import get_logger
+
+log = get_logger(__name__, component="plot_data")
+
+PLOT_DATA_VERSION = 1
+DEFAULT_PLOT_DIR = Path("output") / "distribution_fits"
+PLOT_DATA_SUFFIX = "_fit_data.json"
+PLOT_IMAGE_SUFFIX = "_fit_diagnostics.png"
+
+MODEL_SAMPLES = 50_000  # one draw per model serves the CDF, Q-Q and tail panels
+KDE_SAMPLES = 10_000  # subset used for the density KDE
+GRID_POINTS = 500
+TAIL_POINTS = 200
+ECDF_POINTS = 1_000
+HIST_BINS = 50
+QQ_PROBS = np.linspace(0.01, 0.99, 100)
+TAIL_QUANTILE = 0.10
+
+
+@dataclass
+class ModelPlotData:
+    """One model's curves; None where the model could not be evaluated."""
+
+    name: str
+    label: str
+    pdf: Optional[np.ndarray] = None  # on FitPlotData.x_grid
+    cdf: Optional[np.ndarray] = None  # on FitPlotData.ecdf_x
+    qq: Optional[np.ndarray] = None  # model quantiles at FitPlotData.qq_probs
+    tail_pdf: Optional[np.ndarray] = None  # on FitPlotData.tail_x
+
+
+@dataclass
+class FitPlotData:
+    """Everything ``render_fit_plot`` draws for one symbol."""
+
+    symbol: str
+    hist_edges: np.ndarray
+    hist_density: np.ndarray
+    x_grid: np.ndarray
+    ecdf_x: np.ndarray
+    ecdf_y: np.ndarray
+    qq_probs: np.ndarray
+    empirical_quantiles: np.ndarray
+    tail_x: np.ndarray
+    models: list[ModelPlotData] = field(default_factory=list)
+    image_path: Optional[str] = None  # where the PNG goes when rendered
+
+    def to_dict(self) -> dict[str, Any]:
+        out: dict[str, Any] = {"version": PLOT_DATA_VERSION}
+        for key, value in vars(self).items():
+            if key == "models":
+                out[key] = [{k: _to_list(v) for k, v in vars(m).items()} for m in value]
+            else:
+                out[key] = _to_list(value)
+        return out
+
+    @classmethod
+    def from_dict(cls, raw: dict[str, Any]) -> "FitPlotData":
+        models = [
+            ModelPlotData(**{k: _to_array(v) for k, v in m.items()}) for m in raw.get("models", [])
+        ]
+        fields = {k: _to_array(v) for k, v in raw.items() if k not in ("models", "version")}
+        return cls(models=models, **fields)
+
+
+def _to_list(value: Any) -> Any:
+    if not isinstance(value, np.ndarray):
+        return value
+    # Seven significant digits are plenty for a figure and keep the files small
+    return [float(f"{v:.7g}") for v in value.tolist()]
+
+
+def _to_array(value: Any) -> Any:
+    return np.asarray(value, dtype=float) if isinstance(value, list) else value
+
+
+def compute_fit_plot_data(
+    returns: np.ndarray,
+    fit_results: Sequence[FitResult],
+    candidate_models: Sequence[Any],
+    symbol: str = "UNKNOWN",
+    seed: Optional[int] = None,
+    image_path: Optional[Path] = None,
+) -> FitPlotData:
+    """Panel arrays for ``fit_results`` of fitted ``candidate_models`` (ModelSpecs)."""
+
+    r = np.asarray(returns, dtype=float)
+    r = r[np.isfinite(r)]
+    hist_density, hist_edges = np.histogram(r, bins=HIST_BINS, density=True)
+    x_grid = np.linspace(r.min(), r.max(), GRID_POINTS)
+    sorted_r = np.sort(r)
+    keep = np.unique(np.linspace(0, len(sorted_r) - 1, min(ECDF_POINTS, len(sorted_r))).astype(int))
+    ecdf_x = sorted_r[keep]
+    ecdf_y = (keep + 1) / len(sorted_r)
+    tail_x = np.linspace(r.min(), np.quantile(r, TAIL_QUANTILE), TAIL_POINTS)
+
+    data = FitPlotData(
+        symbol=symbol,
+        hist_edges=hist_edges,
+        hist_density=hist_density,
+        x_grid=x_grid,
+        ecdf_x=ecdf_x,
+        ecdf_y=ecdf_y,
+        qq_probs=QQ_PROBS.copy(),
+        empirical_quantiles=np.quantile(r, QQ_PROBS),
+        tail_x=tail_x,
+        image_path=str(image_path) if image_path is not None else None,
+    )
+    for i, (spec, fr) in enumerate(zip(candidate_models, fit_results)):
+        if not fr.fit_success:
+            continue
+        model = ModelPlotData(name=spec.name, label=format_legend_label(spec.name, fr))
+        try:
+            draw_seed = None if seed is None else seed + i
+            samples = np.asarray(
+                spec.cls.sample(n_paths=1, n_steps=MODEL_SAMPLES, seed=draw_seed), dtype=float
+            ).ravel()
+            samples = np.sort(samples[np.isfinite(samples)])
+            _model_curves(model, spec.name, fr, samples, data)
+        except Exception as exc:  # noqa: BLE001 - plot what is available
+            log.warning("plot data failed", extra={"model": spec.name, "error": str(exc)})
+        data.models.append(model)
+    return data
+
+
+def _model_curves(
+    model: ModelPlotData, name: str, fr: FitResult, samples: np.ndarray, data: FitPlotData
+) -> None:
+    from scipy import stats
+
+    kde = stats.gaussian_kde(samples[:: max(1, len(samples) // KDE_SAMPLES)])
+    model.pdf = kde(data.x_grid)
+    model.cdf = np.searchsorted(samples, data.ecdf_x, side="right") / len(samples)
+    model.qq = np.quantile(samples, data.qq_probs)
+    # Closed-form densities where available; KDE on the full draw otherwise
+    if name == "laplace":
+        loc, scale = fr.params.get("loc", 0.0), fr.params.get("scale", 1.0)
+        model.tail_pdf = stats.laplace.pdf(data.tail_x, loc=loc, scale=scale)
+    elif name == "student_t":
+        df, loc = fr.params.get("df", 5.0), fr.params.get("loc", 0.0)
+        scale = fr.params.get("scale", 1.0)
+        model.tail_pdf = stats.t.pdf(data.tail_x, df=df, loc=loc, scale=scale)
+    else:
+        model.tail_pdf = stats.gaussian_kde(samples, bw_method="scott")(data.tail_x)
+
+
+def format_legend_label(model_name: str, fit_result: FitResult) -> str:
+    """
+    Format a legend label with model name, parameters, and quality metrics.
+
+    Example output:
+    "Laplace (μ=0.001, σ=0.015) | AIC=1234.5 | HT=✓"
+    """
+    params_str = ", ".join(f"{k}={v:.4f}" for k, v in fit_result.params.items())
+
+    # Format quality metrics
+    aic_str = f"AIC={fit_result.aic:.1f}" if np.isfinite(fit_result.aic) else "AIC=inf"
+    bic_str = f"BIC={fit_result.bic:.1f}" if np.isfinite(fit_result.bic) else "BIC=inf"
+    ht_indicator = "✓" if fit_result.heavy_tailed else "✗"
+
+    return (
+        f"{model_name.capitalize()} ({params_str})\n"
+        f"{aic_str} | {bic_str} | HeavyTail={ht_indicator}"
+    )
+
+
+def plot_data_path(symbol: str, base_dir: Path | str | None = None) -> Path:
+    return Path(base_dir or DEFAULT_PLOT_DIR) / f"{symbol}{PLOT_DATA_SUFFIX}"
+
+
+def save_plot_data(data: FitPlotData, path: Path) -> Path:
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    atomic_write_text(path, json.dumps(data.to_dict()))
+    return path
+
+
+def load_plot_data(path: Path) -> FitPlotData:
+    raw = json.loads(Path(path).read_text())
+    if raw.get("version") != PLOT_DATA_VERSION:
+        raise ValueError(f"unsupported plot data version in {path}: {raw.get('version')}")
+    return FitPlotData.from_dict(raw)
+
+
+__all__ = [
+    "DEFAULT_PLOT_DIR",
+    "FitPlotData",
+    "ModelPlotData",
+    "PLOT_DATA_SUFFIX",
+    "PLOT_IMAGE_SUFFIX",
+    "compute_fit_plot_data",
+    "format_legend_label",
+    "load_plot_data",
+    "plot_data_path",
+    "save_plot_data",
+]
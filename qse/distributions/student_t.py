@@ -7,6 +7,7 @@ from numpy.random import PCG64, Generator
 from scipy import stats
 
 from qse.distributions.ar_detection import detect_ar_process
+from qse.distributions.cache.fit_cache import cached_fit
 from qse.distributions.stationarity import check_stationarity
 from qse.distributions.validation import (
     enforce_convergence,
@@ -20,12 +21,15 @@ from qse.interfaces.distribution import DistributionMetadata, ReturnDistribution
 
 
 class StudentTDistribution(ReturnDistribution):
+    fit_state_attrs = ("df", "loc", "scale")
+
     def __init__(self) -> None:
         super().__init__()
         self.df: float | None = None
         self.loc: float | None = None
         self.scale: float | None = None
 
+    @cached_fit
     def fit(self, returns: np.ndarray, min_samples: int = 60) -> None:
         validate_returns(returns, min_samples)
 
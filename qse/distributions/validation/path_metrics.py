@@ -0,0 +1,143 @@
+"""Chunked realism metrics over simulated return paths (US6a AS5, T157-T160).
+
+Computes the statistics of ``annualized_volatility``, ``autocorr_squared_returns``,
+``max_drawdown`` (mean over paths) and ``extreme_move_frequencies`` in one pass
+over blocks of paths, so price paths are never materialised for the whole
+simulation, and the accumulator's state does not grow with the number of
+paths. Per-path drawdowns and extreme-move frequencies are exact; the mean
+drawdown, volatility and the squared-return ACF use running sums and agree
+with the full-array helpers to floating-point rounding.
+As in the full-array helpers, paths are treated as one flattened return
+series (the lag-1 ACF pairs each path's last return with the next path's first).
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+
+import numpy as np
+
+DEFAULT_CHUNK_PATHS = 1024
+_LOG_FLOOR = 1e-9
+_PRICE_FLOOR = 1e-8
+
+
+@dataclass
+class RealismAccumulator:
+    """Running realism statistics fed one ``(paths, steps)`` block at a time."""
+
+    s0: float
+    thresholds: tuple[float, ...] = (0.03, 0.05)
+    n: int = 0
+    _shift: float | None = None  # pilot mean of returns
+    _sum: float = 0.0
+    _sum_sq: float = 0.0
+    _sq_shift: float | None = None  # pilot mean of squared returns
+    _sq_sum: float = 0.0
+    _sq_sum_sq: float = 0.0
+    _sq_cross: float = 0.0  # sum of c[t] * c[t + 1], c = sq - shift
+    _sq_first: float = 0.0
+    _sq_last: float | None = None
+    _extreme_counts: list[int] = field(default_factory=list)
+    _dd_sum: float = 0.0  # sum of per-path max drawdowns
+    _dd_paths: int = 0
+
+    def update(self, block: np.ndarray) -> None:
+        block = np.asarray(block, dtype=float)
+        if block.ndim == 1:
+            block = block[np.newaxis, :]
+        if block.size == 0:
+            return
+        flat = block.reshape(-1)
+        if self._shift is None:
+            self._shift = float(flat.mean())
+            self._sq_shift = float(np.mean(flat**2))
+            self._extreme_counts = [0] * len(self.thresholds)
+
+        centered = flat - self._shift
+        self._sum += float(centered.sum())
+        self._sum_sq += float(np.dot(centered, centered))
+
+        sq = flat**2
+        sq -= self._sq_shift
+        self._sq_sum += float(sq.sum())
+        self._sq_sum_sq += float(np.dot(sq, sq))
+        self._sq_cross += float(np.dot(sq[:-1], sq[1:]))
+        if self._sq_last is None:
+            self._sq_first = float(sq[0])
+        else:
+            self._sq_cross += self._sq_last * float(sq[0])
+        self._sq_last = float(sq[-1])
+
+        moves = np.abs(flat, out=centered)
+        for i, th in enumerate(self.thresholds):
+            self._extreme_counts[i] += int(np.count_nonzero(moves > th))
+
+        drawdowns = self._path_drawdowns(block)
+        self._dd_sum += float(drawdowns.sum())
+        self._dd_paths += drawdowns.size
+        self.n += flat.size
+
+    def _path_drawdowns(self, block: np.ndarray) -> np.ndarray:
+        prices = np.cumsum(block, axis=1)
+        prices += np.log(max(self.s0, _LOG_FLOOR))
+        np.exp(prices, out=prices)
+        np.clip(prices, _PRICE_FLOOR, None, out=prices)
+        peak = np.maximum.accumulate(prices, axis=1)
+        prices -= peak
+        prices /= peak
+        return prices.min(axis=1)
+
+    def annualized_vol(self) -> float:
+        if self.n < 2:
+            return float("nan")
+        var = (self._sum_sq - self._sum**2 / self.n) / (self.n - 1)
+        return float(np.sqrt(max(var, 0.0))) * (252.0**0.5)
+
+    def acf_sq_lag1(self) -> float:
+        if self.n <= 1:
+            return 0.0
+        d = self._sq_sum / self.n  # mean(sq) - shift
+        denom = self._sq_sum_sq - self.n * d * d
+        if denom <= 0:
+            return 0.0
+        # sum over t of (c[t+1] - d) * (c[t] - d) with c = sq - shift
+        ends = self._sq_first + (self._sq_last or 0.0)
+        numer = self._sq_cross - d * (2 * self._sq_sum - ends) + (self.n - 1) * d * d
+        return float(numer / denom)
+
+    def max_drawdown(self) -> float:
+        if not self._dd_paths:
+            return float("nan")
+        return self._dd_sum / self._dd_paths
+
+    def extremes(self) -> dict:
+        counts = self._extreme_counts or [0] * len(self.thresholds)
+        n = self.n or 1
+        return {f"gt_{int(th*100)}pct": float(c / n) for th, c in zip(self.thresholds, counts)}
+
+    def result(self) -> dict:
+        return {
+            "annualized_vol": self.annualized_vol(),
+            "acf_sq_lag1": self.acf_sq_lag1(),
+            "max_drawdown": self.max_drawdown(),
+            "extremes": self.extremes(),
+        }
+
+
+def realism_metrics(
+    returns: np.ndarray, s0: float, *, chunk_paths: int = DEFAULT_CHUNK_PATHS
+) -> dict:
+    """Realism metrics for a ``(paths, steps)`` return array, ``chunk_paths`` rows at a time."""
+
+    arr = np.asarray(returns, dtype=float)
+    if arr.ndim == 1:
+        arr = arr[np.newaxis, :]
+    acc = RealismAccumulator(s0=s0)
+    step = max(1, int(chunk_paths))
+    for start in range(0, arr.shape[0], step):
+        acc.update(arr[start : start + step])
+    return acc.result()
+
+
+__all__ = ["DEFAULT_CHUNK_PATHS", "RealismAccumulator", "realism_metrics"]
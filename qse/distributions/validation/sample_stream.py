@@ -0,0 +1,214 @@
+"""Single-pass, memory-bounded model sampling for the audit (US6a AS3-AS5).
+
+The audit needs three things from a fitted model's samples: tail quantiles
+(tail metrics, tail report, static VaR), excess kurtosis (tail report) and
+path realism statistics (volatility, clustering, drawdowns, extreme moves).
+``summarize_model_samples`` draws the simulation paths once, ``chunk_paths``
+paths at a time, and feeds every block to
+
+* ``QuantileSketch`` - log-bucketed counts with relative accuracy
+  ``relative_accuracy`` (DDSketch-style) and a fixed number of buckets;
+* ``MomentAccumulator`` - shifted power sums for mean/variance/kurtosis;
+* ``RealismAccumulator`` - the chunked realism metrics.
+
+Only one block of samples is alive at a time, so peak memory is set by
+``chunk_paths * steps`` and does not grow with the path count. Block ``i`` is
+drawn with the ``i``-th child of ``SeedSequence(seed)``; the blocking depends
+only on ``chunk_paths``, so a given seed always yields the same summary.
+"""
+
+from __future__ import annotations
+
+import math
+from dataclasses import dataclass, field
+from typing import Any, Iterator
+
+import numpy as np
+
+from qse.distributions.validation.path_metrics import DEFAULT_CHUNK_PATHS, RealismAccumulator
+
+DEFAULT_RELATIVE_ACCURACY = 1e-3
+_MIN_MAGNITUDE = 1e-12  # |x| below this counts as zero
+_MAX_MAGNITUDE = 1e3  # |x| above this is clamped into the last bucket
+
+
+@dataclass
+class QuantileSketch:
+    """Fixed-size quantile sketch.
+
+    ``quantile(q)`` is within ``relative_accuracy`` of the order statistic of
+    rank ``floor(q * (n - 1))`` (``np.quantile`` interpolates between it and
+    the next one).
+
+    Magnitudes are binned on a log scale with ratio
+    ``gamma = (1 + a) / (1 - a)`` separately for negative and positive values,
+    so memory is a few hundred KB whatever the number of values.
+    """
+
+    relative_accuracy: float = DEFAULT_RELATIVE_ACCURACY
+    count: int = 0
+    zeros: int = 0
+    _log_gamma: float = field(init=False)
+    _offset: int = field(init=False)
+    _neg: np.ndarray = field(init=False, repr=False)
+    _pos: np.ndarray = field(init=False, repr=False)
+
+    def __post_init__(self) -> None:
+        a = self.relative_accuracy
+        self._log_gamma = math.log((1 + a) / (1 - a))
+        self._offset = self._index(_MIN_MAGNITUDE)
+        n_buckets = self._index(_MAX_MAGNITUDE) - self._offset + 1
+        self._neg = np.zeros(n_buckets, dtype=np.int64)
+        self._pos = np.zeros(n_buckets, dtype=np.int64)
+
+    def _index(self, magnitude: float | np.ndarray):
+        return np.ceil(np.log(magnitude) / self._log_gamma).astype(np.int64)
+
+    def update(self, values: np.ndarray) -> None:
+        x = np.asarray(values, dtype=float).reshape(-1)
+        x = x[np.isfinite(x)]
+        self.count += x.size
+        mag = np.abs(x)
+        small = mag < _MIN_MAGNITUDE
+        self.zeros += int(np.count_nonzero(small))
+        for sign_mask, counts in ((x < 0) & ~small, self._neg), ((x > 0) & ~small, self._pos):
+            m = np.minimum(mag[sign_mask], _MAX_MAGNITUDE)
+            if m.size:
+                counts += np.bincount(self._index(m) - self._offset, minlength=counts.size)
+
+    def _value(self, bucket: int) -> float:
+        # Midpoint (in relative terms) of (gamma^(i-1), gamma^i]
+        gamma = math.exp(self._log_gamma)
+        return 2.0 * math.exp((bucket + self._offset) * self._log_gamma) / (gamma + 1.0)
+
+    def quantile(self, q: float) -> float:
+        if self.count == 0:
+            return float("nan")
+        rank = q * (self.count - 1)
+        # Order: negatives from the largest magnitude down, zeros, positives upward
+        neg_total = int(self._neg.sum())
+        if rank < neg_total:
+            cum = np.cumsum(self._neg[::-1])
+            bucket = self._neg.size - 1 - int(np.searchsorted(cum, rank, side="right"))
+            return -self._value(bucket)
+        rank -= neg_total
+        if rank < self.zeros:
+            return 0.0
+        rank -= self.zeros
+        cum = np.cumsum(self._pos)
+        bucket = min(int(np.searchsorted(cum, rank, side="right")), self._pos.size - 1)
+        return self._value(bucket)
+
+
+@dataclass
+class MomentAccumulator:
+    """Running mean, variance and excess kurtosis (population moments, as scipy's default)."""
+
+    n: int = 0
+    _shift: float | None = None
+    _sums: np.ndarray = field(default_factory=lambda: np.zeros(4))  # sum of d^1..d^4
+
+    def update(self, values: np.ndarray) -> None:
+        x = np.asarray(values, dtype=float).reshape(-1)
+        if x.size == 0:
+            return
+        if self._shift is None:
+            self._shift = float(x.mean())
+        d = x - self._shift
+        d2 = d * d
+        self._sums += (d.sum(), d2.sum(), (d2 * d).sum(), (d2 * d2).sum())
+        self.n += x.size
+
+    def _central(self) -> tuple[float, float, float]:
+        s1, s2, s3, s4 = self._sums / self.n
+        m2 = s2 - s1**2
+        m4 = s4 - 4 * s1 * s3 + 6 * s1**2 * s2 - 3 * s1**4
+        return s1 + (self._shift or 0.0), m2, m4
+
+    def mean(self) -> float:
+        return self._central()[0] if self.n else float("nan")
+
+    def kurtosis(self) -> float:
+        """Fisher excess kurtosis (``scipy.stats.kurtosis(x, fisher=True)``)."""
+        if not self.n:
+            return float("nan")
+        _, m2, m4 = self._central()
+        return float(m4 / m2**2 - 3.0) if m2 > 0 else float("nan")
+
+
+@dataclass
+class ModelSampleSummary:
+    """Everything the audit derives from one model's simulated returns."""
+
+    quantiles: QuantileSketch
+    moments: MomentAccumulator
+    realism: RealismAccumulator
+    paths: int = 0
+    steps: int = 0
+
+    def quantile(self, q: float) -> float:
+        return self.quantiles.quantile(q)
+
+    def var(self, level: float) -> float:
+        """Static VaR at confidence ``level`` (the ``1 - level`` return quantile)."""
+        return self.quantile(1.0 - level)
+
+    def kurtosis(self) -> float:
+        return self.moments.kurtosis()
+
+
+def stream_model_samples(
+    fitter: Any,
+    *,
+    paths: int,
+    steps: int,
+    seed: int | None = None,
+    chunk_paths: int = DEFAULT_CHUNK_PATHS,
+) -> Iterator[np.ndarray]:
+    """Yield ``(<=chunk_paths, steps)`` blocks of ``fitter.sample`` draws totalling ``paths``."""
+
+    step = max(1, int(chunk_paths))
+    n_blocks = math.ceil(paths / step) if paths > 0 else 0
+    children = np.random.SeedSequence(seed).spawn(n_blocks) if seed is not None else None
+    for i in range(n_blocks):
+        n = min(step, paths - i * step)
+        block_seed = int(children[i].generate_state(1)[0]) if children is not None else None
+        yield np.asarray(fitter.sample(n_paths=n, n_steps=steps, seed=block_seed), dtype=float)
+
+
+def summarize_model_samples(
+    fitter: Any,
+    *,
+    s0: float,
+    paths: int,
+    steps: int,
+    seed: int | None = None,
+    chunk_paths: int = DEFAULT_CHUNK_PATHS,
+    relative_accuracy: float = DEFAULT_RELATIVE_ACCURACY,
+) -> ModelSampleSummary:
+    """Draw ``paths x steps`` returns once and summarise them block by block."""
+
+    summary = ModelSampleSummary(
+        quantiles=QuantileSketch(relative_accuracy=relative_accuracy),
+        moments=MomentAccumulator(),
+        realism=RealismAccumulator(s0=s0),
+        paths=paths,
+        steps=steps,
+    )
+    for block in stream_model_samples(
+        fitter, paths=paths, steps=steps, seed=seed, chunk_paths=chunk_paths
+    ):
+        summary.quantiles.update(block)
+        summary.moments.update(block)
+        summary.realism.update(block)
+    return summary
+
+
+__all__ = [
+    "DEFAULT_RELATIVE_ACCURACY",
+    "ModelSampleSummary",
+    "MomentAccumulator",
+    "QuantileSketch",
+    "stream_model_samples",
+    "summarize_model_samples",
+]
@@ -6,8 +6,11 @@ features while keeping derived columns separate from source inputs.
 
 from __future__ import annotations
 
+import numpy as np
 import pandas as pd
 
+from qse.data.compact import match_precision
+from qse.features import indicators
 from qse.features.gap import compute_gap_pct
 from qse.features.indicators import (
     compute_rsi,
@@ -34,7 +37,8 @@ def enrich_ohlcv(
 ) -> pd.DataFrame:
     """Return a copy of df with derived features appended.
 
-    Required columns: open, high, low, close, volume.
+    Required columns: open, high, low, close, volume. Features of a compact
+    (float32) frame are returned as float32 too.
     """
 
     ensure_columns_present(df, ["open", "high", "low", "close", "volume"])
@@ -67,6 +71,8 @@ def enrich_ohlcv(
     if fillna:
         out = out.ffill().bfill()
 
+    out = match_precision(out, df)
+
     if log_output:
         log.info(
             "Feature pipeline complete",
@@ -74,3 +80,91 @@ def enrich_ohlcv(
         )
 
     return out
+
+
+def enrich_panel(
+    panel: pd.DataFrame,
+    *,
+    sma_windows: tuple[int, ...] = (20, 50),
+    rsi_period: int = 14,
+    volume_window: int = 20,
+    fillna: bool = True,
+    indicator_definitions: tuple[IndicatorDefinition, ...] | None = None,
+) -> pd.DataFrame:
+    """Return a copy of a long ``symbol``/``date`` panel with the ``enrich_ohlcv`` features.
+
+    Features are computed with grouped, vectorised passes over the whole
+    panel, so per-symbol values match ``enrich_ohlcv`` on each symbol's frame.
+    When pandas-ta or dynamic indicators are in play the panel is enriched
+    symbol by symbol to keep their exact semantics.
+    """
+
+    ensure_columns_present(panel, ["symbol", "date", "open", "high", "low", "close", "volume"])
+    if indicators.ta is not None or indicator_definitions:
+        return _enrich_panel_per_symbol(
+            panel,
+            sma_windows=sma_windows,
+            rsi_period=rsi_period,
+            volume_window=volume_window,
+            fillna=fillna,
+            indicator_definitions=indicator_definitions,
+        )
+
+    out = panel.copy()
+    symbols = out["symbol"]
+    grouped = out.groupby(symbols, observed=True, sort=False)
+
+    def _rolling(series: pd.Series, window: int, min_periods: int):
+        by_symbol = series.groupby(symbols, observed=True, sort=False)
+        return by_symbol.rolling(window, min_periods=min_periods)
+
+    prev_close = grouped["close"].shift(1)
+    out["gap_pct"] = ((out["open"] - prev_close) / prev_close).fillna(0.0)
+
+    for win in sma_windows:
+        if int(win) <= 0:
+            raise ValueError("length must be positive")
+        out[f"sma_{win}"] = _rolling(out["close"], int(win), 1).mean().droplevel(0)
+
+    if int(rsi_period) <= 0:
+        raise ValueError("length must be positive")
+    length = int(rsi_period)
+    delta = grouped["close"].diff()
+    avg_gain = _rolling(delta.clip(lower=0), length, length).mean().droplevel(0)
+    avg_loss = _rolling(-delta.clip(upper=0), length, length).mean().droplevel(0)
+    rs = avg_gain / avg_loss.replace(0, np.nan)
+    out[f"rsi_{rsi_period}"] = (100 - (100 / (1 + rs))).fillna(50.0)
+
+    if int(volume_window) <= 1:
+        raise ValueError("window must be > 1 for z-score")
+    volume_roll = _rolling(out["volume"], int(volume_window), 2)
+    mean = volume_roll.mean().droplevel(0)
+    std = volume_roll.std(ddof=1).droplevel(0)
+    out["volume_z"] = ((out["volume"] - mean) / std.replace(0, np.nan)).fillna(0.0)
+
+    if fillna:
+        value_columns = [c for c in out.columns if c != "symbol"]
+        filled = out[value_columns].groupby(symbols, observed=True, sort=False).ffill()
+        out[value_columns] = filled.groupby(symbols, observed=True, sort=False).bfill()
+
+    out = match_precision(out, panel)
+    log.info(
+        "Panel feature pipeline complete",
+        extra={"symbols": int(symbols.nunique()), "rows": len(out)},
+    )
+    return out
+
+
+def _enrich_panel_per_symbol(panel: pd.DataFrame, **kwargs) -> pd.DataFrame:
+    frames = []
+    for symbol, group in panel.groupby("symbol", observed=True, sort=False):
+        bars = group.drop(columns="symbol").set_index("date")
+        enriched = enrich_ohlcv(bars, log_output=False, **kwargs).reset_index()
+        enriched.insert(0, "symbol", symbol)
+        frames.append(enriched)
+    if not frames:
+        return panel.copy()
+    out = pd.concat(frames, ignore_index=True)
+    if isinstance(panel["symbol"].dtype, pd.CategoricalDtype):
+        out["symbol"] = pd.Categorical(out["symbol"], categories=panel["symbol"].cat.categories)
+    return out
@@ -33,6 +33,22 @@ class CandidateSelector(ABC):
     def select(self, data) -> list[CandidateEpisode]:
         """Return a ranked list of candidate episodes from provided data."""
 
+    def select_panel(self, panel) -> list[CandidateEpisode]:
+        """Select across a long ``symbol``/``date`` panel (see ``qse.data.universe_dataset``).
+
+        The default runs ``select`` on each symbol's date-indexed slice;
+        selectors with vectorisable rules override this to filter the whole
+        panel at once.
+        """
+
+        episodes: list[CandidateEpisode] = []
+        for symbol, group in panel.groupby("symbol", observed=True, sort=False):
+            symbol_episodes = self.select(group.set_index("date"))
+            for episode in symbol_episodes:
+                episode.symbol = str(symbol)
+            episodes.extend(symbol_episodes)
+        return episodes
+
     def select_candidates(self, data) -> list[CandidateEpisode]:
         """Compatibility alias, defers to select()."""
 
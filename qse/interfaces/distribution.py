@@ -34,10 +34,20 @@ class ReturnDistribution(ABC):
     """
 
     metadata: DistributionMetadata
+    fit_state_attrs: tuple[str, ...] = ()  # fitted attributes restored from the fit cache
 
     def __init__(self) -> None:
         self.metadata = DistributionMetadata()
 
+    def fit_state(self) -> dict:
+        """JSON-serialisable fitted parameters (see ``qse.distributions.cache.fit_cache``)."""
+        return {name: getattr(self, name) for name in self.fit_state_attrs}
+
+    def restore_fit_state(self, state: dict) -> None:
+        """Inverse of :meth:`fit_state`."""
+        for name in self.fit_state_attrs:
+            setattr(self, name, state.get(name))
+
     @abstractmethod
     def fit(self, returns) -> None:
         """Fit parameters from 1D array of log returns.
@@ -62,12 +62,27 @@ class PositionMonitor:
                 break
             time.sleep(interval_seconds)
 
+    def evaluate_many(
+        self, positions: Iterable[PositionSnapshot], *, now: datetime | None = None
+    ) -> list[dict[str, Any]]:
+        """Evaluate several positions against one batched quote snapshot."""
+
+        positions = list(positions)
+        quotes = self._prefetch_quotes(*positions)
+        return [self.evaluate_once(position, now=now, quotes=quotes) for position in positions]
+
     def evaluate_once(
-        self, position: PositionSnapshot, *, now: datetime | None = None
+        self,
+        position: PositionSnapshot,
+        *,
+        now: datetime | None = None,
+        quotes: Mapping[str, Any] | None = None,
     ) -> dict[str, Any]:
         current_time = now or datetime.utcnow()
-        underlying_mark = self._fetch_underlying_price(position.underlying)
-        leg_marks, mark_pnl = self._reprice_legs(position, current_time)
+        if quotes is None:
+            quotes = self._prefetch_quotes(position)
+        underlying_mark = self._fetch_underlying_price(position.underlying, quotes)
+        leg_marks, mark_pnl = self._reprice_legs(position, current_time, quotes)
         remaining_horizon = position.remaining_horizon(current_time)
         simulation = self._simulate_remaining_paths(position, remaining_horizon, underlying_mark, current_time)
         alert = self._check_alerts(position.alerts, mark_pnl)
@@ -87,12 +102,15 @@ class PositionMonitor:
         }
 
     def _reprice_legs(
-        self, position: PositionSnapshot, current_time: datetime
+        self,
+        position: PositionSnapshot,
+        current_time: datetime,
+        quotes: Mapping[str, Any] | None = None,
     ) -> tuple[list[dict[str, Any]], float]:
         leg_marks: list[dict[str, Any]] = []
         total_pnl = 0.0
         for leg in position.legs:
-            mark = self._fetch_leg_mark(position.underlying, leg)
+            mark = self._fetch_leg_mark(position.underlying, leg, quotes)
             leg_pnl = leg.direction * (mark - leg.entry_price) * abs(leg.quantity)
             leg_marks.append(
                 {
@@ -174,15 +192,42 @@ class PositionMonitor:
             return AlertResult(triggered=True, reason="stop_loss", pnl=pnl)
         return AlertResult(triggered=False, pnl=pnl)
 
-    def _fetch_underlying_price(self, symbol: str) -> float:
+    def _prefetch_quotes(self, *positions: PositionSnapshot) -> dict[str, Any]:
+        """Quote every underlying and leg in a single batched ``fetch_quotes`` call."""
+
+        if not hasattr(self.data_source, "fetch_quotes"):
+            return {}
+        keys: list[str] = []
+        for position in positions:
+            if not hasattr(self.data_source, "get_underlying_price"):
+                keys.append(position.underlying)
+            if not hasattr(self.data_source, "get_option_mark"):
+                keys.extend(self._leg_quote_key(position.underlying, leg) for leg in position.legs)
+        if not keys:
+            return {}
+        return dict(self.data_source.fetch_quotes(list(dict.fromkeys(keys))))
+
+    @staticmethod
+    def _leg_quote_key(underlying: str, leg: PositionLeg) -> str:
+        if leg.option_symbol:
+            return leg.option_symbol
+        return f"{underlying}:{leg.option_type}:{leg.strike}:{leg.expiry.isoformat()}"
+
+    def _fetch_underlying_price(
+        self, symbol: str, quotes: Mapping[str, Any] | None = None
+    ) -> float:
         if hasattr(self.data_source, "get_underlying_price"):
             return float(self.data_source.get_underlying_price(symbol))
+        if quotes and symbol in quotes:
+            return float(self._mid_from_quote(quotes[symbol]))
         if hasattr(self.data_source, "fetch_quotes"):
             quotes = self.data_source.fetch_quotes([symbol])
             return float(self._mid_from_quote(quotes.get(symbol, {})))
         raise SchemaError("data_source must provide get_underlying_price or fetch_quotes")
 
-    def _fetch_leg_mark(self, underlying: str, leg: PositionLeg) -> float:
+    def _fetch_leg_mark(
+        self, underlying: str, leg: PositionLeg, quotes: Mapping[str, Any] | None = None
+    ) -> float:
         if hasattr(self.data_source, "get_option_mark"):
             return float(
                 self.data_source.get_option_mark(
@@ -194,15 +239,11 @@ class PositionMonitor:
                 )
             )
 
-        symbol_key = leg.option_symbol
-        if symbol_key and hasattr(self.data_source, "fetch_quotes"):
-            quotes = self.data_source.fetch_quotes([symbol_key])
-            return float(self._mid_from_quote(quotes.get(symbol_key, {})))
-
         if hasattr(self.data_source, "fetch_quotes"):
-            option_key = f"{underlying}:{leg.option_type}:{leg.strike}:{leg.expiry.isoformat()}"
-            quotes = self.data_source.fetch_quotes([option_key])
-            return float(self._mid_from_quote(quotes.get(option_key, {})))
+            quote_key = self._leg_quote_key(underlying, leg)
+            if not quotes or quote_key not in quotes:
+                quotes = self.data_source.fetch_quotes([quote_key])
+            return float(self._mid_from_quote(quotes.get(quote_key, {})))
 
         raise SchemaError("data_source cannot provide option marks for monitoring")
 
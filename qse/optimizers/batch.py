@@ -0,0 +1,200 @@
+"""Multi-ticker optimizer batch runs on one persistent worker pool.
+
+Each worker process imports the optimizer stack and builds a single
+``StrategyOptimizer`` once (pool initializer), then serves many tickers.
+Fitted distributions are cached per regime/distribution inside that optimizer,
+option chains come from a per-worker session chain cache when a provider is
+configured, and per-ticker Top-10 lists are merged into one combined ranked
+report.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Sequence
+
+from qse.utils.logging import get_logger
+from qse.utils.progress import ProgressReporter
+from qse.utils.ranking import TopK
+
+log = get_logger(__name__, component="optimizer.batch")
+
+_WORKER_OPTIMIZER = None
+
+
+@dataclass
+class TickerOutcome:
+    """Result envelope for one ticker in a batch."""
+
+    ticker: str
+    status: str
+    runtime_seconds: float
+    result: dict[str, Any] | None = None
+    error: str | None = None
+
+
+@dataclass
+class BatchReport:
+    """Combined ranking across tickers plus per-ticker status."""
+
+    regime: str
+    trade_horizon: int
+    ranked: list[dict[str, Any]] = field(default_factory=list)
+    outcomes: list[TickerOutcome] = field(default_factory=list)
+    runtime_seconds: float = 0.0
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "regime": self.regime,
+            "trade_horizon_days": self.trade_horizon,
+            "runtime_seconds": self.runtime_seconds,
+            "ranked": self.ranked,
+            "tickers": [
+                {
+                    "ticker": o.ticker,
+                    "status": o.status,
+                    "runtime_seconds": o.runtime_seconds,
+                    "error": o.error,
+                    "top10_count": len((o.result or {}).get("top10", [])),
+                    "stage_counts": (o.result or {}).get("diagnostics", {}).get("stage_counts"),
+                }
+                for o in self.outcomes
+            ],
+        }
+
+
+def _build_optimizer(
+    config: dict[str, Any],
+    provider_spec: dict[str, Any] | None,
+    chain_cache_dir: Path | None = None,
+):
+    from qse.optimizers.strategy_optimizer import StrategyOptimizer
+
+    provider = None
+    chain_cache = None
+    if provider_spec:
+        from qse.data.factory import get_data_source
+
+        provider = get_data_source(**provider_spec)
+        if chain_cache_dir is not None:
+            from qse.data.option_chain_cache import session_chain_cache
+
+            chain_cache = session_chain_cache(provider, chain_cache_dir, config)
+    return StrategyOptimizer(config=config, data_provider=provider, logger=log, chain_cache=chain_cache)
+
+
+def _init_worker(
+    config: dict[str, Any],
+    provider_spec: dict[str, Any] | None,
+    chain_cache_dir: Path | None = None,
+) -> None:
+    """Pool initializer: pay import + optimizer construction once per worker."""
+
+    global _WORKER_OPTIMIZER
+    _WORKER_OPTIMIZER = _build_optimizer(config, provider_spec, chain_cache_dir)
+
+
+def _optimize_ticker(ticker: str, regime: str, trade_horizon: int, optimizer=None) -> TickerOutcome:
+    start = time.time()
+    optimizer = optimizer or _WORKER_OPTIMIZER
+    try:
+        result = optimizer.optimize(ticker=ticker, regime=regime, trade_horizon=trade_horizon)
+        return TickerOutcome(ticker=ticker, status="success", runtime_seconds=time.time() - start, result=result)
+    except Exception as exc:  # noqa: BLE001 - one bad ticker must not sink the batch
+        return TickerOutcome(ticker=ticker, status="failed", runtime_seconds=time.time() - start, error=str(exc))
+
+
+def rank_outcomes(outcomes: Sequence[TickerOutcome], top_n: int = 50) -> list[dict[str, Any]]:
+    """Merge each ticker's Top-10 into one list ranked by MC score."""
+
+    merged: TopK[dict[str, Any]] = TopK(top_n, key=lambda e: (e.get("metrics") or {}).get("score", 0.0))
+    for outcome in outcomes:
+        if outcome.result is None:
+            continue
+        for entry in outcome.result.get("top10", []):
+            merged.push({"ticker": outcome.ticker, **entry})
+    return merged.items()
+
+
+def run_optimizer_batch(
+    tickers: Sequence[str],
+    *,
+    regime: str,
+    trade_horizon: int,
+    config: dict[str, Any],
+    provider_spec: dict[str, Any] | None = None,
+    chain_cache_dir: Path | None = None,
+    max_workers: int | None = None,
+    top_n: int = 50,
+    output_path: Path | None = None,
+) -> BatchReport:
+    """Run the Stage 0-4 sweep for many tickers through one worker pool.
+
+    `provider_spec` holds keyword arguments for ``get_data_source`` so each
+    worker builds its own provider (clients are not shared across processes).
+    With `chain_cache_dir`, each worker also serves option chains from a
+    session ``OptionChainCache`` over that provider.
+    """
+
+    tickers = list(dict.fromkeys(tickers))
+    start = time.time()
+    worker_count = max(1, min(max_workers or min(6, os.cpu_count() or 1), len(tickers) or 1))
+    progress = ProgressReporter(total=len(tickers), log=log, component="optimizer.batch")
+    outcomes: list[TickerOutcome] = []
+
+    if worker_count == 1:
+        optimizer = _build_optimizer(config, provider_spec, chain_cache_dir)
+        for ticker in tickers:
+            outcomes.append(_optimize_ticker(ticker, regime, trade_horizon, optimizer))
+            progress.tick("optimizer batch")
+    else:
+        with ProcessPoolExecutor(
+            max_workers=worker_count,
+            initializer=_init_worker,
+            initargs=(config, provider_spec, chain_cache_dir),
+        ) as executor:
+            futures = {
+                executor.submit(_optimize_ticker, ticker, regime, trade_horizon): ticker
+                for ticker in tickers
+            }
+            for future in as_completed(futures):
+                outcome = future.result()
+                if outcome.status == "failed":
+                    log.error("Ticker optimization failed", extra={"symbol": outcome.ticker, "error": outcome.error})
+                outcomes.append(outcome)
+                progress.tick("optimizer batch")
+
+    order = {t: i for i, t in enumerate(tickers)}
+    outcomes.sort(key=lambda o: order[o.ticker])
+    report = BatchReport(
+        regime=regime,
+        trade_horizon=trade_horizon,
+        ranked=rank_outcomes(outcomes, top_n=top_n),
+        outcomes=outcomes,
+        runtime_seconds=time.time() - start,
+    )
+
+    if output_path:
+        output_path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = output_path.with_suffix(output_path.suffix + ".tmp")
+        tmp.write_text(json.dumps(report.to_dict(), indent=2))
+        tmp.replace(output_path)
+
+    log.info(
+        "Optimizer batch complete",
+        extra={
+            "tickers": len(tickers),
+            "failed": sum(o.status == "failed" for o in outcomes),
+            "workers": worker_count,
+            "runtime_seconds": round(report.runtime_seconds, 2),
+        },
+    )
+    return report
+
+
+__all__ = ["BatchReport", "TickerOutcome", "rank_outcomes", "run_optimizer_batch"]
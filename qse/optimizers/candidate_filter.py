@@ -47,10 +47,20 @@ def select_expiries(chain: pd.DataFrame, as_of: datetime, config: Stage0Config |
             when the option chain lacks required columns.
     """
 
-    config = config or Stage0Config()
     _validate_columns(chain)
+    return select_expiries_from_index(chain["expiry"], as_of, config)
+
+
+def select_expiries_from_index(
+    expiries: Iterable[pd.Timestamp], as_of: datetime, config: Stage0Config | None = None
+) -> List[pd.Timestamp]:
+    """Stage 0 selection over a bare expiry index (no chain rows required).
 
-    expiries = pd.to_datetime(chain["expiry"], errors="coerce").dropna().drop_duplicates()
+    Used by ``OptionChainCache`` so repeated runs skip re-reading the chain.
+    """
+
+    config = config or Stage0Config()
+    expiries = pd.to_datetime(pd.Series(list(expiries)), errors="coerce").dropna().drop_duplicates()
     dtes = (expiries - pd.Timestamp(as_of)).dt.days
     windowed = expiries[(dtes >= config.min_dte) & (dtes <= config.max_dte)].sort_values()
     selected = list(windowed[: config.max_expiries])
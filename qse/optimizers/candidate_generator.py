@@ -1,22 +1,106 @@
 """Stage 2 candidate structure generation."""
 from __future__ import annotations
 
+from bisect import bisect_left, bisect_right
 from dataclasses import dataclass
 from typing import List, Sequence
 
 import pandas as pd
 
+from qse.optimizers.costs import CostAssumptions
 from qse.optimizers.models import CandidateStructure, Leg
+from qse.optimizers.prefilter import Stage3Config
+from qse.utils.logging import get_logger
+
+log = get_logger(__name__, component="optimizer.generator")
 
 REQUIRED_COLUMNS = {"expiry", "strike", "option_type", "mid"}
 
 
+def _quote_is_nan(row, field: str) -> bool:
+    """True when ``row`` carries bid/ask quotes and ``field`` is NaN.
+
+    The cost model only falls back to a synthetic spread when a quote is
+    missing (``None``); a NaN quote propagates into the leg's cash flows.
+    """
+
+    if not (hasattr(row, "bid") and hasattr(row, "ask")):
+        return False
+    return bool(pd.isna(getattr(row, field)))
+
+
+@dataclass(frozen=True)
+class PruningBounds:
+    """Stage 3 hard constraints checked analytically during enumeration.
+
+    Every bound is a necessary condition of ``Prefilter._passes_constraints``,
+    so a pruned pair is one Stage 3 would have rejected anyway. Only vertical
+    enumeration is bounded: it is the one quadratic loop (strike pairs per
+    expiry), while iron condors, straddles and strangles are built once per
+    expiry. Butterflies and calendars are not generated by this module, so they
+    are out of scope until they are added here. ``None``
+    disables a bound. Quotes that are present but NaN make Stage 3's entry
+    cash (and so its P&L and loss checks) NaN, which never fails a
+    comparison; the price-dependent bounds leave such pairs alone.
+    """
+
+    max_capital: float | None = None
+    max_loss_pct: float | None = None
+    min_expected_pnl: float | None = None
+    commission_per_contract: float = 0.65
+    spread_pct: float = 0.15
+
+    @classmethod
+    def from_stage3(
+        cls, config: Stage3Config, costs: CostAssumptions | None = None
+    ) -> "PruningBounds":
+        costs = costs or CostAssumptions()
+        return cls(
+            max_capital=config.max_capital,
+            max_loss_pct=config.max_loss_pct,
+            min_expected_pnl=config.min_expected_pnl,
+            commission_per_contract=costs.commission_per_contract,
+            spread_pct=costs.spread_pct,
+        )
+
+    def capital_exceeded(self, width: float) -> bool:
+        # Stage 3 capital is at least width * 100 and grows with width
+        return self.max_capital is not None and max(width, 1.0) * 100.0 > self.max_capital
+
+    def loss_ratio_exceeded(self, short_strike: float, spot: float) -> bool:
+        # max_loss >= capital * (1 - pop_breakeven), and pop_breakeven depends
+        # only on the short strike's distance from spot
+        if self.max_loss_pct is None or spot <= 0:
+            return False
+        pop_breakeven = min(0.95, 0.55 + abs(short_strike - spot) / spot)
+        return 1.0 - pop_breakeven > self.max_loss_pct
+
+    def credit_pnl_unreachable(self, short_row, legs: int = 2) -> bool:
+        # Credit structures earn 40% of entry cash; entry cash cannot exceed
+        # the short leg's bid (the long leg only costs money)
+        if self.min_expected_pnl is None:
+            return False
+        if _quote_is_nan(short_row, "bid"):
+            return False
+        bid, ask = getattr(short_row, "bid", None), getattr(short_row, "ask", None)
+        if bid is None or ask is None:
+            # Same synthetic spread the cost model falls back to
+            bid = float(short_row.mid) * (1.0 - self.spread_pct / 2.0)
+        best = float(bid) * 100.0 * 0.4 - legs * self.commission_per_contract
+        return best < self.min_expected_pnl
+
+
 @dataclass(frozen=True)
 class GeneratorConfig:
-    """Configuration for structure generation."""
+    """Configuration for structure generation.
+
+    `bounds` enables branch-and-bound pruning of vertical enumeration against
+    the Stage 3 limits (see ``PruningBounds.from_stage3``).
+    """
 
     min_width: int = 1
     max_width: int = 10
+    bounds: PruningBounds | None = None
 
 
 class CandidateGenerator:
@@ -24,14 +108,18 @@ class CandidateGenerator:
 
     def __init__(self, config: GeneratorConfig | None = None) -> None:
         self.config = config or GeneratorConfig()
+        self.pruned = 0
 
     def generate(self, chain: pd.DataFrame, spot: float) -> List[CandidateStructure]:
         """Create Stage 2 candidate structures.
 
         Returns an ordered list containing verticals, iron condors, straddles,
-        and strangles for each expiry present in ``chain``.
+        and strangles for each expiry present in ``chain``. When bounds are
+        configured, ``self.pruned`` holds the number of verticals skipped
+        without being built.
         """
 
+        self.pruned = 0
         if chain.empty:
             return []
         self._validate_columns(chain)
@@ -42,7 +130,7 @@ class CandidateGenerator:
 
         candidates: List[CandidateStructure] = []
         for expiry, slice_df in df.groupby("expiry"):
-            candidates.extend(self._generate_verticals(slice_df))
+            candidates.extend(self._generate_verticals(slice_df, spot))
             condor = self._generate_iron_condor(slice_df, spot)
             if condor:
                 candidates.append(condor)
@@ -53,14 +141,32 @@ class CandidateGenerator:
             if strangle:
                 candidates.append(strangle)
 
+        if self.config.bounds is not None and self.pruned:
+            log.info(
+                "Pruned verticals by Stage 3 bounds",
+                extra={"pruned": self.pruned, "generated": len(candidates)},
+            )
         return candidates
 
-    def _generate_verticals(self, df: pd.DataFrame) -> List[CandidateStructure]:
+    def _generate_verticals(self, df: pd.DataFrame, spot: float = 0.0) -> List[CandidateStructure]:
         candidates: List[CandidateStructure] = []
+        bounds = self.config.bounds
         for option_type in ("call", "put"):
             subset = df[df["option_type"] == option_type].sort_values("strike")
             rows: Sequence[pd.Series] = list(subset.itertuples(index=False))
+            strikes = [float(r.strike) for r in rows]
+            # Stage 3 entry cash is NaN for pairs with a NaN short bid or long ask
+            no_bid = [_quote_is_nan(r, "bid") for r in rows]
+            no_ask = [_quote_is_nan(r, "ask") for r in rows]
             for i, short in enumerate(rows):
+                loss_cut = skip_credit = False
+                if bounds is not None:
+                    loss_cut = bounds.loss_ratio_exceeded(strikes[i], spot)
+                    if loss_cut and not no_bid[i] and not any(no_ask[i + 1 :]):
+                        # Whole subtree: every pair sharing this short strike fails the loss bound
+                        self.pruned += self._pairs_in_window(strikes, i, i + 1)
+                        continue
+                    skip_credit = bounds.credit_pnl_unreachable(short)
                 for j in range(i + 1, len(rows)):
                     long = rows[j]
                     width = float(abs(long.strike - short.strike))
@@ -68,6 +174,17 @@ class CandidateGenerator:
                         continue
                     if width > self.config.max_width:
                         break
+                    if bounds is not None:
+                        if bounds.capital_exceeded(width):
+                            # Capital only grows with width: cut the remaining pairs
+                            self.pruned += self._pairs_in_window(strikes, i, j)
+                            break
+                        if loss_cut and not no_bid[i] and not no_ask[j]:
+                            self.pruned += 1
+                            continue
+                        if skip_credit and not no_ask[j] and float(short.mid) > float(long.mid):
+                            self.pruned += 1
+                            continue
 
                     legs = [
                         Leg(
@@ -99,6 +216,13 @@ class CandidateGenerator:
                     )
         return candidates
 
+    def _pairs_in_window(self, strikes: Sequence[float], i: int, start: int) -> int:
+        """Count pairs (i, j >= start) whose width lies in the configured range."""
+
+        lo = max(start, bisect_left(strikes, strikes[i] + self.config.min_width))
+        hi = bisect_right(strikes, strikes[i] + self.config.max_width)
+        return max(0, hi - lo)
+
     def _generate_iron_condor(self, df: pd.DataFrame, spot: float) -> CandidateStructure | None:
         puts = df[df["option_type"] == "put"].sort_values("strike", ascending=False)
         calls = df[df["option_type"] == "call"].sort_values("strike")
@@ -243,4 +367,4 @@ class CandidateGenerator:
             raise ValueError(f"Filtered chain missing required columns: {sorted(missing)}")
 
 
-__all__ = ["CandidateGenerator", "GeneratorConfig"]
+__all__ = ["CandidateGenerator", "GeneratorConfig", "PruningBounds"]
@@ -27,14 +27,15 @@ class MCEngine:
 
     def __init__(
         self,
-        distribution: ReturnDistribution,
+        distribution: ReturnDistribution | None,
         pricer: BlackScholesPricer | None = None,
         config: MCConfig | None = None,
     ) -> None:
         """Initialize MC engine with distribution and pricer.
 
         Args:
-            distribution: Fitted return distribution for path generation
+            distribution: Fitted return distribution for path generation (may be
+                ``None`` when only scoring precomputed terminal prices)
             pricer: Option pricing model (defaults to Black-Scholes)
             config: MC configuration parameters
         """
@@ -60,14 +61,35 @@ class MCEngine:
         Returns:
             Candidates with updated metrics including full MC scores
         """
-        np.random.seed(self.config.seed)
+        terminal = self.terminal_prices(spot, trade_horizon, regime_params)
+        return self.score_terminal(candidates, spot, terminal, trade_horizon)
+
+    def terminal_prices(
+        self,
+        spot: float,
+        trade_horizon: int,
+        regime_params: RegimeParams | None = None,
+    ) -> np.ndarray:
+        """Generate paths once and return the terminal price per path.
 
-        # Generate price paths for the trade horizon
+        Scoring only reads terminal prices, so this array can be shared
+        read-only across expiry buckets (see ``qse.optimizers.parallel``).
+        """
+        np.random.seed(self.config.seed)
         paths = self._generate_paths(spot, trade_horizon, regime_params)
+        return np.ascontiguousarray(paths[:, -1])
 
+    def score_terminal(
+        self,
+        candidates: Sequence[CandidateStructure],
+        spot: float,
+        terminal_prices: np.ndarray,
+        trade_horizon: int,
+    ) -> list[CandidateStructure]:
+        """Score candidates against precomputed terminal prices."""
         scored: list[CandidateStructure] = []
         for candidate in candidates:
-            metrics = self._score_candidate(candidate, spot, paths, trade_horizon)
+            metrics = self._score_candidate(candidate, spot, terminal_prices, trade_horizon)
             candidate.metrics = metrics
             scored.append(candidate)
 
@@ -109,22 +131,21 @@ class MCEngine:
         self,
         candidate: CandidateStructure,
         spot: float,
-        paths: np.ndarray,
+        final_prices: np.ndarray,
         trade_horizon: int,
     ) -> CandidateMetrics:
-        """Score a single candidate using MC paths.
+        """Score a single candidate using MC terminal prices.
 
         Args:
             candidate: Candidate structure to score
             spot: Initial spot price
-            paths: Price paths array (num_paths, steps+1)
+            final_prices: Terminal price per path, shape (num_paths,)
             trade_horizon: Holding period in trading days
 
         Returns:
             Updated metrics with MC-based E[PnL], POP, etc.
         """
-        num_paths = paths.shape[0]
-        final_prices = paths[:, -1]  # Terminal prices
+        num_paths = final_prices.shape[0]
 
         # Calculate initial DTE (days to expiry from now)
         # Assume candidate.expiry is the option expiry date
@@ -0,0 +1,192 @@
+"""Per-expiry parallel execution of optimizer Stages 2-4.
+
+Generation, Stage 3 prefiltering and Stage 4 MC scoring are independent per
+expiry until the final ranking, so each expiry bucket runs as one task on a
+process pool. Terminal prices are generated once in the parent and shared
+read-only with every worker through ``multiprocessing.shared_memory``; each
+bucket returns only its top-K candidates, which are merged in the parent.
+"""
+
+from __future__ import annotations
+
+import os
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+from multiprocessing import resource_tracker, shared_memory
+from typing import List, Sequence
+
+import numpy as np
+import pandas as pd
+
+from qse.optimizers.candidate_generator import CandidateGenerator, GeneratorConfig
+from qse.optimizers.mc_engine import MCEngine
+from qse.optimizers.models import CandidateStructure
+from qse.optimizers.prefilter import Prefilter, Stage3Config
+from qse.utils.logging import get_logger
+from qse.utils.ranking import TopK, top_k
+
+log = get_logger(__name__, component="optimizer.parallel")
+
+
+@dataclass(frozen=True)
+class SharedArraySpec:
+    """Handle used by workers to attach to the shared terminal-price block."""
+
+    name: str
+    shape: tuple[int, ...]
+    dtype: str
+
+
+@dataclass
+class BucketTask:
+    """Inputs for one expiry bucket."""
+
+    expiry: pd.Timestamp
+    chain: pd.DataFrame
+    spot: float
+    trade_horizon: int
+    generator_config: GeneratorConfig
+    stage3_config: Stage3Config
+    terminal: SharedArraySpec
+    top_n: int
+
+
+@dataclass
+class BucketResult:
+    """Ranked survivors and stage counts for one expiry bucket."""
+
+    expiry: pd.Timestamp
+    generated: int
+    survivors: int
+    scored: int
+    top: List[CandidateStructure] = field(default_factory=list)
+    pruned: int = 0
+
+
+def _score_key(candidate: CandidateStructure) -> float:
+    return candidate.metrics.score if candidate.metrics else 0.0
+
+
+def _attach(spec: SharedArraySpec) -> shared_memory.SharedMemory:
+    shm = shared_memory.SharedMemory(name=spec.name)
+    # The parent owns the block; stop this process's tracker from unlinking it on exit.
+    try:
+        resource_tracker.unregister(shm._name, "shared_memory")  # type: ignore[attr-defined]
+    except Exception:  # pragma: no cover - tracker internals differ across platforms
+        pass
+    return shm
+
+
+def run_bucket(task: BucketTask) -> BucketResult:
+    """Run Stages 2-4 for a single expiry bucket (process-pool entry point)."""
+
+    generator = CandidateGenerator(task.generator_config)
+    candidates = generator.generate(task.chain, task.spot)
+    survivors = Prefilter(task.stage3_config).evaluate(candidates, task.spot)
+
+    shm = _attach(task.terminal)
+    try:
+        terminal = np.ndarray(task.terminal.shape, dtype=task.terminal.dtype, buffer=shm.buf)
+        terminal.flags.writeable = False
+        scored = MCEngine(distribution=None).score_terminal(
+            survivors, task.spot, terminal, task.trade_horizon
+        )
+        del terminal
+    finally:
+        shm.close()
+
+    ranked = top_k(scored, task.top_n, key=_score_key)
+    return BucketResult(
+        expiry=task.expiry,
+        generated=len(candidates),
+        survivors=len(survivors),
+        scored=len(scored),
+        top=ranked,
+        pruned=generator.pruned,
+    )
+
+
+def run_expiry_buckets(
+    chain: pd.DataFrame,
+    *,
+    spot: float,
+    trade_horizon: int,
+    terminal_prices: np.ndarray,
+    generator_config: GeneratorConfig,
+    stage3_config: Stage3Config,
+    top_n: int = 100,
+    max_workers: int | None = None,
+) -> tuple[List[CandidateStructure], List[BucketResult]]:
+    """Fan Stage 2-4 out per expiry and merge the buckets' top-K.
+
+    Note that ``stage3_config.top_k_per_type`` applies per expiry bucket here,
+    whereas the serial path applies it across all expiries.
+
+    Returns the merged ranking (at most ``top_n``) and per-bucket results in
+    expiry order.
+    """
+
+    df = chain.copy()
+    df["expiry"] = pd.to_datetime(df["expiry"], errors="coerce")
+    groups = [(pd.Timestamp(expiry), g) for expiry, g in df.dropna(subset=["expiry"]).groupby("expiry")]
+    if not groups:
+        return [], []
+
+    worker_count = max(1, min(max_workers or min(6, os.cpu_count() or 1), len(groups)))
+    terminal_prices = np.ascontiguousarray(terminal_prices)
+    shm = shared_memory.SharedMemory(create=True, size=max(terminal_prices.nbytes, 1))
+    try:
+        block = np.ndarray(terminal_prices.shape, dtype=terminal_prices.dtype, buffer=shm.buf)
+        block[:] = terminal_prices
+        del block
+        spec = SharedArraySpec(
+            name=shm.name, shape=terminal_prices.shape, dtype=terminal_prices.dtype.str
+        )
+        tasks = [
+            BucketTask(
+                expiry=expiry,
+                chain=bucket,
+                spot=spot,
+                trade_horizon=trade_horizon,
+                generator_config=generator_config,
+                stage3_config=stage3_config,
+                terminal=spec,
+                top_n=top_n,
+            )
+            for expiry, bucket in groups
+        ]
+        log.info(
+            "Running expiry buckets",
+            extra={"buckets": len(tasks), "workers": worker_count, "paths": terminal_prices.shape[0]},
+        )
+        if worker_count == 1:
+            results = [run_bucket(task) for task in tasks]
+        else:
+            with ProcessPoolExecutor(max_workers=worker_count) as executor:
+                results = list(executor.map(run_bucket, tasks))
+    finally:
+        shm.close()
+        shm.unlink()
+
+    return merge_bucket_results(results, top_n=top_n), results
+
+
+def merge_bucket_results(
+    results: Sequence[BucketResult], *, top_n: int = 100
+) -> List[CandidateStructure]:
+    """Merge per-bucket rankings into one list ordered by score (stable by expiry)."""
+
+    merged: TopK[CandidateStructure] = TopK(top_n, key=_score_key)
+    for result in results:
+        merged.extend(result.top)
+    return merged.items()
+
+
+__all__ = [
+    "BucketResult",
+    "BucketTask",
+    "SharedArraySpec",
+    "merge_bucket_results",
+    "run_bucket",
+    "run_expiry_buckets",
+]
@@ -3,7 +3,7 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
-from typing import List, Sequence
+from typing import Iterable, List
 
 from qse.optimizers.costs import (
     CostAssumptions,
@@ -13,6 +13,7 @@ from qse.optimizers.costs import (
     compute_expected_exit_cost,
 )
 from qse.optimizers.models import CandidateMetrics, CandidateStructure
+from qse.utils.ranking import TopK
 
 
 @dataclass(frozen=True)
@@ -35,17 +36,18 @@ class Prefilter:
         self.config = config or Stage3Config()
         self.cost_assumptions = cost_assumptions or CostAssumptions()
 
-    def evaluate(self, candidates: Sequence[CandidateStructure], spot: float) -> List[CandidateStructure]:
-        scored: List[CandidateStructure] = []
+    def evaluate(self, candidates: Iterable[CandidateStructure], spot: float) -> List[CandidateStructure]:
+        # Survivors stream into per-type bounded heaps; memory stays at top_k_per_type per type
+        buckets: dict[str, TopK[CandidateStructure]] = {}
         for candidate in candidates:
             metrics = self._compute_metrics(candidate, spot)
             if not self._passes_constraints(metrics):
                 continue
             candidate.metrics = metrics
             candidate = apply_costs(candidate, self.cost_assumptions)
-            scored.append(candidate)
+            self._bucket(buckets, candidate.structure_type).push(candidate)
 
-        return self._top_k(scored)
+        return [c for bucket in buckets.values() for c in bucket.items()]
 
     def _compute_metrics(self, candidate: CandidateStructure, spot: float) -> CandidateMetrics:
         width = max(candidate.width, 1.0)
@@ -105,16 +107,20 @@ class Prefilter:
             return False
         return True
 
-    def _top_k(self, candidates: List[CandidateStructure]) -> List[CandidateStructure]:
-        grouped: dict[str, List[CandidateStructure]] = {}
+    def _bucket(self, buckets: dict[str, TopK[CandidateStructure]], structure_type: str) -> TopK[CandidateStructure]:
+        if structure_type not in buckets:
+            buckets[structure_type] = TopK(self.config.top_k_per_type, key=_score_key)
+        return buckets[structure_type]
+
+    def _top_k(self, candidates: Iterable[CandidateStructure]) -> List[CandidateStructure]:
+        buckets: dict[str, TopK[CandidateStructure]] = {}
         for candidate in candidates:
-            grouped.setdefault(candidate.structure_type, []).append(candidate)
+            self._bucket(buckets, candidate.structure_type).push(candidate)
+        return [c for bucket in buckets.values() for c in bucket.items()]
+
 
-        survivors: List[CandidateStructure] = []
-        for bucket in grouped.values():
-            sorted_bucket = sorted(bucket, key=lambda c: c.metrics.score if c.metrics else 0.0, reverse=True)
-            survivors.extend(sorted_bucket[: self.config.top_k_per_type])
-        return survivors
+def _score_key(candidate: CandidateStructure) -> float:
+    return candidate.metrics.score if candidate.metrics else 0.0
 
 
 __all__ = ["Prefilter", "Stage3Config"]
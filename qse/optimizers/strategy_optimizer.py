@@ -4,10 +4,14 @@ from __future__ import annotations
 
 import logging
 import time
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
+from qse.exceptions import DataSourceError
 from qse.scorers.intraday_spreads import IntradaySpreadsScorer
 
+if TYPE_CHECKING:
+    from qse.data.option_chain_cache import OptionChainCache
+
 
 class StrategyOptimizer:
     """
@@ -17,7 +21,13 @@ class StrategyOptimizer:
     Tasks: T013 (Phase 3), T014-T018 (Phase 4)
     """
 
-    def __init__(self, config: dict[str, Any], data_provider: Any, logger: logging.Logger):
+    def __init__(
+        self,
+        config: dict[str, Any],
+        data_provider: Any,
+        logger: logging.Logger,
+        chain_cache: OptionChainCache | None = None,
+    ):
         """
         Initialize optimizer with config and data provider.
 
@@ -25,10 +35,16 @@ class StrategyOptimizer:
             config: Merged configuration with regimes, mc, filters, scoring sections
             data_provider: Data source for fetching option chains (Schwab/yfinance with fallback)
             logger: Structured logger for diagnostics
+            chain_cache: Optional session option chain cache; when provided, Stage 0/1
+                read real chains from it instead of the synthetic chain
         """
         self.config = config
         self.data_provider = data_provider
         self.log = logger
+        self.chain_cache = chain_cache
+        # Fitted distributions keyed by (regime, distribution); reused across
+        # optimize() calls so batch workers fit each regime once for all tickers.
+        self._fitted_distributions: dict[tuple[str, str], Any] = {}
 
         # Extract config sections
         self.regimes = config.get("regimes", {})
@@ -51,6 +67,10 @@ class StrategyOptimizer:
 
         Runtime: Up to 1 hour for broad candidate search (FR-061 mode a).
 
+        Set ``execution.mode: per_expiry`` (with optional ``execution.max_workers``)
+        to fan Stages 2-4 out per expiry bucket on a process pool; Stage 3
+        ``top_k_per_type`` then applies per bucket.
+
         Args:
             ticker: Stock ticker symbol (e.g., NVDA)
             regime: Regime label from config (e.g., strong-bullish)
@@ -66,21 +86,18 @@ class StrategyOptimizer:
         """
         from datetime import datetime
 
-        import numpy as np
         import pandas as pd
 
-        from qse.distributions.factory import get_distribution
-        from qse.distributions.regime_loader import load_regime_params
         from qse.optimizers.candidate_filter import (
             Stage0Config,
             Stage1Config,
             filter_strikes,
             select_expiries,
         )
-        from qse.optimizers.candidate_generator import CandidateGenerator, GeneratorConfig
-        from qse.optimizers.mc_engine import MCConfig, MCEngine
+        from qse.optimizers.candidate_generator import CandidateGenerator, GeneratorConfig, PruningBounds
+        from qse.optimizers.parallel import run_expiry_buckets
         from qse.optimizers.prefilter import Prefilter, Stage3Config
-        from qse.pricing.black_scholes import BlackScholesPricer
+        from qse.utils.ranking import top_k
 
         start_time = time.time()
         self.log.info(f"Starting full optimization: {ticker} regime={regime} horizon={trade_horizon}d")
@@ -91,12 +108,6 @@ class StrategyOptimizer:
             # =================================================================
             self.log.info("Stage 0: Fetching option chain and selecting expiries")
 
-            # Fetch option chain from data provider
-            # For now, create a synthetic chain for testing
-            # TODO: Replace with actual data_provider.fetch_option_chain(ticker)
-            spot = 500.0  # Synthetic spot price
-            chain_df = self._create_synthetic_chain(spot)
-
             as_of = datetime.now()
             stage0_config = Stage0Config(
                 min_dte=self.filter_config.get("min_dte", 7),
@@ -105,7 +116,25 @@ class StrategyOptimizer:
                 max_expiries=5,
             )
 
-            selected_expiries = select_expiries(chain_df, as_of, stage0_config)
+            chain_df = None
+            selected_expiries = None
+            if self.chain_cache is not None:
+                # Expiry index and static contract metadata come from the session cache;
+                # only quotes inside the Stage 0/1 window are refreshed below. The spot
+                # must be current (not the metadata snapshot) since it centres that window.
+                try:
+                    selected_expiries = self.chain_cache.select_expiries(ticker, as_of, stage0_config)
+                except DataSourceError as exc:
+                    self.log.warning(f"Option chain cache unavailable for {ticker}, using synthetic chain: {exc}")
+            if selected_expiries is not None:
+                spot = self.chain_cache.spot(ticker, expiries=selected_expiries)
+                if spot is None:
+                    raise ValueError(f"Underlying price unavailable for {ticker} in option chain cache")
+            else:
+                # No chain cache configured (or its provider failed): use the synthetic chain
+                spot = 500.0  # Synthetic spot price
+                chain_df = self._create_synthetic_chain(spot)
+                selected_expiries = select_expiries(chain_df, as_of, stage0_config)
             self.log.info(f"Stage 0: Selected {len(selected_expiries)} expiries")
 
             # =================================================================
@@ -121,29 +150,14 @@ class StrategyOptimizer:
                 max_bid_ask_pct=self.filter_config.get("max_bid_ask_pct", 0.15),
             )
 
+            if chain_df is None:
+                chain_df = self.chain_cache.get_chain(
+                    ticker, expiries=selected_expiries, spot=spot, stage1=stage1_config
+                )
             filtered_chain = filter_strikes(chain_df, spot, selected_expiries, stage1_config)
             num_strikes = len(filtered_chain["strike"].unique())
             self.log.info(f"Stage 1: Retained {num_strikes} strikes after filtering")
 
-            # =================================================================
-            # Stage 2: Structure generation (T016, FR-008)
-            # =================================================================
-            self.log.info("Stage 2: Generating candidate structures")
-
-            generator_config = GeneratorConfig(
-                min_width=1,
-                max_width=self.filter_config.get("max_width", 3),
-            )
-            generator = CandidateGenerator(generator_config)
-            candidates = generator.generate(filtered_chain, spot)
-
-            self.log.info(f"Stage 2: Generated {len(candidates)} candidate structures")
-
-            # =================================================================
-            # Stage 3: Analytic prefilter + hard constraints (T017, FR-009-FR-011)
-            # =================================================================
-            self.log.info("Stage 3: Applying analytic prefilter with hard constraints")
-
             stage3_config = Stage3Config(
                 max_capital=self.filter_config.get("max_capital", 15000),
                 max_loss_pct=self.filter_config.get("max_loss_pct", 0.05),
@@ -152,71 +166,101 @@ class StrategyOptimizer:
                 min_pop_target=self.filter_config.get("min_pop_target", 0.30),
                 top_k_per_type=self.filter_config.get("top_k_per_type", 20),
             )
+            # Stage 3 limits bound Stage 2 enumeration (branch and bound)
+            generator_config = GeneratorConfig(
+                min_width=1,
+                max_width=self.filter_config.get("max_width", 3),
+                bounds=PruningBounds.from_stage3(stage3_config)
+                if self.filter_config.get("prune_candidates", True)
+                else None,
+            )
+            execution = self.config.get("execution", {})
+
+            if execution.get("mode", "serial") == "per_expiry":
+                # =============================================================
+                # Stages 2-4 fanned out per expiry bucket on a process pool
+                # =============================================================
+                # Stage 4 inputs are built first so all buckets share one
+                # read-only terminal-price array. Stage 3's top_k_per_type cut
+                # applies per expiry bucket here (the serial path cuts across
+                # all expiries), so more survivors may reach Stage 4.
+                mc_engine, regime_params = self._build_mc_engine(ticker, regime)
+                terminal = mc_engine.terminal_prices(spot, trade_horizon, regime_params)
+                ranked, buckets = run_expiry_buckets(
+                    filtered_chain,
+                    spot=spot,
+                    trade_horizon=trade_horizon,
+                    terminal_prices=terminal,
+                    generator_config=generator_config,
+                    stage3_config=stage3_config,
+                    top_n=100,
+                    max_workers=execution.get("max_workers"),
+                )
+                num_candidates = sum(b.generated for b in buckets)
+                num_survivors = sum(b.survivors for b in buckets)
+                num_scored = sum(b.scored for b in buckets)
+                num_pruned = sum(b.pruned for b in buckets)
+                self.log.info(
+                    f"Stages 2-4: {len(buckets)} expiry buckets, {num_candidates} structures, "
+                    f"{num_survivors} survivors, {num_scored} MC scored"
+                )
+            else:
+                # =============================================================
+                # Stage 2: Structure generation (T016, FR-008)
+                # =============================================================
+                self.log.info("Stage 2: Generating candidate structures")
+
+                generator = CandidateGenerator(generator_config)
+                candidates = generator.generate(filtered_chain, spot)
+                num_candidates = len(candidates)
+                num_pruned = generator.pruned
+
+                self.log.info(
+                    f"Stage 2: Generated {num_candidates} candidate structures "
+                    f"({num_pruned} pruned by Stage 3 bounds)"
+                )
 
-            prefilter = Prefilter(stage3_config)
-            survivors = prefilter.evaluate(candidates, spot)
+                # =============================================================
+                # Stage 3: Analytic prefilter + hard constraints (T017, FR-009-FR-011)
+                # =============================================================
+                self.log.info("Stage 3: Applying analytic prefilter with hard constraints")
 
-            self.log.info(f"Stage 3: {len(survivors)} survivors advanced to Stage 4")
+                prefilter = Prefilter(stage3_config)
+                survivors = prefilter.evaluate(candidates, spot)
+                num_survivors = len(survivors)
 
-            # =================================================================
-            # Stage 4: Full MC scoring (T018, FR-012)
-            # =================================================================
-            self.log.info("Stage 4: Running full Monte Carlo scoring")
+                self.log.info(f"Stage 3: {num_survivors} survivors advanced to Stage 4")
 
-            # Load regime parameters
-            regime_params = load_regime_params(
-                regime=regime,
-                regimes_cfg=self.regimes,
-                mode=self.config.get("regime_mode", "table"),
-            )
+                # =============================================================
+                # Stage 4: Full MC scoring (T018, FR-012)
+                # =============================================================
+                self.log.info("Stage 4: Running full Monte Carlo scoring")
 
-            # Get distribution and fit with synthetic returns for MVP
-            # TODO: Replace with real historical returns from data_provider
-            distribution = get_distribution(self.config.get("distribution", "garch_t"))
+                mc_engine, regime_params = self._build_mc_engine(ticker, regime)
 
-            # For MVP testing: Generate synthetic returns for fitting
-            # In production, use: returns = self.data_provider.fetch_returns(ticker, days=252)
-            synthetic_returns = np.random.normal(
-                loc=regime_params.mean_daily_return if regime_params else 0.001,
-                scale=regime_params.daily_vol if regime_params else 0.02,
-                size=252  # 1 year of daily returns
-            )
-            distribution.fit(synthetic_returns, min_samples=252)
-
-            # Create MC engine
-            mc_config = MCConfig(
-                num_paths=self.mc_config.get("num_paths", 5000),
-                bars_per_day=1,
-                seed=self.mc_config.get("seed", 42),
-            )
-
-            pricer = BlackScholesPricer()
-            mc_engine = MCEngine(distribution, pricer, mc_config)
+                # Score survivors
+                scored_candidates = mc_engine.score_candidates(
+                    survivors, spot, trade_horizon, regime_params
+                )
+                num_scored = len(scored_candidates)
 
-            # Score survivors
-            scored_candidates = mc_engine.score_candidates(
-                survivors, spot, trade_horizon, regime_params
-            )
+                self.log.info(f"Stage 4: Scored {num_scored} candidates with MC")
 
-            self.log.info(f"Stage 4: Scored {len(scored_candidates)} candidates with MC")
+                # Bounded heap: only the reported Top-100 is retained
+                ranked = top_k(
+                    scored_candidates,
+                    100,
+                    key=lambda c: c.metrics.score if c.metrics else 0.0,
+                )
 
             # =================================================================
             # Ranking and scoring (T028, FR-041)
             # =================================================================
             self.log.info("Ranking candidates by composite score")
 
-            # Add score decomposition
-            scored_candidates = self._add_score_decomposition(scored_candidates)
-
-            # Sort by composite score
-            ranked = sorted(
-                scored_candidates,
-                key=lambda c: c.metrics.score if c.metrics else 0.0,
-                reverse=True,
-            )
-
-            top10 = ranked[:10]
-            top100 = ranked[:100]
+            # Add score decomposition (only ranked outputs are reported)
+            top100 = self._add_score_decomposition(ranked[:100])
+            top10 = top100[:10]
 
             # Convert to dictionaries
             top10_dicts = [self._candidate_to_dict(c) for c in top10]
@@ -234,12 +278,13 @@ class StrategyOptimizer:
                     "stage_counts": {
                         "Stage 0 (expiries)": len(selected_expiries),
                         "Stage 1 (strikes)": num_strikes,
-                        "Stage 2 (structures)": len(candidates),
-                        "Stage 3 (survivors)": len(survivors),
-                        "Stage 4 (MC scored)": len(scored_candidates),
+                        "Stage 2 (structures)": num_candidates,
+                        "Stage 3 (survivors)": num_survivors,
+                        "Stage 4 (MC scored)": num_scored,
                     },
                     "rejections": {
-                        "capital_filter": len(candidates) - len(survivors),
+                        "bound_pruning": num_pruned,
+                        "capital_filter": num_candidates - num_survivors,
                         "maxloss_filter": 0,  # TODO: Track individual filter rejections
                         "epnl_filter": 0,
                         "pop_filter": 0,
@@ -248,6 +293,7 @@ class StrategyOptimizer:
                     "runtime_seconds": runtime,
                     "regime": regime,
                     "trade_horizon_days": trade_horizon,
+                    "execution_mode": execution.get("mode", "serial"),
                 },
             }
 
@@ -258,6 +304,53 @@ class StrategyOptimizer:
             self.log.exception(f"Optimization failed for {ticker}: {exc}")
             raise
 
+    def _build_mc_engine(self, ticker: str, regime: str) -> tuple[Any, Any]:
+        """Load regime parameters, fit (or reuse) the return distribution and build the MC engine."""
+        import numpy as np
+
+        from qse.distributions.factory import get_distribution
+        from qse.distributions.regime_loader import load_regime_params
+        from qse.optimizers.mc_engine import MCConfig, MCEngine
+        from qse.pricing.black_scholes import BlackScholesPricer
+
+        # Load regime parameters
+        regime_params = load_regime_params(
+            regime=regime,
+            regimes_cfg=self.regimes,
+            mode=self.config.get("regime_mode", "table"),
+        )
+
+        distribution_name = self.config.get("distribution", "garch_t")
+        # The fit only sees regime parameters (no ticker history yet), so it is
+        # shared across tickers; key on the ticker once real returns are fitted.
+        cache_key = (regime, distribution_name)
+        distribution = self._fitted_distributions.get(cache_key)
+        if distribution is not None:
+            self.log.info(f"Reusing fitted {distribution_name} distribution for {regime} ({ticker})")
+        else:
+            # Get distribution and fit with synthetic returns for MVP
+            # TODO: Replace with real historical returns from data_provider
+            distribution = get_distribution(distribution_name)
+
+            # For MVP testing: Generate synthetic returns for fitting
+            # In production, use: returns = self.data_provider.fetch_returns(ticker, days=252)
+            rng = np.random.default_rng(self.mc_config.get("seed", 42))
+            synthetic_returns = rng.normal(
+                loc=regime_params.mean_daily_return if regime_params else 0.001,
+                scale=regime_params.daily_vol if regime_params else 0.02,
+                size=252  # 1 year of daily returns
+            )
+            distribution.fit(synthetic_returns, min_samples=252)
+            self._fitted_distributions[cache_key] = distribution
+
+        # Create MC engine
+        mc_config = MCConfig(
+            num_paths=self.mc_config.get("num_paths", 5000),
+            bars_per_day=1,
+            seed=self.mc_config.get("seed", 42),
+        )
+        return MCEngine(distribution, BlackScholesPricer(), mc_config), regime_params
+
     def _create_synthetic_chain(self, spot: float) -> Any:
         """Create synthetic option chain for testing.
 
@@ -67,3 +67,44 @@ class GapVolumeSelector(CandidateSelector):
 
         return episodes
 
+
+    def select_panel(self, panel: pd.DataFrame) -> list:
+        """Filter and score every symbol of a long panel in one vectorised pass."""
+
+        missing = [c for c in self.feature_requirements if c not in panel.columns]
+        if missing:
+            log.warning("missing required features", extra={"missing": missing})
+            return []
+
+        mask = (panel["gap_pct"].abs() >= self.gap_min) & (panel["volume_z"] >= self.volume_z_min)
+        filtered = panel.loc[mask].copy()
+        if filtered.empty:
+            log.info("no candidates after filtering", extra={"component": self.name})
+            return []
+
+        if type(self).score is GapVolumeSelector.score:
+            filtered["score"] = filtered["gap_pct"].abs() + filtered["volume_z"].clip(lower=0)
+        else:
+            filtered["score"] = filtered.apply(lambda row: self.score(row), axis=1)
+
+        episodes: list = []
+        short = 0
+        for symbol, group in filtered.groupby("symbol", observed=True, sort=False):
+            group = group.set_index("date").sort_values("score", ascending=False)
+            symbol_episodes = build_candidate_episodes(
+                symbol=str(symbol),
+                selector_name=self.name,
+                df=group,
+                horizon=self.horizon,
+                feature_fields=["gap_pct", "volume_z"],
+                score_field="score",
+            )
+            short += len(symbol_episodes) < self.min_episodes
+            episodes.extend(symbol_episodes)
+
+        if short:
+            log.warning(
+                "selector produced fewer episodes than min_episodes",
+                extra={"min_episodes": self.min_episodes, "symbols_below": short},
+            )
+        return episodes
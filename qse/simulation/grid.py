@@ -23,6 +23,7 @@ from qse.schema.strategy import StrategyParams
 from qse.simulation.compare import run_compare
 from qse.simulation.metrics import MetricsReport
 from qse.utils.logging import get_logger
+from qse.utils.ranking import top_k
 from qse.utils.resources import select_storage_policy
 
 log = get_logger(__name__, component="grid")
@@ -259,7 +260,7 @@ def apply_objective_scores(
             + weights.cvar * (-zc)
         )
 
-    return sorted(results, key=lambda r: (r.objective_score or float("-inf")), reverse=True)
+    return top_k(results, None, key=lambda r: (r.objective_score or float("-inf")))
 
 
 def write_grid_results(path: Path, results: list[GridResult], *, weights: ObjectiveWeights) -> None:
@@ -16,6 +16,7 @@ from qse.schema.strategy import StrategyParams
 from qse.features.technical import compute_all_features
 from qse.simulation.simulator import MarketSimulator
 from qse.models.screen import SymbolScreenResult
+from qse.utils.ranking import TopK
 
 log = get_logger(__name__, component="screen")
 
@@ -47,6 +48,12 @@ def screen_universe(
 
     worker_count = _clamp_workers(max_workers)
     results: list[CandidateEpisode] = []
+    # Completion order varies between runs, so ties break on symbol
+    ranked: TopK[CandidateEpisode] | None = (
+        TopK(int(top_n), key=lambda ep: ep.score or 0.0, tiebreak=lambda ep: ep.symbol)
+        if top_n is not None
+        else None
+    )
 
     with ProcessPoolExecutor(max_workers=worker_count) as executor:
         futures = {executor.submit(_screen_symbol, sym, df, selector): sym for sym, df in universe.items()}
@@ -54,18 +61,42 @@ def screen_universe(
             symbol = futures[fut]
             try:
                 episodes = fut.result()
-                results.extend(episodes)
+                if ranked is not None:
+                    ranked.extend(episodes)
+                else:
+                    results.extend(episodes)
             except Exception as exc:  # pragma: no cover - defensive logging
                 log.error("screening failed for symbol", extra={"symbol": symbol, "error": str(exc)})
 
-    if top_n is not None and results:
-        results.sort(key=lambda ep: ep.score or 0.0, reverse=True)
-        results = results[: int(top_n)]
+    if ranked is not None:
+        results = ranked.items()
 
     log.info("screening complete", extra={"candidates": len(results)})
     return results
 
 
+def screen_panel(
+    *,
+    panel: pd.DataFrame,
+    selector: CandidateSelector,
+    top_n: int | None = None,
+) -> list[CandidateEpisode]:
+    """Apply ``selector`` to a long multi-symbol panel in-process.
+
+    The panel is already one contiguous frame, so no per-symbol frames are
+    pickled to workers; ``selector.select_panel`` filters it in one pass.
+    """
+
+    episodes = selector.select_panel(panel)
+    if top_n is not None:
+        ranked: TopK[CandidateEpisode] = TopK(
+            int(top_n), key=lambda ep: ep.score or 0.0, tiebreak=lambda ep: ep.symbol
+        )
+        episodes = ranked.extend(episodes).items()
+    log.info("screening complete", extra={"candidates": len(episodes)})
+    return episodes
+
+
 def run_strategy_screen(
     *,
     universe: Mapping[str, pd.DataFrame],
@@ -75,7 +106,9 @@ def run_strategy_screen(
     min_episodes: int = 10,
     top_n: Optional[int] = None,
 ) -> List[SymbolScreenResult]:
-    results: List[SymbolScreenResult] = []
+    ranked: TopK[SymbolScreenResult] = TopK(
+        None if top_n is None else int(top_n), key=lambda r: r.rank_metric or float("-inf")
+    )
     rank_by = rank_by.lower()
 
     for symbol, df in universe.items():
@@ -108,7 +141,7 @@ def run_strategy_screen(
             comparison = cond_result.comparison
 
         rank_metric = getattr(cond_metrics or metrics_uncond, rank_by, None)
-        results.append(
+        ranked.push(
             SymbolScreenResult(
                 symbol=symbol,
                 metrics_unconditional=metrics_uncond,
@@ -120,7 +153,4 @@ def run_strategy_screen(
             )
         )
 
-    results.sort(key=lambda r: r.rank_metric or float("-inf"), reverse=True)
-    if top_n is not None:
-        results = results[: int(top_n)]
-    return results
+    return ranked.items()
@@ -0,0 +1,108 @@
+"""Bounded streaming top-K ranking.
+
+``TopK`` keeps the ``k`` best items seen so far in a min-heap, so ranking a
+stream of scored candidates needs O(k) memory instead of materialising and
+sorting everything. Ordering matches ``sorted(items, key=key, reverse=True)``:
+higher scores first, and ties keep arrival order (or an explicit
+``tiebreak`` key when arrival order is not deterministic, e.g. results from
+``as_completed``). Accumulators from different workers can be merged.
+"""
+
+from __future__ import annotations
+
+import heapq
+import math
+from typing import Any, Callable, Generic, Iterable, Iterator, List, TypeVar
+
+T = TypeVar("T")
+
+
+class _Entry:
+    __slots__ = ("score", "order", "item")
+
+    def __init__(self, score: float, order: tuple, item: Any) -> None:
+        self.score = score
+        self.order = order
+        self.item = item
+
+    def __lt__(self, other: "_Entry") -> bool:
+        # Heap root is the entry ranked last: lowest score, then latest order
+        if self.score != other.score:
+            return self.score < other.score
+        return self.order > other.order
+
+
+def _as_score(value: Any) -> float:
+    if value is None:
+        return float("-inf")
+    value = float(value)
+    return float("-inf") if math.isnan(value) else value
+
+
+class TopK(Generic[T]):
+    """Accumulate the ``k`` highest-scoring items; ``k=None`` keeps everything."""
+
+    def __init__(
+        self,
+        k: int | None,
+        key: Callable[[T], Any],
+        *,
+        tiebreak: Callable[[T], Any] | None = None,
+    ) -> None:
+        if k is not None and k < 0:
+            raise ValueError("k must be non-negative")
+        self.k = k
+        self.key = key
+        self.tiebreak = tiebreak
+        self.seen = 0
+        self._heap: List[_Entry] = []
+
+    def push(self, item: T) -> None:
+        self.seen += 1
+        if self.k == 0:
+            return
+        order = (self.tiebreak(item), self.seen) if self.tiebreak else (self.seen,)
+        entry = _Entry(_as_score(self.key(item)), order, item)
+        if self.k is None or len(self._heap) < self.k:
+            heapq.heappush(self._heap, entry)
+        elif self._heap[0] < entry:
+            heapq.heapreplace(self._heap, entry)
+
+    def extend(self, items: Iterable[T]) -> "TopK[T]":
+        for item in items:
+            self.push(item)
+        return self
+
+    def merge(self, other: "TopK[T]") -> "TopK[T]":
+        """Fold another accumulator in (its items arrive in its rank order)."""
+
+        seen = self.seen + other.seen
+        self.extend(other.items())
+        self.seen = seen
+        return self
+
+    def items(self) -> List[T]:
+        """Return retained items best-first."""
+
+        return [entry.item for entry in sorted(self._heap, reverse=True)]
+
+    def __len__(self) -> int:
+        return len(self._heap)
+
+    def __iter__(self) -> Iterator[T]:
+        return iter(self.items())
+
+
+def top_k(
+    items: Iterable[T],
+    k: int | None,
+    key: Callable[[T], Any],
+    *,
+    tiebreak: Callable[[T], Any] | None = None,
+) -> List[T]:
+    """Return the ``k`` best of ``items`` best-first (``k=None`` ranks all)."""
+
+    return TopK(k, key, tiebreak=tiebreak).extend(items).items()
+
+
+__all__ = ["TopK", "top_k"]
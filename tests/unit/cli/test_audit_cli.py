@@ -5,6 +5,7 @@ pytest.importorskip("typer")
 from typer.testing import CliRunner
 
 from qse.cli.main import app
+from qse.data.bulk_fetch import PROVIDER_LIMITS, RateLimiter
 from qse.distributions.distribution_audit import (
     DistributionAuditResult,
     FitResult,
@@ -104,3 +105,49 @@ def test_audit_cli_formats_output(monkeypatch, tmp_path):
     assert res.exit_code == 0
     assert "Distribution Audit for TEST" in res.stdout
     assert "Best Model: laplace" in res.stdout
+
+
+def test_audit_cli_batch_mode_prints_summary(monkeypatch, tmp_path):
+    from qse.distributions.batch_audit import SymbolAuditSummary
+
+    universe = tmp_path / "universe.csv"
+    universe.write_text("symbol\nAAPL\nMSFT\n")
+    captured = {}
+
+    class SpyLimiter(RateLimiter):
+        def wrap(self, fn):
+            captured["limits"] = self.limits
+            return super().wrap(fn)
+
+    def fake_fetch(symbol, start, end, interval, target):
+        return pd.DataFrame({"date": pd.date_range("2024-01-01", periods=3), "close": [1.0, 2.0, 3.0]})
+
+    def fake_universe(symbols, load_prices, **kwargs):
+        captured["symbols"] = symbols
+        captured["kwargs"] = kwargs
+        captured["prices"] = load_prices("AAPL")
+        return [
+            SymbolAuditSummary("AAPL", "audited", "student_t", 0.42, runtime_seconds=3.0),
+            SymbolAuditSummary("MSFT", "cached", "laplace", 0.31),
+        ]
+
+    monkeypatch.setattr("qse.cli.commands.audit_distributions.audit_universe", fake_universe)
+    monkeypatch.setattr("qse.cli.commands.audit_distributions.RateLimiter", SpyLimiter)
+    monkeypatch.setattr("qse.cli.commands.audit_distributions.fetch_symbol", fake_fetch)
+    res = CliRunner().invoke(
+        app,
+        [
+            "audit-distributions", "--symbols-file", str(universe), "--end-date", "2024-12-31",
+            "--workers", "4", "--target", str(tmp_path),
+        ],
+    )
+
+    assert res.exit_code == 0, res.stdout
+    assert captured["symbols"] == ["AAPL", "MSFT"]
+    assert captured["kwargs"]["max_workers"] == 4
+    assert captured["kwargs"]["data_source"] == "yfinance:1d"
+    # Cache misses go through the yfinance rate limiter
+    assert captured["limits"] == PROVIDER_LIMITS["yfinance"]
+    assert list(captured["prices"]) == [1.0, 2.0, 3.0]
+    assert "Distribution Audit Summary (2 symbols)" in res.stdout
+    assert "student_t" in res.stdout and "Cached: 1" in res.stdout
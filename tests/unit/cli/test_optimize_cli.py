@@ -0,0 +1,40 @@
+import pytest
+
+pytest.importorskip("typer")
+from typer.testing import CliRunner
+
+from qse.cli.main import app
+from qse.optimizers import batch
+from qse.optimizers.batch import BatchReport
+
+
+def _capture_batch(monkeypatch) -> dict:
+    captured: dict = {}
+
+    def fake_batch(symbols, **kwargs):
+        captured.update(kwargs)
+        return BatchReport(regime=kwargs["regime"], trade_horizon=kwargs["trade_horizon"])
+
+    monkeypatch.setattr(batch, "run_optimizer_batch", fake_batch)
+    return captured
+
+
+def test_optimize_batch_falls_back_to_yfinance_by_default(monkeypatch):
+    captured = _capture_batch(monkeypatch)
+
+    result = CliRunner().invoke(app, ["optimize-batch", "--tickers", "AAA", "--regime", "neutral"])
+
+    assert result.exit_code == 0, result.output
+    assert captured["provider_spec"]["name"] == "schwab"
+    assert captured["provider_spec"]["fallback"] == "yfinance"
+
+
+def test_optimize_batch_no_fallback(monkeypatch):
+    captured = _capture_batch(monkeypatch)
+
+    result = CliRunner().invoke(
+        app, ["optimize-batch", "--tickers", "AAA", "--regime", "neutral", "--no-fallback"]
+    )
+
+    assert result.exit_code == 0, result.output
+    assert "fallback" not in captured["provider_spec"]
@@ -0,0 +1,95 @@
+import threading
+import time
+from pathlib import Path
+
+import pandas as pd
+
+from qse.data.bulk_fetch import (
+    ProviderLimits,
+    RateLimitedSource,
+    RateLimiter,
+    TokenBucket,
+    fetch_symbols,
+    limits_for,
+)
+from qse.data.data_loader import DataLoader
+from qse.exceptions import DataSourceError
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+        self.sleeps = []
+
+    def __call__(self):
+        return self.now
+
+    def sleep(self, seconds):
+        self.sleeps.append(seconds)
+        self.now += seconds
+
+
+class SlowSource:
+    name = "fake"
+
+    def __init__(self, fail=()):
+        self.fail = set(fail)
+        self.active = 0
+        self.peak = 0
+        self._lock = threading.Lock()
+
+    def fetch_ohlcv(self, symbol, start, end, interval="1d"):
+        with self._lock:
+            self.active += 1
+            self.peak = max(self.peak, self.active)
+        try:
+            time.sleep(0.02)
+            if symbol in self.fail:
+                raise DataSourceError(f"no data for {symbol}")
+            idx = pd.date_range(start, end, freq="D")
+            return pd.DataFrame(
+                {"open": 1.0, "high": 2.0, "low": 0.5, "close": 1.5, "volume": 100}, index=idx
+            )
+        finally:
+            with self._lock:
+                self.active -= 1
+
+
+def test_token_bucket_waits_once_burst_is_spent():
+    clock = FakeClock()
+    bucket = TokenBucket(rate=2.0, capacity=2, clock=clock, sleep=clock.sleep)
+
+    waits = [bucket.acquire() for _ in range(4)]
+
+    assert waits[:2] == [0.0, 0.0]
+    assert waits[2] == 0.5 and waits[3] == 0.5
+    assert clock.now == 1.0
+
+
+def test_limits_for_resolves_primary_provider():
+    assert limits_for("schwab+yfinance") == limits_for("schwab")
+    assert limits_for("unknown").max_concurrency >= 1
+
+
+def test_fetch_symbols_caps_concurrency_and_reports_failures(tmp_path: Path):
+    source = SlowSource(fail={"BAD"})
+    limiter = RateLimiter(ProviderLimits(rate_per_second=1000.0, burst=1000, max_concurrency=2))
+    loader = DataLoader(tmp_path / "data" / "historical", data_source=RateLimitedSource(source, limiter), storage_format="pickle")
+    symbols = ["AAA", "BBB", "BAD", "CCC", "DDD", "EEE"]
+    seen = []
+
+    results = fetch_symbols(
+        symbols,
+        lambda s: loader.load_ohlcv(s, "2024-01-01", "2024-01-10", "1d"),
+        max_workers=6,
+        on_result=lambda result, df: seen.append(result.symbol),
+    )
+
+    assert [r.symbol for r in results] == symbols
+    assert sorted(seen) == sorted(symbols)
+    assert source.peak <= 2
+    assert limiter.calls == len(symbols)
+    by_symbol = {r.symbol: r for r in results}
+    assert by_symbol["BAD"].status == "failed" and "BAD" in by_symbol["BAD"].error
+    assert all(by_symbol[s].status == "success" and by_symbol[s].rows == 10 for s in symbols if s != "BAD")
+    assert list(tmp_path.rglob("*.pkl"))
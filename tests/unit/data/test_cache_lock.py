@@ -0,0 +1,116 @@
+import multiprocessing
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+import pandas as pd
+import pytest
+
+from qse.data.cache_lock import atomic_write, atomic_write_text, partition_lock
+from qse.data.data_loader import DataLoader
+from qse.data.partitioned_store import PartitionedStore
+from qse.exceptions import DataSourceError
+
+
+def _make_df(start: str, periods: int) -> pd.DataFrame:
+    dates = pd.date_range(start=start, periods=periods, freq="D")
+    return pd.DataFrame(
+        {
+            "open": range(1, periods + 1),
+            "high": range(2, periods + 2),
+            "low": range(0, periods),
+            "close": range(1, periods + 1),
+            "volume": [100] * periods,
+        },
+        index=dates,
+    )
+
+
+class SlowLoader(DataLoader):
+    def __init__(self, base_dir: Path, **kwargs):
+        super().__init__(base_dir, storage_format="pickle", **kwargs)
+        self.calls = 0
+        self._count = threading.Lock()
+
+    def _fetch_from_source(self, symbol, start, end, interval):
+        with self._count:
+            self.calls += 1
+        time.sleep(0.2)
+        return _make_df("2023-01-01", 5)
+
+
+@pytest.mark.parametrize("single_flight, expected_calls", [(True, 1), (False, 4)])
+def test_single_flight_shares_one_fetch(tmp_path: Path, single_flight, expected_calls):
+    loader = SlowLoader(tmp_path / "data" / "historical", single_flight=single_flight)
+    with ThreadPoolExecutor(max_workers=4) as pool:
+        frames = list(
+            pool.map(lambda _: loader.load_ohlcv("AAPL", "2023-01-01", "2023-01-05"), range(4))
+        )
+    assert loader.calls == expected_calls
+    for df in frames:
+        pd.testing.assert_frame_equal(df, frames[0])
+    partition = tmp_path / "data" / "historical" / "interval=1d" / "symbol=AAPL" / "_v1"
+    assert not list(partition.glob("*.tmp"))
+
+
+def _hold_lock(directory: str, held, release) -> None:
+    with partition_lock(Path(directory)):
+        held.set()
+        release.wait(10)
+
+
+def test_partition_lock_excludes_other_processes(tmp_path: Path):
+    ctx = multiprocessing.get_context("fork")
+    held, release = ctx.Event(), ctx.Event()
+    child = ctx.Process(target=_hold_lock, args=(str(tmp_path), held, release))
+    child.start()
+    try:
+        assert held.wait(10)
+        with pytest.raises(DataSourceError):
+            with partition_lock(tmp_path, timeout=0.1):
+                pass
+    finally:
+        release.set()
+        child.join(10)
+    with partition_lock(tmp_path, timeout=5):
+        with partition_lock(tmp_path, timeout=0):  # re-entrant in-process
+            pass
+
+
+def test_atomic_write_keeps_previous_file_on_failure(tmp_path: Path):
+    target = tmp_path / "data.meta.json"
+    atomic_write_text(target, "old")
+
+    def partial(tmp: Path) -> None:
+        tmp.write_text("half-writ")
+        raise RuntimeError("disk full")
+
+    with pytest.raises(RuntimeError):
+        atomic_write(target, partial)
+    assert target.read_text() == "old"
+    assert [p.name for p in tmp_path.iterdir()] == ["data.meta.json"]
+
+
+def test_partitioned_rewrite_keeps_old_manifest_readable(tmp_path: Path, monkeypatch):
+    store = PartitionedStore(tmp_path, storage_format="pickle")
+    store.write(_make_df("2022-12-30", 4))
+    old_files = store.files()
+    reader = PartitionedStore(tmp_path, storage_format="pickle")
+    old_manifest = reader.load_manifest()
+
+    # A crash before the new manifest lands leaves the old series intact
+    monkeypatch.setattr(store, "_save", lambda manifest: (_ for _ in ()).throw(OSError("crash")))
+    with pytest.raises(OSError):
+        store.write(_make_df("2022-12-20", 20))
+    assert len(reader.read()) == 4
+    monkeypatch.undo()
+
+    # A reader holding the old manifest can read until the swap; afterwards it retries
+    assert len(reader._read(old_manifest, None, None, None)) == 4
+    store.write(_make_df("2022-12-20", 20))
+    assert not any(p.exists() for p in old_files)
+    assert all(p.exists() for p in store.files())
+    assert len(reader.read()) == 20
+    # Orphans of the crashed rewrite were swept
+    assert sorted(p for p in tmp_path.rglob("data*.pkl")) == sorted(store.files())
@@ -0,0 +1,86 @@
+import json
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+from qse.data.compact import compact_ohlcv, is_compact
+from qse.data.data_loader import DataLoader
+from qse.features.pipeline import enrich_ohlcv
+
+
+def _bars(periods: int = 600) -> pd.DataFrame:
+    rng = np.random.default_rng(7)
+    close = 150 * np.exp(np.cumsum(rng.normal(0, 0.015, periods)))
+    df = pd.DataFrame(
+        {
+            "open": close * (1 + rng.normal(0, 0.01, periods)),
+            "high": close * 1.01,
+            "low": close * 0.99,
+            "close": close,
+            "volume": rng.integers(10_000, 5_000_000, periods),
+            "symbol": "AAPL",
+            "interval": "1m",
+        },
+        index=pd.date_range("2024-03-01 09:30", periods=periods, freq="min", name="date"),
+    )
+    return df
+
+
+def test_compact_ohlcv_dtypes_and_memory():
+    df = _bars()
+    compact = compact_ohlcv(df)
+
+    assert all(compact[c].dtype == np.float32 for c in ["open", "high", "low", "close"])
+    assert compact["volume"].dtype == np.uint32
+    assert isinstance(compact["symbol"].dtype, pd.CategoricalDtype)
+    assert str(compact.index.dtype) == "datetime64[ns]"
+    assert compact.attrs["representation"] == "compact"
+    assert compact_ohlcv(compact) is compact
+    before = df.memory_usage(deep=True).sum()
+    assert compact.memory_usage(deep=True).sum() < 0.5 * before
+
+
+def test_compact_feature_and_metric_drift_is_bounded():
+    df = _bars()
+    full = enrich_ohlcv(df, log_output=False)
+    compact = enrich_ohlcv(compact_ohlcv(df), log_output=False)
+
+    assert compact["sma_20"].dtype == np.float32 and is_compact(compact)
+    np.testing.assert_allclose(compact["sma_20"], full["sma_20"], rtol=1e-6)
+    np.testing.assert_allclose(compact["sma_50"], full["sma_50"], rtol=1e-6)
+    np.testing.assert_allclose(compact["gap_pct"], full["gap_pct"], atol=1e-6)
+    np.testing.assert_allclose(compact["rsi_14"], full["rsi_14"], atol=1e-3)
+    np.testing.assert_allclose(compact["volume_z"], full["volume_z"], atol=1e-5)
+
+    returns_full = np.log(full["close"]).diff().dropna()
+    returns_compact = np.log(compact["close"].astype(np.float64)).diff().dropna()
+    np.testing.assert_allclose(returns_compact.std(), returns_full.std(), rtol=1e-4)
+    sharpe_full = returns_full.mean() / returns_full.std()
+    sharpe_compact = returns_compact.mean() / returns_compact.std()
+    assert abs(sharpe_compact - sharpe_full) < 1e-4
+
+
+def test_loader_compact_mode_records_representation(tmp_path: Path):
+    bars = _bars(40).drop(columns=["symbol", "interval"])
+    bars.index = pd.date_range("2024-01-01", periods=40, freq="D", name="date")
+
+    class Source:
+        name = "stub"
+
+        def fetch_ohlcv(self, symbol, start, end, interval="1d"):
+            return bars
+
+    base = tmp_path / "data" / "historical"
+    loader = DataLoader(base, data_source=Source(), storage_format="pickle", representation="compact")
+    out = loader.load_ohlcv("AAPL", "2024-01-01", "2024-02-09")
+    assert is_compact(out) and out["volume"].dtype == np.uint32
+
+    meta_path = loader._resolve_partition("AAPL", "interval=1d", None) / "data.meta.json"
+    meta = json.loads(meta_path.read_text())
+    assert meta["representation"] == "compact"
+    assert meta["dtypes"]["close"] == "float32"
+
+    # A standard loader reading the compact cache still gets float64 prices
+    standard = DataLoader(base, data_source=Source(), storage_format="pickle")
+    assert standard.load_ohlcv("AAPL", "2024-01-01", "2024-02-09")["close"].dtype == np.float64
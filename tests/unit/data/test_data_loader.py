@@ -2,10 +2,13 @@ import json
 from datetime import datetime, timedelta
 from pathlib import Path
 
+import numpy as np
 import pandas as pd
 import pytest
 
 from qse.data.data_loader import DataLoader
+from qse.data.frame_cache import FrameCache, estimate_nbytes
+from qse.data.validation import compute_fingerprint
 from qse.exceptions import DataSourceError
 
 
@@ -103,6 +106,9 @@ def test_incremental_append_without_corporate_action(tmp_path: Path):
     # incremental fetch should have appended two new rows (total 4 unique dates because one overlaps)
     assert len(out) == 4
     assert loader.calls[-1] == ("2023-01-03", "2023-01-05")
+    # The fingerprint is updated from the appended rows and matches a full recompute
+    meta_path = loader._resolve_partition("AAPL", "interval=1d", None) / "data.meta.json"
+    assert json.loads(meta_path.read_text())["fingerprint"] == compute_fingerprint(out)
 
 
 def test_allow_stale_cache_on_failure(tmp_path: Path):
@@ -149,3 +155,139 @@ def test_option_chain_caching(tmp_path: Path):
     # cached read should avoid source call
     df_cached = loader.load_option_chain("AAPL", as_of="2024-01-02", expiry="2024-01-19")
     assert len(df_cached) == len(df)
+
+
+def test_frame_cache_serves_repeat_loads_and_invalidates_on_write(tmp_path: Path):
+    base_dir = tmp_path / "data" / "historical"
+    cache = FrameCache(max_bytes=10_000_000)
+    loader = StubLoader(base_dir, responses={("2023-01-01", "2023-01-05"): _make_df("2023-01-01", 5)}, frame_cache=cache)
+    part = loader._resolve_partition("AAPL", "interval=1d", "_v1")
+    part.mkdir(parents=True, exist_ok=True)
+    loader._write_cache(part / "data.pkl", part / "data.meta.json", _make_df("2023-01-01", 5), "AAPL", "2023-01-01", "2023-01-05")
+
+    first = loader.load_ohlcv("AAPL", "2023-01-01", "2023-01-05")
+    second = loader.load_ohlcv("AAPL", "2023-01-02", "2023-01-03")
+
+    assert len(second) == 2
+    assert cache.stats.misses == 2  # parquet/pickle + meta
+    assert cache.stats.hits == 2
+    assert np.shares_memory(first["close"].to_numpy(), second["close"].to_numpy())
+
+    loader._write_cache(part / "data.pkl", part / "data.meta.json", _make_df("2023-01-01", 6), "AAPL", "2023-01-01", "2023-01-06")
+    assert cache.stats.invalidations == 2
+    assert len(loader.load_ohlcv("AAPL", "2023-01-01", "2023-01-06")) == 6
+
+
+def test_frame_cache_evicts_least_recently_used(tmp_path: Path):
+    frames = {}
+    for name in ("a", "b", "c"):
+        path = tmp_path / f"{name}.pkl"
+        _make_df("2023-01-01", 50).to_pickle(path)
+        frames[name] = path
+    size = estimate_nbytes(_make_df("2023-01-01", 50))
+    cache = FrameCache(max_bytes=int(size * 2.5))
+
+    cache.get(frames["a"], pd.read_pickle)
+    cache.get(frames["b"], pd.read_pickle)
+    cache.get(frames["a"], pd.read_pickle)
+    cache.get(frames["c"], pd.read_pickle)  # evicts b (least recently used)
+    cache.get(frames["a"], pd.read_pickle)
+    cache.get(frames["b"], pd.read_pickle)
+
+    assert cache.stats.evictions == 2
+    assert cache.stats.hits == 2
+    assert cache.stats.misses == 4
+    assert cache.stats.bytes <= cache.max_bytes
+
+
+def test_large_parquet_partitions_use_range_pushdown(tmp_path: Path, monkeypatch):
+    import qse.data.data_loader as data_loader
+
+    base_dir = tmp_path / "data" / "historical"
+    loader = DataLoader(base_dir, frame_cache=FrameCache())
+    # Minute bars under the 1d partition keep the staleness window at one day
+    part = loader._resolve_partition("AAPL", "interval=1d", "_v1")
+    part.mkdir(parents=True, exist_ok=True)
+    bars = pd.DataFrame(
+        {"open": 1.0, "high": 2.0, "low": 0.5, "close": 1.5, "volume": 10},
+        index=pd.date_range("2023-01-01", periods=20_000, freq="min", tz="UTC"),
+    )
+    loader._write_cache(part / "data.parquet", part / "data.meta.json", bars, "AAPL", "2023-01-01", "2023-01-14")
+    monkeypatch.setattr(data_loader, "PUSHDOWN_MIN_BYTES", 0)
+
+    out = loader.load_ohlcv("AAPL", "2023-01-03", "2023-01-03", columns=["close"])
+
+    assert list(out.columns) == ["close"]
+    assert len(out) == 1_440
+    assert out.index.is_monotonic_increasing
+    assert loader.frame_cache.stats.entries == 1  # only the meta file was cached
+
+
+def test_partitioned_layout_appends_only_latest_partition(tmp_path: Path):
+    base_dir = tmp_path / "data" / "historical"
+    history = _make_df("2022-12-25", 12)  # spans 2022 and 2023
+    latest = _make_df("2022-12-25", 14).iloc[11:]  # 2023-01-05..07, continuing closes
+    responses = {
+        ("2022-12-25", "2023-01-05"): history,
+        ("2023-01-05", "2023-01-06"): latest.iloc[:1],  # overlap bar, no corporate action
+        ("2023-01-05", "2023-01-07"): latest,
+    }
+    loader = StubLoader(base_dir, responses=responses, frame_cache=FrameCache(), layout="partitioned")
+
+    loader.load_ohlcv("AAPL", "2022-12-25", "2023-01-05")
+    part = loader._resolve_partition("AAPL", "interval=1d", None)
+    manifest = json.loads((part / "manifest.json").read_text())
+    assert set(manifest["partitions"]) == {"year=2022", "year=2023"}
+    assert not (part / "data.pkl").exists()
+    file_2022 = part / manifest["partitions"]["year=2022"]["path"]
+    old_2022 = file_2022.stat().st_mtime_ns
+
+    out = loader.load_ohlcv("AAPL", "2022-12-30", "2023-01-07")
+
+    manifest = json.loads((part / "manifest.json").read_text())
+    assert file_2022.stat().st_mtime_ns == old_2022
+    assert manifest["partitions"]["year=2023"]["rows"] == 7
+    assert manifest["rows"] == 14
+    assert json.loads((part / "data.meta.json").read_text())["fingerprint"] == manifest["fingerprint"]
+    assert out.index.min() == pd.Timestamp("2022-12-30")
+    assert out.index.max() == pd.Timestamp("2023-01-07")
+    assert out.index.is_unique
+
+
+def test_partitioned_layout_refreshes_stale_cache_incrementally(tmp_path: Path):
+    base_dir = tmp_path / "data" / "historical"
+    history = _make_df("2022-12-25", 12)
+    latest = _make_df("2022-12-25", 14).iloc[11:]
+    responses = {
+        ("2022-12-25", "2023-01-05"): history,
+        ("2023-01-05", "2023-01-06"): latest.iloc[:1],
+        ("2023-01-05", "2023-01-07"): latest,
+    }
+    loader = StubLoader(base_dir, responses=responses, frame_cache=FrameCache(), layout="partitioned")
+    loader.load_ohlcv("AAPL", "2022-12-25", "2023-01-05")
+    part = loader._resolve_partition("AAPL", "interval=1d", None)
+    manifest = json.loads((part / "manifest.json").read_text())
+    file_2022 = part / manifest["partitions"]["year=2022"]["path"]
+    old_2022 = file_2022.stat().st_mtime_ns
+
+    def _age_cache(hours: int) -> None:
+        meta = json.loads((part / "data.meta.json").read_text())
+        meta["fetched_at"] = (datetime.utcnow() - timedelta(hours=hours)).isoformat()
+        (part / "data.meta.json").write_text(json.dumps(meta))
+        loader.frame_cache.invalidate(part / "data.meta.json")
+
+    # Past the 1d stale threshold: same window refreshes only the overlap bar
+    _age_cache(25)
+    loader.calls.clear()
+    out = loader.load_ohlcv("AAPL", "2022-12-25", "2023-01-05")
+    assert loader.calls == [("2023-01-05", "2023-01-06")]
+    assert len(out) == 12
+
+    # Stale and extended: overlap check plus the new bars, never the whole window
+    _age_cache(25)
+    loader.calls.clear()
+    out = loader.load_ohlcv("AAPL", "2022-12-25", "2023-01-07")
+    assert loader.calls == [("2023-01-05", "2023-01-06"), ("2023-01-05", "2023-01-07")]
+    assert file_2022.stat().st_mtime_ns == old_2022
+    assert len(out) == 14 and out.index.is_unique
+    assert json.loads((part / "data.meta.json").read_text())["end"] == "2023-01-07"
@@ -0,0 +1,217 @@
+from collections import namedtuple
+from datetime import datetime, timedelta
+from pathlib import Path
+
+import pandas as pd
+import pytest
+
+from qse.data.option_chain_cache import (
+    ChainCacheConfig,
+    OptionChainCache,
+    contract_id,
+    session_chain_cache,
+)
+from qse.data.yfinance import YFinanceDataSource
+from qse.exceptions import DataSourceError
+from qse.optimizers.candidate_filter import Stage0Config, Stage1Config
+
+AS_OF = datetime(2025, 1, 2)
+EXPIRIES = [AS_OF + timedelta(days=d) for d in (3, 10, 20, 30, 60)]
+
+
+class Clock:
+    def __init__(self, now: datetime) -> None:
+        self.now = now
+
+    def __call__(self) -> datetime:
+        return self.now
+
+
+class ChainSource:
+    name = "chain"
+
+    def __init__(self) -> None:
+        self.calls: list[str | None] = []
+        self.bid = 1.0
+        self.spot = 100.0
+
+    def fetch_option_chain(self, symbol: str, expiry: str | None = None) -> pd.DataFrame:
+        self.calls.append(expiry)
+        expiries = [e for e in EXPIRIES if expiry is None or e.date().isoformat() == expiry]
+        rows = []
+        for exp in expiries:
+            for strike in (80.0, 95.0, 100.0, 105.0, 120.0):
+                for option_type in ("call", "put"):
+                    rows.append(
+                        {
+                            "expiry": exp.date().isoformat(),
+                            "strike": strike,
+                            "option_type": option_type,
+                            "bid": self.bid,
+                            "ask": self.bid + 0.2,
+                            "implied_volatility": 0.2,
+                            "open_interest": 10 if expiry is None else 999,
+                            "volume": 5,
+                            "underlying_price": self.spot,
+                        }
+                    )
+        return pd.DataFrame(rows)
+
+
+def _cache(tmp_path: Path, source: ChainSource, clock: Clock) -> OptionChainCache:
+    return OptionChainCache(
+        tmp_path / "data" / "option_chains",
+        source,
+        ChainCacheConfig(ttl_seconds=60),
+        clock=clock,
+    )
+
+
+def test_contract_id_is_occ_style():
+    assert contract_id("aapl", "2024-01-19", "call", 100.0) == "AAPL  240119C00100000"
+    assert contract_id("SPY", "2024-03-15", "put", 512.5) == "SPY   240315P00512500"
+
+
+def test_rejects_wrong_category_path(tmp_path: Path):
+    with pytest.raises(DataSourceError):
+        OptionChainCache(tmp_path / "data", ChainSource())
+
+
+def test_expiry_selection_served_from_index(tmp_path: Path):
+    source, clock = ChainSource(), Clock(AS_OF)
+    cache = _cache(tmp_path, source, clock)
+
+    first = cache.select_expiries("AAPL", AS_OF, Stage0Config(min_expiries=1))
+    second = cache.select_expiries("AAPL", AS_OF, Stage0Config(min_expiries=1))
+
+    assert first == second == [pd.Timestamp(e) for e in EXPIRIES[1:4]]
+    assert source.calls == [None]
+    assert cache.underlying_price("AAPL") == 100.0
+
+
+def test_refresh_only_updates_stale_quotes_in_window(tmp_path: Path):
+    source, clock = ChainSource(), Clock(AS_OF)
+    cache = _cache(tmp_path, source, clock)
+    selected = cache.select_expiries("AAPL", AS_OF, Stage0Config(min_expiries=1))
+
+    # Fresh quotes are served without another provider call
+    chain = cache.get_chain("AAPL", expiries=selected, spot=100.0, stage1=Stage1Config())
+    assert source.calls == [None]
+    assert set(chain["strike"]) == {95.0, 100.0, 105.0}
+
+    clock.now = AS_OF + timedelta(minutes=5)
+    source.bid = 2.0
+    chain = cache.get_chain("AAPL", expiries=selected, spot=100.0, stage1=Stage1Config())
+
+    assert source.calls[1:] == [e.date().isoformat() for e in selected]
+    assert (chain["bid"] == 2.0).all()
+    # Static metadata is kept from the snapshot; only quote columns change
+    assert (chain["open_interest"] == 10).all()
+    # Contracts outside the moneyness band were not touched
+    assert cache.stats.contracts_refreshed == len(chain)
+
+
+def test_persisted_chain_reused_across_sessions(tmp_path: Path):
+    source, clock = ChainSource(), Clock(AS_OF)
+    _cache(tmp_path, source, clock).expiries("AAPL")
+
+    reloaded = _cache(tmp_path, source, clock)
+    assert len(reloaded.expiries("AAPL")) == len(EXPIRIES)
+    assert source.calls == [None]
+    assert reloaded.stats.disk_hits == 1
+
+
+def test_stale_spot_refreshed_before_window(tmp_path: Path):
+    source, clock = ChainSource(), Clock(AS_OF)
+    cache = _cache(tmp_path, source, clock)
+    expiries = cache.select_expiries("AAPL", AS_OF, Stage0Config(min_expiries=1))
+    assert cache.spot("AAPL", expiries=expiries) == 100.0
+    assert source.calls == [None]
+
+    clock.now += timedelta(hours=2)
+    source.spot = 120.0
+    spot = cache.spot("AAPL", expiries=expiries)
+    assert spot == 120.0
+    assert source.calls == [None, expiries[0].date().isoformat()]
+
+    chain = cache.get_chain(
+        "AAPL", expiries=expiries, spot=spot, stage1=Stage1Config(moneyness_low=0.9, moneyness_high=1.1)
+    )
+    assert set(chain["strike"]) == {120.0}
+    # The nearest expiry was just refreshed with the spot; only the others are refetched
+    assert source.calls[2:] == [e.date().isoformat() for e in expiries[1:]]
+
+
+def test_session_chain_cache_requires_chain_provider(tmp_path: Path):
+    class QuotesOnly:
+        name = "quotes"
+
+    assert session_chain_cache(QuotesOnly(), tmp_path / "option_chains") is None
+    cache = session_chain_cache(
+        ChainSource(), tmp_path / "option_chains", {"chain_cache": {"ttl_seconds": 5}}
+    )
+    assert cache is not None and cache.config.ttl_seconds == 5.0
+
+
+class YFinanceShapedSource(YFinanceDataSource):
+    """Real yfinance adapter over stubbed ``yf.Ticker`` calls (one expiry per chain, no expiry field)."""
+
+    Chain = namedtuple("Options", ["calls", "puts", "underlying"])
+
+    def __init__(self, listed: list[datetime] = EXPIRIES) -> None:
+        super().__init__(max_retries=1)
+        self.listed = [e.date().isoformat() for e in listed]
+        self.calls: list[str | None] = []
+
+    def _option_expiries(self, symbol: str) -> list[str]:
+        return self.listed
+
+    def _option_chain(self, symbol: str, expiry: str | None):
+        self.calls.append(expiry)
+        frame = pd.DataFrame(
+            {
+                "contractSymbol": ["X"] * 3,
+                "strike": [95.0, 100.0, 105.0],
+                "bid": [1.0] * 3,
+                "ask": [1.2] * 3,
+                "impliedVolatility": [0.2] * 3,
+                "openInterest": [10] * 3,
+                "volume": [5] * 3,
+            }
+        )
+        return self.Chain(calls=frame, puts=frame.copy(), underlying={"regularMarketPrice": 100.0})
+
+
+def test_yfinance_shaped_full_chain_indexes_all_expiries(tmp_path: Path):
+    source, clock = YFinanceShapedSource(), Clock(AS_OF)
+    cache = _cache(tmp_path, source, clock)
+
+    assert cache.expiries("AAPL") == [pd.Timestamp(e) for e in EXPIRIES]
+    assert cache.underlying_price("AAPL") == 100.0
+    assert source.calls == [e.date().isoformat() for e in EXPIRIES]
+
+
+def test_chain_without_expiries_fails_clearly(tmp_path: Path):
+    cache = _cache(tmp_path, YFinanceShapedSource(listed=[]), Clock(AS_OF))
+
+    with pytest.raises(DataSourceError, match="No listed option expiries"):
+        cache.expiries("AAPL")
+
+
+def test_optimizer_falls_back_to_synthetic_chain_when_cache_fails(tmp_path: Path):
+    import logging
+
+    from qse.optimizers.strategy_optimizer import StrategyOptimizer
+
+    config = {
+        "regimes": {"neutral": {"mean_daily_return": 0.0, "daily_vol": 0.01, "skew": 0.0, "kurtosis_excess": 1.0}},
+        "mc": {"num_paths": 200, "seed": 1},
+        "filters": {"max_loss_pct": 1.0, "min_expected_pnl": 0.0, "min_pop_breakeven": 0.0,
+                    "min_pop_target": 0.0, "top_k_per_type": 2},
+    }
+    cache = _cache(tmp_path, YFinanceShapedSource(listed=[]), Clock(AS_OF))
+    optimizer = StrategyOptimizer(config, data_provider=None, logger=logging.getLogger(__name__), chain_cache=cache)
+
+    result = optimizer.optimize(ticker="AAPL", regime="neutral", trade_horizon=1)
+
+    assert result["diagnostics"]["stage_counts"]["Stage 0 (expiries)"] > 0
@@ -0,0 +1,177 @@
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from qse.data.data_loader import DataLoader
+from qse.data.partitioned_store import PartitionedStore
+from qse.data.resampling import ResampleCache, resample_ohlcv
+from qse.data.resolution import derivable_from
+from qse.exceptions import DataSourceError
+
+
+def _minute_bars(days: list[str], tz: str | None = "America/New_York") -> pd.DataFrame:
+    # 08:00-16:59 so pre/post-market bars exist on both sides of the session
+    index = pd.DatetimeIndex(
+        [ts for day in days for ts in pd.date_range(f"{day} 08:00", f"{day} 16:59", freq="1min")]
+    )
+    if tz is not None:
+        index = index.tz_localize(tz)
+    rng = np.random.default_rng(7)
+    steps, volume = rng.normal(0, 0.05, 10_000), rng.integers(100, 1000, 10_000)
+    close = 100 + np.cumsum(steps[: len(index)])
+    open_ = np.concatenate([[close[0]], close[:-1]])
+    return pd.DataFrame(
+        {
+            "open": open_,
+            "high": np.maximum(open_, close) + 0.01,
+            "low": np.minimum(open_, close) - 0.01,
+            "close": close,
+            "volume": volume[: len(index)],
+        },
+        index=index,
+    )
+
+
+class MinuteLoader(DataLoader):
+    def __init__(self, base_dir: Path, bars: pd.DataFrame):
+        super().__init__(base_dir, storage_format="pickle")
+        self.bars = bars
+
+    def _fetch_from_source(self, symbol, start, end, interval):
+        return self.bars
+
+
+def test_resample_respects_session_and_ohlcv_rules():
+    bars = _minute_bars(["2024-03-07", "2024-03-08"])
+
+    daily = resample_ohlcv(bars, "1d")
+    assert list(daily.index) == [pd.Timestamp("2024-03-07"), pd.Timestamp("2024-03-08")]
+    session = bars.between_time("09:30", "16:00", inclusive="left")
+    day = session.loc["2024-03-08"]
+    row = daily.loc["2024-03-08"]
+    assert row["open"] == day["open"].iloc[0]
+    assert row["close"] == day["close"].iloc[-1]
+    assert row["high"] == day["high"].max() and row["low"] == day["low"].min()
+    assert row["volume"] == day["volume"].sum()
+
+    five = resample_ohlcv(bars, "5m")
+    assert len(five) == 2 * 78  # 6.5h session per day, no empty overnight bins
+    assert five.index[0] == pd.Timestamp("2024-03-07 09:30", tz="America/New_York")
+    first = session.iloc[:5]
+    assert five.iloc[0]["close"] == first["close"].iloc[-1]
+    assert five.iloc[0]["volume"] == first["volume"].sum()
+
+    # UTC input is grouped by exchange-local session date
+    utc = resample_ohlcv(bars.tz_convert("UTC"), "1d")
+    pd.testing.assert_frame_equal(utc, daily)
+
+    # 1d from 5m matches 1d from 1m
+    pd.testing.assert_frame_equal(resample_ohlcv(five, "1d"), daily, check_dtype=False)
+
+    with pytest.raises(DataSourceError):
+        resample_ohlcv(bars, "1h")
+
+
+def test_resample_cache_builds_hits_and_extends_incrementally(tmp_path: Path):
+    base = tmp_path / "data" / "historical"
+    first = _minute_bars(["2024-03-07", "2024-03-08"])
+    # The last stored bar ends mid-bin, so the tail 5m bin is partial
+    first = first[first.index < pd.Timestamp("2024-03-08 11:02", tz="America/New_York")]
+    loader = MinuteLoader(base, first)
+    loader.load_ohlcv("AAPL", "2024-03-07", "2024-03-08", interval="1m")
+    assert derivable_from("5m") == ("1m",)
+
+    cache = ResampleCache(loader)
+    assert cache.source_for("AAPL", "5m") == "1m"
+    five = cache.load("AAPL", target="5m")
+    pd.testing.assert_frame_equal(five, resample_ohlcv(first, "5m"), check_freq=False)
+    cache.load("AAPL", target="5m")
+    assert cache.stats.to_dict() == {"hits": 1, "incremental": 0, "rebuilds": 1}
+
+    full = _minute_bars(["2024-03-07", "2024-03-08", "2024-03-11"])
+    loader.bars = full
+    loader.load_ohlcv("AAPL", "2024-03-07", "2024-03-11", interval="1m", force_refresh=True)
+    five = cache.load("AAPL", target="5m")
+    daily = cache.load("AAPL", "2024-03-08", "2024-03-11", target="1d")
+    assert cache.stats.incremental == 1
+    pd.testing.assert_frame_equal(five, resample_ohlcv(full, "5m"), check_freq=False)
+    pd.testing.assert_frame_equal(
+        daily, resample_ohlcv(full, "1d").loc["2024-03-08":], check_freq=False
+    )
+
+    # A rewritten history (not an append) rebuilds the tier
+    loader.bars = full.assign(close=full["close"] + 1.0, high=full["high"] + 1.0)
+    loader.load_ohlcv("AAPL", "2024-03-07", "2024-03-11", interval="1m", force_refresh=True)
+    cache.load("AAPL", target="5m")
+    assert cache.stats.rebuilds == 3
+
+    with pytest.raises(DataSourceError):
+        cache.load("MSFT", target="5m")
+
+
+class CountingSource:
+    name = "counting"
+
+    def __init__(self, bars: pd.DataFrame):
+        self.bars = bars
+        self.calls: list[str] = []
+
+    def fetch_ohlcv(self, symbol, start, end, interval):
+        self.calls.append(interval)
+        return self.bars
+
+
+def test_loader_derives_covered_intervals_without_provider_calls(tmp_path: Path):
+    bars = _minute_bars(["2024-03-07", "2024-03-08"])
+    source = CountingSource(bars)
+    loader = DataLoader(tmp_path / "data" / "historical", storage_format="pickle", data_source=source)
+    loader.load_ohlcv("AAPL", "2024-03-07", "2024-03-08", interval="1m")
+    assert source.calls == ["1m"]
+
+    derived = DataLoader(
+        tmp_path / "data" / "historical", storage_format="pickle", data_source=source, derive=True
+    )
+    assert derived.derived_source("AAPL", "2024-03-07", "2024-03-08", "1d") == "1m"
+    five = derived.load_ohlcv("AAPL", "2024-03-07", "2024-03-08", interval="5m")
+    daily = derived.load_ohlcv("AAPL", "2024-03-08", "2024-03-08", interval="1d", columns=["close"])
+    assert source.calls == ["1m"]
+    pd.testing.assert_frame_equal(five, resample_ohlcv(bars, "5m"), check_freq=False)
+    pd.testing.assert_frame_equal(
+        daily, resample_ohlcv(bars, "1d").loc["2024-03-08":, ["close"]], check_freq=False
+    )
+    derived.load_ohlcv("AAPL", "2024-03-07", "2024-03-08", interval="5m")
+    assert derived.resampler.stats.to_dict() == {"hits": 1, "incremental": 0, "rebuilds": 2}
+
+    # Ranges the stored tier does not cover still go to the provider
+    assert derived.derived_source("AAPL", "2024-03-07", "2024-03-11", "1d") is None
+    derived.load_ohlcv("AAPL", "2024-03-07", "2024-03-11", interval="1d")
+    assert source.calls == ["1m", "1d"]
+
+
+def test_incremental_refresh_reads_only_the_last_source_partition(tmp_path: Path, monkeypatch):
+    base = tmp_path / "data" / "historical"
+    full = _minute_bars(["2024-02-29", "2024-03-01", "2024-03-04"])
+    source = CountingSource(full[full.index < pd.Timestamp("2024-03-04", tz="America/New_York")])
+    loader = DataLoader(base, storage_format="pickle", data_source=source, layout="partitioned")
+    loader.load_ohlcv("AAPL", "2024-02-29", "2024-03-01", interval="1m")
+    cache = ResampleCache(loader)
+    cache.load("AAPL", target="1d")
+
+    source.bars = full
+    loader.load_ohlcv("AAPL", "2024-02-29", "2024-03-04", interval="1m", force_refresh=True)
+    source_root = loader.partitioned_store("AAPL", "1m").root
+    original_read_part = PartitionedStore._read_part
+    read = []
+
+    def _spy(self, key, **kwargs):
+        read.append((self.root, key))
+        return original_read_part(self, key, **kwargs)
+
+    monkeypatch.setattr(PartitionedStore, "_read_part", _spy)
+    daily = cache.load("AAPL", target="1d")
+
+    assert cache.stats.incremental == 1
+    assert [key for root, key in read if root == source_root] == ["year=2024/month=03"] * 2
+    pd.testing.assert_frame_equal(daily, resample_ohlcv(full, "1d"), check_freq=False)
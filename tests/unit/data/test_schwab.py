@@ -71,3 +71,22 @@ def test_fallback_datasource_warns_and_recovers():
     wrapper = FallbackDataSource(Primary(), Secondary())
     df = wrapper.fetch_ohlcv("AAPL", "2024-01-01", "2024-01-02")
     assert not df.empty
+
+
+def test_quotes_are_batched_over_a_pooled_session():
+    class FakeSession:
+        def __init__(self):
+            self.calls = []
+
+        def get(self, url, headers=None, params=None, timeout=None):
+            self.calls.append(params["symbols"])
+            return FakeResponse(200, {s: {"bid": 1.0, "ask": 1.2} for s in params["symbols"].split(",")})
+
+    session = FakeSession()
+    ds = SchwabDataSource(access_token="token", session=session, quote_batch_size=2)
+    quotes = ds.fetch_quotes(["AAPL", "MSFT", "AAPL", "SPY", "AAPL  250117C00100000"])
+
+    assert session.calls == ["AAPL,MSFT", "SPY,AAPL  250117C00100000"]
+    assert set(quotes) == {"AAPL", "MSFT", "SPY", "AAPL  250117C00100000"}
+    assert ds.metrics.to_dict()["quotes"]["requests"] == 2
+    assert ds.metrics.requests == 2
@@ -0,0 +1,66 @@
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+from qse.data.data_loader import DataLoader
+from qse.data.parquet_io import write_sorted_parquet
+from qse.data.universe_dataset import UniverseDataset, split_panel, to_wide
+
+
+def _bars(start: str, periods: int, seed: int) -> pd.DataFrame:
+    rng = np.random.default_rng(seed)
+    close = 100 * np.exp(np.cumsum(rng.normal(0, 0.02, periods)))
+    return pd.DataFrame(
+        {
+            "open": close * (1 + rng.normal(0, 0.01, periods)),
+            "high": close * 1.01,
+            "low": close * 0.99,
+            "close": close,
+            "volume": rng.integers(1_000, 5_000, periods),
+        },
+        index=pd.date_range(start, periods=periods, freq="D", name="date"),
+    )
+
+
+def _write_cache_tree(root: Path, symbol: str, bars: pd.DataFrame) -> None:
+    # Same layout and columns as qse.data.cache.fetch_symbol
+    out = bars.reset_index()
+    out["symbol"] = symbol
+    out["interval"] = "1d"
+    path = root / "historical" / "interval=1d" / f"symbol={symbol}" / "_v1" / "data.parquet"
+    path.parent.mkdir(parents=True)
+    write_sorted_parquet(out, path, sort_column="date", index=False)
+
+
+def test_universe_dataset_loads_symbols_in_one_panel(tmp_path: Path):
+    frames = {"MSFT": _bars("2024-01-01", 40, 1), "AAPL": _bars("2024-01-05", 40, 2)}
+    for symbol, bars in frames.items():
+        _write_cache_tree(tmp_path, symbol, bars)
+    # A partitioned DataLoader cache (datetime index column) in the same tree
+    spy = _bars("2023-12-20", 40, 3)
+
+    class Source:
+        name = "stub"
+
+        def fetch_ohlcv(self, symbol, start, end, interval="1d"):
+            return spy
+
+    loader = DataLoader(tmp_path / "historical", data_source=Source(), layout="partitioned")
+    loader.load_ohlcv("SPY", "2023-12-20", "2024-01-28")
+
+    dataset = UniverseDataset(tmp_path / "historical")
+    assert dataset.symbols() == ["AAPL", "MSFT", "SPY"]
+    panel = dataset.load(["MSFT", "SPY", "AAPL", "NOPE"], start="2024-01-10", end="2024-01-31")
+
+    assert list(panel["symbol"].cat.categories) == ["MSFT", "SPY", "AAPL"]
+    assert panel["date"].min() == pd.Timestamp("2024-01-10")
+    by_symbol = split_panel(panel)
+    assert list(by_symbol) == ["MSFT", "SPY", "AAPL"]
+    expected = frames["MSFT"].loc["2024-01-10":"2024-01-31"].astype(float)
+    pd.testing.assert_frame_equal(by_symbol["MSFT"], expected, check_freq=False)
+    assert by_symbol["SPY"].index.max() == pd.Timestamp("2024-01-28")
+
+    wide = to_wide(panel, "close")
+    assert list(wide.columns) == ["MSFT", "SPY", "AAPL"]
+    assert wide.index.is_monotonic_increasing and wide.index.max() == pd.Timestamp("2024-01-31")
@@ -2,8 +2,11 @@ import pandas as pd
 import pytest
 
 from qse.data.validation import (
+    Fingerprint,
+    combine_fingerprints,
     compute_fingerprint,
     enforce_missing_tolerance,
+    fingerprint_version,
     fingerprints_match,
     validate_ohlcv,
 )
@@ -47,6 +50,26 @@ def test_validate_ohlcv_passes_and_fingerprint_changes_on_data_change():
     assert fingerprints_match(fp1, fp1)
 
 
+def test_fingerprint_composes_across_partitions_and_appends():
+    df = pd.concat([_frame(), _frame().set_axis(pd.date_range("2024-01-01", periods=2, freq="D"))])
+    whole = compute_fingerprint(df)
+    assert fingerprint_version(whole) == "v2"
+    assert combine_fingerprints([compute_fingerprint(df.iloc[:3]), compute_fingerprint(df.iloc[3:])]) == whole
+
+    revised = df.copy()
+    revised.loc[revised.index[-1], "close"] = 7
+    updated = Fingerprint.parse(whole) - Fingerprint.of(df.iloc[-1:]) + Fingerprint.of(revised.iloc[-1:])
+    assert str(updated) == compute_fingerprint(revised)
+
+
+def test_legacy_fingerprints_still_match_through_version_tag():
+    df = _frame()
+    legacy = compute_fingerprint(df, version="v1")
+    assert fingerprint_version(legacy) == "v1"
+    assert not fingerprints_match(legacy, compute_fingerprint(df))
+    assert fingerprints_match(legacy, compute_fingerprint(df), df=df)
+
+
 def test_enforce_missing_tolerance_detects_gap():
     df = _frame()
     df.loc[df.index[0], "close"] = None
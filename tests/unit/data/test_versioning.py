@@ -15,3 +15,15 @@ def test_detect_drift_distribution_change():
     old = DataVersion(schema_hash="a", row_count=100, mean_return=0.01, std_return=0.02)
     new = DataVersion(schema_hash="a", row_count=100, mean_return=0.5, std_return=0.02)
     assert detect_drift(old, new, stat_threshold=0.1) == "distribution"
+
+
+def test_detect_drift_accepts_run_meta_without_fingerprint():
+    df = pd.DataFrame(
+        {"open": [1.0, 2.0], "high": [2.0, 3.0], "low": [0.5, 1.5], "close": [1.0, 2.0], "volume": [10, 10]},
+        index=pd.date_range("2024-01-01", periods=2, freq="D"),
+    )
+    current = compute_version(df)
+    assert current.fingerprint is not None
+    legacy = DataVersion(**{k: v for k, v in current.__dict__.items() if k != "fingerprint"})
+    assert detect_drift(legacy, current) == "none"
+    assert detect_drift(current, compute_version(df.copy())) == "none"
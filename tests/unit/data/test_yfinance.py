@@ -82,3 +82,31 @@ def test_option_chain_normalization(monkeypatch):
     yf = YFinanceDataSource(max_retries=1)
     df = yf.fetch_option_chain("AAPL", expiry="2024-01-19")
     assert set(["bid", "ask", "implied_volatility", "open_interest", "volume", "strike", "expiry"]).issubset(df.columns)
+
+
+def test_full_option_chain_walks_listed_expiries(monkeypatch):
+    # yfinance's chain namedtuple carries no expiry; the adapter must stamp it
+    from collections import namedtuple
+
+    Chain = namedtuple("Options", ["calls", "puts", "underlying"])
+    requested: list[str | None] = []
+
+    def fake_option_chain(symbol, expiry):
+        requested.append(expiry)
+        frame = pd.DataFrame({"strike": [100.0], "bid": [1.0], "ask": [1.1], "impliedVolatility": [0.2],
+                              "openInterest": [10], "volume": [5]})
+        return Chain(calls=frame, puts=frame, underlying={"regularMarketPrice": 101.5})
+
+    monkeypatch.setattr(YFinanceDataSource, "_option_chain", staticmethod(fake_option_chain))
+    monkeypatch.setattr(YFinanceDataSource, "_option_expiries", lambda self, symbol: ["2024-01-19", "2024-02-16"])
+    df = YFinanceDataSource(max_retries=1).fetch_option_chain("AAPL")
+
+    assert requested == ["2024-01-19", "2024-02-16"]
+    assert sorted(df["expiry"].unique()) == ["2024-01-19", "2024-02-16"]
+    assert len(df) == 4 and (df["underlying_price"] == 101.5).all()
+
+
+def test_full_option_chain_without_listed_expiries_fails(monkeypatch):
+    monkeypatch.setattr(YFinanceDataSource, "_option_expiries", lambda self, symbol: [])
+    with pytest.raises(DataSourceError):
+        YFinanceDataSource(max_retries=1).fetch_option_chain("AAPL")
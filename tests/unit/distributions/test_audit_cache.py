@@ -0,0 +1,69 @@
+import json
+import os
+from concurrent.futures import ThreadPoolExecutor
+
+from qse.distributions.cache.cache_manager import (
+    INDEX_NAME,
+    PAYLOAD_SUFFIX,
+    AuditCache,
+)
+
+
+def _payload(model: str, score: float) -> dict:
+    return {
+        "best_model": {"name": model},
+        "scores": [{"model_name": model, "total_score": score, "components": {}}],
+    }
+
+
+def test_put_get_and_latest_use_the_index(tmp_path):
+    cache = AuditCache(tmp_path)
+    with ThreadPoolExecutor(max_workers=4) as pool:
+        list(
+            pool.map(
+                lambda i: cache.put("AAPL", 100 + i, "2024-01-01", "unit", _payload("laplace", i)),
+                range(4),
+            )
+        )
+    newest = cache.put("AAPL", 500, "2024-06-30", "unit", _payload("student_t", 0.7))
+
+    entry = cache.get("AAPL", 500, "2024-06-30", "unit")
+    assert entry.path.name.endswith(PAYLOAD_SUFFIX) and entry.is_fresh()
+    assert (entry.best_model, entry.best_score) == ("student_t", 0.7)
+    assert entry.load() == _payload("student_t", 0.7)
+    assert cache.get("AAPL", 1, "2024-01-01", "unit") is None
+    assert cache.latest("AAPL") == newest
+    assert len(cache.entries("AAPL")) == 5 and cache.latest("MSFT") is None
+    # A second handle on the same directory sees the same index
+    assert AuditCache(tmp_path).get("AAPL", 102, "2024-01-01", "unit").best_score == 2
+
+
+def test_legacy_json_entries_are_indexed_and_superseded(tmp_path):
+    legacy = tmp_path / "SPY_252_2023-12-29_yfinance:1d.json"
+    legacy.write_text(json.dumps(_payload("laplace", 0.4), indent=2))
+    cache = AuditCache(tmp_path)
+
+    entry = cache.latest("SPY")
+    assert entry.path == legacy and entry.lookback_days == 252
+    assert entry.data_source == "yfinance:1d" and entry.best_model == "laplace"
+
+    cache.put("SPY", 252, "2023-12-29", "yfinance:1d", _payload("garch_t", 0.9))
+    assert not legacy.exists()
+    assert cache.get("SPY", 252, "2023-12-29", "yfinance:1d").best_model == "garch_t"
+
+
+def test_evict_expired_removes_rows_and_files(tmp_path):
+    cache = AuditCache(tmp_path, ttl_days=30)
+    old = cache.put("QQQ", 100, "2022-01-03", "unit", _payload("laplace", 0.1))
+    keep = cache.put("QQQ", 100, "2024-01-02", "unit", _payload("laplace", 0.2))
+    legacy = tmp_path / "IWM_100_2021-01-04_unit.json"
+    legacy.write_text(json.dumps(_payload("laplace", 0.3)))
+    os.utime(legacy, (0, 0))
+    with cache._connect() as conn:  # age the indexed entry
+        conn.execute("UPDATE entries SET written_at = 0 WHERE key = ?", (old.key,))
+
+    assert cache.latest("QQQ", fresh_only=True) == keep
+    assert cache.evict_expired() == 2
+    assert not old.path.exists() and not legacy.exists() and keep.path.exists()
+    assert [e.key for e in cache.entries()] == [keep.key]
+    assert sorted(p.name for p in tmp_path.iterdir()) == sorted([INDEX_NAME, keep.path.name])
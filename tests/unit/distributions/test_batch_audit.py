@@ -0,0 +1,93 @@
+import json
+
+import numpy as np
+import pandas as pd
+
+from qse.distributions import batch_audit
+from qse.distributions.batch_audit import audit_universe
+from qse.distributions.cache.cache_manager import AuditCache
+from qse.distributions.distribution_audit import DistributionAuditResult, ModelScore, ModelSpec
+
+
+def _fake_audit(calls: list):
+    def audit(*, symbol, cache_dir, lookback_days, end_date, data_source, executor, **_):
+        calls.append((symbol, executor))
+        best = ModelSpec(name="student_t", cls=None, config={})
+        score = ModelScore(model_name="student_t", total_score=0.4, components={})
+        AuditCache(cache_dir).put(
+            symbol,
+            lookback_days,
+            end_date,
+            data_source,
+            {"best_model": {"name": "student_t"}, "scores": [vars(score)]},
+        )
+        return DistributionAuditResult(
+            symbol=symbol,
+            models=[best],
+            fit_results=[],
+            tail_metrics=[],
+            var_backtests=[],
+            simulation_metrics=[],
+            scores=[score],
+            best_model=best,
+        )
+
+    return audit
+
+
+def test_audit_universe_skips_fresh_cache_and_shares_one_pool(tmp_path, monkeypatch):
+    calls: list = []
+    monkeypatch.setattr(batch_audit, "audit_distributions_for_symbol", _fake_audit(calls))
+    prices = pd.Series(100 + np.arange(300, dtype=float))
+
+    def load(symbol):
+        if symbol == "NODATA":
+            return None
+        if symbol == "BROKEN":
+            raise RuntimeError("provider down")
+        return prices
+
+    keys = dict(cache_dir=tmp_path, lookback_days=756, end_date="2024-12-31", data_source="yfinance:1d")
+    # Pre-index JSON entries are still honoured
+    cached = tmp_path / "MSFT_756_2024-12-31_yfinance:1d.json"
+    cached.write_text(json.dumps({"best_model": {"name": "laplace"}, "scores": []}, indent=2))
+
+    seen = []
+    summaries = audit_universe(
+        ["AAPL", "MSFT", "NODATA", "BROKEN", "SPY", "AAPL"],
+        load,
+        max_workers=2,
+        on_result=lambda s: seen.append(s.symbol),
+        **keys,
+    )
+
+    assert [s.symbol for s in summaries] == ["AAPL", "MSFT", "NODATA", "BROKEN", "SPY"]
+    assert [s.status for s in summaries] == ["audited", "cached", "no_data", "failed", "audited"]
+    assert sorted(seen) == sorted(s.symbol for s in summaries)
+    assert summaries[0].best_model == "student_t" and summaries[0].score == 0.4
+    assert summaries[1].best_model == "laplace" and summaries[1].score is None
+    assert "provider down" in summaries[3].error
+    # Every symbol submitted its model tasks to the same process pool
+    assert sorted(c[0] for c in calls) == ["AAPL", "SPY"]
+    assert len({id(c[1]) for c in calls}) == 1 and calls[0][1] is not None
+
+    calls.clear()
+    again = audit_universe(["AAPL", "SPY"], load, **keys)
+    assert [s.status for s in again] == ["cached", "cached"] and not calls
+    forced = audit_universe(["AAPL"], load, force_refit=True, max_workers=1, **keys)
+    assert forced[0].status == "audited" and len(calls) == 1
+
+
+def test_audit_universe_evicts_expired_entries_first(tmp_path, monkeypatch):
+    calls: list = []
+    monkeypatch.setattr(batch_audit, "audit_distributions_for_symbol", _fake_audit(calls))
+    cache = AuditCache(tmp_path)
+    expired = cache.put("OLD", 756, "2020-12-31", "yfinance:1d", {"best_model": {"name": "laplace"}})
+    with cache._connect() as conn:
+        conn.execute("UPDATE entries SET written_at = 0 WHERE key = ?", (expired.key,))
+
+    audit_universe(["AAPL"], lambda s: pd.Series([1.0]), cache_dir=tmp_path, max_workers=1)
+    assert expired.path.exists()
+
+    audit_universe(["AAPL"], lambda s: pd.Series([1.0]), cache_dir=tmp_path, max_workers=1, evict_expired=True)
+    assert not expired.path.exists() and cache.entries("OLD") == []
@@ -0,0 +1,56 @@
+import math
+
+import numpy as np
+from scipy.stats import chi2
+
+from qse.distributions.backtesting.christoffersen_test import christoffersen_pvalue
+from qse.distributions.backtesting.coverage import breach_matrix, coverage_tests
+from qse.distributions.backtesting.kupiec_test import kupiec_pvalue
+
+
+def _kupiec_reference(n: int, x: int, p: float) -> float:
+    pi = x / n
+    ll0 = (n - x) * math.log(1 - p) + (x * math.log(p) if x else 0.0)
+    ll1 = (n - x) * math.log(1 - pi) + (x * math.log(pi) if x else 0.0)
+    return float(chi2.sf(-2 * (ll0 - ll1), 1))
+
+
+def test_kupiec_is_log_space_and_uses_breach_rate():
+    assert math.isclose(kupiec_pvalue(250, 4, 0.99), _kupiec_reference(250, 4, 0.01), rel_tol=1e-12)
+    assert math.isclose(kupiec_pvalue(250, 0, 0.99), _kupiec_reference(250, 0, 0.01), rel_tol=1e-12)
+    # Long windows near the expected rate no longer underflow to zero
+    assert kupiec_pvalue(100_000, 1_000, 0.99) == 1.0
+    assert 0.0 < kupiec_pvalue(100_000, 1_100, 0.99) < 0.01
+    assert kupiec_pvalue(0, 0, 0.95) == 1.0
+
+
+def test_christoffersen_detects_clustered_breaches():
+    spread = np.zeros(500, bool)
+    spread[::50] = True
+    clustered = np.zeros(500, bool)
+    clustered[100:110] = True
+    assert christoffersen_pvalue(spread) > 0.5
+    assert christoffersen_pvalue(clustered) < 1e-6
+    assert christoffersen_pvalue([]) == 1.0
+
+
+def test_coverage_grid_matches_scalar_tests():
+    rng = np.random.default_rng(2)
+    returns = rng.standard_t(4, size=2000) * 0.01
+    levels = np.array([0.95, 0.99])
+    var = np.stack([np.quantile(returns, 1 - levels) * s for s in (0.8, 1.0, 1.3)])  # (3, 2)
+    var = np.repeat(var[..., None], returns.size, axis=-1)
+    var[1, :, :50] = np.nan  # model 1 has no forecasts for the first 50 days
+
+    breaches, valid = breach_matrix(returns, var)
+    tests = coverage_tests(breaches, levels[None, :], valid)
+
+    assert tests.kupiec_pvalue.shape == (3, 2)
+    for m in range(3):
+        for j, level in enumerate(levels):
+            seq = breaches[m, j][valid[m, j]]
+            assert tests.n_obs[m, j] == seq.size
+            assert tests.n_breaches[m, j] == seq.sum()
+            assert np.isclose(tests.kupiec_pvalue[m, j], kupiec_pvalue(seq.size, seq.sum(), level))
+            assert np.isclose(tests.christoffersen_pvalue[m, j], christoffersen_pvalue(seq))
+    assert np.allclose(tests.lr_cc, tests.lr_uc + tests.lr_ind)
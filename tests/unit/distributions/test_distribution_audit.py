@@ -1,9 +1,14 @@
 import sys
+from concurrent.futures import ThreadPoolExecutor
 
 import numpy as np
 import pandas as pd
+import pytest
 
-from qse.distributions.distribution_audit import audit_distributions_for_symbol
+from qse.distributions import distribution_audit
+from qse.distributions.distribution_audit import ModelSpec, audit_distributions_for_symbol
+from qse.distributions.fitters.laplace_fitter import LaplaceFitter
+from qse.distributions.fitters.student_t_fitter import StudentTFitter
 
 
 def test_audit_selects_best_model_and_reports_failures(tmp_path):
@@ -90,3 +95,75 @@ def test_audit_outputs_tail_var_and_realism_metrics(tmp_path):
     realism = result.realism_reports.get(sim_model)
     assert realism and "deltas" in realism
     assert result.selection_report["scores"], "selection report should include scores"
+
+
+def _two_models():
+    return [
+        ModelSpec(name="laplace", cls=LaplaceFitter(), config={}),
+        ModelSpec(name="student_t", cls=StudentTFitter(), config={}),
+    ]
+
+
+def test_parallel_model_audit_matches_serial(tmp_path):
+    rng = np.random.default_rng(3)
+    prices = pd.Series(100.0 * np.exp(np.cumsum(rng.standard_t(4, size=500) * 0.01)))
+    common = dict(
+        require_heavy_tails=False,
+        seed=11,
+        force_refit=True,
+        simulation_paths=200,
+        simulation_steps=50,
+    )
+
+    serial = audit_distributions_for_symbol(
+        "PAR", prices, cache_dir=tmp_path / "a", candidate_models=_two_models(), **common
+    )
+    parallel = audit_distributions_for_symbol(
+        "PAR",
+        prices,
+        cache_dir=tmp_path / "b",
+        candidate_models=_two_models(),
+        max_workers=2,
+        **common,
+    )
+
+    assert [fr.model_name for fr in parallel.fit_results] == ["laplace", "student_t"]
+    assert [fr.params for fr in parallel.fit_results] == [fr.params for fr in serial.fit_results]
+    assert parallel.tail_metrics == serial.tail_metrics
+    assert parallel.var_backtests == serial.var_backtests
+    assert parallel.simulation_metrics == serial.simulation_metrics
+    assert parallel.scores == serial.scores
+    assert parallel.selection_report == serial.selection_report
+    # Fitted instances come back from the workers
+    for spec in parallel.models:
+        assert spec.cls.sample(n_paths=1, n_steps=2, seed=0).shape == (1, 2)
+
+
+def test_model_audit_retries_in_process_only_for_pool_failures(monkeypatch):
+    calls: list[str] = []
+    errors = {"laplace": TypeError("cannot pickle '_thread.lock' object")}
+
+    def fake_audit(spec, r_train, r_test, **kwargs):
+        calls.append(spec.name)
+        error = errors.pop(spec.name, None)
+        if error is not None:
+            raise error
+        return spec.name
+
+    monkeypatch.setattr(distribution_audit, "audit_single_model", fake_audit)
+    returns = np.zeros(10)
+    with ThreadPoolExecutor(max_workers=2) as pool:
+        outcomes = distribution_audit.run_model_audits(
+            _two_models(), returns, returns, hist_metrics=None, s0=100.0, executor=pool
+        )
+        assert outcomes == ["laplace", "student_t"]
+        assert sorted(calls) == ["laplace", "laplace", "student_t"]
+
+        # A genuine task error surfaces at once instead of re-running in-process
+        calls.clear()
+        errors["laplace"] = ValueError("bad task")
+        with pytest.raises(ValueError, match="bad task"):
+            distribution_audit.run_model_audits(
+                _two_models(), returns, returns, hist_metrics=None, s0=100.0, executor=pool
+            )
+        assert calls.count("laplace") == 1
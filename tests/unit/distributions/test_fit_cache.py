@@ -0,0 +1,74 @@
+import numpy as np
+import pytest
+
+from qse.distributions import laplace as laplace_module
+from qse.distributions.cache import fit_cache
+from qse.distributions.cache.fit_cache import FitCache, fit_cache_key, returns_fingerprint
+from qse.distributions.laplace import LaplaceDistribution
+
+
+@pytest.fixture
+def cache(monkeypatch, tmp_path):
+    fresh = FitCache(cache_dir=tmp_path)
+    monkeypatch.setattr(fit_cache, "_DEFAULT_CACHE", fresh)
+    return fresh
+
+
+@pytest.fixture
+def stationarity_calls(monkeypatch):
+    calls = []
+    original = laplace_module.check_stationarity
+
+    def counting(returns):
+        calls.append(len(returns))
+        return original(returns)
+
+    monkeypatch.setattr(laplace_module, "check_stationarity", counting)
+    return calls
+
+
+def _returns(seed: int = 0) -> np.ndarray:
+    return np.random.default_rng(seed).laplace(0.0, 0.01, size=400)
+
+
+def test_hit_restores_params_and_metadata_without_refitting(cache, stationarity_calls):
+    r = _returns()
+    first = LaplaceDistribution()
+    first.fit(r)
+    second = LaplaceDistribution()
+    second.fit(r.copy())
+
+    assert len(stationarity_calls) == 1
+    assert (second.loc, second.scale) == (first.loc, first.scale)
+    assert second.metadata == first.metadata
+    assert cache.stats.hits == 1 and cache.stats.misses == 1
+
+    # Different data or settings refit
+    LaplaceDistribution().fit(r, min_samples=30)
+    LaplaceDistribution().fit(_returns(1))
+    assert len(stationarity_calls) == 3
+
+
+def test_disk_tier_survives_a_new_process_cache(cache, monkeypatch, tmp_path, stationarity_calls):
+    r = _returns()
+    first = LaplaceDistribution()
+    first.fit(r)
+
+    monkeypatch.setattr(fit_cache, "_DEFAULT_CACHE", FitCache(cache_dir=tmp_path))
+    restored = LaplaceDistribution()
+    restored.fit(r)
+
+    assert len(stationarity_calls) == 1
+    assert fit_cache.default_fit_cache().stats.disk_hits == 1
+    assert restored.metadata == first.metadata
+    assert restored.sample(2, 3, seed=1).tolist() == first.sample(2, 3, seed=1).tolist()
+
+
+def test_key_depends_on_values_shape_model_and_settings():
+    r = _returns()
+    assert returns_fingerprint(r) == returns_fingerprint(list(r))
+    assert returns_fingerprint(r) != returns_fingerprint(r.reshape(20, 20))
+    base = fit_cache_key("laplace", r, {"min_samples": 60})
+    assert base == fit_cache_key("laplace", r.copy(), {"min_samples": 60})
+    assert base != fit_cache_key("normal", r, {"min_samples": 60})
+    assert base != fit_cache_key("laplace", r, {"min_samples": 61})
@@ -0,0 +1,65 @@
+import numpy as np
+import pytest
+from scipy.optimize import approx_fprime
+
+from qse.distributions.fitters import garch_t_fitter
+from qse.distributions.fitters.garch_native import (
+    NativeGarchFit,
+    fit_garch_t,
+    garch_backcast,
+    negative_loglik,
+)
+from qse.distributions.fitters.garch_t_fitter import GarchTFitter
+
+pytest.importorskip("arch", reason="arch not installed")
+
+
+def _garch_returns(n: int = 1500, seed: int = 11) -> np.ndarray:
+    rng = np.random.default_rng(seed)
+    nu = 6.0
+    z = rng.standard_t(nu, size=n) * np.sqrt((nu - 2) / nu)
+    out = np.empty(n)
+    h = 1e-4
+    for t in range(n):
+        out[t] = 2e-4 + np.sqrt(h) * z[t]
+        h = 2e-6 + 0.08 * (out[t] - 2e-4) ** 2 + 0.9 * h
+    return out
+
+
+def test_native_fit_matches_arch():
+    r = _garch_returns()
+    native = GarchTFitter()
+    res_native = native.fit(r)
+    res_arch = GarchTFitter(engine="arch").fit(r)
+
+    assert native.fit_engine == "native"
+    assert res_native.converged and res_arch.converged
+    assert list(res_native.params) == list(res_arch.params)
+    assert res_native.log_likelihood >= res_arch.log_likelihood - 1e-4
+    assert np.isclose(res_native.log_likelihood, res_arch.log_likelihood, atol=1e-3)
+    assert np.allclose(
+        list(res_native.params.values()), list(res_arch.params.values()), rtol=2e-2, atol=1e-3
+    )
+    assert np.isclose(res_native.aic, res_arch.aic, atol=1e-2)
+    assert native.forecast_var(r[-5:], [0.99]).shape == (5, 1)
+
+
+def test_native_gradient_matches_finite_differences():
+    fit = fit_garch_t(_garch_returns(600))
+    y = fit.resid + fit.params["mu"]
+    backcast = garch_backcast(y - y.mean())
+    theta = np.array([0.01, 0.05, 0.1, 0.8, 7.0])
+    _, grad = negative_loglik(theta, y, backcast)
+    numeric = approx_fprime(theta, lambda x: negative_loglik(x, y, backcast)[0], 1e-7)
+    assert np.allclose(grad, numeric, rtol=1e-4, atol=1e-2)
+
+
+def test_unconverged_native_fit_falls_back_to_arch(monkeypatch):
+    def failing(returns, **kwargs):
+        return NativeGarchFit({}, float("nan"), 1.0, False, "ABNORMAL_TERMINATION")
+
+    monkeypatch.setattr(garch_t_fitter, "fit_garch_t", failing)
+    fitter = GarchTFitter()
+    result = fitter.fit(_garch_returns(500))
+    assert fitter.fit_engine == "arch"
+    assert result.converged
@@ -2,10 +2,14 @@ import json
 import os
 from pathlib import Path
 
-from qse.distributions.cache.cache_manager import get_cache_path
 from qse.distributions.integration.model_loader import load_validated_model
 
 
+def _legacy_path(cache_dir: Path, key: str) -> Path:
+    # Pre-index audits: one pretty-printed "{symbol}_{lookback}_{end}_{source}.json" per key
+    return cache_dir / f"{key}.json"
+
+
 def _write_payload(path: Path, loc: float = 0.25, scale: float = 0.05) -> None:
     payload = {
         "symbol": path.stem.split("_")[0],
@@ -74,7 +78,7 @@ def test_model_loader_falls_back_when_cache_missing(tmp_path):
 
 def test_model_loader_reads_cached_model(tmp_path):
     cache_dir = Path(tmp_path)
-    cache_path = get_cache_path(cache_dir, "ABC", 200, "2024-02-02", "unit")
+    cache_path = _legacy_path(cache_dir, "ABC_200_2024-02-02_unit")
     _write_payload(cache_path)
 
     loaded = load_validated_model(
@@ -93,8 +97,8 @@ def test_model_loader_reads_cached_model(tmp_path):
 
 def test_model_loader_uses_latest_cache_when_key_unknown(tmp_path):
     cache_dir = Path(tmp_path)
-    older = get_cache_path(cache_dir, "ABC", 100, "2024-01-01", "unit")
-    newer = get_cache_path(cache_dir, "ABC", 200, "2024-02-02", "unit")
+    older = _legacy_path(cache_dir, "ABC_100_2024-01-01_unit")
+    newer = _legacy_path(cache_dir, "ABC_200_2024-02-02_unit")
     _write_payload(older, loc=0.1, scale=0.02)
     os.utime(older, (0, 0))  # force old timestamp
     _write_payload(newer, loc=0.3, scale=0.08)
@@ -114,8 +118,8 @@ def test_model_loader_uses_latest_cache_when_key_unknown(tmp_path):
 
 def test_model_loader_skips_stale_cache_when_disallowed(tmp_path):
     cache_dir = Path(tmp_path)
-    stale = get_cache_path(cache_dir, "ABC", 50, "2023-01-01", "unit")
-    fresh = get_cache_path(cache_dir, "ABC", 150, "2024-03-01", "unit")
+    stale = _legacy_path(cache_dir, "ABC_50_2023-01-01_unit")
+    fresh = _legacy_path(cache_dir, "ABC_150_2024-03-01_unit")
     _write_payload(stale, loc=0.05, scale=0.01)
     os.utime(stale, (0, 0))
     _write_payload(fresh, loc=0.4, scale=0.09)
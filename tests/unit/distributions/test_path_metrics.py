@@ -0,0 +1,26 @@
+import numpy as np
+import pytest
+
+from qse.distributions.validation.clustering_calc import autocorr_squared_returns
+from qse.distributions.validation.drawdown_calc import max_drawdown
+from qse.distributions.validation.extreme_moves import extreme_move_frequencies
+from qse.distributions.validation.path_metrics import realism_metrics
+from qse.distributions.validation.volatility_calc import annualized_volatility
+
+
+@pytest.mark.parametrize("chunk_paths", [1, 7, 64, 500])
+def test_chunked_realism_metrics_match_per_path_helpers(chunk_paths):
+    rng = np.random.default_rng(11)
+    returns = rng.standard_t(4, size=(300, 60)) * 0.015 + 0.0003
+    s0 = 120.0
+    prices = np.clip(np.exp(np.log(s0) + np.cumsum(returns, axis=1)), 1e-8, None)
+    flat = returns.reshape(-1)
+
+    got = realism_metrics(returns, s0, chunk_paths=chunk_paths)
+
+    # Extreme-move counts are exact; drawdown means and moments agree to rounding
+    expected_dd = float(np.mean([max_drawdown(p) for p in prices]))
+    assert got["max_drawdown"] == pytest.approx(expected_dd, rel=1e-12)
+    assert got["extremes"] == extreme_move_frequencies(flat)
+    assert got["annualized_vol"] == pytest.approx(annualized_volatility(flat), rel=1e-12)
+    assert got["acf_sq_lag1"] == pytest.approx(autocorr_squared_returns(flat, lag=1), rel=1e-10)
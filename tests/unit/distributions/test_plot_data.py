@@ -0,0 +1,57 @@
+import subprocess
+import sys
+
+import numpy as np
+import pytest
+
+from qse.distributions.distribution_audit import ModelSpec
+from qse.distributions.fitters.laplace_fitter import LaplaceFitter
+from qse.distributions.plotting.plot_data import (
+    compute_fit_plot_data,
+    load_plot_data,
+    plot_data_path,
+    save_plot_data,
+)
+
+
+def _plot_data(tmp_path):
+    r = np.random.default_rng(2).laplace(0.0, 0.01, size=500)
+    fitter = LaplaceFitter()
+    result = fitter.fit(r)
+    spec = ModelSpec(name="laplace", cls=fitter, config={})
+    image = tmp_path / "TEST_fit_diagnostics.png"
+    return compute_fit_plot_data(r, [result], [spec], symbol="TEST", seed=1, image_path=image)
+
+
+def test_plot_data_round_trips_through_json(tmp_path):
+    data = _plot_data(tmp_path)
+    model = data.models[0]
+    assert model.pdf.shape == data.x_grid.shape
+    assert model.cdf.shape == data.ecdf_x.shape and np.all(np.diff(model.cdf) >= 0)
+    assert model.qq.shape == data.qq_probs.shape
+
+    path = save_plot_data(data, plot_data_path("TEST", tmp_path))
+    loaded = load_plot_data(path)
+    assert loaded.symbol == "TEST" and loaded.image_path == data.image_path
+    assert np.allclose(loaded.models[0].tail_pdf, model.tail_pdf, rtol=1e-6)
+    assert np.allclose(loaded.empirical_quantiles, data.empirical_quantiles, rtol=1e-6)
+
+
+def test_audit_import_graph_excludes_plotting_libraries():
+    code = (
+        "import sys, qse.distributions.distribution_audit, qse.distributions.batch_audit;"
+        "print(any(m in sys.modules for m in ('matplotlib', 'plotly')))"
+    )
+    out = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True)
+    assert out.stdout.strip() == "False"
+
+
+def test_render_plot_files_skips_up_to_date_images(tmp_path):
+    pytest.importorskip("matplotlib")
+    from qse.distributions.plotting.fit_diagnostics import render_plot_files
+
+    path = save_plot_data(_plot_data(tmp_path), plot_data_path("TEST", tmp_path))
+    written = render_plot_files([path])
+    assert written == [tmp_path / "TEST_fit_diagnostics.png"] and written[0].exists()
+    assert render_plot_files([path]) == []
+    assert render_plot_files([path], force=True) == written
@@ -0,0 +1,138 @@
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+from scipy import stats
+
+from qse.distributions.backtesting.rolling_var import (
+    RollingVarConfig,
+    refit_points,
+    rolling_var_forecasts,
+)
+from qse.distributions.distribution_audit import (
+    ModelSpec,
+    audit_cache_source,
+    fit_candidate_models,
+    run_model_audits,
+    run_rolling_var_backtests,
+)
+from qse.distributions.fitters.garch_t_fitter import GarchTFitter
+from qse.distributions.fitters.laplace_fitter import LaplaceFitter
+from qse.distributions.fitters.student_t_fitter import StudentTFitter
+
+
+def _returns(n: int = 700, seed: int = 5) -> np.ndarray:
+    return np.random.default_rng(seed).standard_t(5, size=n) * 0.01
+
+
+def test_garch_forecast_var_matches_arch_one_step_forecast():
+    r = _returns(600)
+    fitter = GarchTFitter(engine="arch")
+    fitter.fit(r[:500])
+    res = fitter._fit_result
+    fc = res.forecast(horizon=1, reindex=False)
+    nu = res.params["nu"]
+    z = stats.t.ppf(0.01, nu) * np.sqrt((nu - 2) / nu)
+    expected = (fc.mean.values[-1, 0] + np.sqrt(fc.variance.values[-1, 0]) * z) / res.scale
+
+    var = fitter.forecast_var(r[500:510], [0.99])
+    assert var.shape == (10, 1)
+    assert np.isclose(var[0, 0], expected, rtol=1e-10)
+    # Later rows respond to realised returns through the variance recursion
+    assert len(np.unique(var[:, 0])) == 10
+
+    warm = GarchTFitter()
+    warm._scale_factor = fitter._scale_factor
+    result = warm.fit(r[5:505], starting_values=fitter._fit_params)
+    cold = GarchTFitter().fit(r[5:505])
+    assert np.allclose(list(result.params.values()), list(cold.params.values()), rtol=1e-3, atol=1e-5)
+
+
+def test_rolling_forecasts_identical_serial_and_pooled():
+    r = _returns()
+    config = RollingVarConfig(window=250, refit_every=10, max_obs=300, refits_per_task=7)
+    fitters = {"laplace": LaplaceFitter, "student_t": StudentTFitter()}
+    serial = rolling_var_forecasts(r, fitters, start=250, config=config)
+    pooled = rolling_var_forecasts(r, fitters, start=250, config=config, max_workers=2)
+
+    assert refit_points(len(r), 250, config)[0] == 400
+    for name in fitters:
+        assert serial[name].var.shape == (300, 2) and serial[name].n_refits == 30
+        np.testing.assert_array_equal(serial[name].var, pooled[name].var)
+        assert serial[name].breaches(0.99) == pooled[name].breaches(0.99)
+
+
+def test_rolling_var_backtests_feed_coverage_tests():
+    r = _returns()
+    spec = ModelSpec(name="laplace", cls=LaplaceFitter(), config={})
+    fit = fit_candidate_models(r[:400], [spec])
+    config = RollingVarConfig(window=250, refit_every=20, max_obs=None)
+
+    results = run_rolling_var_backtests(r[:500], [spec], fit, start=400, config=config)
+
+    assert [(res.level, res.n_obs) for res in results] == [(0.95, 100), (0.99, 100)]
+    assert all(0.0 <= res.kupiec_pvalue <= 1.0 for res in results)
+    assert audit_cache_source("yfinance:1d", None) == "yfinance:1d"
+    assert audit_cache_source("yfinance:1d", config).endswith("rolling-w250-r20-nall")
+
+
+class RecordingPool(ProcessPoolExecutor):
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.submitted: list[str] = []
+
+    def submit(self, fn, /, *args, **kwargs):
+        self.submitted.append(fn.__name__)
+        return super().submit(fn, *args, **kwargs)
+
+
+def _audit_specs() -> list[ModelSpec]:
+    return [
+        ModelSpec(name="laplace", cls=LaplaceFitter(), config={}),
+        ModelSpec(name="student_t", cls=StudentTFitter(), config={}),
+    ]
+
+
+def test_audit_rolling_var_segments_run_on_shared_pool():
+    r = _returns(600)
+    config = RollingVarConfig(window=250, refit_every=20, max_obs=None, refits_per_task=2)
+    common = dict(hist_metrics={}, s0=100.0, seed=3, paths=100, steps=20, var_backtest=config)
+
+    serial = run_model_audits(_audit_specs(), r[:400], r[400:], **common)
+    with RecordingPool(max_workers=2) as pool:
+        pooled = run_model_audits(_audit_specs(), r[:400], r[400:], executor=pool, **common)
+
+    # 10 refits per model in segments of 2: model tasks plus 5 segment tasks each
+    assert pool.submitted.count("audit_single_model") == 2
+    assert pool.submitted.count("forecast_segment") == 10
+    assert [o.var_backtests for o in pooled] == [o.var_backtests for o in serial]
+    assert all(len(o.var_backtests) == 2 for o in pooled)
+
+
+def test_fresh_fitter_keeps_constructor_configuration(monkeypatch):
+    from qse.distributions.backtesting.rolling_var import _fresh
+
+    fitted = GarchTFitter(engine="arch")
+    fitted.fit(_returns(300))
+
+    fresh = _fresh(fitted)
+    assert fresh is not fitted
+    assert fresh.engine == "arch"
+    assert fresh._fit_params is None and fresh.fit_engine is None
+    assert _fresh(GarchTFitter).engine == "auto"
+
+    engines = []
+    original_fit = GarchTFitter.fit
+
+    def spy_fit(self, *args, **kwargs):
+        engines.append(self.engine)
+        return original_fit(self, *args, **kwargs)
+
+    monkeypatch.setattr(GarchTFitter, "fit", spy_fit)
+    rolling_var_forecasts(
+        _returns(400),
+        {"garch_t": GarchTFitter(engine="arch")},
+        start=300,
+        config=RollingVarConfig(window=250, refit_every=50),
+        levels=(0.99,),
+    )
+    assert engines == ["arch", "arch"]
@@ -0,0 +1,52 @@
+import numpy as np
+import pandas as pd
+
+from qse.data.universe_dataset import panel_from_frames, split_panel
+from qse.features.pipeline import enrich_ohlcv, enrich_panel
+from qse.selectors.gap_volume import GapVolumeSelector
+
+
+def _frames() -> dict[str, pd.DataFrame]:
+    frames = {}
+    for seed, symbol in enumerate(["BBB", "AAA", "CCC"]):
+        rng = np.random.default_rng(seed)
+        periods = 80 + 10 * seed
+        close = 50 * np.exp(np.cumsum(rng.normal(0, 0.03, periods)))
+        frames[symbol] = pd.DataFrame(
+            {
+                "open": close * (1 + rng.normal(0, 0.04, periods)),
+                "high": close * 1.02,
+                "low": close * 0.98,
+                "close": close,
+                "volume": rng.integers(1_000, 9_000, periods).astype(float),
+            },
+            index=pd.date_range("2024-01-01", periods=periods, freq="D", name="date"),
+        )
+    return frames
+
+
+def test_enrich_panel_matches_per_symbol_pipeline():
+    frames = _frames()
+    enriched = split_panel(enrich_panel(panel_from_frames(frames)))
+
+    assert list(enriched) == list(frames)
+    for symbol, bars in frames.items():
+        expected = enrich_ohlcv(bars, log_output=False)
+        pd.testing.assert_frame_equal(enriched[symbol], expected, check_freq=False)
+
+
+def test_gap_volume_select_panel_matches_per_symbol_select():
+    frames = _frames()
+    panel = enrich_panel(panel_from_frames(frames))
+    selector = GapVolumeSelector(gap_min=0.02, volume_z_min=0.5, horizon=3, min_episodes=1)
+
+    expected = []
+    for symbol, bars in frames.items():
+        enriched = enrich_ohlcv(bars, log_output=False)
+        enriched["symbol"] = symbol
+        expected.extend((ep.symbol, ep.t0, ep.score) for ep in selector.select(enriched))
+
+    got = [(ep.symbol, ep.t0, ep.score) for ep in selector.select_panel(panel)]
+    assert got and len(got) == len(expected)
+    assert [(s, t) for s, t, _ in got] == [(s, t) for s, t, _ in expected]
+    np.testing.assert_allclose([g[2] for g in got], [e[2] for e in expected])
@@ -0,0 +1,42 @@
+from __future__ import annotations
+
+from datetime import datetime, timedelta
+
+from qse.monitoring.monitor import PositionMonitor
+from qse.monitoring.position import PositionLeg, PositionSnapshot
+
+
+class QuoteSource:
+    def __init__(self):
+        self.calls: list[list[str]] = []
+
+    def fetch_quotes(self, symbols, fields=None):
+        self.calls.append(list(symbols))
+        return {s: {"bid": 2.0, "ask": 2.2} for s in symbols}
+
+
+def _position(underlying: str, entry_time: datetime) -> PositionSnapshot:
+    expiry = (entry_time + timedelta(days=10)).date()
+    common = {"option_type": "call", "expiry": expiry, "implied_vol": 0.2}
+    legs = [
+        PositionLeg(side="long", strike=100.0, quantity=1, entry_price=1.5, **common),
+        PositionLeg(side="short", strike=105.0, quantity=-1, entry_price=0.5, **common),
+    ]
+    return PositionSnapshot(
+        underlying=underlying, trade_horizon=5, entry_time=entry_time, regime="neutral", legs=legs
+    )
+
+
+def test_positions_are_repriced_from_one_batched_quote_call():
+    now = datetime.utcnow()
+    source = QuoteSource()
+    monitor = PositionMonitor(source)
+
+    single = monitor.evaluate_once(_position("SPY", now), now=now)
+    assert len(source.calls) == 1 and len(source.calls[0]) == 3
+    assert [leg["mark"] for leg in single["leg_marks"]] == [2.1, 2.1]
+
+    source.calls.clear()
+    results = monitor.evaluate_many([_position("SPY", now), _position("QQQ", now)], now=now)
+    assert len(results) == 2
+    assert len(source.calls) == 1 and len(source.calls[0]) == 6
@@ -0,0 +1,88 @@
+from __future__ import annotations
+
+import json
+import logging
+from pathlib import Path
+
+from qse.data.universe import load_symbol_file
+from qse.optimizers import batch
+from qse.optimizers.batch import TickerOutcome, rank_outcomes, run_optimizer_batch
+from qse.optimizers.strategy_optimizer import StrategyOptimizer
+
+CONFIG = {
+    "regimes": {
+        "neutral": {"mean_daily_return": 0.0, "daily_vol": 0.01, "skew": 0.0, "kurtosis_excess": 1.0}
+    },
+    "mc": {"num_paths": 200, "seed": 1},
+    "filters": {"max_loss_pct": 1.0, "min_expected_pnl": 0.0, "min_pop_breakeven": 0.0,
+                "min_pop_target": 0.0, "top_k_per_type": 2},
+}
+
+
+def test_optimizer_reuses_fitted_distribution_per_regime():
+    optimizer = StrategyOptimizer(CONFIG, data_provider=None, logger=logging.getLogger(__name__))
+
+    first, _ = optimizer._build_mc_engine("AAA", "neutral")
+    second, _ = optimizer._build_mc_engine("BBB", "neutral")
+    fresh, _ = StrategyOptimizer(CONFIG, data_provider=None, logger=logging.getLogger(__name__))._build_mc_engine(
+        "AAA", "neutral"
+    )
+
+    assert first.distribution is second.distribution
+    assert list(optimizer._fitted_distributions) == [("neutral", "garch_t")]
+    # Seeded fit: a new optimizer reproduces the same parameters
+    assert fresh.distribution.fit_state() == first.distribution.fit_state()
+
+
+def test_rank_outcomes_merges_by_score_and_skips_failures():
+    outcomes = [
+        TickerOutcome("AAA", "success", 0.1, result={"top10": [{"metrics": {"score": 0.2}}, {"metrics": {"score": 0.9}}]}),
+        TickerOutcome("BBB", "failed", 0.1, error="boom"),
+        TickerOutcome("CCC", "success", 0.1, result={"top10": [{"metrics": {"score": 0.5}}]}),
+    ]
+
+    ranked = rank_outcomes(outcomes, top_n=2)
+
+    assert [(e["ticker"], e["metrics"]["score"]) for e in ranked] == [("AAA", 0.9), ("CCC", 0.5)]
+
+
+def test_batch_runs_all_tickers_and_writes_report(tmp_path: Path):
+    output = tmp_path / "batch.json"
+
+    report = run_optimizer_batch(
+        ["AAA", "BBB", "AAA"],
+        regime="neutral",
+        trade_horizon=1,
+        config=CONFIG,
+        max_workers=1,
+        top_n=5,
+        output_path=output,
+    )
+
+    assert [o.ticker for o in report.outcomes] == ["AAA", "BBB"]
+    assert all(o.status == "success" for o in report.outcomes)
+    scores = [e["metrics"]["score"] for e in report.ranked]
+    assert 0 < len(scores) <= 5 and scores == sorted(scores, reverse=True)
+    payload = json.loads(output.read_text())
+    assert {t["ticker"] for t in payload["tickers"]} == {"AAA", "BBB"}
+    assert batch._WORKER_OPTIMIZER is None
+
+
+def test_batch_optimizer_uses_session_chain_cache(tmp_path: Path):
+    optimizer = batch._build_optimizer(
+        CONFIG, {"name": "yfinance", "max_retries": 1}, tmp_path / "data" / "option_chains"
+    )
+
+    assert optimizer.chain_cache is not None
+    assert optimizer.chain_cache.base_dir == tmp_path / "data" / "option_chains"
+    assert batch._build_optimizer(CONFIG, {"name": "yfinance", "max_retries": 1}).chain_cache is None
+
+
+def test_load_symbol_file_reads_csv_and_text(tmp_path: Path):
+    csv_path = tmp_path / "universe.csv"
+    csv_path.write_text("Symbol,Name\naapl,Apple\nMSFT,Microsoft\nAAPL,Apple\n")
+    txt_path = tmp_path / "watchlist.txt"
+    txt_path.write_text("# core\nnvda, amd\nTSLA  # ev\n")
+
+    assert load_symbol_file(csv_path) == ["AAPL", "MSFT"]
+    assert load_symbol_file(txt_path) == ["NVDA", "AMD", "TSLA"]
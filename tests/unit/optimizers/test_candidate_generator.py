@@ -2,9 +2,12 @@ from __future__ import annotations
 
 from datetime import datetime
 
+import numpy as np
 import pandas as pd
+import pytest
 
-from qse.optimizers.candidate_generator import CandidateGenerator, GeneratorConfig
+from qse.optimizers.candidate_generator import CandidateGenerator, GeneratorConfig, PruningBounds
+from qse.optimizers.prefilter import Prefilter, Stage3Config
 
 
 def _sample_chain() -> pd.DataFrame:
@@ -45,3 +48,53 @@ def test_generate_handles_empty_chain():
     generator = CandidateGenerator()
 
     assert generator.generate(pd.DataFrame(), spot=100.0) == []
+
+
+def _wide_chain(spot: float = 100.0) -> pd.DataFrame:
+    rows = []
+    for strike in range(50, 151, 5):
+        for option_type in ("call", "put"):
+            otm = strike - spot if option_type == "call" else spot - strike
+            mid = max(0.05, 6.0 - 0.1 * otm)
+            rows.append(
+                {
+                    "expiry": datetime(2025, 1, 20),
+                    "strike": float(strike),
+                    "option_type": option_type,
+                    "mid": mid,
+                    "bid": mid * 0.95,
+                    "ask": mid * 1.05,
+                }
+            )
+    return pd.DataFrame(rows)
+
+
+def _survivor_keys(candidates, stage3):
+    survivors = Prefilter(stage3).evaluate(candidates, 100.0)
+    return sorted((c.structure_type, tuple((l.strike, l.side, l.option_type) for l in c.legs)) for c in survivors)
+
+
+@pytest.mark.parametrize("nan_quotes", [False, True])
+def test_bound_pruning_keeps_stage3_survivors_identical(nan_quotes):
+    chain = _wide_chain()
+    if nan_quotes:
+        # Present-but-NaN quotes: Stage 3 metrics go NaN and never fail a check
+        chain.loc[chain.index % 7 == 3, "bid"] = np.nan
+        chain.loc[chain.index % 11 == 5, "ask"] = np.nan
+    for stage3 in (
+        Stage3Config(max_capital=2_000, max_loss_pct=1.0, min_expected_pnl=0.0, min_pop_breakeven=0.0,
+                     min_pop_target=0.0, top_k_per_type=10_000),
+        Stage3Config(max_capital=5_000, max_loss_pct=0.2, min_expected_pnl=150.0, min_pop_breakeven=0.0,
+                     min_pop_target=0.0, top_k_per_type=10_000),
+    ):
+        plain = CandidateGenerator(GeneratorConfig(min_width=1, max_width=50))
+        pruned = CandidateGenerator(
+            GeneratorConfig(min_width=1, max_width=50, bounds=PruningBounds.from_stage3(stage3))
+        )
+
+        all_candidates = plain.generate(chain, spot=100.0)
+        kept = pruned.generate(chain, spot=100.0)
+
+        assert pruned.pruned > 0
+        assert len(kept) + pruned.pruned == len(all_candidates)
+        assert _survivor_keys(kept, stage3) == _survivor_keys(all_candidates, stage3)
@@ -0,0 +1,163 @@
+from __future__ import annotations
+
+import logging
+from datetime import datetime, timedelta
+
+import numpy as np
+import pandas as pd
+
+from qse.optimizers.candidate_generator import GeneratorConfig
+from qse.optimizers.mc_engine import MCEngine
+from qse.optimizers.parallel import run_expiry_buckets
+from qse.optimizers.prefilter import Stage3Config
+from qse.optimizers.strategy_optimizer import StrategyOptimizer
+
+SPOT = 100.0
+STAGE3 = Stage3Config(max_loss_pct=1.0, min_expected_pnl=0.0, min_pop_breakeven=0.0, min_pop_target=0.0)
+
+
+def _chain() -> pd.DataFrame:
+    expiries = [datetime.now() + timedelta(days=d) for d in (10, 20, 30)]
+    rows = []
+    for expiry in expiries:
+        for strike in (95.0, 97.0, 100.0, 103.0, 105.0):
+            for option_type in ("call", "put"):
+                rows.append(
+                    {
+                        "expiry": expiry,
+                        "strike": strike,
+                        "option_type": option_type,
+                        "mid": 2.0 + abs(strike - SPOT) * 0.1,
+                    }
+                )
+    return pd.DataFrame(rows)
+
+
+def _terminal() -> np.ndarray:
+    rng = np.random.default_rng(7)
+    return SPOT * np.exp(rng.normal(0.0, 0.02, size=200))
+
+
+def _optimizer_config(mode: str, top_k_per_type: int) -> dict:
+    # "normal" samples reproducibly from the MC seed (arch's GARCH-t simulation
+    # does not), so two runs see identical terminal prices
+    return {
+        "distribution": "normal",
+        "regimes": {
+            "neutral": {"mean_daily_return": 0.0, "daily_vol": 0.01, "skew": 0.0, "kurtosis_excess": 1.0}
+        },
+        "mc": {"num_paths": 200, "seed": 1},
+        "filters": {"max_loss_pct": 1.0, "min_expected_pnl": 0.0, "min_pop_breakeven": 0.0,
+                    "min_pop_target": 0.0, "top_k_per_type": top_k_per_type, "max_width": 10},
+        "execution": {"mode": mode, "max_workers": 2},
+    }
+
+
+def _optimizer_chain() -> pd.DataFrame:
+    # Built once so both modes see identical contracts around the optimizer's spot (500)
+    rows = []
+    for i, days in enumerate((10, 17, 24, 31)):
+        expiry = datetime.now() + timedelta(days=days)
+        for strike in np.arange(485.0, 516.0, 5.0):
+            for option_type in ("call", "put"):
+                intrinsic = max(0.0, 500.0 - strike) if option_type == "call" else max(0.0, strike - 500.0)
+                mid = intrinsic + 4.0 + 1.5 * i + 0.05 * abs(strike - 500.0)
+                rows.append(
+                    {
+                        "expiry": expiry,
+                        "strike": float(strike),
+                        "option_type": option_type,
+                        "bid": mid * 0.98,
+                        "ask": mid * 1.02,
+                        "mid": mid,
+                        "volume": 1000,
+                        "open_interest": 1000,
+                    }
+                )
+    return pd.DataFrame(rows)
+
+
+def _ranked(mode: str, top_k_per_type: int, chain: pd.DataFrame) -> tuple[dict, dict]:
+    optimizer = StrategyOptimizer(
+        _optimizer_config(mode, top_k_per_type), data_provider=None, logger=logging.getLogger(__name__)
+    )
+    optimizer._create_synthetic_chain = lambda spot: chain.copy()
+    result = optimizer.optimize(ticker="TEST", regime="neutral", trade_horizon=1)
+    scores = {
+        (c["structure_type"], c["expiry"], tuple((leg["strike"], leg["option_type"], leg["side"]) for leg in c["legs"])):
+        c["metrics"]["score"]
+        for c in result["top100"]
+    }
+    return scores, result["diagnostics"]["stage_counts"]
+
+
+def test_per_expiry_matches_serial_optimizer():
+    # With no effective per-type cut both paths score the same survivors on the
+    # same seeded terminal prices, so the rankings agree exactly.
+    chain = _optimizer_chain()
+    serial, serial_counts = _ranked("serial", 10_000, chain)
+    bucketed, bucketed_counts = _ranked("per_expiry", 10_000, chain)
+
+    assert len(serial) > 20 and len({key[0] for key in serial}) == 4
+    assert bucketed == serial
+    assert bucketed_counts == serial_counts
+
+
+def test_per_expiry_type_cut_applies_per_bucket():
+    # top_k_per_type keeps k per structure type in each expiry bucket, which is a
+    # superset of the serial path's k per type across all expiries.
+    chain = _optimizer_chain()
+    serial, serial_counts = _ranked("serial", 3, chain)
+    bucketed, bucketed_counts = _ranked("per_expiry", 3, chain)
+
+    assert serial_counts["Stage 3 (survivors)"] <= 3 * 4
+    assert serial_counts["Stage 3 (survivors)"] < bucketed_counts["Stage 3 (survivors)"] <= 3 * 4 * 4
+    assert set(serial) <= set(bucketed)
+    assert all(bucketed[key] == score for key, score in serial.items())
+
+
+def test_bucket_ranking_matches_in_process_rescoring():
+    chain = _chain()
+    terminal = _terminal()
+    config = GeneratorConfig(min_width=1, max_width=5)
+
+    ranked, buckets = run_expiry_buckets(
+        chain,
+        spot=SPOT,
+        trade_horizon=1,
+        terminal_prices=terminal,
+        generator_config=config,
+        stage3_config=STAGE3,
+        top_n=5,
+        max_workers=2,
+    )
+
+    assert len(buckets) == 3
+    assert len(ranked) == 5
+    scores = [c.metrics.score for c in ranked]
+    assert scores == sorted(scores, reverse=True)
+
+    # Re-scoring a merged winner in-process against the same terminal prices is identical
+    best = ranked[0]
+    expected = MCEngine(distribution=None).score_terminal([best], SPOT, terminal, 1)[0].metrics
+    assert expected.score == best.metrics.score
+
+
+def test_optimizer_per_expiry_mode_reports_stage_counts():
+    config = {
+        "regimes": {
+            "neutral": {"mean_daily_return": 0.0, "daily_vol": 0.01, "skew": 0.0, "kurtosis_excess": 1.0}
+        },
+        "mc": {"num_paths": 200, "seed": 1},
+        "filters": {"max_loss_pct": 1.0, "min_expected_pnl": 0.0, "min_pop_breakeven": 0.0,
+                    "min_pop_target": 0.0, "top_k_per_type": 2},
+        "execution": {"mode": "per_expiry", "max_workers": 2},
+    }
+    optimizer = StrategyOptimizer(config, data_provider=None, logger=logging.getLogger(__name__))
+
+    result = optimizer.optimize(ticker="TEST", regime="neutral", trade_horizon=1)
+
+    counts = result["diagnostics"]["stage_counts"]
+    assert result["diagnostics"]["execution_mode"] == "per_expiry"
+    assert counts["Stage 4 (MC scored)"] == counts["Stage 3 (survivors)"]
+    assert 0 < len(result["top10"]) <= 10
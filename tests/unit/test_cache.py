@@ -40,8 +40,7 @@ def test_load_or_fetch_uses_existing_slice(tmp_path):
         "close": [1, 2, 3, 4, 5],
         "volume": [10, 10, 10, 10, 10],
     })
-    # Ensure file exists; actual parquet read is mocked
-    (path / "data.parquet").write_text("")
+    df_existing.to_parquet(path / "data.parquet", index=False)
 
     called = False
 
@@ -51,14 +50,11 @@ def test_load_or_fetch_uses_existing_slice(tmp_path):
         raise AssertionError("fetch_symbol should not be called when cache covers window")
 
     original_fetch = cache.fetch_symbol
-    original_read = cache.pd.read_parquet
     cache.fetch_symbol = _fake_fetch  # type: ignore
-    cache.pd.read_parquet = lambda *args, **kwargs: df_existing  # type: ignore
     try:
         out = cache.load_or_fetch("AAPL", start="2024-01-02", end="2024-01-04", interval="1d", target=tmp_path)
     finally:
         cache.fetch_symbol = original_fetch  # type: ignore
-        cache.pd.read_parquet = original_read  # type: ignore
 
     assert not called
     assert len(out) == 3
@@ -77,7 +73,7 @@ def test_load_or_fetch_extends_when_needed(tmp_path):
         "close": [1, 2],
         "volume": [10, 10],
     })
-    (path / "data.parquet").write_text("")
+    df_existing.to_parquet(path / "data.parquet", index=False)
 
     called = False
 
@@ -96,15 +92,30 @@ def test_load_or_fetch_extends_when_needed(tmp_path):
         return df_new
 
     original_fetch = cache.fetch_symbol
-    original_read = cache.pd.read_parquet
     cache.fetch_symbol = _fake_fetch  # type: ignore
-    cache.pd.read_parquet = lambda *args, **kwargs: df_existing  # type: ignore
     try:
         out = cache.load_or_fetch("AAPL", start="2024-01-01", end="2024-01-04", interval="1d", target=tmp_path)
     finally:
         cache.fetch_symbol = original_fetch  # type: ignore
-        cache.pd.read_parquet = original_read  # type: ignore
 
     assert called
     assert len(out) == 4
     assert out["close"].tolist() == [1, 2, 3, 4]
+
+
+def test_load_or_fetch_reads_only_requested_row_groups(tmp_path):
+    from qse.data.parquet_io import read_parquet_range, write_sorted_parquet
+
+    path = tmp_path / "historical/interval=1m/symbol=AAPL/_v1"
+    path.mkdir(parents=True)
+    dates = pd.date_range("2024-01-01", periods=10_000, freq="min")
+    df_existing = pd.DataFrame({"date": dates, "close": range(10_000)}).iloc[::-1]
+    write_sorted_parquet(df_existing, path / "data.parquet", sort_column="date", row_group_size=1_000, index=False)
+
+    out = cache.load_or_fetch("AAPL", start="2024-01-02", end="2024-01-02", interval="1m", target=tmp_path)
+    assert out["date"].is_monotonic_increasing
+    assert out["date"].tolist() == [pd.Timestamp("2024-01-02")]
+
+    window = read_parquet_range(path / "data.parquet", start="2024-01-02", end="2024-01-02", column="date")
+    # Whole day via pushdown (1440 bars) without decoding the other days
+    assert len(window) == 1_440
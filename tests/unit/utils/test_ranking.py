@@ -0,0 +1,36 @@
+import random
+
+import pytest
+
+from qse.utils.ranking import TopK, top_k
+
+
+def test_matches_stable_sort_with_ties():
+    rng = random.Random(3)
+    items = [(i, rng.choice([0.1, 0.2, 0.3, None, float("nan")])) for i in range(200)]
+    key = lambda item: item[1]  # noqa: E731
+
+    expected = sorted(items, key=lambda item: item[1] if item[1] == item[1] and item[1] is not None else float("-inf"), reverse=True)
+
+    assert top_k(items, 15, key) == expected[:15]
+    assert top_k(items, None, key) == expected
+
+
+def test_merge_across_workers_equals_single_pass():
+    items = [{"symbol": s, "score": float(i % 7)} for i, s in enumerate("ABCDEFGHIJKLMNOPQRST")]
+    key = lambda e: e["score"]  # noqa: E731
+    tiebreak = lambda e: e["symbol"]  # noqa: E731
+
+    left = TopK(5, key, tiebreak=tiebreak).extend(items[10:])
+    right = TopK(5, key, tiebreak=tiebreak).extend(items[:10])
+    merged = right.merge(left)
+
+    assert merged.items() == top_k(items, 5, key, tiebreak=tiebreak)
+    assert merged.seen == len(items)
+    assert len(merged) == 5
+
+
+def test_zero_and_negative_k():
+    assert top_k([1, 2, 3], 0, float) == []
+    with pytest.raises(ValueError):
+        TopK(-1, float)